@@ -23,6 +23,7 @@ defusedxml.defuse_stdlib()
 
 from app.database.basex_connector import BaseXConnector
 from app.database.workset_db import create_workset_tables
+from app.utils.startup_profile import StartupProfile
 
 
 # Create a global injector
@@ -42,12 +43,16 @@ def create_app(config_name=None):
     Returns:
         Flask application instance
     """
+    startup = StartupProfile()
+
     # Moved imports inside to avoid circular dependency with models/services
     from app.services.dictionary_service import DictionaryService
     from app.services.merge_split_service import MergeSplitService
     from app.config_manager import ConfigManager
     from app.services.cache_service import CacheService
 
+    startup.mark("core imports")
+
     app = Flask(__name__, instance_relative_config=True)  # type: Flask
     # Ensure the instance folder exists
     try:
@@ -104,6 +109,8 @@ def create_app(config_name=None):
     except Exception as e:
         app.logger.debug(f"Error during TEST_DB_NAME sync: {e}")
 
+    startup.mark("config")
+
     # Ensure SQLAlchemy is registered with the Flask app after config is loaded
     from app.models.project_settings import db
 
@@ -172,6 +179,19 @@ def create_app(config_name=None):
             db.session.commit()
         except Exception:
             db.session.rollback()
+        try:
+            from app.services.entry_revision_service import missing_revision_columns
+
+            missing = missing_revision_columns()
+            if missing:
+                app.logger.error(
+                    "entry_revisions is missing %s; saving revisions will fail until "
+                    "migrations/add_entry_revision_deltas.py is run",
+                    ", ".join(missing),
+                )
+        except Exception as e:
+            app.logger.debug(f"Could not check the entry_revisions schema: {e}")
+    startup.mark("models and tables")
 
     # Configure logging - write to file for debugging
     log_path = os.path.join(app.instance_path, 'debug.log')
@@ -206,8 +226,14 @@ def create_app(config_name=None):
         migrate_legacy_audio()
     except Exception:
         app.logger.warning("Legacy audio migration failed", exc_info=True)
+    startup.mark("logging and instance directories")
 
     # Register blueprints
+    #
+    # Blueprint modules are imported eagerly (the URL map and the API spec need
+    # every rule), so they must not import heavy optional stacks at module level:
+    # scikit-learn, spaCy, sentence-transformers/torch and Qdrant are imported
+    # by the services on first use. tests/unit/test_startup_profile.py guards this.
     from app.api import api_bp
 
     app.register_blueprint(api_bp)
@@ -406,6 +432,7 @@ def create_app(config_name=None):
     from app.routes.auth_routes import auth_bp
 
     app.register_blueprint(auth_bp)
+    startup.mark("blueprints")
 
     # Create PostgreSQL connection pool and create tables
     app.pg_pool = None
@@ -464,6 +491,7 @@ def create_app(config_name=None):
 
     swagger = Swagger(app, config=swagger_config)
     app.swagger = swagger  # Store reference to avoid unused variable warning
+    startup.mark("postgres and swagger")
 
     # safe_url_for is registered as a template global in app/views.py via
     # @main_bp.app_template_global(). No need to duplicate here.
@@ -596,6 +624,37 @@ def create_app(config_name=None):
             # Defensive: avoid breaking request processing if logging fails
             app.logger.debug("Per-request BaseX status logging skipped (init failure)")
 
+    # Per-request BaseX profile: Server-Timing header and an N+1 warning
+    from app.database.query_profiler import get_query_profiler
+
+    query_profiler = get_query_profiler()
+    query_profiler.slow_query_ms = app.config.get("BASEX_SLOW_QUERY_MS", query_profiler.SLOW_QUERY_MS)
+
+    @app.after_request
+    def add_basex_server_timing(response):
+        try:
+            summary = query_profiler.request_summary()
+            if summary is None:
+                return response
+            if app.config.get("SERVER_TIMING_ENABLED", True):
+                timing = (
+                    f'basex;dur={summary["db_ms"]:.1f};desc="{summary["queries"]} queries, '
+                    f'{summary["updates"]} updates, {summary["bytes"]} bytes", '
+                    f'basex-pool;dur={summary["pool_wait_ms"]:.1f}'
+                )
+                existing = response.headers.get("Server-Timing")
+                response.headers["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+            repeated = summary["most_repeated"]
+            if repeated["count"] >= query_profiler.REPEATED_QUERY_WARNING:
+                app.logger.warning(
+                    "Request %s %s ran one BaseX query shape %d times (fingerprint %s, %d queries, %.1f ms)",
+                    request.method, request.path, repeated["count"], repeated["fingerprint"],
+                    summary["queries"], summary["db_ms"],
+                )
+        except Exception:
+            app.logger.debug("BaseX request profile skipped", exc_info=True)
+        return response
+
     # In testing mode, log redirects to help triage UI auth/redirect issues
     # (This includes E2E mode)
     is_testing = app.config.get("TESTING") or app.config.get("E2E_TESTING")
@@ -899,9 +958,8 @@ def create_app(config_name=None):
         )
 
         # Initialize and bind EventBus for service coordination
-        from app.services.event_bus import EventBus
+        from app.services.event_bus import EventBus, event_bus
 
-        event_bus = EventBus()
         binder.bind(EventBus, to=event_bus, scope=singleton)
 
         # Initialize and bind AI Service
@@ -952,6 +1010,8 @@ def create_app(config_name=None):
     def inject_first_run_flag():
         return {"FIRST_RUN_SETUP": app.config.get("FIRST_RUN_SETUP", False)}
 
+    startup.mark("request hooks")
+
     # Create and attach injector
     injector = Injector()
     injector.binder.install(configure_dependencies)
@@ -966,6 +1026,7 @@ def create_app(config_name=None):
     app.cache_service = injector.get(CacheService)
     app.merge_split_service = injector.get(MergeSplitService)
     app.validation_rules_service = injector.get(ValidationRulesService)
+    startup.mark("services")
 
     # Initialize Lucene corpus client
     from app.services.lucene_corpus_client import LuceneCorpusClient
@@ -974,6 +1035,13 @@ def create_app(config_name=None):
         base_url=app.config.get("LUCENE_CORPUS_URL", "http://localhost:8082")
     )
 
+    # Load the embedding model off the startup path so the first semantic
+    # query does not pay for it
+    if app.config.get("EMBEDDING_WARMUP"):
+        from app.services.encoding_service import warm_up_in_background
+
+        warm_up_in_background(app)
+
     # Authentication gate. Installed here, after every blueprint is registered, so
     # it covers the whole URL map. REQUIRE_AUTH is what turns it on; see
     # app/auth_gate.py and specs/auth_overhaul/tasks.md (3.4) for the rollout.
@@ -1012,4 +1080,12 @@ def create_app(config_name=None):
             f"({result['values_imported']} values) from {file_path}"
         )
 
+    startup.mark("auth and cli")
+    app.startup_profile = startup.report()
+    budget_ms = app.config.get("STARTUP_BUDGET_MS") or 0
+    if budget_ms and startup.total_ms > budget_ms:
+        app.logger.warning("App startup took %s, over the %d ms budget", startup.format(), budget_ms)
+    else:
+        app.logger.info("App startup took %s", startup.format())
+
     return app
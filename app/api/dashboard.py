@@ -14,8 +14,10 @@ from flasgger import swag_from
 
 from app.services.dictionary_service import DictionaryService
 from app.services.cache_service import CacheService
+from app.database.query_profiler import get_query_profiler
 from app.models.dismissed_duplicate import DismissedDuplicate
 from app.models.workset_models import db
+from app.utils.auth_decorators import admin_required
 from app.utils.exceptions import JobCancelled
 
 # Create blueprint
@@ -52,6 +54,7 @@ def _write_job(job_id: str, data: dict) -> None:
 
 # Unified cache key for dashboard stats
 DASHBOARD_CACHE_KEY = 'dashboard_stats_v2'
+POS_COHERENCE_CACHE_KEY = 'dashboard_pos_coherence'
 OLD_CACHE_KEYS = ['dashboard_stats', 'dashboard_stats_api']
 
 
@@ -117,64 +120,45 @@ def get_dashboard_stats():
               description: Error message
     """
     try:
-        # Try to get cached data first (new key, then old keys for migration)
         cache = CacheService()
-        cache_key = DASHBOARD_CACHE_KEY
-        if cache.is_available():
-            cached_data = cache.get(cache_key)
-            # Try old keys for cache migration
-            if not cached_data:
-                for old_key in OLD_CACHE_KEYS:
-                    cached_data = cache.get(old_key)
-                    if cached_data:
-                        # Migrate to new key
-                        cache.set(cache_key, cached_data, ttl=300)
-                        logger.info("Migrated dashboard cache from '%s' to '%s'", old_key, cache_key)
-                        break
-            if cached_data:
-                logger.info("Returning cached dashboard stats from API")
-                return jsonify({
-                    'success': True,
-                    'data': cached_data,
-                    'cached': True
-                })
-        
-        # Get fresh data from database
-        dict_service = current_app.injector.get(DictionaryService)
-        
-        # Get entry count
-        entry_count = dict_service.count_entries()
-        
-        # Get sense and example counts
-        sense_count, example_count = dict_service.count_senses_and_examples()
-        
-        # Get recent activity
-        recent_activity = dict_service.get_recent_activity(limit=5)
-        
-        # Get system status
-        system_status = dict_service.get_system_status()
-        
-        # Prepare response data
-        stats_data = {
-            'stats': {
-                'entries': entry_count,
-                'senses': sense_count,
-                'examples': example_count
-            },
-            'system_status': system_status,
-            'recent_activity': recent_activity,
-            'last_updated': datetime.now().isoformat()
-        }
-        
-        # Cache the data for 5 minutes (300 seconds) - shorter than view cache
-        if cache.is_available():
-            cache.set(cache_key, stats_data, ttl=300)
-            logger.info("Cached dashboard stats via API for 5 minutes")
-        
+        computed = []
+
+        def build_stats_data():
+            # Reuse data cached under an old key (migrated to the new key by get_or_set)
+            for old_key in OLD_CACHE_KEYS:
+                old_data = cache.get(old_key)
+                if old_data:
+                    logger.info("Migrated dashboard cache from '%s' to '%s'", old_key, DASHBOARD_CACHE_KEY)
+                    return old_data
+
+            computed.append(True)
+            dict_service = current_app.injector.get(DictionaryService)
+
+            # Get entry count
+            entry_count = dict_service.count_entries()
+
+            # Get sense and example counts
+            sense_count, example_count = dict_service.count_senses_and_examples()
+
+            return {
+                'stats': {
+                    'entries': entry_count,
+                    'senses': sense_count,
+                    'examples': example_count
+                },
+                'system_status': dict_service.get_system_status(),
+                'recent_activity': dict_service.get_recent_activity(limit=5),
+                'last_updated': datetime.now().isoformat()
+            }
+
+        # Cached for 5 minutes (shorter than the view cache); concurrent misses
+        # share one computation
+        stats_data = cache.get_or_set(DASHBOARD_CACHE_KEY, build_stats_data, ttl=300)
+
         return jsonify({
             'success': True,
             'data': stats_data,
-            'cached': False
+            'cached': not computed
         })
         
     except Exception as e:
@@ -301,118 +285,29 @@ def get_anomalies():
         description: Internal server error
     """
     try:
-        cache = CacheService()
-        cache_key = "dashboard:anomalies:v1"
-        if cache.is_available():
-            cached = cache.get(cache_key)
-            if cached and isinstance(cached, dict):
-                return jsonify(cached)
-
-        from app.services.import_converter import SHOEBOX_POS_MAP
         dict_service = current_app.injector.get(DictionaryService)
         project_id = request.args.get('project_id', type=int)
         if not project_id:
             from flask import session as _s
             project_id = _s.get('project_id')
 
-        has_ns = dict_service._detect_namespace_usage()
-        prologue = dict_service._query_builder.get_namespace_prologue(has_ns)
-        entry_path = dict_service._query_builder.get_element_path('entry', has_ns)
-        lu_path = dict_service._query_builder.get_element_path('lexical-unit', has_ns)
-        form_path = dict_service._query_builder.get_element_path('form', has_ns)
-        text_path = dict_service._query_builder.get_element_path('text', has_ns)
-        sense_path = dict_service._query_builder.get_element_path('sense', has_ns)
-        gi_path = dict_service._query_builder.get_element_path('grammatical-info', has_ns)
-        def_path = dict_service._query_builder.get_element_path('definition', has_ns)
-        gloss_path = dict_service._query_builder.get_element_path('gloss', has_ns)
-
-        db_name = dict_service.db_connector.database
-        C = f"collection('{db_name}')"
-
-        canonical_pos = set(SHOEBOX_POS_MAP.values())
-
-        anomalies = {
-            'non_canonical_pos': [],
-            'duplicate_headwords': [],
-            'missing_headwords': [],
-            'empty_senses': [],
-            'pos_coherence_mismatches': [],
-        }
+        # Structural checks come precomputed from the dictionary statistics store
+        anomalies = dict_service.get_structural_anomalies(project_id=project_id)
+        anomalies['pos_coherence_mismatches'] = []
 
-        # Unified single-pass XQuery to fetch entry, headword, POS, sense ID, and definition text
-        unified_q = (
-            f"{prologue} "
-            f"for $e in {C}//{entry_path} "
-            f"let $eid := string($e/@id) "
-            f"let $hw := normalize-space(($e/{lu_path}/{form_path}/{text_path}/string(), '')[1]) "
-            f"for $s in $e//{sense_path} "
-            f"let $sid := string(($s/@id, '')[1]) "
-            f"let $gi := string(($s/{gi_path}/@value/string(), $e/{gi_path}/@value/string())[1]) "
-            f"let $dtext := string-join(($s/{def_path}//{text_path}/string(), $s/{gloss_path}//{text_path}/string()), ' ') "
-            f"return concat($eid, '|||', $hw, '|||', $gi, '|||', $sid, '|||', normalize-space($dtext))"
-        )
-        raw = dict_service.db_connector.execute_query(unified_q)
-
-        seen_noncanon: set = set()
-        hw_map: dict[str, set[str]] = {}
-        missing_hw_entries: set[str] = set()
-        ml_data: list[tuple[str, str, str, str]] = []
-
-        for line in (raw or "").strip().split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            parts = line.split("|||")
-            if len(parts) < 5:
-                continue
-            eid, hw, gi, sid, dtext = parts[0], parts[1], parts[2], parts[3], parts[4]
-
-            # 1. Non-canonical POS
-            if gi and gi not in canonical_pos:
-                key = (eid, gi)
-                if key not in seen_noncanon:
-                    seen_noncanon.add(key)
-                    suggested = SHOEBOX_POS_MAP.get(gi.lower())
-                    anomalies['non_canonical_pos'].append({
-                        'entry_id': eid,
-                        'pos_value': gi,
-                        'suggested': suggested,
-                    })
-
-            # 2. Missing headwords
-            if not hw:
-                missing_hw_entries.add(eid)
-            else:
-                hw_map.setdefault(hw, set()).add(eid)
-
-            # 4. Empty senses
-            if not dtext:
-                anomalies['empty_senses'].append({'entry_id': eid, 'sense_id': sid})
-
-            # Data for ML POS Coherence model
-            if gi and dtext:
-                norm_p = SHOEBOX_POS_MAP.get(gi.lower(), gi)
-                ml_data.append((eid, hw, norm_p, dtext))
-
-        # 2. Missing headwords list
-        for eid in missing_hw_entries:
-            anomalies['missing_headwords'].append({'entry_id': eid})
-
-        # 3. Duplicate headwords list
-        for hw, ids in hw_map.items():
-            if len(ids) > 1:
-                anomalies['duplicate_headwords'].append({
-                    'headword': hw,
-                    'entry_ids': list(ids),
-                    'count': len(ids),
-                })
-
-        # 5. ML POS-Definition Coherence Mismatches
+        # ML POS-Definition Coherence Mismatches: training the model reads the
+        # whole dictionary, so the result is cached, including an empty one
         try:
             from app.services.pos_coherence_service import get_pos_coherence_service
-            coherence_svc = get_pos_coherence_service()
-            anomalies['pos_coherence_mismatches'] = coherence_svc.detect_anomalies_from_data(
-                ml_data, min_confidence=0.80, limit=50
+
+            def detect_pos_mismatches():
+                return get_pos_coherence_service().detect_anomalies(
+                    dict_service, min_confidence=0.80, limit=50
+                )
+
+            cache_key = f"{POS_COHERENCE_CACHE_KEY}:{dict_service.db_connector.database or 'default'}"
+            anomalies['pos_coherence_mismatches'] = CacheService().get_or_set(
+                cache_key, detect_pos_mismatches, ttl=3600
             )
         except Exception as e:
             logger.warning("Anomaly check (POS coherence) failed: %s", e)
@@ -425,16 +320,12 @@ def get_anomalies():
             'pos_coherence_mismatch_count': len(anomalies['pos_coherence_mismatches']),
         }
 
-        payload = {
+        return jsonify({
             'success': True,
             'summary': summary,
             'anomalies': anomalies,
             'timestamp': datetime.now().isoformat(),
-        }
-        if cache.is_available():
-            cache.set(cache_key, payload, ttl=300)
-
-        return jsonify(payload)
+        })
 
     except Exception as e:
         logger.error(f"Error detecting anomalies: {e}", exc_info=True)
@@ -472,12 +363,21 @@ def get_anomalies():
 def clear_dashboard_cache():
     """
     Clear the dashboard statistics cache.
+
+    Materialized dictionary statistics are not dropped; a background
+    reconciliation against BaseX is started instead.
     """
     try:
+        try:
+            current_app.injector.get(DictionaryService).get_stats_store().reconcile_async()
+        except Exception as e:
+            logger.warning("Could not schedule dictionary statistics reconciliation: %s", e)
+
         cache = CacheService()
         if cache.is_available():
             # Delete new key and all old keys for complete cache invalidation
             cache.delete(DASHBOARD_CACHE_KEY)
+            cache.clear_pattern(f"{POS_COHERENCE_CACHE_KEY}:*")
             for old_key in OLD_CACHE_KEYS:
                 cache.delete(old_key)
             logger.info("Dashboard stats cache cleared")
@@ -501,6 +401,108 @@ def clear_dashboard_cache():
         }), 500
 
 
+@dashboard_bp.route('/cache-stats', methods=['GET'])
+@swag_from({
+    'tags': ['Dashboard'],
+    'summary': 'Get cache statistics',
+    'description': 'Per-prefix hit ratios for the in-process (L1) and Redis (L2) cache tiers.',
+    'responses': {
+        200: {
+            'description': 'Cache statistics',
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'success': {'type': 'boolean', 'example': True},
+                    'data': {'type': 'object'}
+                }
+            }
+        },
+        500: {
+            'description': 'Error reading cache statistics'
+        }
+    }
+})
+def get_cache_stats():
+    """Return CacheService tier and per-prefix statistics."""
+    try:
+        return jsonify({'success': True, 'data': CacheService().get_stats()})
+    except Exception as e:
+        logger.error(f"Error reading cache stats: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@dashboard_bp.route('/query-stats', methods=['GET'])
+@admin_required
+@swag_from({
+    'tags': ['Dashboard'],
+    'summary': 'Get BaseX query profile',
+    'description': 'Slow-query log (newest first) and the most expensive query shapes since the last reset. '
+                   'Queries are grouped by fingerprint: the query with its literals replaced by "?".',
+    'parameters': [
+        {'name': 'limit', 'in': 'query', 'type': 'integer', 'default': 50,
+         'description': 'Maximum number of slow queries and query shapes to return'},
+        {'name': 'sort', 'in': 'query', 'type': 'string', 'enum': ['total_ms', 'count', 'max_ms'],
+         'default': 'total_ms', 'description': 'Order of the query shapes'}
+    ],
+    'responses': {
+        200: {
+            'description': 'Query profile',
+            'schema': {
+                'type': 'object',
+                'properties': {
+                    'success': {'type': 'boolean', 'example': True},
+                    'data': {
+                        'type': 'object',
+                        'properties': {
+                            'totals': {'type': 'object'},
+                            'slow_queries': {'type': 'array', 'items': {'type': 'object'}},
+                            'top_queries': {'type': 'array', 'items': {'type': 'object'}},
+                            'pool': {'type': 'object'}
+                        }
+                    }
+                }
+            }
+        },
+        403: {'description': 'Admin rights required'}
+    }
+})
+def get_query_stats():
+    """Return the BaseX slow-query log and per-fingerprint totals."""
+    limit = request.args.get('limit', 50, type=int)
+    sort = request.args.get('sort', 'total_ms')
+    if sort not in ('total_ms', 'count', 'max_ms'):
+        return jsonify({'success': False, 'error': f'Invalid sort: {sort}'}), 400
+    profiler = get_query_profiler()
+    data = {
+        'totals': profiler.get_stats(),
+        'slow_queries': profiler.slow_queries(limit),
+        'top_queries': profiler.top_fingerprints(limit, sort=sort),
+    }
+    try:
+        from app.database.basex_connector import BaseXConnector
+        data['pool'] = current_app.injector.get(BaseXConnector).get_pool_metrics()
+    except Exception:
+        data['pool'] = None
+    return jsonify({'success': True, 'data': data})
+
+
+@dashboard_bp.route('/query-stats', methods=['DELETE'])
+@admin_required
+@swag_from({
+    'tags': ['Dashboard'],
+    'summary': 'Reset BaseX query profile',
+    'description': 'Clear the slow-query log and per-fingerprint totals.',
+    'responses': {
+        200: {'description': 'Profile cleared'},
+        403: {'description': 'Admin rights required'}
+    }
+})
+def clear_query_stats():
+    """Clear the BaseX slow-query log and per-fingerprint totals."""
+    get_query_profiler().clear()
+    return jsonify({'success': True})
+
+
 @dashboard_bp.route('/duplicates/count', methods=['GET'])
 def get_duplicate_entry_count():
     """Quick count of non-variant entries for progress estimation."""
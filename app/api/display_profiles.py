@@ -15,6 +15,7 @@ from typing import Dict, Any
 
 from app.models.workset_models import db
 from app.utils.db_utils import safe_commit
+from app.services.cache_service import CacheService
 from app.services.display_profile_service import DisplayProfileService
 from app.services.lift_element_registry import LIFTElementRegistry
 from app.utils.api_response_handler import api_response_handler, get_service
@@ -515,120 +516,104 @@ def preview_profile_impl(data):
         }
         cache_key = f"preview:{hashlib.sha256(json.dumps(cache_data, sort_keys=True).encode()).hexdigest()}"
 
-        cache_service = None
-        # Try to get cached result
-        try:
-            cache_service = current_app.injector.get('cache_service')
-            if hasattr(cache_service, 'get') and cache_service.is_available():
-                cached_result = cache_service.get(cache_key)
-                if cached_result:
-                    current_app.logger.debug(f"Preview cache hit: {cache_key[:16]}...")
-                    return jsonify(cached_result), 200
-        except Exception as e:
-            current_app.logger.debug(f"Preview cache unavailable: {e}")
-
-        # Create a temporary profile object (not saved to database)
-        temp_profile = DisplayProfile(
-            id=0,
-            name="Preview",
-            description="Temporary preview profile",
-            custom_css=data.get('custom_css', ''),
-            show_subentries=data.get('show_subentries', False),
-            number_senses=data.get('number_senses', True),
-            is_default=False,
-            is_system=False
-        )
-
-        # Add elements to temporary profile
-        temp_profile.elements = []
-        for elem_config in data.get('elements', []):
-            elem = ProfileElement(
-                profile_id=0,
-                lift_element=elem_config.get('lift_element', ''),
-                css_class=elem_config.get('css_class', ''),
-                visibility=elem_config.get('visibility', 'if-content'),
-                display_order=elem_config.get('display_order', 0),
-                language_filter=elem_config.get('language_filter', '*'),
-                prefix=elem_config.get('prefix', ''),
-                suffix=elem_config.get('suffix', ''),
-                config=elem_config.get('config')
+        def render_preview():
+            # Create a temporary profile object (not saved to database)
+            temp_profile = DisplayProfile(
+                id=0,
+                name="Preview",
+                description="Temporary preview profile",
+                custom_css=data.get('custom_css', ''),
+                show_subentries=data.get('show_subentries', False),
+                number_senses=data.get('number_senses', True),
+                is_default=False,
+                is_system=False
             )
-            temp_profile.elements.append(elem)
 
-        # Get a sample entry or specified entry
-        dict_service = None
-        try:
-            dict_service = current_app.injector.get(DictionaryService)
-        except Exception:
+            # Add elements to temporary profile
+            temp_profile.elements = []
+            for elem_config in data.get('elements', []):
+                elem = ProfileElement(
+                    profile_id=0,
+                    lift_element=elem_config.get('lift_element', ''),
+                    css_class=elem_config.get('css_class', ''),
+                    visibility=elem_config.get('visibility', 'if-content'),
+                    display_order=elem_config.get('display_order', 0),
+                    language_filter=elem_config.get('language_filter', '*'),
+                    prefix=elem_config.get('prefix', ''),
+                    suffix=elem_config.get('suffix', ''),
+                    config=elem_config.get('config')
+                )
+                temp_profile.elements.append(elem)
+
+            # Get a sample entry or specified entry
             dict_service = None
-
-        entry_id = data.get('entry_id')
-        if entry_id is not None:
-            entry_id = str(entry_id).strip() or None
-            # entry_id flows into build_entry_by_id_query, which escapes it for
-            # XQuery (quotes doubled) — any id is accepted safely, including
-            # space-containing GUIDs; nothing to whitelist here.
-        entry_xml = None
-
-        if dict_service and hasattr(dict_service, 'db_connector') and dict_service.db_connector:
             try:
-                if not entry_id:
-                    query = """
-                        for $entry in collection('dictionary')//entry
-                        where not(contains($entry/@id, 'test'))
-                          and $entry/sense
-                          and count($entry/sense) <= 3
-                        order by string-length(serialize($entry))
-                        return $entry
-                    """
-                    result = dict_service.db_connector.execute_query(query)
-                    if result and '<entry' in result:
-                        import re
-                        match = re.search(r'<entry[^>]*>.*?</entry>', result, re.DOTALL)
-                        entry_xml = match.group(0) if match else result
+                dict_service = current_app.injector.get(DictionaryService)
+            except Exception:
+                dict_service = None
+
+            entry_id = data.get('entry_id')
+            if entry_id is not None:
+                entry_id = str(entry_id).strip() or None
+                # entry_id flows into build_entry_by_id_query, which escapes it for
+                # XQuery (quotes doubled) — any id is accepted safely, including
+                # space-containing GUIDs; nothing to whitelist here.
+            entry_xml = None
+
+            if dict_service and hasattr(dict_service, 'db_connector') and dict_service.db_connector:
+                try:
+                    if not entry_id:
+                        query = """
+                            for $entry in collection('dictionary')//entry
+                            where not(contains($entry/@id, 'test'))
+                              and $entry/sense
+                              and count($entry/sense) <= 3
+                            order by string-length(serialize($entry))
+                            return $entry
+                        """
+                        result = dict_service.db_connector.execute_query(query)
+                        if result and '<entry' in result:
+                            import re
+                            match = re.search(r'<entry[^>]*>.*?</entry>', result, re.DOTALL)
+                            entry_xml = match.group(0) if match else result
+                        else:
+                            entry_xml = result
                     else:
-                        entry_xml = result
-                else:
-                    db_name = getattr(dict_service.db_connector, 'database', 'dictionary')
-                    has_ns = dict_service._detect_namespace_usage() if hasattr(dict_service, '_detect_namespace_usage') else False
-                    query = dict_service._query_builder.build_entry_by_id_query(entry_id, db_name, has_ns)
-                    entry_xml = dict_service.db_connector.execute_query(query)
-            except Exception as e:
-                current_app.logger.debug(f"Preview DB query failed, using fallback sample: {e}")
-
-        # Fallback sample entry if DB query returned nothing or connector unavailable
-        if not entry_xml or not isinstance(entry_xml, str) or not entry_xml.strip():
-            entry_xml = (
-                '<entry id="sample-preview">'
-                '  <lexical-unit><form lang="en"><text>example</text></form></lexical-unit>'
-                '  <pronunciation><form lang="seh-fonipa"><text>ɪɡˈzæmpəl</text></form></pronunciation>'
-                '  <sense id="s1">'
-                '    <grammatical-info value="noun"/>'
-                '    <definition><form lang="en"><text>A representative form or pattern</text></form></definition>'
-                '    <example><form lang="en"><text>This is a sample sentence.</text></form></example>'
-                '  </sense>'
-                '</entry>'
-            )
-
-
-        # Ensure entry_xml is wrapped in a root element if it's not already valid XML
-        # BaseX might return just the entry element without a root wrapper
-        if not entry_xml.strip().startswith('<?xml'):
-            # Wrap in a temporary root to ensure valid XML parsing
-            entry_xml = f'<root>{entry_xml}</root>'
-
-        # Render with CSS mapping service
-        css_service = CSSMappingService()
-        html = css_service.render_entry(entry_xml, temp_profile, dict_service=dict_service)
-
-        # Cache the result
-        result_data = {"html": html}
-        try:
-            if cache_service is not None and cache_service.is_available():
-                cache_service.set(cache_key, result_data, ttl=300)  # 5 minute TTL for preview
-                current_app.logger.debug(f"Cached preview result: {cache_key[:16]}...")
-        except Exception as e:
-            current_app.logger.debug(f"Failed to cache preview: {e}")
+                        db_name = getattr(dict_service.db_connector, 'database', 'dictionary')
+                        has_ns = dict_service._detect_namespace_usage() if hasattr(dict_service, '_detect_namespace_usage') else False
+                        query = dict_service._query_builder.build_entry_by_id_query(entry_id, db_name, has_ns)
+                        entry_xml = dict_service.db_connector.execute_query(query)
+                except Exception as e:
+                    current_app.logger.debug(f"Preview DB query failed, using fallback sample: {e}")
+
+            # Fallback sample entry if DB query returned nothing or connector unavailable
+            if not entry_xml or not isinstance(entry_xml, str) or not entry_xml.strip():
+                entry_xml = (
+                    '<entry id="sample-preview">'
+                    '  <lexical-unit><form lang="en"><text>example</text></form></lexical-unit>'
+                    '  <pronunciation><form lang="seh-fonipa"><text>ɪɡˈzæmpəl</text></form></pronunciation>'
+                    '  <sense id="s1">'
+                    '    <grammatical-info value="noun"/>'
+                    '    <definition><form lang="en"><text>A representative form or pattern</text></form></definition>'
+                    '    <example><form lang="en"><text>This is a sample sentence.</text></form></example>'
+                    '  </sense>'
+                    '</entry>'
+                )
+
+
+            # Ensure entry_xml is wrapped in a root element if it's not already valid XML
+            # BaseX might return just the entry element without a root wrapper
+            if not entry_xml.strip().startswith('<?xml'):
+                # Wrap in a temporary root to ensure valid XML parsing
+                entry_xml = f'<root>{entry_xml}</root>'
+
+            # Render with CSS mapping service
+            css_service = CSSMappingService()
+            html = css_service.render_entry(entry_xml, temp_profile, dict_service=dict_service)
+            return {"html": html}
+
+        # 5 minute TTL for preview; concurrent identical previews render once
+        result_data = CacheService().get_or_set(cache_key, render_preview, ttl=300)
 
         return jsonify(result_data), 200
 
@@ -78,21 +78,15 @@ def _record_undo_operation(
         )
 
 
-def _entries_cache_version(cache: CacheService, db_name: str) -> str:
-    """Return the current cache version for the given database, defaulting to '1'."""
-    version = cache.get(f"entries:version:{db_name}")
-    return str(version) if version is not None else "1"
-
-
-def _entries_cache_key(db_name: str, version: str, limit: int, offset: int, sort_by: str, sort_order: str, filter_text: str) -> str:
-    """Build a versioned entries cache key so we can invalidate by bumping the version."""
-    return f"entries:v2_{version}:{db_name}:{limit}:{offset}:{sort_by}:{sort_order}:{filter_text}"
+def _entries_cache_key(cache: CacheService, db_name: str, limit: int, offset: int, sort_by: str, sort_order: str, filter_text: str) -> str:
+    """Build an entries cache key in the current version of the database's namespace."""
+    return cache.versioned_key('entries', db_name, limit, offset, sort_by, sort_order, filter_text)
 
 
 def _invalidate_entries_cache(cache: CacheService, db_name: str) -> None:
-    """Invalidate entries cache by bumping the per-database version counter."""
+    """Invalidate entries cache by bumping the per-database namespace version."""
     if cache.is_available():
-        cache.increment(f"entries:version:{db_name}", 1, ttl=86400)
+        cache.bump_namespace('entries', db_name)
 
 
 @entries_bp.route("/", methods=["GET"], strict_slashes=False)
@@ -195,58 +189,50 @@ def list_entries() -> Any:
             limit = limit if limit is not None else 100
             offset = offset if offset is not None else 0
 
-        # Cache miss - query dictionary service
         dict_service = get_dictionary_service()
 
-        # Redis cache key - include DB name to prevent cross-project collisions
+        # Cache key - include DB name to prevent cross-project collisions
         db_name = dict_service.db_connector.database or 'default'
         cache = CacheService()
-        version = _entries_cache_version(cache, db_name)
-        cache_key = _entries_cache_key(db_name, version, limit, offset, sort_by, sort_order, filter_text)
-        if cache.is_available():
-            cached = cache.get(cache_key)
-            if cached:
-                logger.info(f"Returning cached entries for key: {cache_key}")
-                return jsonify(json.loads(cached))
-
-        entries, total_count = dict_service.list_entries(
-            limit=limit,
-            offset=offset,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            filter_text=filter_text,
-        )
-
-        # Prepare response entries
-        response_entries = []
-        for i, entry in enumerate(entries):
-            try:
-                response_entries.append(entry.to_display_dict())
-            except AttributeError as e:
-                logger.error(
-                    f"Entry at index {i} has wrong type: {type(entry)}. Error: {e}"
-                )
-                raise e
-
-        curr_limit = limit if limit > 0 else 50
-        curr_page = (offset // curr_limit) + 1
-        total_pages = (total_count + curr_limit - 1) // curr_limit if curr_limit > 0 else 1
+        cache_key = _entries_cache_key(cache, db_name, limit, offset, sort_by, sort_order, filter_text)
+
+        def build_response() -> Dict[str, Any]:
+            entries, total_count = dict_service.list_entries(
+                limit=limit,
+                offset=offset,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                filter_text=filter_text,
+            )
 
-        response = {
-            "entries": response_entries,
-            "total_count": total_count,
-            "total": total_count,
-            "limit": curr_limit,
-            "offset": offset,
-            "page": curr_page,
-            "per_page": curr_limit,
-            "pages": total_pages,
-        }
+            # Prepare response entries
+            response_entries = []
+            for i, entry in enumerate(entries):
+                try:
+                    response_entries.append(entry.to_display_dict())
+                except AttributeError as e:
+                    logger.error(
+                        f"Entry at index {i} has wrong type: {type(entry)}. Error: {e}"
+                    )
+                    raise e
+
+            curr_limit = limit if limit > 0 else 50
+            curr_page = (offset // curr_limit) + 1
+            total_pages = (total_count + curr_limit - 1) // curr_limit if curr_limit > 0 else 1
+
+            return {
+                "entries": response_entries,
+                "total_count": total_count,
+                "total": total_count,
+                "limit": curr_limit,
+                "offset": offset,
+                "page": curr_page,
+                "per_page": curr_limit,
+                "pages": total_pages,
+            }
 
-        # Cache the response for 3 minutes
-        if cache.is_available():
-            cache.set(cache_key, json.dumps(response), ttl=180)
-            logger.info(f"Cached entries response for key: {cache_key}")
+        # Cache the response for 3 minutes; concurrent misses share one query
+        response = cache.get_or_set(cache_key, build_response, ttl=180)
 
         return jsonify(response)
 
@@ -461,8 +447,7 @@ def create_entry() -> Any:
         # Invalidate entries cache (version bump, not pattern delete — avoids stampede)
         cache = CacheService()
         if cache.is_available():
-            db_name = dict_service.db_connector.database or 'default'
-            cache.increment(f"entries:version:{db_name}", 1, ttl=86400)
+            _invalidate_entries_cache(cache, dict_service.db_connector.database or 'default')
             logger.info(f"Invalidated entries cache (version bump) after creating entry {entry_id}")
 
         # Return response
@@ -740,8 +725,7 @@ def update_entry(entry_id: str) -> Any:
         # Invalidate entries cache (version bump — avoids stampede)
         cache = CacheService()
         if cache.is_available():
-            db_name = dict_service.db_connector.database or 'default'
-            cache.increment(f"entries:version:{db_name}", 1, ttl=86400)
+            _invalidate_entries_cache(cache, dict_service.db_connector.database or 'default')
             logger.info(f"Invalidated entries cache (version bump) after updating entry {entry_id}")
 
         # Invalidate validation cache for this entry
@@ -823,8 +807,7 @@ def delete_entry(entry_id: str) -> Any:
         try:
             cache = CacheService()
             if cache.is_available():
-                db_name = dict_service.db_connector.database or 'default'
-                cache.increment(f"entries:version:{db_name}", 1, ttl=86400)
+                _invalidate_entries_cache(cache, dict_service.db_connector.database or 'default')
         except Exception as ce:
             logger.warning(f"Cache invalidation error: {ce}")
         try:
@@ -861,10 +844,8 @@ def delete_entry(entry_id: str) -> Any:
 
     # Clean up orphaned revision records (entry exists only in revision table)
     try:
-        from app.models.entry_revision import EntryRevision
-        from app.models.workset_models import db
-        deleted = EntryRevision.query.filter_by(entry_id=entry_id).delete()
-        db.session.commit()
+        from app.services.entry_revision_service import EntryRevisionService
+        deleted = EntryRevisionService.delete_revisions(entry_id)
         if deleted:
             logger.info(f"Cleaned up {deleted} orphan revision(s) for {entry_id}")
             return jsonify({"success": True, "note": "orphan revisions cleaned"})
@@ -962,7 +943,7 @@ def clear_entries_cache() -> Any:
     try:
         cache = CacheService()
         if cache.is_available():
-            cache.clear_pattern("entries:*")
+            _invalidate_entries_cache(cache, get_dictionary_service().db_connector.database or 'default')
             logger.info("Entries cache cleared")
             return jsonify(
                 {"status": "success", "message": "Entries cache cleared."}
@@ -20,6 +20,7 @@ pronunciation_bp = Blueprint('pronunciation', __name__, url_prefix='/api/pronunc
 # Audio file configuration
 ALLOWED_EXTENSIONS = {'mp3', 'wav', 'ogg', 'opus', 'm4a'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+MAX_DRAFT_BATCH = 500  # headwords per /draft/batch request
 
 
 def allowed_file(filename: str) -> bool:
@@ -569,6 +570,66 @@ def draft_ipa():
     )
 
 
+@pronunciation_bp.route("/draft/batch", methods=["POST"])
+@_require_auth("pronunciation:read")
+def draft_ipa_batch():
+    """Draft IPA pronunciations for many headwords in batched model calls.
+
+    Expects JSON body::
+
+        {"headwords": ["cat", "dog"], "writing_system": "seh-fonipa", "num_candidates": 1}
+
+    Returns::
+
+        {"available": true, "writing_system": "...",
+         "drafts": [{"headword": "cat", "candidates": ["ˈkæt"]}, ...]}
+
+    At most ``MAX_DRAFT_BATCH`` headwords per request.
+    """
+    data = request.get_json(silent=True) or {}
+    headwords = data.get("headwords")
+    if not isinstance(headwords, list) or not headwords:
+        return jsonify({"error": "Request body must contain a non-empty 'headwords' list"}), 400
+    if len(headwords) > MAX_DRAFT_BATCH:
+        return jsonify({"error": f"At most {MAX_DRAFT_BATCH} headwords per request"}), 400
+    headwords = [str(h or "").strip() for h in headwords]
+
+    ws = data.get("writing_system") or "seh-fonipa"
+    try:
+        num_candidates = int(data.get("num_candidates", 1) or 1)
+    except (TypeError, ValueError):
+        num_candidates = 1
+    num_candidates = max(1, min(num_candidates, 5))
+
+    from app.services.ipa_byt5_service import IPAByT5Service
+
+    svc = IPAByT5Service.get_instance(ipa_ws=ws)
+    if not svc.is_available():
+        return jsonify(
+            {
+                "available": False,
+                "writing_system": ws,
+                "drafts": [],
+                "message": "No ByT5 IPA model is deployed for this writing system.",
+            }
+        ), 200
+
+    drafts = svc.draft_ipa_batch(headwords, num_return_sequences=num_candidates)
+    return (
+        jsonify(
+            {
+                "available": True,
+                "writing_system": ws,
+                "drafts": [
+                    {"headword": headword, "candidates": candidates}
+                    for headword, candidates in zip(headwords, drafts)
+                ],
+            }
+        ),
+        200,
+    )
+
+
 @pronunciation_bp.route("/deduplicate/apply", methods=["POST"])
 @_require_auth("pronunciation:write")
 def apply_deduplication():
@@ -3,15 +3,45 @@ API endpoints for entry and dictionary validation.
 """
 
 import json
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Dict
 
 from flask import Blueprint, jsonify, request, current_app
 from flasgger import swag_from
 from app.models.entry import Entry
 from app.services.dictionary_service import DictionaryService
+from app.utils.auth_decorators import admin_required
 from app.utils.exceptions import NotFoundError, ValidationError
 
+logger = logging.getLogger(__name__)
+
 validation_bp = Blueprint('validation_bp', __name__)
 
+# In-memory progress of background whole-dictionary validation runs; finished
+# runs are kept for JOB_RETENTION_SECONDS so their report can still be polled
+_validation_jobs: Dict[str, Dict[str, Any]] = {}
+_jobs_lock = threading.Lock()
+_job_finished_at: Dict[str, float] = {}
+JOB_RETENTION_SECONDS = 3600
+_FINISHED_STATUSES = ('completed', 'cancelled', 'failed')
+
+
+def _update_job(job_id: str, data: Dict[str, Any]):
+    with _jobs_lock:
+        now = time.monotonic()
+        for old_id, finished_at in list(_job_finished_at.items()):
+            if now - finished_at > JOB_RETENTION_SECONDS:
+                _validation_jobs.pop(old_id, None)
+                del _job_finished_at[old_id]
+        if job_id not in _validation_jobs:
+            _validation_jobs[job_id] = {}
+        _validation_jobs[job_id].update(data)
+        if data.get('status') in _FINISHED_STATUSES:
+            _job_finished_at[job_id] = now
+
 @validation_bp.route('/api/validation/entry/<string:entry_id>', methods=['GET'])
 @swag_from({
     'tags': ['Validation'],
@@ -401,6 +431,154 @@ def validate_batch():
         return jsonify({'valid': False, 'errors': [f'Batch validation error: {str(e)}'], 'total_entries': 0, 'valid_entries': 0, 'invalid_entries': 0, 'results': []}), 200
 
 
+@validation_bp.route('/api/validation/dictionary/run', methods=['POST'])
+@admin_required
+@swag_from({
+    'tags': ['Validation'],
+    'summary': 'Start a background validation run over the whole dictionary',
+    'description': 'Only entries whose dateModified changed, and rules whose definition changed, '
+                   'are revalidated unless "full" is set. Results are stored per entry.',
+    'parameters': [{
+        'name': 'body', 'in': 'body', 'required': False,
+        'schema': {'type': 'object', 'properties': {
+            'full': {'type': 'boolean'},
+            'workers': {'type': 'integer'},
+            'project_id': {'type': 'string'},
+            'validation_mode': {'type': 'string', 'enum': ['save', 'delete', 'draft', 'all']},
+        }},
+    }],
+    'responses': {'202': {'description': 'Run started; poll the returned job_id.'},
+                  '409': {'description': 'A run is already in progress for this database.'}}
+})
+def start_dictionary_validation():
+    """Start a whole-dictionary validation run in the background (one at a time per database)."""
+    from app.models.validation_cache_models import ValidationRunLock
+    from app.services.dictionary_validation_runner import DictionaryValidationRunner
+
+    data = request.get_json(silent=True) or {}
+    workers = data.get('workers')
+    if workers is not None:
+        try:
+            workers = max(1, min(DictionaryValidationRunner.MAX_WORKERS, int(workers)))
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'error': 'workers must be an integer'}), 400
+    dictionary_service = current_app.injector.get(DictionaryService)
+    db_name = dictionary_service.db_connector.database
+    job_id = str(uuid.uuid4())
+    active_job = ValidationRunLock.acquire(db_name, job_id)
+    if active_job is not None:
+        return jsonify({'success': False, 'error': 'A validation run is already in progress',
+                        'job_id': active_job}), 409
+    _update_job(job_id, {
+        'job_id': job_id,
+        'status': 'queued',
+        'processed': 0,
+        'total': 0,
+        'message': 'Queued validation run...',
+        'error': None,
+    })
+
+    app_obj = current_app._get_current_object()
+
+    def _run_validation():
+        with app_obj.app_context():
+            try:
+                _update_job(job_id, {'status': 'running', 'message': 'Loading entry index...'})
+
+                def _progress_cb(processed: int, total: int, message: str):
+                    _update_job(job_id, {'processed': processed, 'total': total, 'message': message})
+                    ValidationRunLock.heartbeat(db_name, job_id)
+
+                runner = DictionaryValidationRunner(dictionary_service)
+                report = runner.run(
+                    db_name=db_name,
+                    project_id=data.get('project_id'),
+                    full=bool(data.get('full', False)),
+                    workers=workers,
+                    validation_mode=data.get('validation_mode', 'save'),
+                    progress=_progress_cb,
+                    cancel_check=lambda: _validation_jobs.get(job_id, {}).get('cancelled', False),
+                )
+                _update_job(job_id, {
+                    'status': 'cancelled' if report['cancelled'] else 'completed',
+                    'message': 'Validation stopped by user.' if report['cancelled'] else 'Validation complete.',
+                    'result': report,
+                })
+            except Exception as e:
+                logger.error("Dictionary validation job %s failed: %s", job_id, e, exc_info=True)
+                _update_job(job_id, {'status': 'failed', 'error': str(e), 'message': f'Failed: {e}'})
+            finally:
+                try:
+                    ValidationRunLock.release(db_name, job_id)
+                except Exception as e:
+                    logger.error("Could not release the validation run lock of job %s: %s", job_id, e)
+
+    threading.Thread(target=_run_validation, daemon=True).start()
+    return jsonify({'success': True, 'job_id': job_id, 'message': 'Validation started'}), 202
+
+
+@validation_bp.route('/api/validation/dictionary/run/<job_id>', methods=['GET'])
+@swag_from({
+    'tags': ['Validation'],
+    'summary': 'Poll a whole-dictionary validation run',
+    'parameters': [{'name': 'job_id', 'in': 'path', 'type': 'string', 'required': True}],
+    'responses': {'200': {'description': 'Job progress and, when finished, the run report.'},
+                  '404': {'description': 'Job not found.'}}
+})
+def get_dictionary_validation_progress(job_id: str):
+    """Poll progress of a background validation run."""
+    with _jobs_lock:
+        job = _validation_jobs.get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, 'job': job})
+
+
+@validation_bp.route('/api/validation/dictionary/run/<job_id>/stop', methods=['POST'])
+@admin_required
+@swag_from({
+    'tags': ['Validation'],
+    'summary': 'Stop a whole-dictionary validation run after the current chunk',
+    'parameters': [{'name': 'job_id', 'in': 'path', 'type': 'string', 'required': True}],
+    'responses': {'200': {'description': 'Stop requested.'}, '404': {'description': 'Job not found.'}}
+})
+def stop_dictionary_validation(job_id: str):
+    """Stop a background validation run."""
+    with _jobs_lock:
+        job = _validation_jobs.get(job_id)
+        if not job:
+            return jsonify({'success': False, 'error': 'Job not found'}), 404
+        job['cancelled'] = True
+        job['message'] = 'Stopping validation run...'
+    return jsonify({'success': True, 'message': 'Stop request sent'})
+
+
+@validation_bp.route('/api/validation/dictionary/results', methods=['GET'])
+@swag_from({
+    'tags': ['Validation'],
+    'summary': 'Stored per-entry results of the last whole-dictionary validation runs',
+    'parameters': [
+        {'name': 'limit', 'in': 'query', 'type': 'integer', 'default': 100},
+        {'name': 'offset', 'in': 'query', 'type': 'integer', 'default': 0},
+    ],
+    'responses': {'200': {'description': 'Totals, issue counts by rule and entries with issues.'}}
+})
+def get_dictionary_validation_results():
+    """Summarise the stored validation results for the current database."""
+    from app.models.validation_cache_models import EntryValidationResult
+
+    try:
+        dictionary_service = current_app.injector.get(DictionaryService)
+        summary = EntryValidationResult.summary(
+            dictionary_service.db_connector.database,
+            limit=request.args.get('limit', 100, type=int),
+            offset=request.args.get('offset', 0, type=int),
+        )
+        return jsonify(summary), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+
 @validation_bp.route('/api/validation/schema', methods=['GET'])
 @swag_from({
     'tags': ['Validation'],
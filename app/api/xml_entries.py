@@ -57,6 +57,30 @@ def get_xml_entry_service() -> XMLEntryService:
 
 
 
+def _load_previous_entry(entry_id: str) -> Any:
+    """The stored entry before a write, or None (derived data is diffed against it)."""
+    try:
+        from app.services.dictionary_service import DictionaryService
+        return current_app.injector.get(DictionaryService).get_entry(entry_id)
+    except Exception:
+        return None
+
+
+def _after_entry_write(
+    xml_service: XMLEntryService, entry_id: str, entry_xml: Any = None,
+    previous_entry: Any = None, deleted: bool = False
+) -> None:
+    """Update indexes, statistics and cached renders and emit the entry event, as DictionaryService saves do."""
+    try:
+        from app.services.dictionary_service import DictionaryService
+        current_app.injector.get(DictionaryService).after_external_entry_write(
+            entry_id, previous_entry=previous_entry, entry_xml=entry_xml,
+            deleted=deleted, db_name=xml_service.database
+        )
+    except Exception as e:
+        logger.warning('[XML API] Derived data update failed for entry %s: %s', entry_id, e)
+
+
 @xml_entries_bp.route('/entries', methods=['POST'], strict_slashes=False)
 @swag_from({'tags': ['XML Entries'], 'summary': 'Create a new dictionary entry from LIFT XML', 'consumes': ['application/xml'], 'parameters': [{'name': 'body', 'in': 'body', 'required': True, 'description': 'LIFT XML entry to create'}], 'responses': {'201': {'description': 'Entry created successfully'}, '400': {'description': 'Invalid XML or validation error'}, '500': {'description': 'Internal server error'}}})
 def create_entry() -> Any:
@@ -78,13 +102,13 @@ def create_entry() -> Any:
         result = xml_service.create_entry(xml_string)
         
         logger.info('[XML API] Entry created: %s', result['id'])
+        _after_entry_write(xml_service, result['id'], xml_string)
         
         # Invalidate entries cache (version bump — avoids stampede)
         from app.services.cache_service import CacheService
         cache = CacheService()
         if cache.is_available():
-            db_name = current_app.config.get('BASEX_DATABASE') or 'default'
-            cache.increment(f"entries:version:{db_name}", 1, ttl=86400)
+            cache.bump_namespace('entries', current_app.config.get('BASEX_DATABASE') or 'default')
             logger.info('[XML API] Invalidated entries cache (version bump) after creating entry %s', result['id'])
         
         # Return response
@@ -149,6 +173,7 @@ def update_entry(entry_id: str) -> Any:
         # the entry with (X-Base-Date-Modified). If another write happened
         # since, reject the save instead of silently clobbering it.
         base_modified = request.headers.get('X-Base-Date-Modified')
+        current_entry = None
         if base_modified:
             try:
                 from app.services.dictionary_service import DictionaryService
@@ -179,6 +204,7 @@ def update_entry(entry_id: str) -> Any:
                 }), 500
 
         # Try to update entry, if not found then create it
+        previous_entry = current_entry or _load_previous_entry(entry_id)
         try:
             result = xml_service.update_entry(
                 entry_id, xml_string, base_modified=base_modified
@@ -187,6 +213,7 @@ def update_entry(entry_id: str) -> Any:
             # If entry doesn't exist, create it instead
             logger.info('[XML API] Entry %s not found, creating new entry', entry_id)
             result = xml_service.create_entry(xml_string)
+            previous_entry = None
         except VersionConflictError as vce:
             # The conditional replace matched nothing — another write landed
             # since the client loaded the entry.
@@ -198,13 +225,13 @@ def update_entry(entry_id: str) -> Any:
             }), 409
         
         logger.info('[XML API] Entry saved: %s', result['id'])
+        _after_entry_write(xml_service, result['id'], xml_string, previous_entry)
 
         # Invalidate entries cache (version bump — avoids stampede)
         from app.services.cache_service import CacheService
         cache = CacheService()
         if cache.is_available():
-          db_name = current_app.config.get('BASEX_DATABASE') or 'default'
-          cache.increment(f"entries:version:{db_name}", 1, ttl=86400)
+          cache.bump_namespace('entries', current_app.config.get('BASEX_DATABASE') or 'default')
           logger.info('[XML API] Invalidated entries cache (version bump) after saving entry %s', result['id'])
         
         # Return response
@@ -252,18 +279,19 @@ def delete_entry(entry_id: str) -> Any:
         
         # Get XML entry service
         xml_service = get_xml_entry_service()
+        previous_entry = _load_previous_entry(entry_id)
         
         # Delete entry
         result = xml_service.delete_entry(entry_id)
         
         logger.info('[XML API] Entry deleted: %s', entry_id)
+        _after_entry_write(xml_service, entry_id, previous_entry=previous_entry, deleted=True)
         
         # Invalidate entries cache (version bump — avoids stampede)
         from app.services.cache_service import CacheService
         cache = CacheService()
         if cache.is_available():
-            db_name = current_app.config.get('BASEX_DATABASE') or 'default'
-            cache.increment(f"entries:version:{db_name}", 1, ttl=86400)
+            cache.bump_namespace('entries', current_app.config.get('BASEX_DATABASE') or 'default')
             logger.info('[XML API] Invalidated entries cache (version bump) after deleting entry %s', entry_id)
         
         # Return response
@@ -568,3 +596,38 @@ def get_stats() -> Any:
                 _svc.close()
             except Exception:
                 pass
+
+
+@xml_entries_bp.route('/stats/pool', methods=['GET'])
+def get_pool_stats() -> Any:
+    """
+    Get BaseX connection pool metrics for the XML API
+    ---
+    tags:
+      - XML Entries
+    responses:
+      200:
+        description: Pool occupancy and acquisition wait-time metrics
+        schema:
+          type: object
+          properties:
+            in_use:
+              type: integer
+              description: Connections currently checked out
+            idle:
+              type: integer
+              description: Connections waiting in the pool
+            acquisitions:
+              type: integer
+              description: Total connection checkouts
+            wait_time_avg_ms:
+              type: number
+              description: Average time spent waiting for a free connection
+      500:
+        description: Internal server error
+    """
+    try:
+        return jsonify(get_xml_entry_service().get_pool_metrics()), 200
+    except Exception as e:
+        logger.error('[XML API] Unexpected error getting pool stats: %s', str(e), exc_info=True)
+        return jsonify({'error': f'Internal error: {str(e)}'}), 500
@@ -7,6 +7,7 @@ import logging
 import threading
 import os
 import queue
+import time
 from typing import Any, Optional, Dict, List
 from contextlib import contextmanager
 from tenacity import retry, stop_after_attempt, retry_if_exception_type, RetryError
@@ -17,18 +18,37 @@ except ImportError:
     logging.warning("BaseXClient not found. BaseX connector will not work.")
     BaseXSession = None
 
+from app.database.query_profiler import get_query_profiler
 from app.utils.exceptions import DatabaseError
 
 
+def _utf8_length(result: Optional[str]) -> int:
+    """Size of a query result in bytes as sent by BaseX (UTF-8), without encoding ASCII results."""
+    if not result:
+        return 0
+    return len(result) if result.isascii() else len(result.encode('utf-8'))
+
+
 class _BaseXConnection:
     """Wraps a raw BaseX session with per-connection state."""
 
-    __slots__ = ('session', 'current_db', 'logger')
+    __slots__ = ('session', 'current_db', 'logger', 'last_used')
 
     def __init__(self, host: str, port: int, username: str, password: str):
         self.session = BaseXSession(host, port, username, password) if BaseXSession else None
         self.current_db: Optional[str] = None
         self.logger = logging.getLogger(__name__)
+        self.last_used = time.monotonic()
+
+    def is_alive(self) -> bool:
+        """Round-trip a no-op query to verify the socket is still usable."""
+        if self.session is None:
+            return False
+        try:
+            self.session.execute("xquery ()")
+            return True
+        except Exception:
+            return False
 
     def ensure_db(self, db_name: Optional[str]) -> None:
         if db_name and db_name != self.current_db:
@@ -51,6 +71,9 @@ class BaseXConnector:
 
     Maintains a pool of TCP connections to BaseX, allowing concurrent
     read operations. Each connection is used by at most one thread at a time.
+    Pooled connections are only liveness-checked when they have sat idle for
+    longer than ``idle_check_seconds``; a connection that was just returned is
+    handed out again without an extra round-trip.
 
     Attributes:
         host: Hostname of the BaseX server.
@@ -61,7 +84,8 @@ class BaseXConnector:
     """
 
     def __init__(self, host: str, port: int, username: str, password: str,
-                 database: Optional[str] = None, pool_size: int = 4):
+                 database: Optional[str] = None, pool_size: int = 4,
+                 idle_check_seconds: float = 30.0):
         self.host = host
         self.port = port
         self.username = username
@@ -73,6 +97,17 @@ class BaseXConnector:
         self._max_pool = pool_size
         self._semaphore = threading.BoundedSemaphore(pool_size)
         self._created = 0
+        self.idle_check_seconds = idle_check_seconds
+
+        # Pool occupancy / wait-time metrics (see get_pool_metrics)
+        self._metrics_lock = threading.Lock()
+        self._in_use = 0
+        self._acquisitions = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+        self._health_checks = 0
+        self._health_check_failures = 0
+        self._discarded = 0
 
     # ---- Database name resolution ----
 
@@ -122,22 +157,19 @@ class BaseXConnector:
         # Use the timeout: a drained pool must raise, not block forever (a
         # leaked slot from a failed _make_connection below used to hang every
         # subsequent caller — the integration-suite freeze).
+        wait_start = time.monotonic()
         if not self._semaphore.acquire(timeout=timeout):
             raise DatabaseError(
                 f"Connection pool exhausted after {timeout}s "
                 f"(max_pool={self._max_pool}, created={self._created})"
             )
+        waited = time.monotonic() - wait_start
 
         try:
-            try:
-                conn = self._pool.get_nowait()
-                return conn
-            except queue.Empty:
-                pass
-
-            conn = self._make_connection()
-            self._created += 1
-            return conn
+            conn = self._take_pooled_connection()
+            if conn is None:
+                conn = self._make_connection()
+                self._created += 1
         except Exception:
             # Never leak the semaphore slot: if connection creation fails
             # (e.g. transient BaseX errors), return the slot so the pool can
@@ -145,14 +177,78 @@ class BaseXConnector:
             self._semaphore.release()
             raise
 
+        get_query_profiler().record_wait(waited)
+        with self._metrics_lock:
+            self._in_use += 1
+            self._acquisitions += 1
+            self._wait_time_total += waited
+            if waited > self._wait_time_max:
+                self._wait_time_max = waited
+        return conn
+
+    def _take_pooled_connection(self) -> Optional[_BaseXConnection]:
+        """Pop an idle connection, health-checking it only if it sat idle too long."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return None
+            if time.monotonic() - conn.last_used < self.idle_check_seconds:
+                return conn
+            with self._metrics_lock:
+                self._health_checks += 1
+            if conn.is_alive():
+                return conn
+            self.logger.debug("Discarding stale pooled BaseX connection")
+            with self._metrics_lock:
+                self._health_check_failures += 1
+                self._discarded += 1
+            conn.close()
+            self._created = max(0, self._created - 1)
+
     def _release(self, conn: _BaseXConnection) -> None:
+        conn.last_used = time.monotonic()
+        with self._metrics_lock:
+            self._in_use = max(0, self._in_use - 1)
         self._pool.put(conn)
         self._semaphore.release()
 
     def _discard(self, conn: _BaseXConnection) -> None:
         conn.close()
+        with self._metrics_lock:
+            self._in_use = max(0, self._in_use - 1)
+            self._discarded += 1
+        self._created = max(0, self._created - 1)
         self._semaphore.release()
 
+    @contextmanager
+    def session(self, db_name: Optional[str] = None):
+        """Check out a pooled connection and yield its raw BaseX session.
+
+        The connection is returned to the pool when the block exits, or
+        discarded if the block raised a socket-level error, so callers that
+        need several queries/commands on one session (e.g. update + FLUSH)
+        hold a single connection for just that unit of work.
+
+        Args:
+            db_name: Database to open on the connection (defaults to the
+                connector's configured database).
+        """
+        conn = self._acquire()
+        try:
+            target_db = db_name or self.database
+            if target_db:
+                conn.ensure_db(target_db)
+            yield conn.session
+        except (IOError, OSError):
+            self._discard(conn)
+            raise
+        except BaseException:
+            self._release(conn)
+            raise
+        else:
+            self._release(conn)
+
     def _run_with_retry(self, operation, error_context: str, max_attempts: int = 3):
         """Run *operation(conn)* with automatic retry on IOError/OSError.
 
@@ -270,6 +366,8 @@ class BaseXConnector:
             Query result as string.
         """
         conn = self._acquire()
+        started = time.perf_counter()
+        result = None
         try:
             # Determine target database
             target_db = db_name
@@ -349,7 +447,11 @@ class BaseXConnector:
                     except Exception:
                         pass
         finally:
+            # Read before release: another thread may switch the connection's database
+            current_db = conn.current_db
             self._release(conn)
+            get_query_profiler().record(query, time.perf_counter() - started,
+                                        _utf8_length(result), db_name=current_db)
 
     def execute_lift_query(self, query: str, has_namespace: bool = False, db_name: str = None) -> str:
         if not query.strip().startswith('xquery'):
@@ -421,6 +523,7 @@ class BaseXConnector:
                 clean_query = q_text.strip()[7:].strip()
 
             q = None
+            started = time.perf_counter()
             try:
                 q = conn.session.query(clean_query)
                 q.execute()
@@ -435,6 +538,8 @@ class BaseXConnector:
                         q.close()
                     except Exception:
                         pass
+                get_query_profiler().record(clean_query, time.perf_counter() - started,
+                                            kind='update', db_name=conn.current_db)
 
         self._run_with_retry(_op, "update")
 
@@ -512,8 +617,28 @@ class BaseXConnector:
             'pool_size': self._created,
             'max_pool': self._max_pool,
             'configured_database': self.database,
+            'pool': self.get_pool_metrics(),
         }
 
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """Return pool occupancy and acquisition wait-time counters."""
+        with self._metrics_lock:
+            acquisitions = self._acquisitions
+            return {
+                'max_pool': self._max_pool,
+                'created': self._created,
+                'in_use': self._in_use,
+                'idle': self._pool.qsize(),
+                'acquisitions': acquisitions,
+                'wait_time_total_ms': round(self._wait_time_total * 1000, 3),
+                'wait_time_avg_ms': round(self._wait_time_total * 1000 / acquisitions, 3) if acquisitions else 0.0,
+                'wait_time_max_ms': round(self._wait_time_max * 1000, 3),
+                'health_checks': self._health_checks,
+                'health_check_failures': self._health_check_failures,
+                'discarded': self._discarded,
+                'idle_check_seconds': self.idle_check_seconds,
+            }
+
     # ---- Safety checks (test mode) ----
 
     def _is_test_mode(self) -> bool:
@@ -531,3 +656,37 @@ class BaseXConnector:
                 return False
         return True
 
+
+
+# ---- Process-wide shared connectors ----
+
+_shared_connectors: Dict[tuple, BaseXConnector] = {}
+_shared_connectors_lock = threading.Lock()
+
+
+def get_shared_connector(host: str, port: int, username: str, password: str,
+                         pool_size: int = 4) -> BaseXConnector:
+    """Return the process-wide pooled connector for a BaseX server/account.
+
+    Services that are instantiated per request (e.g. ``XMLEntryService``)
+    use this instead of opening their own sessions, so TCP connections are
+    reused across requests. The connector has no default database; callers
+    select one per checkout via ``BaseXConnector.session(db_name)``.
+    """
+    key = (host, int(port), username, password)
+    with _shared_connectors_lock:
+        connector = _shared_connectors.get(key)
+        if connector is None:
+            connector = BaseXConnector(host, port, username, password,
+                                       database=None, pool_size=pool_size)
+            _shared_connectors[key] = connector
+        return connector
+
+
+def reset_shared_connectors() -> None:
+    """Disconnect and forget all shared connectors (tests, worker shutdown)."""
+    with _shared_connectors_lock:
+        connectors = list(_shared_connectors.values())
+        _shared_connectors.clear()
+    for connector in connectors:
+        connector.disconnect()
@@ -0,0 +1,205 @@
+"""
+Per-request BaseX query profiling and slow-query log.
+
+``BaseXConnector`` reports every query, update and pool checkout here.
+Inside a Flask request the figures accumulate on ``g`` (query count, DB
+time, pool wait, bytes returned and how often each query shape ran), which
+``app/__init__.py`` turns into a ``Server-Timing`` header. Queries slower
+than ``slow_query_ms`` go into a bounded ring buffer, and per-fingerprint
+totals are kept across requests so repeated shapes (N+1 patterns) stand out
+on the admin endpoint.
+
+A fingerprint is the query with string and numeric literals replaced by
+``?`` and whitespace collapsed, so ``get_entry('a')`` and ``get_entry('b')``
+share one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from typing import Any, Dict, List, Optional
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_QUERY_PREVIEW = 500
+
+
+def normalize_query(query: str) -> str:
+    """The query with literals replaced by ``?`` and whitespace collapsed."""
+    text = query.strip()
+    if text[:7].lower() == 'xquery ':
+        text = text[7:]
+    text = _STRING_LITERAL.sub('?', text)
+    text = _NUMBER.sub('?', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+def fingerprint(query: str) -> str:
+    """Short stable ID of the query's normalized shape."""
+    return hashlib.sha1(normalize_query(query).encode('utf-8')).hexdigest()[:12]
+
+
+def _request_stats() -> Optional[Dict[str, Any]]:
+    """The current request's stats on ``g``, or None outside a request."""
+    try:
+        from flask import g, has_request_context
+    except ImportError:
+        return None
+    if not has_request_context():
+        return None
+    stats = getattr(g, '_basex_profile', None)
+    if stats is None:
+        stats = g._basex_profile = {
+            'queries': 0, 'updates': 0, 'db_seconds': 0.0, 'pool_wait_seconds': 0.0,
+            'bytes': 0, 'fingerprints': Counter(),
+        }
+    return stats
+
+
+class QueryProfiler:
+    """Collects BaseX query timings per request and across requests."""
+
+    SLOW_QUERY_MS = 250.0
+    SLOW_LOG_SIZE = 200
+    FINGERPRINT_LIMIT = 1000
+    # A request running one query shape this often is logged as a likely N+1
+    REPEATED_QUERY_WARNING = 50
+
+    def __init__(self, slow_query_ms: Optional[float] = None, slow_log_size: Optional[int] = None) -> None:
+        self.slow_query_ms = self.SLOW_QUERY_MS if slow_query_ms is None else slow_query_ms
+        self._lock = threading.Lock()
+        self._slow: deque = deque(maxlen=slow_log_size or self.SLOW_LOG_SIZE)
+        # fingerprint -> {'query', 'count', 'total_ms', 'max_ms', 'bytes'}
+        self._fingerprints: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._totals = {'queries': 0, 'updates': 0, 'slow': 0, 'db_seconds': 0.0}
+
+    # ---- Recording ----
+
+    def record(self, query: str, seconds: float, result_bytes: int = 0, kind: str = 'query',
+               db_name: Optional[str] = None) -> None:
+        """Record one query (``kind='query'``) or update (``kind='update'``)."""
+        normalized = normalize_query(query)
+        key = hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:12]
+        ms = seconds * 1000
+
+        stats = _request_stats()
+        if stats is not None:
+            stats['queries' if kind == 'query' else 'updates'] += 1
+            stats['db_seconds'] += seconds
+            stats['bytes'] += result_bytes
+            stats['fingerprints'][key] += 1
+
+        with self._lock:
+            self._totals['queries' if kind == 'query' else 'updates'] += 1
+            self._totals['db_seconds'] += seconds
+            shape = self._fingerprints.get(key)
+            if shape is None:
+                shape = self._fingerprints[key] = {
+                    'query': normalized[:_QUERY_PREVIEW], 'kind': kind,
+                    'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'bytes': 0,
+                }
+                while len(self._fingerprints) > self.FINGERPRINT_LIMIT:
+                    self._fingerprints.popitem(last=False)
+            else:
+                self._fingerprints.move_to_end(key)
+            shape['count'] += 1
+            shape['total_ms'] += ms
+            shape['max_ms'] = max(shape['max_ms'], ms)
+            shape['bytes'] += result_bytes
+            if ms >= self.slow_query_ms:
+                self._totals['slow'] += 1
+                self._slow.append({
+                    'fingerprint': key,
+                    'query': query.strip()[:_QUERY_PREVIEW],
+                    'kind': kind,
+                    'ms': round(ms, 3),
+                    'bytes': result_bytes,
+                    'db_name': db_name,
+                    'at': time.time(),
+                    **_request_labels(),
+                })
+
+    def record_wait(self, seconds: float) -> None:
+        """Record time spent waiting for a pooled connection."""
+        stats = _request_stats()
+        if stats is not None:
+            stats['pool_wait_seconds'] += seconds
+
+    # ---- Reporting ----
+
+    @staticmethod
+    def request_summary() -> Optional[Dict[str, Any]]:
+        """Figures of the current request, or None if it made no BaseX calls."""
+        stats = _request_stats()
+        if not stats or not (stats['queries'] or stats['updates']):
+            return None
+        repeated = stats['fingerprints'].most_common(1)[0]
+        return {
+            'queries': stats['queries'],
+            'updates': stats['updates'],
+            'db_ms': round(stats['db_seconds'] * 1000, 3),
+            'pool_wait_ms': round(stats['pool_wait_seconds'] * 1000, 3),
+            'bytes': stats['bytes'],
+            'distinct_queries': len(stats['fingerprints']),
+            'most_repeated': {'fingerprint': repeated[0], 'count': repeated[1]},
+        }
+
+    def slow_queries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Slow queries, newest first."""
+        with self._lock:
+            entries = list(self._slow)
+        entries.reverse()
+        return entries[:limit] if limit else entries
+
+    def top_fingerprints(self, limit: int = 20, sort: str = 'total_ms') -> List[Dict[str, Any]]:
+        """Query shapes ordered by ``total_ms``, ``count`` or ``max_ms``."""
+        with self._lock:
+            shapes = [{'fingerprint': key, **shape} for key, shape in self._fingerprints.items()]
+        shapes.sort(key=lambda shape: shape.get(sort, 0), reverse=True)
+        for shape in shapes:
+            shape['total_ms'] = round(shape['total_ms'], 3)
+            shape['max_ms'] = round(shape['max_ms'], 3)
+            shape['avg_ms'] = round(shape['total_ms'] / shape['count'], 3) if shape['count'] else 0.0
+        return shapes[:limit]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'queries': self._totals['queries'],
+                'updates': self._totals['updates'],
+                'slow_queries': self._totals['slow'],
+                'db_ms': round(self._totals['db_seconds'] * 1000, 3),
+                'fingerprints': len(self._fingerprints),
+                'slow_query_ms': self.slow_query_ms,
+                'slow_log_size': self._slow.maxlen,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._slow.clear()
+            self._fingerprints.clear()
+            self._totals = {'queries': 0, 'updates': 0, 'slow': 0, 'db_seconds': 0.0}
+
+
+def _request_labels() -> Dict[str, Any]:
+    try:
+        from flask import g, has_request_context, request
+        if has_request_context():
+            return {'path': request.path, 'request_id': getattr(g, 'request_id', None)}
+    except Exception:
+        pass
+    return {}
+
+
+# Singleton instance
+query_profiler = QueryProfiler()
+
+
+def get_query_profiler() -> QueryProfiler:
+    """Get the global BaseX query profiler."""
+    return query_profiler
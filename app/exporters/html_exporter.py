@@ -42,6 +42,7 @@ class HTMLExporter(BaseExporter):
         super().__init__(dictionary_service)
         self.css_service = css_mapping_service
         self.logger = logging.getLogger(__name__)
+        self._xml_service = None
 
     def export(self, output_path: str, entries: Optional[List] = None,
                title: str = "Dictionary", profile_id: Optional[int] = None,
@@ -506,15 +507,13 @@ body {{
         entry_id = getattr(entry, 'id', None) or getattr(entry, 'guid', None)
         if entry_id:
             try:
-                from app.services.xml_entry_service import XMLEntryService
-                xml_service = XMLEntryService()
-                try:
-                    entry_data = xml_service.get_entry(entry_id)
-                    return entry_data.get('xml', '')
-                finally:
-                    # Release the BaseX session — this runs per entry in export
-                    # loops; leaking a session per entry would pile up DB locks.
-                    xml_service.close()
+                # One service for the whole export; each get_entry borrows a
+                # pooled session and returns it, so nothing is held per entry.
+                if self._xml_service is None:
+                    from app.services.xml_entry_service import XMLEntryService
+                    self._xml_service = XMLEntryService()
+                entry_data = self._xml_service.get_entry(entry_id)
+                return entry_data.get('xml', '')
             except Exception as e:
                 self.logger.debug(f"Could not get XML for entry {entry_id}: {e}")
 
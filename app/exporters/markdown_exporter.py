@@ -22,6 +22,7 @@ from collections import defaultdict
 from app.services.dictionary_service import DictionaryService
 from app.services.css_mapping_service import CSSMappingService
 from app.exporters.base_exporter import BaseExporter
+from app.models.compact_entry import CompactEntry
 from app.models.entry import Entry
 from app.models.sense import Sense
 
@@ -39,6 +40,12 @@ def _extract_text(d: dict[str, str] | str | None, lang: str = "en") -> str:
     return d.get(lang) or next(iter(d.values()), "")
 
 
+def _headword(entry: Entry | CompactEntry) -> str:
+    if isinstance(entry, CompactEntry):
+        return entry.headword
+    return _extract_text(entry.lexical_unit)
+
+
 def _sense_lines(sense: Sense, index: int) -> list[str]:
     lines: list[str] = []
     parts = []
@@ -156,7 +163,9 @@ class MarkdownExporter(BaseExporter):
         **kwargs,
     ) -> str:
         if entries is None:
-            entries, _ = self.dictionary_service.list_entries(limit=None)
+            # Simple mode only reads entries, so they are held compactly and
+            # expanded one at a time while rendering
+            entries, _ = self.dictionary_service.list_entries(limit=None, compact=profile_id is None)
 
         if not entries:
             raise ValueError("No entries to export")
@@ -176,7 +185,7 @@ class MarkdownExporter(BaseExporter):
                 )
         else:
             entries.sort(key=lambda e: (
-                _extract_text(e.lexical_unit).lower(),
+                _headword(e).lower(),
                 e.homograph_number or 0,
             ))
             md = self._build_simple_markdown(entries, title)
@@ -200,7 +209,7 @@ class MarkdownExporter(BaseExporter):
 
     # -- Simple mode ----------------------------------------------------
 
-    def _build_simple_markdown(self, entries: list[Entry], title: str) -> str:
+    def _build_simple_markdown(self, entries: list[Entry | CompactEntry], title: str) -> str:
         lines: list[str] = []
         today = date.today().isoformat()
 
@@ -210,9 +219,9 @@ class MarkdownExporter(BaseExporter):
         lines.append("...")
         lines.append("")
 
-        grouped: dict[str, list[Entry]] = defaultdict(list)
+        grouped: dict[str, list[Entry | CompactEntry]] = defaultdict(list)
         for entry in entries:
-            hw = _extract_text(entry.lexical_unit).strip()
+            hw = _headword(entry).strip()
             letter = hw[0].upper() if hw else "#"
             grouped[letter].append(entry)
 
@@ -220,6 +229,8 @@ class MarkdownExporter(BaseExporter):
             lines.append(f"# {letter}")
             lines.append("")
             for entry in grouped[letter]:
+                if isinstance(entry, CompactEntry):
+                    entry = entry.to_entry()
                 lines.extend(_entry_markdown(entry))
 
         return "\n".join(lines)
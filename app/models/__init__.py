@@ -6,6 +6,7 @@ from app.models.base import BaseModel
 from app.models.entry import Entry
 from app.models.sense import Sense
 from app.models.example import Example
+from app.models.compact_entry import CompactEntry
 from app.models.pronunciation import Pronunciation
 from app.models.project_settings import ProjectSettings, User
 from app.models.workset_models import Workset, WorksetEntry
@@ -14,7 +15,7 @@ from app.models.custom_ranges import CustomRange, CustomRangeValue
 from app.models.validation_models import ProjectValidationRule, ValidationRuleTemplate
 from app.models.dictionary_models import ProjectDictionary, UserDictionary, SystemDictionary
 from app.models.import_mapping import ImportMapping, ImportFieldMapping, ImportLanguageMapping
-from app.models.entry_revision import EntryRevision
+from app.models.entry_revision import EntryRevision, RevisionDailyRollup, RevisionFieldRollup
 from app.models.dismissed_duplicate import DismissedDuplicate
 from app.models.bulk_snapshot import BulkOperationSnapshot
 
@@ -24,6 +25,7 @@ __all__ = [
     'Entry',
     'Sense',
     'Example',
+    'CompactEntry',
     'Pronunciation',
     'ProjectSettings',
     'User',
@@ -42,5 +44,7 @@ __all__ = [
     'ImportFieldMapping',
     'ImportLanguageMapping',
     'EntryRevision',
+    'RevisionDailyRollup',
+    'RevisionFieldRollup',
     'DismissedDuplicate',
 ]
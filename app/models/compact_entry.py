@@ -0,0 +1,322 @@
+"""
+Compact read-only entries for bulk paths.
+
+Exports, duplicate scans and coverage analysis read many entries and edit
+none of them, yet a parsed ``Entry`` carries a ``__dict__`` per model object
+and a dict per multitext. ``CompactEntry`` (with ``CompactSense``,
+``CompactExample``, ``CompactRelation`` and ``CompactVariant``) keeps the same
+data in ``__slots__`` objects:
+
+- a multitext is a flat tuple ``(lang, text, lang, text, ...)``; ``()`` when
+  empty (the shared empty tuple costs nothing);
+- language codes, grammatical info, morph types and relation types are
+  interned, so every entry shares one string object per value;
+- the fields most entries leave empty (notes, traits, custom fields,
+  etymologies, ...) live in one ``extra`` dict, or ``None``.
+
+``CompactEntry.from_entry(entry)`` packs a model and ``to_entry()`` rebuilds
+an equal ``Entry`` (same ``to_dict()``) when the full model is needed.
+``LIFTParser.parse_string_compact`` packs entries as they are parsed, so only
+one full model is alive at a time; ``DictionaryService.list_entries(...,
+compact=True)`` uses it, e.g. for the simple Markdown export, which expands
+each entry only while writing it. Memory per entry is tracked by
+scripts/benchmark_compact_entries.py.
+"""
+
+import copy
+import sys
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.models.entry import Entry, Relation, Variant
+from app.models.example import Example
+from app.models.sense import Sense
+
+Multitext = Tuple[str, ...]
+
+_intern = sys.intern
+_EMPTY_VALUES = (None, '', [], {}, ())
+
+
+def pack_multitext(values: Optional[Dict[str, Any]]) -> Multitext:
+    """``{lang: text}`` as a flat ``(lang, text, ...)`` tuple with interned codes."""
+    if not values:
+        return ()
+    packed = []
+    for lang, text in values.items():
+        packed.append(_intern(lang) if isinstance(lang, str) else lang)
+        packed.append(text)
+    return tuple(packed)
+
+
+def unpack_multitext(packed: Multitext) -> Dict[str, Any]:
+    """The ``{lang: text}`` dict of a packed multitext (a new dict each call)."""
+    return dict(zip(packed[::2], packed[1::2]))
+
+
+def multitext_get(packed: Multitext, lang: str, default: Any = None) -> Any:
+    """Text of ``lang`` in a packed multitext."""
+    for index in range(0, len(packed), 2):
+        if packed[index] == lang:
+            return packed[index + 1]
+    return default
+
+
+def _intern_optional(value: Any) -> Any:
+    return _intern(value) if isinstance(value, str) else value
+
+
+# Per model class: attribute names its constructor always sets (an empty value
+# there needs no storing, the constructor recreates it)
+_constructor_fields: Dict[type, frozenset] = {}
+# Extras holding only empty values, shared by every object with that shape
+_empty_extras: Dict[Tuple, Dict[str, Any]] = {}
+
+
+def _extra(model: Any, core: Iterable[str], **computed: Any) -> Optional[Dict[str, Any]]:
+    """Public attributes of ``model`` outside ``core`` that a rebuild needs, or None."""
+    defaults = _constructor_fields.get(type(model))
+    if defaults is None:
+        defaults = _constructor_fields[type(model)] = frozenset(vars(_blank(type(model))))
+    extra = {}
+    for name, value in vars(model).items():
+        if name[0] == '_' or name in core:
+            continue
+        if value in _EMPTY_VALUES and name in defaults:
+            continue
+        extra[name] = value
+    extra.update((name, value) for name, value in computed.items() if value not in _EMPTY_VALUES)
+    if not extra:
+        return None
+    if all(value in _EMPTY_VALUES for value in extra.values()):
+        shape = tuple((name, type(value)) for name, value in extra.items())
+        return _empty_extras.setdefault(shape, extra)
+    return extra
+
+
+def _blank(model_class: type) -> Any:
+    if model_class is Variant:
+        return Variant(form={})
+    if model_class is Entry:
+        return Entry(morph_type='stem')
+    return model_class()
+
+
+def _extra_kwargs(extra: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    # Copied so editing the rebuilt model never reaches back into the compact one
+    return copy.deepcopy(extra) if extra else {}
+
+
+class _Compact:
+    """Slotted, read-only base."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r})"
+
+
+_set = object.__setattr__
+
+
+class CompactExample(_Compact):
+    """Read-only example: form and translations packed, the rest in ``extra``."""
+
+    __slots__ = ('id', 'form', 'translations', 'extra')
+    _CORE = ('id', 'form', 'translations')
+
+    def __init__(self, id: Optional[str], form: Multitext, translations: Multitext,
+                 extra: Optional[Dict[str, Any]] = None) -> None:
+        _set(self, 'id', id)
+        _set(self, 'form', form)
+        _set(self, 'translations', translations)
+        _set(self, 'extra', extra)
+
+    @classmethod
+    def from_example(cls, example: Example) -> 'CompactExample':
+        return cls(example.id, pack_multitext(example.form), pack_multitext(example.translations),
+                   _extra(example, cls._CORE))
+
+    def to_example(self) -> Example:
+        return Example(id_=self.id, form=unpack_multitext(self.form),
+                       translations=unpack_multitext(self.translations), **_extra_kwargs(self.extra))
+
+
+class CompactSense(_Compact):
+    """Read-only sense (or subsense); ``subsenses`` is None if the sense had no such attribute."""
+
+    __slots__ = ('id', 'glosses', 'definitions', 'grammatical_info', 'examples', 'subsenses', 'extra')
+    _CORE = ('id', 'glosses', 'definitions', 'grammatical_info', 'examples', 'subsenses')
+
+    def __init__(self, id: Optional[str], glosses: Multitext, definitions: Multitext,
+                 grammatical_info: Optional[str], examples: Tuple[CompactExample, ...],
+                 subsenses: Optional[Tuple['CompactSense', ...]], extra: Optional[Dict[str, Any]] = None) -> None:
+        _set(self, 'id', id)
+        _set(self, 'glosses', glosses)
+        _set(self, 'definitions', definitions)
+        _set(self, 'grammatical_info', grammatical_info)
+        _set(self, 'examples', examples)
+        _set(self, 'subsenses', subsenses)
+        _set(self, 'extra', extra)
+
+    @classmethod
+    def from_sense(cls, sense: Sense) -> 'CompactSense':
+        # Raw dicts (legacy examples, subsenses from to_dict() snapshots) stay as they are, in extra
+        raw = {}
+        examples = sense.examples or []
+        if all(isinstance(e, Example) for e in examples):
+            examples = tuple(CompactExample.from_example(e) for e in examples)
+        else:
+            raw['examples'], examples = examples, ()
+        subsenses = getattr(sense, 'subsenses', None)
+        if subsenses is not None:
+            if all(isinstance(s, Sense) for s in subsenses):
+                subsenses = tuple(cls.from_sense(s) for s in subsenses)
+            else:
+                raw['subsenses'], subsenses = subsenses, None
+        return cls(
+            sense.id, pack_multitext(sense.glosses), pack_multitext(sense.definitions),
+            _intern_optional(sense.grammatical_info), examples, subsenses,
+            _extra(sense, cls._CORE, domain_type=sense.domain_type, semantic_domains=sense.semantic_domains, **raw),
+        )
+
+    def to_sense(self) -> Sense:
+        kwargs = {
+            'glosses': unpack_multitext(self.glosses),
+            'definitions': unpack_multitext(self.definitions),
+            'grammatical_info': self.grammatical_info,
+            'examples': [e.to_example() for e in self.examples],
+        }
+        if self.subsenses is not None:
+            kwargs['subsenses'] = [s.to_sense() for s in self.subsenses]
+        kwargs.update(_extra_kwargs(self.extra))
+        return Sense(id_=self.id, **kwargs)
+
+
+class CompactRelation(_Compact):
+    """Read-only entry-level relation."""
+
+    __slots__ = ('id', 'type', 'ref', 'traits', 'order')
+
+    def __init__(self, id: Optional[str], type: str, ref: str,
+                 traits: Optional[Dict[str, str]] = None, order: Optional[int] = None) -> None:
+        _set(self, 'id', id)
+        _set(self, 'type', type)
+        _set(self, 'ref', ref)
+        _set(self, 'traits', traits)
+        _set(self, 'order', order)
+
+    @classmethod
+    def from_relation(cls, relation: Relation) -> 'CompactRelation':
+        return cls(relation.id, _intern_optional(relation.type), relation.ref,
+                   relation.traits or None, relation.order)
+
+    def to_relation(self) -> Relation:
+        return Relation(type=self.type, ref=self.ref, traits=dict(self.traits) if self.traits else None,
+                        order=self.order, id_=self.id)
+
+
+class CompactVariant(_Compact):
+    """Read-only variant form."""
+
+    __slots__ = ('id', 'form', 'extra')
+    _CORE = ('id', 'form')
+
+    def __init__(self, id: Optional[str], form: Multitext, extra: Optional[Dict[str, Any]] = None) -> None:
+        _set(self, 'id', id)
+        _set(self, 'form', form)
+        _set(self, 'extra', extra)
+
+    @classmethod
+    def from_variant(cls, variant: Variant) -> 'CompactVariant':
+        return cls(variant.id, pack_multitext(variant.form), _extra(variant, cls._CORE))
+
+    def to_variant(self) -> Variant:
+        return Variant(form=unpack_multitext(self.form), id_=self.id, **_extra_kwargs(self.extra))
+
+
+class CompactEntry(_Compact):
+    """Read-only entry for bulk reads; ``to_entry()`` gives the editable model."""
+
+    __slots__ = ('id', 'lexical_unit', 'pronunciations', 'citations', 'grammatical_info', 'morph_type',
+                 'homograph_number', 'date_created', 'date_modified', 'senses', 'relations', 'variants',
+                 'extra')
+    _CORE = ('id', 'lexical_unit', 'pronunciations', 'citations', 'grammatical_info', 'morph_type',
+             'homograph_number', 'date_created', 'date_modified', 'senses', 'relations', 'variants',
+             'traits')
+
+    def __init__(self, id: Optional[str], lexical_unit: Multitext, pronunciations: Multitext = (),
+                 citations: Tuple[Multitext, ...] = (), grammatical_info: Optional[str] = None,
+                 morph_type: Optional[str] = None, homograph_number: Optional[int] = None,
+                 date_created: Optional[str] = None, date_modified: Optional[str] = None,
+                 senses: Tuple[CompactSense, ...] = (), relations: Tuple[CompactRelation, ...] = (),
+                 variants: Tuple[CompactVariant, ...] = (), extra: Optional[Dict[str, Any]] = None) -> None:
+        _set(self, 'id', id)
+        _set(self, 'lexical_unit', lexical_unit)
+        _set(self, 'pronunciations', pronunciations)
+        _set(self, 'citations', citations)
+        _set(self, 'grammatical_info', grammatical_info)
+        _set(self, 'morph_type', morph_type)
+        _set(self, 'homograph_number', homograph_number)
+        _set(self, 'date_created', date_created)
+        _set(self, 'date_modified', date_modified)
+        _set(self, 'senses', senses)
+        _set(self, 'relations', relations)
+        _set(self, 'variants', variants)
+        _set(self, 'extra', extra)
+
+    @classmethod
+    def from_entry(cls, entry: Entry) -> 'CompactEntry':
+        # Entry() puts morph_type back into traits; store traits only when there is more
+        traits = entry.traits
+        if traits and traits == {'morph-type': entry.morph_type}:
+            traits = None
+        return cls(
+            entry.id,
+            pack_multitext(entry.lexical_unit),
+            pack_multitext(entry.pronunciations),
+            tuple(pack_multitext(c) for c in entry.citations),
+            _intern_optional(entry.grammatical_info),
+            _intern_optional(entry.morph_type),
+            entry.homograph_number,
+            entry.date_created,
+            entry.date_modified,
+            tuple(CompactSense.from_sense(s) for s in entry.senses),
+            tuple(CompactRelation.from_relation(r) for r in entry.relations),
+            tuple(CompactVariant.from_variant(v) for v in entry.variants),
+            _extra(entry, cls._CORE, traits=traits),
+        )
+
+    def to_entry(self) -> Entry:
+        """The editable ``Entry`` with the same data."""
+        return Entry(
+            id_=self.id,
+            date_created=self.date_created,
+            date_modified=self.date_modified,
+            lexical_unit=unpack_multitext(self.lexical_unit),
+            pronunciations=unpack_multitext(self.pronunciations),
+            citations=[unpack_multitext(c) for c in self.citations],
+            grammatical_info=self.grammatical_info,
+            morph_type=self.morph_type,
+            homograph_number=self.homograph_number,
+            senses=[s.to_sense() for s in self.senses],
+            relations=[r.to_relation() for r in self.relations],
+            variants=[v.to_variant() for v in self.variants],
+            **_extra_kwargs(self.extra),
+        )
+
+    @property
+    def headword(self) -> str:
+        """Lexical unit in 'en', else the first language (as ``Entry.headword``)."""
+        headword = multitext_get(self.lexical_unit, 'en', _MISSING)
+        if headword is not _MISSING:
+            return headword
+        return self.lexical_unit[1] if self.lexical_unit else ''
+
+
+_MISSING = object()
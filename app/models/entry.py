@@ -15,6 +15,29 @@ from app.utils.db_utils import escape_xquery_string
 
 logger = logging.getLogger(__name__)
 
+
+_DISPLAY_LANG_PREFERENCE = ('en', 'pl', 'cs', 'sk')
+_HOMOGRAPH_SUB = '<sub style="font-size: 0.8em; color: #6c757d;">{}</sub>'
+
+
+def _has_relation_index(dict_service: Any) -> bool:
+    """Whether a dictionary service offers indexed reverse lookups and batched labels.
+
+    Checked on the class so duck-typed services (and mocks) keep using the
+    direct XQuery paths.
+    """
+    return (
+        getattr(type(dict_service), 'get_reverse_relations', None) is not None
+        and getattr(type(dict_service), 'get_entry_labels', None) is not None
+    )
+
+
+def _preferred_lexical_unit(lexical_unit: Dict[str, str]) -> str:
+    for lang in _DISPLAY_LANG_PREFERENCE:
+        if lang in lexical_unit:
+            return lexical_unit[lang]
+    return next(iter(lexical_unit.values()), '')
+
 if TYPE_CHECKING:
     from app.models.sense import Sense
 
@@ -671,7 +694,17 @@ class Entry(BaseModel):
             - ref_display_text: Display text from main entry (if found)
         """
         component_relations = []
-        
+
+        # Resolve all referenced main entries in one query instead of one get_entry per ref
+        entry_labels: Optional[Dict[str, Dict[str, Any]]] = None
+        if dict_service and _has_relation_index(dict_service):
+            missing_refs = [
+                str(rel.ref) for rel in self.relations
+                if getattr(rel, 'type', None) == '_component-lexeme' and getattr(rel, 'ref', None)
+                and not (headword_cache and str(rel.ref) in headword_cache)
+            ]
+            entry_labels = dict_service.get_entry_labels(missing_refs) if missing_refs else {}
+
         for relation in self.relations:
             try:
                 # Check for _component-lexeme relations with complex-form-type traits
@@ -703,6 +736,15 @@ class Entry(BaseModel):
                                 hw = headword_cache[component_info['ref']]
                                 component_info['ref_display_text'] = hw
                                 component_info['ref_lexical_unit'] = hw
+                            elif entry_labels is not None:
+                                label = entry_labels.get(component_info['ref'])
+                                if label:
+                                    lexical_unit = _preferred_lexical_unit(label['lexical_unit'])
+                                    component_info['ref_lexical_unit'] = lexical_unit
+                                    display_text = lexical_unit or component_info['ref']
+                                    if label['homograph_number']:
+                                        display_text += _HOMOGRAPH_SUB.format(label['homograph_number'])
+                                    component_info['ref_display_text'] = display_text
                             else:
                                 main_entry = dict_service.get_entry(component_info['ref'])
                                 if main_entry:
@@ -759,7 +801,13 @@ class Entry(BaseModel):
         """
         if not dict_service:
             return []
-        
+
+        if _has_relation_index(dict_service):
+            try:
+                return self._get_subentries_indexed(dict_service)
+            except Exception as e:
+                logger.warning("[Entry] Warning: Indexed subentry lookup failed, querying directly: %s", e)
+
         subentries = []
         
         try:
@@ -865,6 +913,52 @@ class Entry(BaseModel):
         
         return subentries
 
+    def _get_subentries_indexed(self, dict_service) -> List[Dict[str, Any]]:
+        """get_subentries() via the reverse-relation index plus one batched label query."""
+        # Group relations pointing at this entry by source, keeping document order
+        by_source: Dict[str, List[Any]] = {}
+        for ref in dict_service.get_reverse_relations(self.id):
+            by_source.setdefault(ref.source_id, []).append(ref)
+
+        relation_infos: Dict[str, Dict[str, Any]] = {}
+        for source_id, refs in by_source.items():
+            if not any(ref.relation_type == '_component-lexeme' for ref in refs):
+                continue
+            relation_info = None
+            for ref in refs:
+                # A variant-type trait on the subentry's relation marks a variant, not a subentry
+                if 'variant-type' in ref.traits:
+                    break
+                if ref.relation_type == '_component-lexeme':
+                    relation_info = {
+                        'complex_form_type': ref.traits.get('complex-form-type', 'Unknown'),
+                        'is_primary': ref.traits.get('is-primary') == 'true',
+                        'order': ref.order if ref.order is not None else 0,
+                    }
+                    break
+            if relation_info is not None:
+                relation_infos[source_id] = relation_info
+
+        labels = dict_service.get_entry_labels(list(relation_infos))
+        subentries = []
+        for source_id, relation_info in relation_infos.items():
+            label = labels.get(source_id)
+            if not label:
+                continue
+            lexical_unit = _preferred_lexical_unit(label['lexical_unit'])
+            display_text = lexical_unit
+            if label['homograph_number']:
+                display_text += _HOMOGRAPH_SUB.format(label['homograph_number'])
+            subentries.append({
+                'id': source_id,
+                'lexical_unit': lexical_unit,
+                'display_text': display_text,
+                **relation_info
+            })
+
+        subentries.sort(key=lambda x: x.get('order', 0))
+        return subentries
+
     def component_relations(self) -> List[Dict[str, Any]]:
         """
         Get component relations for template access.
@@ -891,7 +985,16 @@ class Entry(BaseModel):
             - ref_display_text: Display text from component entry (if found)
         """
         forward_components = []
-        
+
+        # Resolve all component entries in one query instead of one get_entry per ref
+        entry_labels: Optional[Dict[str, Dict[str, Any]]] = None
+        if dict_service and _has_relation_index(dict_service):
+            refs = [
+                str(rel.ref) for rel in self.relations
+                if getattr(rel, 'type', None) == '_component-lexeme' and getattr(rel, 'ref', None)
+            ]
+            entry_labels = dict_service.get_entry_labels(refs) if refs else {}
+
         for relation in self.relations:
             try:
                 # Check for _component-lexeme relations with complex-form-type traits
@@ -916,7 +1019,16 @@ class Entry(BaseModel):
                             pass
                     
                     # Enrich with component entry information if dict_service is available
-                    if dict_service:
+                    if dict_service and entry_labels is not None:
+                        label = entry_labels.get(component_info['ref'])
+                        if label:
+                            lexical_unit = _preferred_lexical_unit(label['lexical_unit'])
+                            component_info['ref_lexical_unit'] = lexical_unit
+                            display_text = lexical_unit or component_info['ref']
+                            if label['homograph_number']:
+                                display_text += _HOMOGRAPH_SUB.format(label['homograph_number'])
+                            component_info['ref_display_text'] = display_text
+                    elif dict_service:
                         try:
                             component_entry = dict_service.get_entry(component_info['ref'])
                             if component_entry:
@@ -970,6 +1082,16 @@ class Entry(BaseModel):
         """
         variant_relations = []
 
+        # Resolve all variant targets in one query instead of one get_entry per ref
+        entry_labels: Optional[Dict[str, Dict[str, Any]]] = None
+        if dict_service and _has_relation_index(dict_service):
+            refs = [
+                str(rel.ref) for rel in self.relations
+                if getattr(rel, 'ref', None) and isinstance(getattr(rel, 'traits', None), dict)
+                and 'variant-type' in rel.traits
+            ]
+            entry_labels = dict_service.get_entry_labels(refs) if refs else {}
+
         logger.debug("[get_variant_relations] Entry %s - Checking %d relations for variant-type trait", self.id, len(self.relations))
         logger.debug("[get_variant_relations] Entry relations: %s", [(r.type, r.ref, r.traits) for r in self.relations])
 
@@ -1003,7 +1125,14 @@ class Entry(BaseModel):
                             pass
                     
                     # Enrich with target entry information if dict_service is available
-                    if dict_service:
+                    if dict_service and entry_labels is not None:
+                        label = entry_labels.get(variant_info['ref'])
+                        if label:
+                            lexical_unit = label['lexical_unit']
+                            headword = lexical_unit.get('en') or next(iter(lexical_unit.values()), '')
+                            variant_info['ref_lexical_unit'] = headword
+                            variant_info['ref_display_text'] = headword
+                    elif dict_service:
                         try:
                             target_entry = dict_service.get_entry(variant_info['ref'])
                             if target_entry:
@@ -1067,6 +1196,12 @@ class Entry(BaseModel):
 
         logger.debug("[get_reverse_variant_relations] Entry %s - Looking for entries with variant-type relation pointing to this entry", self.id)
 
+        if _has_relation_index(dict_service):
+            try:
+                return self._get_reverse_variant_relations_indexed(dict_service)
+            except Exception as e:
+                logger.warning("[Entry] Warning: Indexed variant lookup failed, querying directly: %s", e)
+
         reverse_relations = []
 
         try:
@@ -1166,6 +1301,38 @@ class Entry(BaseModel):
 
         return reverse_relations
 
+    def _get_reverse_variant_relations_indexed(self, dict_service) -> List[Dict[str, Any]]:
+        """get_reverse_variant_relations() via the reverse-relation index plus one batched label query."""
+        first_variant_refs: Dict[str, Any] = {}
+        for ref in dict_service.get_reverse_relations(self.id):
+            if ref.source_id == self.id or ref.source_id in first_variant_refs:
+                continue
+            if ref.traits.get('variant-type'):
+                first_variant_refs[ref.source_id] = ref
+
+        labels = dict_service.get_entry_labels(list(first_variant_refs))
+        reverse_relations = []
+        for source_id, ref in first_variant_refs.items():
+            label = labels.get(source_id)
+            if label is None:
+                continue
+            lexical_unit = label['lexical_unit']
+            headword = lexical_unit.get('en') or next(iter(lexical_unit.values()), '')
+            variant_info = {
+                'ref': source_id,
+                'ref_lexical_unit': headword,
+                'ref_display_text': headword,
+                'variant_type': str(ref.traits['variant-type']),
+                'type': str(ref.relation_type),
+                'direction': 'incoming'
+            }
+            if ref.order is not None:
+                variant_info['order'] = ref.order
+            reverse_relations.append(variant_info)
+
+        reverse_relations.sort(key=lambda x: (x.get('order', 999), x.get('ref_lexical_unit', x['ref'])))
+        return reverse_relations
+
     def get_complete_variant_relations(self, dict_service=None) -> List[Dict[str, Any]]:
         """
         Get complete variant relations including both directions:
@@ -3,6 +3,11 @@ EntryRevision — SQLAlchemy model for per-entry edit history.
 
 Each explicit form submission (save) produces one row capturing the
 serializer-ready JSON snapshot + a structured field-level change report.
+
+Snapshots are stored as a chain: keyframe rows hold the full JSON in
+``snapshot``; the rows between keyframes hold only a zlib-compressed patch
+against the previous revision in ``delta`` (``snapshot`` is NULL).  Use
+``EntryRevisionService.get_snapshot`` to reconstruct any revision.
 """
 
 from datetime import datetime, timezone
@@ -19,13 +24,19 @@ class EntryRevision(db.Model):
                               default=lambda: datetime.now(timezone.utc))
     user_id = db.Column(db.Text, nullable=True)
     created_by = db.Column(db.Text, nullable=True)
-    snapshot = db.Column(db.JSON, nullable=False)
+    snapshot = db.Column(db.JSON(none_as_null=True), nullable=True)
+    is_keyframe = db.Column(db.Boolean, nullable=False, default=True,
+                            server_default=db.true())
+    delta = db.Column(db.LargeBinary, nullable=True)
     change_report = db.Column(db.JSON, nullable=True)
 
     __table_args__ = (
         db.UniqueConstraint('entry_id', 'revision_number', name='uq_entry_rev'),
     )
 
+    # Full snapshot reconstructed for delta rows (not persisted).
+    resolved_snapshot = None
+
     def to_dict(self, include_snapshot: bool = False) -> dict:
         d = {
             'revision_number': self.revision_number,
@@ -34,6 +45,32 @@ class EntryRevision(db.Model):
             'change_count': len(self.change_report) if self.change_report else 0,
         }
         if include_snapshot:
-            d['snapshot'] = self.snapshot
+            d['snapshot'] = self.snapshot if self.snapshot is not None else self.resolved_snapshot
             d['change_report'] = self.change_report
         return d
+
+
+class RevisionDailyRollup(db.Model):
+    """Revisions per day, entry and editor — maintained on every save."""
+    __tablename__ = 'revision_daily_rollups'
+
+    day = db.Column(db.Date, primary_key=True)
+    entry_id = db.Column(db.Text, primary_key=True)
+    user_id = db.Column(db.Text, primary_key=True, default='')  # '' = anonymous
+    editor = db.Column(db.Text, primary_key=True)
+    revisions = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index('ix_revision_daily_rollups_user_day', 'user_id', 'day'),
+    )
+
+
+class RevisionFieldRollup(db.Model):
+    """Change-report counts per day, field group and change kind."""
+    __tablename__ = 'revision_field_rollups'
+
+    day = db.Column(db.Date, primary_key=True)
+    user_id = db.Column(db.Text, primary_key=True, default='')
+    field_group = db.Column(db.Text, primary_key=True)
+    kind = db.Column(db.Text, primary_key=True)
+    changes = db.Column(db.Integer, nullable=False, default=0)
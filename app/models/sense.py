@@ -310,6 +310,9 @@ class Sense(BaseModel):
         """
         Enrich sense relations with display text from target senses.
 
+        Services offering ``resolve_sense_targets`` resolve every target in
+        one batch; others are queried once per relation.
+
         Args:
             dict_service: Dictionary service to look up target entries/senses
 
@@ -319,6 +322,12 @@ class Sense(BaseModel):
         if not dict_service or not self.relations:
             return self.relations
 
+        sense_targets = None
+        if getattr(type(dict_service), 'resolve_sense_targets', None) is not None:
+            sense_targets = dict_service.resolve_sense_targets(
+                [r.get('ref', '') for r in self.relations if r.get('ref')]
+            )
+
         enriched_relations = []
 
         for relation in self.relations:
@@ -330,6 +339,18 @@ class Sense(BaseModel):
                     enriched_relations.append(enriched)
                     continue
 
+                if sense_targets is not None:
+                    target = sense_targets.get(ref)
+                    if target:
+                        lexical_unit = target['lexical_unit']
+                        enriched['ref_display_text'] = (
+                            lexical_unit.get('en') or next(iter(lexical_unit.values()), ''))
+                        enriched['ref_entry_id'] = target['entry_id']
+                        if target['gloss']:
+                            enriched['ref_gloss'] = target['gloss']
+                    enriched_relations.append(enriched)
+                    continue
+
                 # Use targeted XQuery to find entry containing this sense
                 # The ref can be either "entry_id_sense_id" or just "sense_id"
                 # Try to find entry by querying for sense with this ID
@@ -10,6 +10,8 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy.exc import IntegrityError
+
 from app.models.workset_models import db
 from app.utils.db_utils import safe_commit
 
@@ -363,3 +365,195 @@ class ValidationResultCache(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'expires_at': self.expires_at.isoformat() if self.expires_at else None
         }
+
+
+class EntryValidationResult(db.Model):
+    """
+    Latest whole-dictionary validation result of one entry.
+
+    Written by ``DictionaryValidationRunner``. A row stays current while the
+    entry's ``date_modified`` and the run's ``rule_set_version`` match; the
+    per-rule digests in ``ValidationRuleSetVersion`` let a re-run after a rule
+    change revalidate only the rules that changed.
+    """
+    __tablename__ = 'entry_validation_results'
+
+    id = db.Column(db.Integer, primary_key=True)
+    db_name = db.Column(db.String(255), nullable=False, index=True)
+    entry_id = db.Column(db.String(255), nullable=False)
+    date_modified = db.Column(db.String(50), nullable=False, default='')
+    rule_set_version = db.Column(db.String(64), nullable=False)
+
+    is_valid = db.Column(db.Boolean, nullable=False, default=True)
+    error_count = db.Column(db.Integer, nullable=False, default=0)
+    warning_count = db.Column(db.Integer, nullable=False, default=0)
+    info_count = db.Column(db.Integer, nullable=False, default=0)
+    issues = db.Column(db.JSON, nullable=True)  # [{rule_id, rule_name, message, path, priority, category}]
+
+    validated_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('db_name', 'entry_id', name='uq_entry_validation_result'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<EntryValidationResult {self.db_name}:{self.entry_id}>"
+
+    @classmethod
+    def get_index(cls, db_name: str) -> Dict[str, tuple]:
+        """Map entry_id -> (date_modified, rule_set_version) for a database."""
+        rows = db.session.query(cls.entry_id, cls.date_modified, cls.rule_set_version).filter(
+            cls.db_name == db_name
+        ).all()
+        return {entry_id: (date_modified, version) for entry_id, date_modified, version in rows}
+
+    @classmethod
+    def get_issues(cls, db_name: str, entry_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Stored issues of the given entries."""
+        if not entry_ids:
+            return {}
+        rows = db.session.query(cls.entry_id, cls.issues).filter(
+            cls.db_name == db_name, cls.entry_id.in_(entry_ids)
+        ).all()
+        return {entry_id: issues or [] for entry_id, issues in rows}
+
+    @classmethod
+    def replace(cls, db_name: str, rows: List[Dict[str, Any]]) -> None:
+        """Write results for a batch of entries, replacing their previous rows."""
+        if not rows:
+            return
+        now = datetime.utcnow()
+        cls.query.filter(
+            cls.db_name == db_name, cls.entry_id.in_([row['entry_id'] for row in rows])
+        ).delete(synchronize_session=False)
+        db.session.execute(cls.__table__.insert(), [
+            {**row, 'db_name': db_name, 'validated_at': now} for row in rows
+        ])
+        safe_commit(db, "validation_cache_models")
+
+    @classmethod
+    def delete_entries(cls, db_name: str, entry_ids: List[str]) -> int:
+        """Drop results of entries that no longer exist."""
+        count = 0
+        for start in range(0, len(entry_ids), 500):
+            count += cls.query.filter(
+                cls.db_name == db_name, cls.entry_id.in_(entry_ids[start:start + 500])
+            ).delete(synchronize_session=False)
+        safe_commit(db, "validation_cache_models")
+        return count
+
+    @classmethod
+    def summary(cls, db_name: str, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+        """Totals, issue counts per rule and the invalid entries (paged)."""
+        base = cls.query.filter(cls.db_name == db_name)
+        total = base.count()
+        with_issues = base.filter(
+            (cls.error_count + cls.warning_count + cls.info_count) > 0
+        ).order_by(cls.error_count.desc(), cls.entry_id)
+
+        by_rule: Dict[str, int] = {}
+        for (issues,) in db.session.query(cls.issues).filter(
+            cls.db_name == db_name, (cls.error_count + cls.warning_count + cls.info_count) > 0
+        ):
+            for issue in issues or []:
+                by_rule[issue.get('rule_id')] = by_rule.get(issue.get('rule_id'), 0) + 1
+
+        return {
+            'total_entries': total,
+            'invalid_entries': base.filter(cls.is_valid.is_(False)).count(),
+            'entries_with_issues': with_issues.count(),
+            'issues_by_rule': dict(sorted(by_rule.items(), key=lambda kv: kv[1], reverse=True)),
+            'results': [row.to_dict() for row in with_issues.offset(offset).limit(limit)],
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            'entry_id': self.entry_id,
+            'date_modified': self.date_modified,
+            'rule_set_version': self.rule_set_version,
+            'valid': self.is_valid,
+            'error_count': self.error_count,
+            'warning_count': self.warning_count,
+            'info_count': self.info_count,
+            'issues': self.issues or [],
+            'validated_at': self.validated_at.isoformat() if self.validated_at else None,
+        }
+
+
+class ValidationRuleSetVersion(db.Model):
+    """
+    Per-rule digests of a validation rule set, keyed by the rule-set version.
+
+    Comparing the digests of a stored result's version with the current ones
+    tells which rules changed since the entry was last validated.
+    """
+    __tablename__ = 'validation_rule_set_versions'
+
+    version = db.Column(db.String(64), primary_key=True)
+    rule_digests = db.Column(db.JSON, nullable=False)  # {rule_id: digest}
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @classmethod
+    def get_digests(cls, version: str) -> Optional[Dict[str, str]]:
+        row = db.session.get(cls, version)
+        return dict(row.rule_digests) if row else None
+
+    @classmethod
+    def record(cls, version: str, rule_digests: Dict[str, str]) -> None:
+        if db.session.get(cls, version) is None:
+            db.session.add(cls(version=version, rule_digests=rule_digests))
+            safe_commit(db, "validation_cache_models")
+
+
+class ValidationRunLock(db.Model):
+    """
+    The whole-dictionary validation run in progress, one row per database.
+
+    Held in the database rather than in memory so that only one run starts
+    even with several application processes. A run that stops updating
+    ``heartbeat_at`` for ``STALE_AFTER`` (e.g. its process died) no longer
+    blocks a new one.
+    """
+    __tablename__ = 'validation_run_locks'
+
+    STALE_AFTER = timedelta(minutes=30)
+
+    db_name = db.Column(db.String(255), primary_key=True)
+    job_id = db.Column(db.String(64), nullable=False)
+    started_at = db.Column(db.DateTime, default=datetime.utcnow)
+    heartbeat_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    @classmethod
+    def acquire(cls, db_name: str, job_id: str) -> Optional[str]:
+        """Take the lock for ``job_id``; returns None, or the job ID of the active run."""
+        now = datetime.utcnow()
+        row = db.session.get(cls, db_name)
+        if row is None:
+            db.session.add(cls(db_name=db_name, job_id=job_id, started_at=now, heartbeat_at=now))
+            try:
+                db.session.commit()
+                return None
+            except IntegrityError:
+                # Another request inserted the row first
+                db.session.rollback()
+                return cls.acquire(db_name, job_id)
+        if now - row.heartbeat_at < cls.STALE_AFTER:
+            return row.job_id
+        # Take over a stale lock, unless another request just did
+        taken = cls.query.filter(
+            cls.db_name == db_name, cls.heartbeat_at == row.heartbeat_at
+        ).update({'job_id': job_id, 'started_at': now, 'heartbeat_at': now}, synchronize_session=False)
+        safe_commit(db, "validation_cache_models")
+        return None if taken else cls.query.filter_by(db_name=db_name).one().job_id
+
+    @classmethod
+    def heartbeat(cls, db_name: str, job_id: str) -> None:
+        cls.query.filter_by(db_name=db_name, job_id=job_id).update(
+            {'heartbeat_at': datetime.utcnow()}, synchronize_session=False)
+        safe_commit(db, "validation_cache_models")
+
+    @classmethod
+    def release(cls, db_name: str, job_id: str) -> None:
+        cls.query.filter_by(db_name=db_name, job_id=job_id).delete(synchronize_session=False)
+        safe_commit(db, "validation_cache_models")
@@ -0,0 +1,372 @@
+"""
+Namespace-free ``<entry>`` XML straight from the Entry models.
+
+``DictionaryService._prepare_entry_xml`` used to build a whole LIFT document
+with ``LIFTParser.generate_lift_string`` (ElementTree, then a minidom
+pretty-print), parse it again, strip the namespaces and serialize the entry
+once more, on every create and update. ``LIFTEntryWriter`` writes the same
+text directly: the same elements in the same order as
+``generate_lift_string``/``_serialize_sense_elem``, with the minidom layout
+(two-space indentation from the entry's depth in ``<lift>``, ``<tag>text</tag>``
+leaves, ``<tag />`` for empty elements) and ElementTree escaping. The golden
+files in tests/unit/data/entry_xml pin the output.
+
+When the ElementTree serializer changes, change this writer with it.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from app.models.sense import Sense
+
+SENSE_SPECIFIC_FIELDS = ('exemplar', 'scientific-name', 'literal-meaning')
+INDENT = '  '
+
+
+def _escape_text(text: str) -> str:
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    if '\r' in text:
+        # A parser reading the text back turns CR and CRLF into LF
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _escape_attrib(value: str) -> str:
+    if not isinstance(value, str):
+        raise TypeError(f"cannot serialize {value!r} (type {type(value).__name__})")
+    value = _escape_text(value)
+    if '"' in value:
+        value = value.replace('"', '&quot;')
+    if '\n' in value or '\t' in value:
+        # Attribute-value normalization (the round trip stored these as spaces)
+        value = value.replace('\n', ' ').replace('\t', ' ')
+    return value
+
+
+class _XMLWriter:
+    """Indenting element writer; an element's ``>`` is written with its first child."""
+
+    def __init__(self, depth: int = 1) -> None:
+        self.parts: List[str] = []
+        self._open: List[List[Any]] = []  # [tag, has_children]
+        self._depth = depth
+
+    def _child(self) -> None:
+        if self._open:
+            parent = self._open[-1]
+            if not parent[1]:
+                self.parts.append('>')
+                parent[1] = True
+            self.parts.append('\n' + INDENT * (self._depth + len(self._open)))
+
+    def _start_tag(self, tag: str, attrib: Optional[Dict[str, str]]) -> None:
+        self.parts.append('<' + tag)
+        if attrib:
+            for name, value in attrib.items():
+                self.parts.append(f' {name}="{_escape_attrib(value)}"')
+
+    def start(self, tag: str, attrib: Optional[Dict[str, str]] = None) -> None:
+        self._child()
+        self._start_tag(tag, attrib)
+        self._open.append([tag, False])
+
+    def end(self) -> None:
+        tag, has_children = self._open.pop()
+        if has_children:
+            self.parts.append('\n' + INDENT * (self._depth + len(self._open)) + f'</{tag}>')
+        else:
+            self.parts.append(' />')
+
+    def leaf(self, tag: str, attrib: Optional[Dict[str, str]] = None, text: Optional[str] = None) -> None:
+        self._child()
+        self._start_tag(tag, attrib)
+        if text:
+            self.parts.append(f'>{_escape_text(text)}</{tag}>')
+        else:
+            self.parts.append(' />')
+
+    def form(self, lang: str, text: str, tag: str = 'form') -> None:
+        """``<form lang="..."><text>...</text></form>`` (or ``<gloss>``)."""
+        self.start(tag, {'lang': lang})
+        self.leaf('text', text=text)
+        self.end()
+
+    def getvalue(self) -> str:
+        return ''.join(self.parts)
+
+
+class LIFTEntryWriter:
+    """Writes one Entry as the namespace-free ``<entry>`` element stored in BaseX."""
+
+    def write_entry(self, entry) -> str:
+        w = _XMLWriter()
+        attrib = {'id': entry.id} if entry.id else {}
+        if entry.date_created:
+            attrib['dateCreated'] = entry.date_created
+        if entry.date_modified:
+            attrib['dateModified'] = entry.date_modified
+        if entry.date_deleted:
+            attrib['dateDeleted'] = entry.date_deleted
+        if entry.homograph_number is not None:
+            attrib['order'] = str(entry.homograph_number)
+        elif entry.order is not None:
+            attrib['order'] = str(entry.order)
+        w.start('entry', attrib)
+
+        if getattr(entry, 'grammatical_info', None):
+            w.leaf('grammatical-info', {'value': entry.grammatical_info})
+
+        if entry.lexical_unit:
+            w.start('lexical-unit')
+            for lang, text in entry.lexical_unit.items():
+                w.form(lang, str(text['text'] if isinstance(text, dict) and 'text' in text else text))
+            w.end()
+
+        traits = dict(entry.traits) if getattr(entry, 'traits', None) else {}
+        domain_type = getattr(entry, 'domain_type', None)
+        if domain_type:
+            traits.pop('domain-type', None)
+        for name, value in traits.items():
+            w.leaf('trait', {'name': name, 'value': value})
+        if domain_type:
+            for value in (domain_type if isinstance(domain_type, list) else [domain_type]):
+                w.leaf('trait', {'name': 'domain-type', 'value': value})
+
+        for lang, text in (getattr(entry, 'pronunciations', None) or {}).items():
+            w.start('pronunciation')
+            w.form(lang, str(text))
+            w.end()
+
+        for media in getattr(entry, 'pronunciation_media', None) or []:
+            w.start('pronunciation')
+            self._write_media(w, 'media', media)
+            w.end()
+
+        self._write_fields(w, getattr(entry, 'custom_fields', None))
+        self._write_annotations(w, getattr(entry, 'annotations', None))
+        self._write_notes(w, getattr(entry, 'notes', None))
+
+        for citation in getattr(entry, 'citations', None) or []:
+            if not isinstance(citation, dict):
+                continue
+            w.start('citation')
+            if 'lang' in citation and 'text' in citation:
+                items = [(citation['lang'], citation['text'])]
+            else:
+                items = [(k, v) for k, v in citation.items() if isinstance(v, (str, dict))]
+            for lang, text in items:
+                if text:
+                    w.form(lang, str(text['text'] if isinstance(text, dict) else text))
+            w.end()
+
+        for sense in entry.senses:
+            w.start('sense', {'id': sense.id} if sense.id else {})
+            self._write_sense(w, sense)
+            w.end()
+
+        for variant in entry.variants:
+            w.start('variant')
+            for lang, text in (variant.form or {}).items():
+                w.form(lang, str(text['text'] if isinstance(text, dict) else text))
+            for name, value in (getattr(variant, 'traits', None) or {}).items():
+                w.leaf('trait', {'name': name, 'value': value})
+            if getattr(variant, 'grammatical_info', None):
+                self._write_grammatical_info(w, variant.grammatical_info, getattr(variant, 'grammatical_traits', None))
+            w.end()
+
+        for relation in entry.relations:
+            rel_attrib = {'type': relation.type, 'ref': relation.ref}
+            if getattr(relation, 'order', None) is not None:
+                rel_attrib['order'] = str(relation.order)
+            self._write_with_traits(w, 'relation', rel_attrib, getattr(relation, 'traits', None))
+
+        for etym in getattr(entry, 'etymologies', None) or []:
+            etym_attrib = {}
+            if etym.type:
+                etym_attrib['type'] = etym.type
+            if etym.source:
+                etym_attrib['source'] = etym.source
+            w.start('etymology', etym_attrib)
+            for lang, text in (etym.form or {}).items():
+                w.form(lang, str(text))
+            for lang, text in (etym.gloss or {}).items():
+                w.form(lang, str(text), tag='gloss')
+            if etym.comment:
+                self._write_field(w, 'comment', etym.comment)
+            for field_type, content in (etym.custom_fields or {}).items():
+                if field_type != 'comment':
+                    self._write_field(w, field_type, content)
+            w.end()
+
+        w.end()
+        w.parts.append('\n')
+        return w.getvalue()
+
+    def _write_sense(self, w: _XMLWriter, sense) -> None:
+        if sense.grammatical_info:
+            self._write_grammatical_info(w, sense.grammatical_info, getattr(sense, 'grammatical_traits', None))
+
+        definition = getattr(sense, 'definition', None)
+        if definition:
+            w.start('definition')
+            for lang, text in definition.items():
+                w.form(lang, str(text['text'] if isinstance(text, dict) else text))
+            w.end()
+
+        for lang, text in (getattr(sense, 'gloss', None) or {}).items():
+            w.form(lang, str(text['text'] if isinstance(text, dict) else text), tag='gloss')
+
+        for value in getattr(sense, 'usage_type', None) or []:
+            w.leaf('trait', {'name': 'usage-type', 'value': value})
+        for value in getattr(sense, 'domain_type', None) or []:
+            w.leaf('trait', {'name': 'domain-type', 'value': value})
+        for value in getattr(sense, 'semantic_domains', None) or []:
+            w.leaf('trait', {'name': 'semantic-domain-ddp4', 'value': value})
+        for name, value in (getattr(sense, 'traits', None) or {}).items():
+            w.leaf('trait', {'name': name, 'value': value})
+
+        for field_type, attr in zip(SENSE_SPECIFIC_FIELDS, ('exemplar', 'scientific_name', 'literal_meaning')):
+            content = getattr(sense, attr, None)
+            if content:
+                self._write_field(w, field_type, content)
+        for field_type, content in (getattr(sense, 'custom_fields', None) or {}).items():
+            if field_type not in SENSE_SPECIFIC_FIELDS:
+                self._write_field(w, field_type, content)
+
+        for example in getattr(sense, 'examples', None) or []:
+            self._write_example(w, example)
+
+        self._write_annotations(w, getattr(sense, 'annotations', None))
+
+        for relation in getattr(sense, 'relations', None) or []:
+            rel_attrib = {'type': relation.get('type', ''), 'ref': relation.get('ref', '')}
+            if 'order' in relation and relation['order'] is not None:
+                rel_attrib['order'] = str(relation['order'])
+            self._write_with_traits(w, 'relation', rel_attrib, relation.get('traits'))
+
+        for illustration in getattr(sense, 'illustrations', None) or []:
+            self._write_media(w, 'illustration', illustration)
+
+        self._write_notes(w, getattr(sense, 'notes', None))
+
+        for reversal in getattr(sense, 'reversals', None) or []:
+            if not isinstance(reversal, dict):
+                continue
+            w.start('reversal', {'type': str(reversal['type'])} if reversal.get('type') else {})
+            forms = reversal.get('forms') or {}
+            if not forms:
+                forms = {
+                    k: v for k, v in reversal.items()
+                    if k not in ('type', 'forms', 'grammatical_info', 'grammaticalInfo')
+                    and isinstance(v, (str, dict))
+                }
+            if isinstance(forms, dict):
+                for lang, text in forms.items():
+                    if text:
+                        w.form(lang, str(text['text'] if isinstance(text, dict) else text))
+            w.end()
+
+        for subsense in getattr(sense, 'subsenses', None) or []:
+            if isinstance(subsense, dict):
+                subsense = Sense(**subsense)
+            w.start('subsense')
+            self._write_sense(w, subsense)
+            w.end()
+
+    def _write_example(self, w: _XMLWriter, example) -> None:
+        if isinstance(example, dict):
+            # Legacy format - simple example
+            w.start('example')
+            if 'en' in example:
+                w.form('en', str(example['en']))
+            w.end()
+            return
+        if not getattr(example, 'form', None):
+            return
+        attrib = {}
+        if getattr(example, 'id', None):
+            attrib['id'] = example.id
+        if getattr(example, 'source', None):
+            attrib['source'] = example.source
+        w.start('example', attrib)
+        for lang, text in example.form.items():
+            w.form(lang, str(text))
+        for lang, text in (getattr(example, 'translations', None) or {}).items():
+            w.start('translation')
+            w.form(lang, str(text))
+            w.end()
+        if getattr(example, 'note', None):
+            self._write_field(w, 'note', example.note)
+        for field_type, content in (getattr(example, 'custom_fields', None) or {}).items():
+            self._write_field(w, field_type, content)
+        w.end()
+
+    @staticmethod
+    def _write_grammatical_info(w: _XMLWriter, value: str, traits: Optional[Dict[str, str]]) -> None:
+        LIFTEntryWriter._write_with_traits(w, 'grammatical-info', {'value': value}, traits)
+
+    @staticmethod
+    def _write_with_traits(w: _XMLWriter, tag: str, attrib: Dict[str, str], traits: Optional[Dict[str, str]]) -> None:
+        w.start(tag, attrib)
+        for name, value in (traits or {}).items():
+            w.leaf('trait', {'name': name, 'value': value})
+        w.end()
+
+    @staticmethod
+    def _write_field(w: _XMLWriter, field_type: str, content: Dict[str, Any]) -> None:
+        w.start('field', {'type': field_type})
+        for lang, text in content.items():
+            w.form(lang, str(text))
+        w.end()
+
+    def _write_fields(self, w: _XMLWriter, fields: Optional[Dict[str, Dict[str, Any]]]) -> None:
+        for field_type, content in (fields or {}).items():
+            self._write_field(w, field_type, content)
+
+    @staticmethod
+    def _write_media(w: _XMLWriter, tag: str, media: Dict[str, Any]) -> None:
+        w.start(tag, {'href': media['href']})
+        if media.get('label'):
+            w.start('label')
+            for lang, text in media['label'].items():
+                w.form(lang, str(text))
+            w.end()
+        w.end()
+
+    @staticmethod
+    def _write_annotations(w: _XMLWriter, annotations: Optional[List[Dict[str, Any]]]) -> None:
+        for annotation in annotations or []:
+            attrib = {'name': annotation.get('name', '')}
+            for key in ('value', 'who', 'when'):
+                if annotation.get(key):
+                    attrib[key] = annotation[key]
+            w.start('annotation', attrib)
+            for lang, text in (annotation.get('content') or {}).items():
+                w.form(lang, str(text))
+            w.end()
+
+    @staticmethod
+    def _write_notes(w: _XMLWriter, notes: Optional[Dict[str, Any]]) -> None:
+        for note_type, note_data in (notes or {}).items():
+            w.start('note', {'type': str(note_type)})
+            if isinstance(note_data, str):
+                w.form('en', note_data)
+            elif isinstance(note_data, dict):
+                for lang, text in note_data.items():
+                    if text:
+                        w.form(lang, str(text['text'] if isinstance(text, dict) else text))
+            elif note_data is not None:
+                w.form('en', str(note_data))
+            w.end()
+
+
+_writer = LIFTEntryWriter()
+
+
+def write_entry_xml(entry) -> str:
+    """The namespace-free ``<entry>`` XML of ``entry`` (see module docstring)."""
+    return _writer.write_entry(entry)
@@ -6,8 +6,9 @@ import logging
 import os
 import re
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Any, Optional, Set
+from typing import Callable, Dict, List, Any, Optional, Set, Union
 
+from app.models.compact_entry import CompactEntry
 from app.models.entry import Entry, Etymology, Relation, Variant
 from app.models.sense import Sense
 from app.models.example import Example
@@ -23,26 +24,15 @@ class LIFTParser:
         'flex': 'http://fieldworks.sil.org/schemas/flex/0.1'
     }
     
+    LIFT_PREFIX = '{http://fieldworks.sil.org/schemas/lift/0.13}'
+
+    # Field types Sense pulls out of custom_fields (searched anywhere below the sense)
+    SENSE_SPECIFIC_FIELDS = ('exemplar', 'scientific-name', 'literal-meaning')
+
     def __init__(self, validate: bool = True):
         self.validate = validate
         self.logger = logging.getLogger(__name__)
 
-    # ==================== COMMON PARSING HELPERS ====================
-    
-    def _parse_common_fields(self, elem: ET.Element) -> Dict[str, Any]:
-        """
-        Parse common fields present in entries and senses: traits, notes, custom_fields, annotations.
-        
-        Returns:
-            Dict with 'traits', 'notes', 'custom_fields', 'annotations' keys.
-        """
-        return {
-            'traits': self._parse_traits(elem),
-            'notes': self._parse_notes(elem),
-            'custom_fields': self._parse_custom_fields(elem),
-            'annotations': [self._parse_annotation(a) for a in self._find_elements(elem, './lift:annotation')]
-        }
-
     def parse(self, input_data: str, is_file_path: bool = False) -> List[Entry]:
         """
         Generic parse method that can handle either file paths or XML strings.
@@ -94,44 +84,6 @@ class LIFTParser:
     def _find_elements(self, parent: ET.Element, xpath: str) -> List[ET.Element]:
         return self._find(parent, xpath, single=False)
 
-    # ==================== ATTRIBUTE HELPER ====================
-    
-    def _get_attr(self, parent: ET.Element, xpath: str, attr: str) -> Optional[str]:
-        """Get attribute from element if it exists."""
-        elem = self._find_element(parent, xpath)
-        if elem is not None:
-            return elem.get(attr)
-        return None
-
-    # ==================== MULTILINGUAL PARSING ====================
-    
-    # ==================== MULTILINGUAL PARSING ====================
-    
-    def _parse_multitext(self, parent: ET.Element, xpath: str, form_tag: str = 'lift:form', flatten: bool = False) -> Dict:
-        """Parse multilingual form/text structure.
-        Set flatten=True to get Dict[str, str], otherwise Dict[str, Dict[str, str]]."""
-        result = {}
-        target_path = f'{xpath}/{form_tag}' if xpath != '.' else f'./{form_tag}'
-        
-        for form in self._find_elements(parent, target_path):
-            lang = form.get('lang', 'und')
-            text = self._find_element(form, 'lift:text')
-            if text is not None:
-                if text.text and text.text.strip():
-                    if flatten:
-                        result[lang] = text.text.strip()
-                    else:
-                        result[lang] = {'text': text.text.strip()}
-        return result
-
-    def _parse_text_content(self, elem: ET.Element) -> Dict:
-        """Parse <form><text> or direct text content."""
-        if content := self._parse_multitext(elem, '.', flatten=False):
-            return content
-        if elem.text and elem.text.strip():
-            return {'und': elem.text.strip()}
-        return {}
-
     # ==================== ENTRY PARSING ====================
     
     def parse_file(self, file_path: str) -> List[Entry]:
@@ -145,6 +97,13 @@ class LIFTParser:
         xml_string = self._normalize_xml(xml_string)
         return self._parse_entries(ET.fromstring(xml_string))
 
+    def parse_string_compact(self, xml_string: str) -> List[CompactEntry]:
+        """``parse_string`` for bulk reads: each entry is packed into a
+        ``CompactEntry`` as soon as it is parsed."""
+        reject_xxe(xml_string)
+        xml_string = self._normalize_xml(xml_string)
+        return self._parse_entries(ET.fromstring(xml_string), pack=CompactEntry.from_entry)
+
     def _normalize_xml(self, xml: str) -> str:
         """Handle multiple entries without root or extra XML declarations."""
         from app.utils.normalization_service import normalize_lift_xml
@@ -152,8 +111,10 @@ class LIFTParser:
         self.logger.debug(f"Normalized XML: {xml[:100]}...")
         return xml
 
-    def _parse_entries(self, root: ET.Element) -> List[Entry]:
-        """Parse all entries from root."""
+    def _parse_entries(
+        self, root: ET.Element, pack: Optional[Callable[[Entry], CompactEntry]] = None
+    ) -> List[Union[Entry, CompactEntry]]:
+        """Parse all entries from root: ``Entry`` models, or what ``pack`` turns each into."""
         # Parse header information if present
         header_info = self._parse_header(root)
 
@@ -167,7 +128,7 @@ class LIFTParser:
                     entry.header_info = header_info
                 if self.validate:
                     entry.validate()
-                entries.append(entry)
+                entries.append(pack(entry) if pack else entry)
             except ValidationError as e:
                 self.logger.warning(f"Skipping invalid entry {entry_elem.get('id', 'unknown')}: {e}")
                 if self.validate:
@@ -681,158 +642,236 @@ class LIFTParser:
         """Backward compatible wrapper for _parse_entry."""
         return self._parse_entry(elem)
 
+    # ==================== SINGLE-PASS ENTRY PARSING ====================
+    #
+    # XPath lookups run twice when the document is not namespaced (once with
+    # ``lift:`` and once without) and search the same children once per field.
+    # The readers below walk each element's children once, bucketing them by
+    # local name, and build the models from the buckets. Per tag,
+    # LIFT-namespaced children win over un-namespaced ones, which is the
+    # ``_find`` fallback rule.
+
+    def _children(self, elem: ET.Element) -> Dict[str, List[ET.Element]]:
+        """Children of ``elem`` by local name (LIFT namespace or none)."""
+        prefix = self.LIFT_PREFIX
+        namespaced: Dict[str, List[ET.Element]] = {}
+        plain: Dict[str, List[ET.Element]] = {}
+        for child in elem:
+            tag = child.tag
+            if not isinstance(tag, str):
+                continue  # comments and processing instructions
+            if tag.startswith(prefix):
+                namespaced.setdefault(tag[len(prefix):], []).append(child)
+            elif tag[:1] != '{':
+                plain.setdefault(tag, []).append(child)
+        if not namespaced:
+            return plain
+        for tag, children in plain.items():
+            namespaced.setdefault(tag, children)
+        return namespaced
+
+    def _first_child(self, elem: ET.Element, tag: str) -> Optional[ET.Element]:
+        """First ``tag`` child of ``elem``, preferring the LIFT namespace."""
+        namespaced_tag = self.LIFT_PREFIX + tag
+        plain = None
+        for child in elem:
+            if child.tag == namespaced_tag:
+                return child
+            if plain is None and child.tag == tag:
+                plain = child
+        return plain
+
+    def _read_multitext(self, containers: List[ET.Element], form_tag: str = 'form', flatten: bool = True) -> Dict:
+        """Texts by language from the ``form_tag`` children of ``containers``.
+        Set flatten=False to get Dict[str, Dict[str, str]]."""
+        result = {}
+        for container in containers:
+            for form in self._children(container).get(form_tag, ()):
+                text = self._first_child(form, 'text')
+                if text is not None and text.text and text.text.strip():
+                    result[form.get('lang', 'und')] = text.text.strip() if flatten else {'text': text.text.strip()}
+        return result
+
+    @staticmethod
+    def _read_traits(traits: List[ET.Element]) -> Optional[Dict[str, str]]:
+        result = {t.get('name'): t.get('value') for t in traits if t.get('name') and t.get('value')}
+        return result if result else None
+
+    def _read_notes(self, notes: List[ET.Element]) -> Dict[str, Dict]:
+        result = {}
+        for note in notes:
+            content = self._read_multitext([note], flatten=False)
+            if not content and note.text and note.text.strip():
+                content = {'und': note.text.strip()}
+            if content:
+                result[note.get('type', 'general')] = content
+        return normalize_multilingual_dict(result)
+
+    def _read_fields(self, fields: List[ET.Element], skip) -> Dict[str, Dict]:
+        """Typed field contents, except the types in ``skip``."""
+        result = {}
+        for field in fields:
+            field_type = field.get('type')
+            if field_type and field_type not in skip:
+                content = self._read_multitext([field])
+                if content:
+                    result[field_type] = content
+        return result
+
+    def _read_annotations(self, annotations: List[ET.Element]) -> List[Dict[str, Any]]:
+        return [{
+            'name': a.get('name'),
+            'value': a.get('value'),
+            'who': a.get('who'),
+            'when': a.get('when'),
+            'content': self._read_multitext([a]),
+        } for a in annotations]
+
+    def _read_media(self, media_elems: List[ET.Element]) -> List[Dict[str, Any]]:
+        """Media/illustration dicts: href plus the label, if it has forms."""
+        result = []
+        for media in media_elems:
+            media_data = {'href': media.get('href', '')}
+            label = self._first_child(media, 'label')
+            if label is not None and len(label):
+                label_texts = self._read_multitext([label])
+                if label_texts:
+                    media_data['label'] = label_texts
+            result.append(media_data)
+        return result
+
     def _parse_entry(self, elem: ET.Element) -> Entry:
-        """Parse single entry element."""
+        """Parse single entry element in one pass over its children."""
         order_val = None
         if elem.get('order'):
             try:
                 order_val = int(elem.get('order'))
             except ValueError:
                 self.logger.warning(f"Invalid order value: {elem.get('order')}")
-                
-        # Parse traits first to extract morph-type and domain-type.
-        # Pop them from the traits dict so they aren't stored twice
-        # (once as dedicated field, once inside traits).
-        traits = self._parse_traits(elem) or {}
+
+        children = self._children(elem)
+        traits = self._read_traits(children.get('trait', ())) or {}
         morph_type = traits.pop('morph-type', None) if traits else None
         domain_type = traits.pop('domain-type', None) if traits else None
-        
-        # Parse common fields
-        common = self._parse_common_fields(elem)
-        
+
+        pronunciations = {}
+        media = []
+        for pron in children.get('pronunciation', ()):
+            pronunciations.update(self._read_multitext([pron]))
+            media.extend(self._read_media(self._children(pron).get('media', ())))
+        grammatical_info = children.get('grammatical-info')
+
         return Entry(
             id_=elem.get('id') if elem.get('id') is not None else self._generate_id(),
             date_created=elem.get('dateCreated'),
             date_modified=elem.get('dateModified'),
             date_deleted=elem.get('dateDeleted'),
             order=order_val,
-            homograph_number=order_val, # LIFT 'order' is often used for homograph numbers
-            lexical_unit=self._parse_multitext(elem, './lift:lexical-unit', flatten=True),
-            citations=[self._parse_multitext(c, '.', flatten=True) for c in self._find_elements(elem, './lift:citation')],
-            pronunciations=self._parse_pronunciations(elem),
-            pronunciation_media=self._parse_pronunciation_media(elem),
-            variants=[self._parse_variant(v) for v in self._find_elements(elem, './lift:variant')],
-            grammatical_info=self._get_attr(elem, './lift:grammatical-info', 'value'),
+            homograph_number=order_val,
+            lexical_unit=self._read_multitext(children.get('lexical-unit', ())),
+            citations=[self._read_multitext([c]) for c in children.get('citation', ())],
+            pronunciations=pronunciations,
+            pronunciation_media=media,
+            variants=[self._read_variant(v) for v in children.get('variant', ())],
+            grammatical_info=grammatical_info[0].get('value') if grammatical_info else None,
             morph_type=morph_type,
             domain_type=domain_type,
             traits=traits,
-            relations=[self._parse_relation(r) for r in self._find_elements(elem, './lift:relation')],
-            etymologies=[self._parse_etymology(e) for e in self._find_elements(elem, './lift:etymology')],
-            notes=common['notes'],
-            custom_fields=common['custom_fields'],
-            senses=[self._parse_sense(s) for s in self._find_elements(elem, './lift:sense')],
-            annotations=common['annotations']
+            relations=[Relation(type=r.get('type', ''), ref=r.get('ref', ''),
+                                traits=self._read_traits(self._children(r).get('trait', ())))
+                       for r in children.get('relation', ())],
+            etymologies=[self._read_etymology(e) for e in children.get('etymology', ())],
+            notes=self._read_notes(children.get('note', ())),
+            custom_fields=self._read_fields(children.get('field', ()), self.SENSE_SPECIFIC_FIELDS),
+            senses=[self._read_sense(s) for s in children.get('sense', ())],
+            annotations=self._read_annotations(children.get('annotation', ())),
         )
 
-    def _parse_pronunciations(self, parent: ET.Element) -> Dict[str, str]:
-        """Parse pronunciation elements."""
+    def _specific_fields(self, elem: ET.Element) -> Dict[str, Dict[str, str]]:
+        """First exemplar/scientific-name/literal-meaning field anywhere below ``elem``."""
+        prefix = self.LIFT_PREFIX
+        namespaced: Dict[str, ET.Element] = {}
+        plain: Dict[str, ET.Element] = {}
+        for field in elem.iter():
+            if field is elem or field.tag not in (prefix + 'field', 'field'):
+                continue
+            field_type = field.get('type')
+            if field_type in self.SENSE_SPECIFIC_FIELDS:
+                found = namespaced if field.tag.startswith(prefix) else plain
+                found.setdefault(field_type, field)
         result = {}
-        for pron in self._find_elements(parent, './lift:pronunciation'):
-            # LIFT pronunciation can have multiple forms
-            forms = self._parse_multitext(pron, '.', flatten=True)
-            result.update(forms)
+        for field_type in self.SENSE_SPECIFIC_FIELDS:
+            field = namespaced.get(field_type, plain.get(field_type))
+            if field is not None:
+                result[field_type] = self._read_multitext([field]) or None
         return result
 
-    def _parse_pronunciation_media(self, parent: ET.Element) -> List[Dict[str, Any]]:
-        """Parse media elements within pronunciation elements."""
-        media_list = []
-        for pron in self._find_elements(parent, './lift:pronunciation'):
-            for media in self._find_elements(pron, './lift:media'):
-                media_data = {'href': media.get('href', '')}
-                
-                # Parse label if present
-                label_elem = self._find_element(media, './lift:label')
-                if label_elem:
-                    label_texts = self._parse_multitext(label_elem, '.', flatten=True)
-                    if label_texts:
-                        media_data['label'] = label_texts
-                
-                media_list.append(media_data)
-        return media_list
+    def _read_sense(self, elem: ET.Element) -> Sense:
+        """Parse sense (or subsense) element in one pass over its children."""
+        children = self._children(elem)
+        specific = self._specific_fields(elem)
+        traits = children.get('trait', ())
+        grammatical_info = children.get('grammatical-info')
+        domain_type = next((t for t in traits if t.get('name') == 'domain-type'), None)
 
-    def _parse_lexical_unit(self, parent: ET.Element) -> Dict[str, str]:
-        """Parse lexical unit elements from entry."""
-        # Use the multitext parser with the form-based approach (standard LIFT format)
-        # Format: <lexical-unit><form lang="en"><text>content</text></form></lexical-unit>
-        result = {}
-
-        # First, try the standard LIFT format with forms inside lexical-unit
-        for lu_elem in self._find_elements(parent, './lift:lexical-unit'):
-            for form_elem in self._find_elements(lu_elem, './lift:form'):
-                lang = form_elem.get('lang', 'und')
-                text_elem = self._find_element(form_elem, './lift:text')
-                if text_elem is not None and text_elem.text and text_elem.text.strip():
-                    result[lang] = text_elem.text.strip()
-
-        # If no results from form-based approach, try direct text (fallback)
-        if not result:
-            for lu_elem in self._find_elements(parent, './lift:lexical-unit'):
-                lang = lu_elem.get('lang', 'und')
-                # Get text directly from the lexical-unit element
-                text_elem = self._find_element(lu_elem, './lift:text')
-                if text_elem is not None and text_elem.text and text_elem.text.strip():
-                    result[lang] = text_elem.text.strip()
-
-        return result
-
-    def _parse_illustrations(self, parent: ET.Element) -> List[Dict[str, Any]]:
-        """Parse illustration elements within sense elements."""
-        illustrations_list = []
-        for illustration in self._find_elements(parent, './lift:illustration'):
-            illustration_data = {'href': illustration.get('href', '')}
-
-            # Parse label if present
-            label_elem = self._find_element(illustration, './lift:label')
-            if label_elem:
-                label_texts = self._parse_multitext(label_elem, '.', flatten=True)
-                if label_texts:
-                    illustration_data['label'] = label_texts
-
-            illustrations_list.append(illustration_data)
-        return illustrations_list
-
-    def _parse_variant(self, elem: ET.Element) -> Variant:
-        """Parse variant element."""
-        # Parse direct trait elements within the variant element
-        direct_traits = {}
-        # Use the existing _find_elements method which handles namespace fallback
-        for trait_elem in self._find_elements(elem, './lift:trait'):
-            trait_name = trait_elem.get('name')
-            trait_value = trait_elem.get('value')
-            if trait_name and trait_value:
-                # Add to variant traits, not just grammatical_traits
-                direct_traits[trait_name] = trait_value
+        return Sense(
+            id_=elem.get('id'),
+            glosses=self._read_multitext([elem], form_tag='gloss'),
+            definitions=self._read_multitext(children.get('definition', ())),
+            examples=[self._read_example(e) for e in children.get('example', ())],
+            relations=[{'type': r.get('type', ''), 'ref': r.get('ref', '')} for r in children.get('relation', ())],
+            grammatical_info=grammatical_info[0].get('value') if grammatical_info else None,
+            grammatical_traits=(self._read_traits(self._children(grammatical_info[0]).get('trait', ()))
+                                if grammatical_info else None),
+            usage_type=[v for t in traits if t.get('name') == 'usage-type' and (v := t.get('value'))],
+            domain_type=domain_type.get('value') if domain_type is not None else None,
+            semantic_domains=[v for t in traits if t.get('name') == 'semantic-domain-ddp4' and (v := t.get('value'))],
+            notes=self._read_notes(children.get('note', ())),
+            custom_fields=self._read_fields(children.get('field', ()), self.SENSE_SPECIFIC_FIELDS),
+            illustrations=self._read_media(children.get('illustration', ())),
+            traits={t.get('name'): t.get('value') for t in traits
+                    if t.get('name') not in ('domain-type', 'semantic-domain-ddp4', 'usage-type')},
+            annotations=self._read_annotations(children.get('annotation', ())),
+            subsenses=[self._read_sense(s) for s in children.get('subsense', ())],
+            exemplar=specific.get('exemplar'),
+            scientific_name=specific.get('scientific-name'),
+            literal_meaning=specific.get('literal-meaning'),
+        )
 
-        return Variant(
-            type=elem.get('type', ''),
-            ref=elem.get('ref', ''),
-            form=self._parse_multitext(elem, '.', flatten=True),
-            grammatical_info=self._get_attr(elem, './lift:grammatical-info', 'value'),
-            grammatical_traits=self._parse_traits(self._find_element(elem, './lift:grammatical-info')),
-            traits=direct_traits if direct_traits else None
+    def _read_example(self, elem: ET.Element) -> Example:
+        children = self._children(elem)
+        fields = children.get('field', ())
+        return Example(
+            id_=elem.get('id'),
+            form=self._read_multitext([elem]),
+            translations=self._read_multitext(children.get('translation', ())),
+            source=elem.get('source'),
+            note=self._read_multitext([f for f in fields if f.get('type') == 'note']) or None,
+            custom_fields=self._read_fields(fields, ('note',)),
         )
 
-    def _parse_relation(self, elem: ET.Element) -> Relation:
-        """Parse relation element."""
-        return Relation(
+    def _read_variant(self, elem: ET.Element) -> Variant:
+        children = self._children(elem)
+        grammatical_info = children.get('grammatical-info')
+        return Variant(
             type=elem.get('type', ''),
             ref=elem.get('ref', ''),
-            traits=self._parse_traits(elem)
+            form=self._read_multitext([elem]),
+            grammatical_info=grammatical_info[0].get('value') if grammatical_info else None,
+            grammatical_traits=(self._read_traits(self._children(grammatical_info[0]).get('trait', ()))
+                                if grammatical_info else None),
+            traits=self._read_traits(children.get('trait', ())),
         )
 
-    def _parse_etymology(self, elem: ET.Element) -> Etymology:
-        """Parse etymology element."""
-        comment_content = self._parse_multitext(elem, './lift:field[@type="comment"]', flatten=True)
-        # Convert empty dict to None for backward compatibility
-        comment = comment_content if comment_content else None
-        
+    def _read_etymology(self, elem: ET.Element) -> Etymology:
+        fields = self._children(elem).get('field', ())
         return Etymology(
             type=elem.get('type', ''),
             source=elem.get('source', ''),
-            form=self._parse_multitext(elem, '.', flatten=True),
-            gloss=self._parse_multitext(elem, '.', form_tag='lift:gloss', flatten=True),
-            comment=comment,
-            custom_fields=self._parse_etymology_custom_fields(elem)
+            form=self._read_multitext([elem]),
+            gloss=self._read_multitext([elem], form_tag='gloss'),
+            comment=self._read_multitext([f for f in fields if f.get('type') == 'comment']) or None,
+            custom_fields=self._read_fields(fields, ('comment',)),
         )
 
     def _parse_header(self, lift_root: ET.Element) -> Dict[str, Any]:
@@ -907,139 +946,6 @@ class LIFTParser:
                         'type': field_data['type']
                     })
 
-    def _parse_etymology_custom_fields(self, parent: ET.Element) -> Dict[str, Dict]:
-        """Parse custom field elements in etymology, excluding 'comment' which is handled separately."""
-        fields = {}
-        for field in self._find_elements(parent, './lift:field'):
-            if field_type := field.get('type'):
-                # Skip 'comment' field as it's handled separately
-                if field_type == 'comment':
-                    continue
-                # Use flattened multitext for custom fields
-                content = self._parse_multitext(field, '.', flatten=True)
-                if content:
-                    fields[field_type] = content
-        return fields
-
-    def _parse_notes(self, parent: ET.Element) -> Dict[str, Dict]:
-        """Parse note elements."""
-        notes = {}
-        for note in self._find_elements(parent, './lift:note'):
-            note_type = note.get('type', 'general')
-            content = self._parse_text_content(note)
-            # Also support direct text-only note without forms
-            if not content and note.text and note.text.strip():
-                content = {'und': note.text.strip()}
-            if content:
-                notes[note_type] = content
-        return normalize_multilingual_dict(notes)
-
-    def _parse_traits(self, parent: ET.Element) -> Optional[Dict[str, str]]:
-        """Parse trait elements."""
-        if parent is None:
-            return None
-        traits = {t.get('name'): t.get('value') for t in self._find_elements(parent, './lift:trait') 
-                  if t.get('name') and t.get('value')}
-        return traits if traits else None
-    def _parse_specific_field(self, parent: ET.Element, field_type: str) -> Optional[Dict[str, str]]:
-        """Parse a specific field type (exemplar, scientific-name, literal-meaning)."""
-        field_elem = self._find_element(parent, f'.//lift:field[@type="{field_type}"]')
-        if field_elem is not None:
-            content = self._parse_multitext(field_elem, '.', flatten=True)
-            return content if content else None
-        return None
-
-    def _parse_custom_fields(self, parent: ET.Element) -> Dict[str, Dict]:
-        """Parse field elements."""
-        fields = {}
-        for field in self._find_elements(parent, './lift:field'):
-            if field_type := field.get('type'):
-                # Skip specific field types that are handled separately
-                if field_type in ['exemplar', 'scientific-name', 'literal-meaning']:
-                    continue
-                # Use flattened multitext for custom fields
-                content = self._parse_multitext(field, '.', flatten=True)
-                if content:
-                    fields[field_type] = content
-        return fields
-
-    def _parse_sense(self, elem: ET.Element) -> Sense:
-        """Parse sense element."""
-        # Parse specific custom field types
-        exemplar_field = self._parse_specific_field(elem, 'exemplar')
-        scientific_name_field = self._parse_specific_field(elem, 'scientific-name')
-        literal_meaning_field = self._parse_specific_field(elem, 'literal-meaning')
-        
-        # Parse common fields
-        common_fields = self._parse_common_fields(elem)
-        
-        return Sense(
-            id_=elem.get('id'),
-            glosses=self._parse_multitext(elem, '.', form_tag='lift:gloss', flatten=True),
-            definitions=self._parse_multitext(elem, './lift:definition', flatten=True),
-            examples=[self._parse_example(e) for e in self._find_elements(elem, './lift:example')],
-            relations=[self._parse_relation_dict(r) for r in self._find_elements(elem, './lift:relation')],
-            grammatical_info=self._get_attr(elem, './lift:grammatical-info', 'value'),
-            grammatical_traits=self._parse_traits(self._find_element(elem, './lift:grammatical-info')),
-            usage_type=[v for t in self._find_elements(elem, './lift:trait[@name="usage-type"]') if (v := t.get("value"))],
-            domain_type=self._get_attr(elem, './lift:trait[@name="domain-type"]', 'value'),
-            semantic_domains=[v for t in self._find_elements(elem, './lift:trait[@name="semantic-domain-ddp4"]') 
-                            if (v := t.get('value'))],
-            notes=common_fields['notes'],
-            custom_fields=common_fields['custom_fields'],
-            illustrations=self._parse_illustrations(elem),
-            traits={t.get('name'): t.get('value') for t in self._find_elements(elem, './lift:trait')
-                    if t.get('name') not in ('domain-type', 'semantic-domain-ddp4', 'usage-type')},
-            annotations=common_fields['annotations'],
-            subsenses=[self._parse_sense(s) for s in self._find_elements(elem, './lift:subsense')],
-            exemplar=exemplar_field,
-            scientific_name=scientific_name_field,
-            literal_meaning=literal_meaning_field
-        )
-
-    def _parse_relation_dict(self, elem: ET.Element) -> Dict:
-        """Parse relation into dict for sense/subsense."""
-        return {'type': elem.get('type', ''), 'ref': elem.get('ref', '')}
-
-    def _parse_example_custom_fields(self, parent: ET.Element) -> Dict[str, Dict]:
-        """Parse custom fields from example element."""
-        custom_fields = {}
-        for field_elem in self._find_elements(parent, './lift:field'):
-            field_type = field_elem.get('type')
-            if field_type and field_type != 'note':  # Skip note fields, handled separately
-                field_content = self._parse_multitext(field_elem, '.', flatten=True)
-                if field_content:
-                    custom_fields[field_type] = field_content
-        return custom_fields
-    
-    def _parse_example(self, elem: ET.Element) -> Example:
-        """Parse example element."""
-        # Parse note with flattening for Day 47-48
-        note_content = self._parse_multitext(elem, './lift:field[@type="note"]', flatten=True)
-        note = note_content if note_content else None
-        
-        # Parse custom fields with flattening for Day 47-48
-        custom_fields = self._parse_example_custom_fields(elem)
-        
-        return Example(
-            id_=elem.get('id'),
-            form=self._parse_multitext(elem, '.', flatten=True),
-            translations=self._parse_multitext(elem, './lift:translation', flatten=True),
-            source=elem.get('source'),
-            note=note,
-            custom_fields=custom_fields
-        )
-
-    def _parse_annotation(self, elem: ET.Element) -> Dict[str, Any]:
-        """Parse annotation element."""
-        return {
-            'name': elem.get('name'),
-            'value': elem.get('value'),
-            'who': elem.get('who'),
-            'when': elem.get('when'),
-            'content': self._parse_multitext(elem, '.', flatten=True)
-        }
-
     @staticmethod
     def _generate_id() -> str:
         """Generate unique ID for entry without one."""
@@ -108,50 +108,38 @@ def get_corpus_stats_ui():
         'last_updated': 'N/A'
     }
 
-    # Try to get cached corpus stats first
     cache = CacheService()
     # Skip cache during tests to avoid stale statistics
     use_cache = cache.is_available() and not current_app.testing
-    if use_cache:
-        cached_stats = cache.get('corpus_stats')
-        if cached_stats:
-            try:
-                stats_data = json.loads(cached_stats)
-                lucene_status['connected'] = True
-
-                # Use cached data
-                corpus_stats.update(stats_data)
-
-                current_app.logger.info("Using cached corpus stats for UI")
-                return jsonify({
-                    'success': True,
-                    'lucene_status': lucene_status,
-                    'corpus_stats': corpus_stats,
-                    'cached': True
-                })
-            except (json.JSONDecodeError, KeyError) as e:
-                current_app.logger.warning(f"Invalid cached corpus stats: {e}")
-
-    # If no cache or cache miss, fetch fresh data from Lucene
-    try:
+    fetched = []
+
+    def fetch_corpus_stats():
         stats = current_app.lucene_corpus_client.stats()
 
         # Check if Lucene returned valid data
         if stats.get('status') == 'unhealthy':
             raise Exception(stats.get('error', 'Lucene service unhealthy'))
 
-        lucene_status['connected'] = True
-
-        # Format stats for template
-        total_records = stats.get('total_documents', stats.get('total_records', 0))
-        corpus_stats['total_records'] = total_records
-        corpus_stats['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        fetched.append(True)
+        return json.dumps({
+            'total_records': stats.get('total_documents', stats.get('total_records', 0)),
+            'last_updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        })
 
-        # Cache the stats for 30 minutes (1800 seconds)
+    # Cached for 30 minutes (1800 seconds); concurrent misses share one Lucene call
+    cached = False
+    try:
         if use_cache:
-            cache.set('corpus_stats', json.dumps(corpus_stats), ttl=1800)
-            current_app.logger.info("Cached fresh corpus stats from Lucene for 30 minutes")
+            stats_json = cache.get_or_set('corpus_stats', fetch_corpus_stats, ttl=1800)
+        else:
+            stats_json = fetch_corpus_stats()
+        corpus_stats.update(json.loads(stats_json))
+        lucene_status['connected'] = True
+        cached = use_cache and not fetched
 
+    except json.JSONDecodeError as e:
+        current_app.logger.warning(f"Invalid cached corpus stats: {e}")
+        cache.delete('corpus_stats')
     except Exception as e:
         current_app.logger.warning(f"Could not fetch corpus statistics from Lucene: {e}")
         lucene_status['connected'] = False
@@ -161,7 +149,7 @@ def get_corpus_stats_ui():
         'success': True,
         'lucene_status': lucene_status,
         'corpus_stats': corpus_stats,
-        'cached': False
+        'cached': cached
     })
 
 
@@ -1,19 +1,120 @@
 """
-Redis caching service for performance optimization.
+Two-tier caching service for performance optimization.
+
+L1 is a bounded in-process LRU with per-key expiry; L2 is Redis. Reads check
+L1 first, so hits avoid the network round trip. When Redis is down the
+service keeps caching in L1 only. Invalidation of whole key families uses
+versioned namespaces (see ``bump_namespace``) rather than pattern deletes, and
+``get_or_set`` coalesces concurrent misses so only one caller recomputes.
 """
 from __future__ import annotations
 
+import fnmatch
 import json
 import logging
 import os
 import threading
-from typing import Any, Optional, List, ClassVar
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, List, ClassVar, Tuple
 
 import redis
 
+_MISSING = object()
+
+
+class LocalCache:
+    """Thread-safe in-process LRU cache with per-key TTL."""
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Any:
+        """Return the cached value or ``_MISSING``."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return _MISSING
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def delete_pattern(self, pattern: str) -> int:
+        with self._lock:
+            keys = [k for k in self._data if fnmatch.fnmatchcase(k, pattern)]
+            for k in keys:
+                del self._data[k]
+            return len(keys)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._data)
+            self._data.clear()
+            return count
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _PrefixStats:
+    __slots__ = ('l1_hits', 'l2_hits', 'misses', 'sets', 'coalesced')
+
+    def __init__(self) -> None:
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.coalesced = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        hits = self.l1_hits + self.l2_hits
+        lookups = hits + self.misses
+        return {
+            'l1_hits': self.l1_hits,
+            'l2_hits': self.l2_hits,
+            'misses': self.misses,
+            'sets': self.sets,
+            'coalesced': self.coalesced,
+            'hit_ratio': round(hits / lookups, 3) if lookups else 0.0,
+            'l1_hit_ratio': round(self.l1_hits / lookups, 3) if lookups else 0.0,
+        }
+
 
 class CacheService:
-    """Redis-based caching service with graceful fallback."""
+    """Two-tier (in-process L1 + Redis L2) caching service with graceful fallback.
+
+    L1 stores the same JSON text as Redis, so every read returns a fresh
+    object and both tiers hand back identical values.
+    """
+
+    # L1 entries never outlive this many seconds, which bounds how long a
+    # delete made by another process can go unnoticed here.
+    L1_MAX_TTL: ClassVar[float] = float(os.getenv('CACHE_L1_MAX_TTL', '30'))
+    L1_MAX_ENTRIES: ClassVar[int] = int(os.getenv('CACHE_L1_MAX_ENTRIES', '2048'))
+    # How long a namespace version read from Redis is trusted locally.
+    NAMESPACE_REFRESH_SECONDS: ClassVar[float] = float(os.getenv('CACHE_NAMESPACE_REFRESH_SECONDS', '2'))
+    # Upper bound on how long get_or_set waits for another process's computation.
+    SINGLE_FLIGHT_WAIT_SECONDS: ClassVar[float] = 10.0
     
     # Class-level cache of the instance to avoid repeated Redis connection attempts
     _instance: Optional['CacheService'] = None
@@ -45,6 +146,7 @@ class CacheService:
             CacheService._last_redis_enabled != current_redis_enabled):
             # Environment changed, reset and re-initialize
             self.redis_client = None
+            self.enabled = True
             CacheService._connection_attempted = False
         
         CacheService._last_redis_enabled = current_redis_enabled
@@ -55,6 +157,14 @@ class CacheService:
             
         self.logger = logging.getLogger(__name__)
         self.redis_client = None
+        self.enabled = True
+        self.local = LocalCache(self.L1_MAX_ENTRIES)
+        self._namespace_versions: Dict[str, Tuple[int, float]] = {}
+        self._flight_locks: Dict[str, threading.Lock] = {}
+        self._flight_guard = threading.Lock()
+        self._set_lock = threading.Lock()
+        self._prefix_stats: Dict[str, _PrefixStats] = {}
+        self._stats_lock = threading.Lock()
         self._initialized = True
         
         # Only attempt connection once per application lifecycle
@@ -69,6 +179,7 @@ class CacheService:
         if redis_enabled in ('false', '0', 'no', 'off'):
             self.logger.info("Redis caching disabled via REDIS_ENABLED=false")
             self.redis_client = None
+            self.enabled = False
             return
         
         try:
@@ -90,16 +201,28 @@ class CacheService:
             self.logger.info("Redis cache service connected successfully")
             
         except (redis.ConnectionError, redis.TimeoutError) as e:
-            self.logger.warning(f"Redis unavailable, caching disabled: {e}")
+            self.logger.warning(f"Redis unavailable, using in-process cache only: {e}")
             self.redis_client = None
         except Exception as e:
             self.logger.error(f"Unexpected Redis error: {e}")
             self.redis_client = None
 
     def is_available(self) -> bool:
-        """Return True if Redis is connected and available."""
+        """Return True if caching is enabled (in-process, and Redis when connected)."""
+        return getattr(self, 'enabled', True)
+
+    def is_redis_available(self) -> bool:
+        """Return True if the Redis tier is connected."""
         return self.redis_client is not None
-    
+
+    def _stats_for(self, key: str) -> _PrefixStats:
+        prefix = key.split(':', 1)[0]
+        stats = self._prefix_stats.get(prefix)
+        if stats is None:
+            with self._stats_lock:
+                stats = self._prefix_stats.setdefault(prefix, _PrefixStats())
+        return stats
+
     def set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """
         Set a value in cache with TTL.
@@ -112,11 +235,21 @@ class CacheService:
         Returns:
             True if successful, False otherwise
         """
-        if not self.redis_client:
+        if not self.is_available():
             return False
         
         try:
             serialized_value = json.dumps(value, default=str)
+        except Exception as e:
+            self.logger.error(f"Cache set error for key '{key}': {e}")
+            return False
+
+        self._stats_for(key).sets += 1
+        self.local.set(key, serialized_value, min(ttl, self.L1_MAX_TTL))
+        if not self.redis_client:
+            return True
+
+        try:
             return bool(self.redis_client.setex(key, ttl, serialized_value))
         except Exception as e:
             self.logger.error(f"Cache set error for key '{key}': {e}")
@@ -132,17 +265,112 @@ class CacheService:
         Returns:
             Cached value or None if not found/error
         """
+        if not self.is_available():
+            return None
+
+        stats = self._stats_for(key)
+        value = self._local_get(key)
+        if value is not _MISSING:
+            stats.l1_hits += 1
+            return value
+
         if not self.redis_client:
+            stats.misses += 1
             return None
         
         try:
             cached_value = self.redis_client.get(key)
             if cached_value:
-                return json.loads(cached_value.decode('utf-8'))
+                serialized_value = cached_value.decode('utf-8')
+                value = json.loads(serialized_value)
+                stats.l2_hits += 1
+                # Promote to L1 for the rest of its lifetime (bounded by L1_MAX_TTL)
+                remaining = self._remaining_ttl(key)
+                self.local.set(key, serialized_value,
+                               min(remaining, self.L1_MAX_TTL) if remaining else self.L1_MAX_TTL)
+                return value
+            stats.misses += 1
             return None
         except Exception as e:
+            stats.misses += 1
             self.logger.error(f"Cache get error for key '{key}': {e}")
             return None
+
+    def _local_get(self, key: str) -> Any:
+        # L1 holds the serialized form so callers never share mutable objects
+        serialized_value = self.local.get(key)
+        if serialized_value is _MISSING:
+            return _MISSING
+        return json.loads(serialized_value)
+
+    def _remaining_ttl(self, key: str) -> Optional[float]:
+        try:
+            remaining = self.redis_client.ttl(key)
+            return float(remaining) if isinstance(remaining, (int, float)) and remaining > 0 else None
+        except Exception:
+            return None
+
+    def get_or_set(self, key: str, factory: Callable[[], Any], ttl: int = 3600) -> Any:
+        """
+        Return the cached value for ``key``, computing it with ``factory`` on a miss.
+
+        Concurrent misses are coalesced: within this process only one caller
+        runs ``factory`` while the others wait for its result; across
+        processes a short-lived Redis lock lets one worker compute while the
+        others poll L2. ``None`` results are not cached.
+        """
+        value = self.get(key)
+        if value is not None or not self.is_available():
+            return value if value is not None else factory()
+
+        with self._flight_guard:
+            lock = self._flight_locks.setdefault(key, threading.Lock())
+        acquired_immediately = lock.acquire(blocking=False)
+        if not acquired_immediately:
+            lock.acquire()
+        try:
+            if not acquired_immediately:
+                value = self._local_get(key)
+                if value is not _MISSING:
+                    self._stats_for(key).coalesced += 1
+                    return value
+            value = self._compute_once_across_processes(key, factory, ttl)
+            return value
+        finally:
+            lock.release()
+            with self._flight_guard:
+                if not lock.locked():
+                    self._flight_locks.pop(key, None)
+
+    def _compute_once_across_processes(self, key: str, factory: Callable[[], Any], ttl: int) -> Any:
+        lock_key = f"lock:{key}"
+        have_lock = True
+        if self.redis_client:
+            try:
+                have_lock = bool(self.redis_client.set(
+                    lock_key, b'1', nx=True, px=int(self.SINGLE_FLIGHT_WAIT_SECONDS * 1000)
+                ))
+            except Exception:
+                have_lock = True
+        if not have_lock:
+            deadline = time.monotonic() + self.SINGLE_FLIGHT_WAIT_SECONDS
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                value = self.get(key)
+                if value is not None:
+                    self._stats_for(key).coalesced += 1
+                    return value
+        try:
+            value = factory()
+            if value is not None:
+                self.set(key, value, ttl)
+            return value
+        finally:
+            if have_lock and self.redis_client:
+                try:
+                    self.redis_client.delete(lock_key)
+                except Exception:
+                    pass
     
     def delete(self, key: str) -> bool:
         """
@@ -154,11 +382,12 @@ class CacheService:
         Returns:
             True if deleted, False otherwise
         """
+        deleted_locally = self.local.delete(key) if hasattr(self, 'local') else False
         if not self.redis_client:
-            return False
+            return deleted_locally
         
         try:
-            return bool(self.redis_client.delete(key))
+            return bool(self.redis_client.delete(key)) or deleted_locally
         except Exception as e:
             self.logger.error(f"Cache delete error for key '{key}': {e}")
             return False
@@ -166,6 +395,10 @@ class CacheService:
     def clear_pattern(self, pattern: str) -> int:
         """
         Clear all keys matching a pattern.
+
+        Prefer ``bump_namespace`` for invalidating key families: a pattern
+        delete has to walk the Redis keyspace and cannot reach other
+        processes' L1 caches.
         
         Args:
             pattern: Pattern to match (e.g., 'entries:*')
@@ -173,8 +406,9 @@ class CacheService:
         Returns:
             Number of keys deleted
         """
+        local_deleted = self.local.delete_pattern(pattern) if hasattr(self, 'local') else 0
         if not self.redis_client:
-            return 0
+            return local_deleted
         
         try:
             deleted = 0
@@ -189,6 +423,61 @@ class CacheService:
         except Exception as e:
             self.logger.error(f"Cache clear pattern error for '{pattern}': {e}")
             return 0
+
+    # ---- Versioned namespaces ----
+
+    @staticmethod
+    def _namespace_key(prefix: str, scope: str = '') -> str:
+        return f"{prefix}:version:{scope}"
+
+    def namespace_version(self, prefix: str, scope: str = '', fresh: bool = False) -> int:
+        """
+        Return the current version of a key namespace (1 if never bumped).
+
+        The version lives in Redis so all processes agree on it; it is
+        re-read at most every ``NAMESPACE_REFRESH_SECONDS``, or on every call
+        with ``fresh`` (one GET) where another worker's bump must be seen at
+        once.
+        """
+        ns_key = self._namespace_key(prefix, scope)
+        cached = self._namespace_versions.get(ns_key)
+        now = time.monotonic()
+        if cached is not None and (not self.redis_client or (
+                not fresh and now - cached[1] < self.NAMESPACE_REFRESH_SECONDS)):
+            return cached[0]
+
+        version = cached[0] if cached else 1
+        if self.redis_client:
+            try:
+                raw = self.redis_client.get(ns_key)
+                version = int(raw) if raw else 1
+            except Exception as e:
+                self.logger.debug(f"Cache namespace version read failed for '{ns_key}': {e}")
+        self._namespace_versions[ns_key] = (version, now)
+        return version
+
+    def bump_namespace(self, prefix: str, scope: str = '', ttl: int = 86400) -> int:
+        """
+        Invalidate every key built with ``versioned_key(prefix, scope, ...)``.
+
+        Old entries are never deleted explicitly; they stop being addressed
+        and expire through their TTL.
+        """
+        ns_key = self._namespace_key(prefix, scope)
+        version = self.increment(ns_key, 1, ttl=ttl) if self.redis_client else None
+        if version == 1:
+            # INCR on a missing key yields 1, which is also the implicit default
+            version = self.increment(ns_key, 1, ttl=ttl)
+        if version is None:
+            cached = self._namespace_versions.get(ns_key)
+            version = (cached[0] if cached else 1) + 1
+        self._namespace_versions[ns_key] = (version, time.monotonic())
+        return version
+
+    def versioned_key(self, prefix: str, scope: str, *parts: Any, fresh: bool = False) -> str:
+        """Build a cache key inside the current version of namespace (prefix, scope)."""
+        version = self.namespace_version(prefix, scope, fresh=fresh)
+        return cache_key(f"{prefix}:{scope}:v{version}", *parts)
     
     def increment(self, key: str, amount: int = 1, ttl: Optional[int] = None) -> Optional[int]:
         """
@@ -216,6 +505,64 @@ class CacheService:
             self.logger.error(f"Cache increment error for key '{key}': {e}")
             return None
     
+    # ---- Sets ----
+
+    def add_to_set(self, key: str, members: List[str], ttl: int = 3600) -> bool:
+        """
+        Add ``members`` to the set stored at ``key`` (Redis ``SADD``).
+
+        Concurrent adds from any process never lose each other's members.
+        Without Redis the set lives in L1, so it is bounded by ``L1_MAX_TTL``.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not members:
+            return True
+        if not self.is_available():
+            return False
+        if not self.redis_client:
+            with self._set_lock:
+                current = self._local_get(key)
+                merged = sorted(set(current if current is not _MISSING else []) | set(members))
+                self.local.set(key, json.dumps(merged), min(ttl, self.L1_MAX_TTL))
+            return True
+
+        try:
+            pipeline = self.redis_client.pipeline()
+            pipeline.sadd(key, *members)
+            pipeline.expire(key, ttl)
+            pipeline.execute()
+            return True
+        except Exception as e:
+            self.logger.error(f"Cache set-add error for key '{key}': {e}")
+            return False
+
+    def pop_set(self, key: str) -> List[str]:
+        """
+        Return the members of the set at ``key`` and delete it in one step.
+
+        Members added after the read are kept for the next call rather than
+        deleted unseen.
+        """
+        if not self.is_available():
+            return []
+        if not self.redis_client:
+            with self._set_lock:
+                current = self._local_get(key)
+                self.local.delete(key)
+            return list(current) if current is not _MISSING else []
+
+        try:
+            pipeline = self.redis_client.pipeline(transaction=True)
+            pipeline.smembers(key)
+            pipeline.delete(key)
+            members, _ = pipeline.execute()
+            return [m.decode('utf-8') if isinstance(m, bytes) else m for m in members or ()]
+        except Exception as e:
+            self.logger.error(f"Cache set-pop error for key '{key}': {e}")
+            return []
+
     def exists(self, key: str) -> bool:
         """
         Check if a key exists in cache.
@@ -226,6 +573,8 @@ class CacheService:
         Returns:
             True if exists, False otherwise
         """
+        if self.enabled and self.local.get(key) is not _MISSING:
+            return True
         if not self.redis_client:
             return False
         
@@ -242,8 +591,10 @@ class CacheService:
         Returns:
             Number of keys deleted
         """
+        local_cleared = self.local.clear() if hasattr(self, 'local') else 0
+        self._namespace_versions.clear()
         if not self.redis_client:
-            return 0
+            return local_cleared
         
         try:
             # Use pattern '*' to clear all keys
@@ -252,6 +603,11 @@ class CacheService:
             self.logger.error(f"Cache clear error: {e}")
             return 0
     
+    def get_prefix_stats(self) -> dict[str, dict[str, Any]]:
+        """Hit/miss counters and hit ratios per key prefix (text before the first ':')."""
+        with self._stats_lock:
+            return {prefix: stats.as_dict() for prefix, stats in sorted(self._prefix_stats.items())}
+
     def get_stats(self) -> dict[str, Any]:
         """
         Get cache statistics.
@@ -259,8 +615,21 @@ class CacheService:
         Returns:
             Dictionary with cache statistics
         """
-        if not self.redis_client:
+        local_stats = {
+            'entries': len(self.local),
+            'max_entries': self.local.max_entries,
+            'max_ttl': self.L1_MAX_TTL,
+            'evictions': self.local.evictions,
+        }
+        if not self.is_available():
             return {'status': 'disabled', 'connected': False}
+        if not self.redis_client:
+            return {
+                'status': 'local_only',
+                'connected': False,
+                'l1': local_stats,
+                'prefixes': self.get_prefix_stats(),
+            }
         
         try:
             info = self.redis_client.info()
@@ -274,7 +643,9 @@ class CacheService:
                 'hit_rate': (
                     info.get('keyspace_hits', 0) / 
                     max(info.get('keyspace_hits', 0) + info.get('keyspace_misses', 0), 1) * 100
-                )
+                ),
+                'l1': local_stats,
+                'prefixes': self.get_prefix_stats(),
             }
         except Exception as e:
             self.logger.error(f"Cache stats error: {e}")
@@ -318,15 +689,10 @@ def cached_result(key_prefix: str, ttl: int = 3600):
                 *[f"{k}={v}" for k, v in sorted(kwargs.items())]
             )
             
-            # Try to get from cache
-            cached_value = cache_service.get(cache_key_value)
-            if cached_value is not None:
-                return cached_value
-            
-            # Calculate and cache result
-            result = func(*args, **kwargs)
-            cache_service.set(cache_key_value, result, ttl)
-            return result
+            # Concurrent misses for the same key compute the result once
+            return cache_service.get_or_set(
+                cache_key_value, lambda: func(*args, **kwargs), ttl
+            )
         
         return wrapper
     return decorator
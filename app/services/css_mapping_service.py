@@ -15,6 +15,7 @@ from typing import Any, Dict, List, Optional
 from xml.etree import ElementTree as ET
 
 from app.models.display_profile import DisplayProfile
+from app.services.rendered_entry_cache import rendered_entry_cache
 
 
 class CSSMappingService:
@@ -29,6 +30,7 @@ class CSSMappingService:
         self.storage_path = storage_path
         self._profiles: Dict[str, DisplayProfile] = {}
         self._logger = logging.getLogger(__name__)
+        self.render_cache = rendered_entry_cache
         if storage_path and storage_path.exists():
             self._load_profiles()
 
@@ -781,6 +783,35 @@ class CSSMappingService:
     ) -> str:
         """Render an entry XML with the given display profile.
 
+        Results are served from the rendered-entry cache when the entry,
+        profile, ranges and referenced headwords are unchanged (see
+        ``app.services.rendered_entry_cache``).
+        """
+        return self.render_cache.get_or_render(
+            self._render_cache_scope(dict_service), entry_xml, profile,
+            lambda: self._render_entry_uncached(entry_xml, profile, dict_service, headword_map),
+            headword_map=headword_map,
+        )
+
+    @staticmethod
+    def _render_cache_scope(dict_service=None) -> Optional[str]:
+        """Database name used to scope cached renders (None disables caching)."""
+        try:
+            if dict_service is None:
+                from flask import current_app
+                from app.services.dictionary_service import DictionaryService
+                dict_service = current_app.injector.get(DictionaryService)
+            db_name = dict_service.db_connector.database
+        except Exception:
+            return None
+        return db_name if isinstance(db_name, str) and db_name else None
+
+    def _render_entry_uncached(
+        self, entry_xml: str, profile: DisplayProfile, dict_service=None,
+        headword_map: Optional[Dict[str, str]] = None
+    ) -> str:
+        """Render an entry XML with the given display profile.
+
         Enhanced with debugging for live preview issues.
         """
         import logging
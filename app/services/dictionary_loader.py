@@ -9,9 +9,11 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from typing import Any, Dict, List, Optional, Set
 
 from app.models.dictionary_models import ProjectDictionary, UserDictionary
+from app.services.spell_cache import get_spell_verdict_cache
 
 
 logger = logging.getLogger(__name__)
@@ -25,10 +27,14 @@ class DictionaryLoader:
     - Loading project dictionaries
     - Loading user dictionaries
     - Merging dictionaries (project + user layers)
-    - Caching loaded instances
+    - Caching loaded instances (and, for ``MISSING_TTL_SECONDS``, misses)
     - System dictionary discovery
     """
 
+    # How long a failed dictionary lookup is remembered before the system
+    # paths / project dictionaries are consulted again.
+    MISSING_TTL_SECONDS = 300.0
+
     # Common system dictionary paths
     SYSTEM_DICT_PATHS = [
         '/usr/share/hunspell',
@@ -44,7 +50,8 @@ class DictionaryLoader:
         self._hunspell = None
         self._cache: Dict[str, Any] = {}  # lang_code -> hunspell instance
         self._merged_cache: Dict[str, Any] = {}  # project_id:user_id:lang_code -> merged hunspell
-        self._system_dicts: Dict[str, Dict[str, str]] = {}  # lang_code -> {dic_path, aff_path}
+        self._system_dicts: Optional[Dict[str, Dict[str, str]]] = None  # lang_code -> {dic_path, aff_path}
+        self._missing: Dict[str, float] = {}  # cache key -> time of the failed lookup
 
         # Check hunspell availability once
         self._check_hunspell()
@@ -63,13 +70,16 @@ class DictionaryLoader:
     @property
     def is_available(self) -> bool:
         """Check if hunspell is available."""
-        return self._hunspell_available or self._check_hunspell() or False
+        if self._hunspell_available is None:
+            self._check_hunspell()
+        return bool(self._hunspell_available)
 
     def discover_system_dictionaries(self) -> Dict[str, Dict[str, str]]:
-        """Discover hunspell dictionaries installed on the system."""
-        if self._system_dicts:
+        """Discover hunspell dictionaries installed on the system (scanned once)."""
+        if self._system_dicts is not None:
             return self._system_dicts
 
+        self._system_dicts = {}
         for dict_path in self.SYSTEM_DICT_PATHS:
             if not os.path.exists(dict_path):
                 continue
@@ -112,13 +122,14 @@ class DictionaryLoader:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
-        if not self.is_available:
+        if not self.is_available or self._is_known_missing(cache_key):
             return None
 
         # Get project dictionary for this language
         dictionary = ProjectDictionary.get_for_language(project_id, lang_code)
 
         if not dictionary or not dictionary.files_exist():
+            self._missing[cache_key] = time.monotonic()
             return None
 
         try:
@@ -246,6 +257,9 @@ class DictionaryLoader:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
+        if self._is_known_missing(cache_key):
+            return None
+
         # Check system dictionaries
         system_dicts = self.discover_system_dictionaries()
         system_dict = system_dicts.get(lang_code)
@@ -268,8 +282,19 @@ class DictionaryLoader:
             except Exception as e:
                 logger.warning(f"Failed to load system dictionary {lang_code}: {e}")
 
+        self._missing[cache_key] = time.monotonic()
         return None
 
+    def _is_known_missing(self, cache_key: str) -> bool:
+        """True if ``cache_key`` failed to load within ``MISSING_TTL_SECONDS``."""
+        missed_at = self._missing.get(cache_key)
+        if missed_at is None:
+            return False
+        if time.monotonic() - missed_at > self.MISSING_TTL_SECONDS:
+            del self._missing[cache_key]
+            return False
+        return True
+
     def load_fallback(
         self,
         project_id: int,
@@ -329,7 +354,8 @@ class DictionaryLoader:
         ]
 
         for key in keys_to_remove:
-            del self._cache[key]
+            get_spell_verdict_cache().forget(self._cache.pop(key))
+        self._forget_missing(f":{project_id}:")
 
         return len(keys_to_remove)
 
@@ -349,14 +375,23 @@ class DictionaryLoader:
         ]
 
         for key in keys_to_remove:
-            del self._cache[key]
+            get_spell_verdict_cache().forget(self._cache.pop(key))
+        self._forget_missing(f":{user_id}:")
 
         return len(keys_to_remove)
 
+    def _forget_missing(self, fragment: str) -> None:
+        for key in [key for key in self._missing if fragment in key]:
+            del self._missing[key]
+
     def clear_cache(self) -> int:
-        """Clear all cached dictionaries."""
+        """Clear all cached dictionaries, remembered misses and system dictionary discovery."""
         count = len(self._cache)
+        for instance in self._cache.values():
+            get_spell_verdict_cache().forget(instance)
         self._cache.clear()
+        self._missing.clear()
+        self._system_dicts = None
         return count
 
 
@@ -27,10 +27,17 @@ from tenacity import (
 
 from app.database.basex_connector import BaseXConnector
 from app.database.mock_connector import MockDatabaseConnector
+from app.models.compact_entry import CompactEntry
 from app.models.entry import Entry
+from app.parsers.lift_entry_writer import write_entry_xml
 from app.parsers.lift_parser import LIFTParser, LIFTRangesParser
 from app.services.ranges_service import RangesService, STANDARD_RANGE_METADATA, CONFIG_PROVIDED_RANGES, CONFIG_RANGE_TYPES
 from app.services.lift_export_service import LIFTExportService
+from app.services.relation_index import ReverseRelationIndex, RelationRef, RelationRow, rows_from_entry
+from app.services.relation_target_index import RelationTargetIndex, entry_targets
+from app.services.entry_view_bundle import EntryViewBundle
+from app.services.dictionary_stats_store import DictionaryStatsStore, EntryStats, SenseStats
+from app.services.rendered_entry_cache import bump_ranges_version, rendered_entry_cache
 from app.utils.exceptions import (
     NotFoundError,
     ValidationError,
@@ -301,6 +308,9 @@ class DictionaryService:
         self._namespace_manager = LIFTNamespaceManager()
         self._query_builder = XQueryBuilder()
         self._namespace_cache: dict[str, bool] = {}  # Per-database namespace cache
+        self._relation_indexes: Dict[str, ReverseRelationIndex] = {}  # Per-database reverse-relation index
+        self._target_indexes: Dict[str, RelationTargetIndex] = {}  # Per-database relation-target index
+        self._stats_stores: Dict[str, DictionaryStatsStore] = {}  # Per-database dashboard statistics
 
         # Only connect and open database during non-test environments
         if not (os.getenv("TESTING") == "true" or "pytest" in sys.modules):
@@ -343,29 +353,13 @@ class DictionaryService:
 
     def _prepare_entry_xml(self, entry: Entry) -> str:
         """
-        Generates and prepares the XML string for an entry, stripping namespaces.
-        """
-        entry_xml_full = self.lift_parser.generate_lift_string([entry])
-        root = ET.fromstring(entry_xml_full)
-        entry_elem_ns = root.find(".//lift:entry", self.lift_parser.NSMAP)
-        if entry_elem_ns is None:
-            entry_elem_ns = root.find(".//entry")  # fallback
-
-        if entry_elem_ns is None:
-            raise ValueError("Failed to find entry element in generated XML")
+        Generates the namespace-free XML string stored for an entry.
 
-        # Strip namespaces
-        for elem in entry_elem_ns.iter():
-            if "}" in elem.tag:
-                elem.tag = elem.tag.split("}", 1)[1]
-            for key in elem.attrib.keys():
-                if "}" in key:
-                    new_key = key.split("}", 1)[1]
-                    elem.attrib[new_key] = elem.attrib.pop(key)
-                if key.startswith("xmlns"):
-                    del elem.attrib[key]
-
-        return ET.tostring(entry_elem_ns, encoding="unicode")
+        Written directly from the models by ``write_entry_xml``; the text is
+        what generating a LIFT document and stripping the namespaces from its
+        ``<entry>`` used to give.
+        """
+        return write_entry_xml(entry)
 
     def initialize_database(
         self, lift_path: str, ranges_path: Optional[str] = None
@@ -713,6 +707,7 @@ class DictionaryService:
                 raise DatabaseError("No database configured")
             
             self.logger.info("Dropping and recreating database: %s", db_name)
+            self.invalidate_derived_data()
             
             # Use admin connector to avoid session conflicts
             admin_connector = BaseXConnector(
@@ -854,6 +849,7 @@ class DictionaryService:
         fresh data.
         """
         self.ranges = None
+        bump_ranges_version(self.db_connector.database)
         self.logger.info("Ranges cache invalidated")
 
     def _db_name_from_settings(self, settings) -> Optional[str]:
@@ -927,6 +923,471 @@ class DictionaryService:
             self.logger.warning(f"Batch headword resolution failed: {e}")
             return {}
 
+    # Maximum age of a per-process reverse-relation index before it is rebuilt,
+    # so writes made by other worker processes are eventually picked up.
+    RELATION_INDEX_MAX_AGE_SECONDS = 300.0
+
+    def get_relation_index(self, project_id: Optional[int] = None) -> ReverseRelationIndex:
+        """Return the reverse-relation index for a project's database (built lazily)."""
+        db_name = self._resolve_db_name(project_id)
+        index = self._relation_indexes.get(db_name)
+        if index is None:
+            index = ReverseRelationIndex(
+                lambda entry_ids, _db=db_name: self._load_relation_rows(_db, entry_ids),
+                max_age_seconds=self.RELATION_INDEX_MAX_AGE_SECONDS,
+            )
+            self._relation_indexes[db_name] = index
+        return index
+
+    def get_relation_target_index(self, project_id: Optional[int] = None) -> RelationTargetIndex:
+        """Return the index of IDs/GUIDs relations may point to (built lazily, one query)."""
+        db_name = self._resolve_db_name(project_id)
+        index = self._target_indexes.get(db_name)
+        if index is None or index.is_stale:
+            started = time.monotonic()
+            index = RelationTargetIndex.from_entries(
+                self._load_relation_targets(db_name), max_age_seconds=self.RELATION_INDEX_MAX_AGE_SECONDS
+            )
+            self._target_indexes[db_name] = index
+            self.logger.info(
+                "Built relation-target index: %d targets in %.1f ms",
+                len(index), (time.monotonic() - started) * 1000,
+            )
+        return index
+
+    def _load_relation_targets(self, db_name: str) -> Dict[str, List[str]]:
+        """Entry ID -> IDs and GUIDs of the entry and its senses, in one query."""
+        has_ns = self._detect_namespace_usage()
+        prologue = self._query_builder.get_namespace_prologue(has_ns)
+        entry_q = self._query_builder.get_element_path("entry", has_ns)
+        sense_q = self._query_builder.get_element_path("sense", has_ns)
+        query = (
+            f"{prologue} "
+            f"for $e in collection('{db_name}')//{entry_q}[@id] "
+            f"return string-join(($e/@id, $e/@guid, $e//{sense_q}/(@id, @guid)) ! string(), '|||')"
+        )
+        raw = self.db_connector.execute_query(query) or ""
+        targets: Dict[str, List[str]] = {}
+        for line in raw.split('\n'):
+            parts = [part for part in line.strip().split('|||') if part]
+            if parts:
+                targets[parts[0]] = parts
+        return targets
+
+    def get_reverse_relations(
+        self,
+        target_id: str,
+        relation_type: Optional[str] = None,
+        project_id: Optional[int] = None,
+    ) -> List[RelationRef]:
+        """Return entry-level relations that point at ``target_id``.
+
+        Args:
+            target_id: ID of the referenced entry.
+            relation_type: Optional relation type filter (e.g. '_component-lexeme').
+            project_id: Optional project ID to determine database.
+
+        Returns:
+            List of RelationRef(source_id, relation_type, traits, order) in
+            document order.
+        """
+        return self.get_relation_index(project_id).lookup(target_id, relation_type)
+
+    def get_entry_labels(self, entry_ids: List[str], project_id: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Fetch display data (lexical unit forms and homograph number) in one XQuery.
+
+        Args:
+            entry_ids: IDs of the entries to label.
+            project_id: Optional project ID to determine database.
+
+        Returns:
+            Dict mapping entry ID -> {'lexical_unit': {lang: text}, 'homograph_number': int or None}.
+            Missing entries are omitted.
+        """
+        ids = list(dict.fromkeys(str(i) for i in entry_ids if i))
+        if not ids:
+            return {}
+
+        try:
+            db_name = self._resolve_db_name(project_id)
+            has_ns = self._detect_namespace_usage()
+            prologue = self._query_builder.get_namespace_prologue(has_ns)
+            entry_path = self._query_builder.get_element_path("entry", has_ns)
+            lexical_unit_path = self._query_builder.get_element_path("lexical-unit", has_ns)
+            form_path = self._query_builder.get_element_path("form", has_ns)
+            text_path = self._query_builder.get_element_path("text", has_ns)
+            id_seq = ", ".join(f"'{escape_xquery_string(i)}'" for i in ids)
+
+            query = f"""{prologue}
+            <results>{{
+              for $entry in collection('{db_name}')//{entry_path}[@id = ({id_seq})]
+              return
+                <item id="{{string($entry/@id)}}" order="{{string($entry/@order)}}">{{
+                  for $form in $entry/{lexical_unit_path}/{form_path}
+                  return <form lang="{{string($form/@lang)}}">{{string($form/{text_path}[1])}}</form>
+                }}</item>
+            }}</results>
+            """
+
+            xml_result = self.db_connector.execute_query(query)
+            if not xml_result:
+                return {}
+
+            labels: Dict[str, Dict[str, Any]] = {}
+            for item in ET.fromstring(xml_result).findall("item"):
+                item_id = item.get("id", "")
+                if not item_id or item_id in labels:
+                    continue
+                order = item.get("order", "")
+                labels[item_id] = {
+                    'lexical_unit': {
+                        form.get("lang", ""): form.text or ""
+                        for form in item.findall("form")
+                    },
+                    'homograph_number': int(order) if order.isdigit() else None,
+                }
+            return labels
+
+        except Exception as e:
+            self.logger.warning("Batch entry label lookup failed: %s", e)
+            return {}
+
+    def _load_relation_rows(self, db_name: str, entry_ids: Optional[List[str]] = None) -> List[RelationRow]:
+        """Load entry-level relations for the reverse-relation index in one query.
+
+        Args:
+            db_name: Database to read from.
+            entry_ids: Restrict to these source entries; None loads the whole database.
+        """
+        has_ns = self._detect_namespace_usage()
+        prologue = self._query_builder.get_namespace_prologue(has_ns)
+        entry_q = self._query_builder.get_element_path("entry", has_ns)
+        relation_q = self._query_builder.get_element_path("relation", has_ns)
+        trait_q = self._query_builder.get_element_path("trait", has_ns)
+        id_filter = ""
+        if entry_ids is not None:
+            if not entry_ids:
+                return []
+            id_seq = ", ".join(f"'{escape_xquery_string(i)}'" for i in entry_ids)
+            id_filter = f"[@id = ({id_seq})]"
+
+        query = (
+            f"{prologue} "
+            f"for $rel in collection('{db_name}')//{entry_q}{id_filter}/{relation_q}[@ref] "
+            f"return concat($rel/../@id, '|||', $rel/@type, '|||', $rel/@ref, '|||', $rel/@order, '|||', "
+            f"string-join(for $t in $rel/{trait_q} "
+            f"return concat(normalize-space($t/@name), '==', normalize-space($t/@value)), ';;'))"
+        )
+        raw = self.db_connector.execute_query(query) or ""
+
+        rows: List[RelationRow] = []
+        for line in raw.split('\n'):
+            parts = line.strip().split('|||')
+            if len(parts) != 5 or not parts[0] or not parts[2]:
+                continue
+            source_id, rel_type, target_id, order, trait_str = parts
+            traits: Dict[str, str] = {}
+            for pair in trait_str.split(';;'):
+                name, sep, value = pair.partition('==')
+                if sep and name:
+                    traits[name] = value
+            rows.append(RelationRow(
+                source_id=source_id,
+                relation_type=rel_type,
+                target_id=target_id,
+                traits=traits,
+                order=int(order) if order.isdigit() else None,
+            ))
+        return rows
+
+    def _sync_relation_index(
+        self,
+        db_name: str,
+        entry_id: str,
+        entry: Optional[Entry] = None,
+        previous_entry: Optional[Entry] = None,
+    ) -> None:
+        """Apply a saved (or deleted, when ``entry`` is None) entry to the reverse-relation index.
+
+        Entries whose reverse relations were rewritten by bidirectional
+        relation handling are reloaded from the database in one query.
+        """
+        index = self._relation_indexes.get(db_name)
+        if index is None or not index.is_built:
+            return
+        try:
+            if entry is None:
+                index.remove_source(entry_id)
+            else:
+                index.update_source(entry_id, rows_from_entry(entry))
+            touched = self._changed_relation_targets(entry_id, entry, previous_entry)
+            if touched:
+                index.reindex_sources(touched)
+        except Exception as e:
+            # A stale index is rebuilt after RELATION_INDEX_MAX_AGE_SECONDS; drop it now instead.
+            self.logger.warning("Reverse-relation index update failed for %s: %s", entry_id, e)
+            index.invalidate()
+
+    def _sync_target_index(self, db_name: str, entry_id: str, entry: Optional[Entry] = None) -> None:
+        """Apply a saved (or deleted) entry's IDs to the relation-target index."""
+        index = self._target_indexes.get(db_name)
+        if index is None:
+            return
+        if entry is None:
+            index.remove_entry(entry_id)
+        else:
+            index.set_entry(entry_id, entry_targets(entry))
+
+    @staticmethod
+    def _changed_relation_targets(
+        entry_id: str, entry: Optional[Entry], previous_entry: Optional[Entry]
+    ) -> Set[str]:
+        """IDs of entries whose reverse relations may have been rewritten by a save."""
+        def _keys(source: Optional[Entry]) -> Set[Tuple[str, str, tuple]]:
+            if source is None:
+                return set()
+            return {
+                (row.relation_type, row.target_id, tuple(sorted(row.traits.items())))
+                for row in rows_from_entry(source)
+            }
+
+        changed = _keys(entry) ^ _keys(previous_entry)
+        return {target_id for _, target_id, _ in changed if target_id != entry_id}
+
+    def _sync_stats_store(
+        self,
+        db_name: str,
+        entry_id: str,
+        entry: Optional[Entry] = None,
+        previous_entry: Optional[Entry] = None,
+    ) -> None:
+        """Refresh dashboard statistics for a saved (or deleted) entry and its relation targets."""
+        store = self._stats_stores.get(db_name)
+        if store is None or not store.is_built:
+            return
+        try:
+            if entry is None:
+                store.remove_entry(entry_id)
+                store.refresh_entries(self._changed_relation_targets(entry_id, entry, previous_entry))
+            else:
+                store.refresh_entries(
+                    [entry_id, *self._changed_relation_targets(entry_id, entry, previous_entry)]
+                )
+        except Exception as e:
+            # Reconciliation repairs the counters; schedule it now.
+            self.logger.warning("Dictionary statistics update failed for %s: %s", entry_id, e)
+            store.reconcile_async()
+
+    def _sync_render_cache(
+        self,
+        db_name: str,
+        entry_id: str,
+        entry: Optional[Entry] = None,
+        previous_entry: Optional[Entry] = None,
+    ) -> None:
+        """Drop cached renders of a saved (or deleted) entry and, if its label changed, of entries showing it."""
+        def _sense_ids(source: Optional[Entry]) -> List[str]:
+            if source is None:
+                return []
+            ids = (s.get('id') if isinstance(s, dict) else getattr(s, 'id', None) for s in source.senses or [])
+            return [i for i in ids if i]
+
+        def _label(source: Entry) -> tuple:
+            return sorted((source.lexical_unit or {}).items(), key=str), _sense_ids(source)
+
+        label_changed = previous_entry is None or entry is None or _label(entry) != _label(previous_entry)
+        # Senses removed by this save were referenced under their old IDs too
+        sense_ids = list(dict.fromkeys(_sense_ids(previous_entry) + _sense_ids(entry)))
+        try:
+            rendered_entry_cache.invalidate_entry(db_name, entry_id, label_changed, sense_ids)
+        except Exception as e:
+            self.logger.warning("Rendered entry cache invalidation failed for %s: %s", entry_id, e)
+
+    def _after_entry_write(
+        self,
+        db_name: str,
+        entry_id: str,
+        entry: Optional[Entry] = None,
+        previous_entry: Optional[Entry] = None,
+        project_id: Optional[int] = None,
+    ) -> None:
+        """Keep derived data in step with a create/update (``entry`` set) or delete.
+
+        In-process indexes are updated directly; other subscribers (e.g. the
+        semantic embedding index) are notified with ``entry_saved`` /
+        ``entry_deleted`` events.
+        """
+        self._sync_relation_index(db_name, entry_id, entry, previous_entry)
+        self._sync_target_index(db_name, entry_id, entry)
+        self._sync_stats_store(db_name, entry_id, entry, previous_entry)
+        self._sync_render_cache(db_name, entry_id, entry, previous_entry)
+
+        try:
+            from app.services.event_bus import event_bus
+            event_bus.emit(
+                "entry_saved" if entry is not None else "entry_deleted",
+                {"entry_id": entry_id, "project_id": project_id or 1, "db_name": db_name},
+            )
+        except Exception as e:
+            logger.warning("Could not emit entry event for %s: %s", entry_id, e)
+
+    def after_external_entry_write(
+        self,
+        entry_id: str,
+        entry: Optional[Entry] = None,
+        previous_entry: Optional[Entry] = None,
+        entry_xml: Optional[str] = None,
+        deleted: bool = False,
+        db_name: Optional[str] = None,
+        project_id: Optional[int] = None,
+    ) -> None:
+        """Run ``_after_entry_write`` for a write made through XMLEntryService.
+
+        The XML API and the edit page save without going through this service;
+        they call this afterwards so indexes, statistics, cached renders and
+        ``entry_saved`` / ``entry_deleted`` subscribers see the write. A saved
+        entry is taken from ``entry``, else parsed from ``entry_xml``, else
+        reloaded. Failures are logged, never raised: the write has happened.
+        """
+        db_name = db_name or self._resolve_db_name(project_id)
+        try:
+            if not deleted and entry is None:
+                parsed = self.lift_parser.parse_string(entry_xml) if entry_xml else []
+                entry = parsed[0] if parsed else self.get_entry(entry_id, project_id=project_id)
+            self._after_entry_write(
+                db_name, entry_id, None if deleted else entry, previous_entry, project_id=project_id
+            )
+        except Exception as e:
+            self.logger.warning("Derived data update after external write of %s failed: %s", entry_id, e)
+
+    def invalidate_derived_data(self) -> None:
+        """Drop relation indexes, dashboard statistics and cached renders (after imports or database resets)."""
+        for index in self._relation_indexes.values():
+            index.invalidate()
+        self._target_indexes.clear()
+        for store in self._stats_stores.values():
+            store.invalidate()
+        db_names = {*self._relation_indexes, *self._stats_stores, self.db_connector.database}
+        for db_name in db_names:
+            if isinstance(db_name, str) and db_name:
+                rendered_entry_cache.invalidate_all(db_name)
+
+    # Age after which dashboard statistics are reconciled against BaseX in the background.
+    STATS_RECONCILE_INTERVAL_SECONDS = 900.0
+
+    def get_stats_store(self, project_id: Optional[int] = None) -> DictionaryStatsStore:
+        """Return the dashboard statistics store for a project's database (built lazily)."""
+        db_name = self._resolve_db_name(project_id)
+        store = self._stats_stores.get(db_name)
+        if store is None:
+            store = DictionaryStatsStore(
+                lambda entry_ids, _db=db_name: self._load_entry_stats(_db, entry_ids),
+                reconcile_interval_seconds=self.STATS_RECONCILE_INTERVAL_SECONDS,
+            )
+            self._stats_stores[db_name] = store
+        return store
+
+    def _load_entry_stats(self, db_name: str, entry_ids: Optional[List[str]] = None) -> List[EntryStats]:
+        """Compute per-entry dashboard statistics in one XQuery pass.
+
+        Args:
+            db_name: Database to read from.
+            entry_ids: Restrict to these entries; None scans the whole database.
+        """
+        qb = self._query_builder
+        has_ns = self._detect_namespace_usage()
+        prologue = qb.get_namespace_prologue(has_ns)
+        entry_path = qb.get_element_path("entry", has_ns)
+        sense_path = qb.get_element_path("sense", has_ns)
+        lexical_unit_path = qb.get_element_path("lexical-unit", has_ns)
+        citation_path = qb.get_element_path("citation", has_ns)
+        form_path = qb.get_element_path("form", has_ns)
+        text_path = qb.get_element_path("text", has_ns)
+        pronunciation_path = qb.get_element_path("pronunciation", has_ns)
+        definition_path = qb.get_element_path("definition", has_ns)
+        gloss_path = qb.get_element_path("gloss", has_ns)
+        example_path = qb.get_element_path("example", has_ns)
+        note_path = qb.get_element_path("note", has_ns)
+        gi_path = qb.get_element_path("grammatical-info", has_ns)
+        relation_path = qb.get_element_path("relation", has_ns)
+        trait_path = qb.get_element_path("trait", has_ns)
+
+        id_filter = ""
+        if entry_ids is not None:
+            if not entry_ids:
+                return []
+            id_seq = ", ".join(f"'{escape_xquery_string(i)}'" for i in entry_ids)
+            id_filter = f"[@id = ({id_seq})]"
+
+        def flag(xpath: str) -> str:
+            return f"(if (exists({xpath})) then 1 else 0)"
+
+        blank = "[string-length(normalize-space(.)) = 0]"
+        variant_xpath = f"$e//{relation_path}[{trait_path}[@name='variant-type']]"
+        # One line per entry:
+        # id|||headword|||has_hw|||variant|||citation|||note|||pron|||pos|||examples|||blank_texts|||senses
+        # senses: sid~~pos~~has_def~~has_gloss~~examples~~has_text joined by ';;'
+        query = (
+            f"{prologue} "
+            f"for $e in collection('{db_name}')//{entry_path}{id_filter} "
+            f"let $egi := string($e/{gi_path}/@value) "
+            f"return concat("
+            f"string($e/@id), '|||', "
+            f"normalize-space(($e/{lexical_unit_path}/{form_path}/{text_path}/string(), '')[1]), '|||', "
+            f"{flag(f'$e/{lexical_unit_path}/{form_path}/{text_path}')}, '|||', "
+            f"{flag(variant_xpath)}, '|||', "
+            f"{flag(f'$e/{citation_path}/{form_path}/{text_path}')}, '|||', "
+            f"{flag(f'$e//{note_path}')}, '|||', "
+            f"{flag(f'$e//{pronunciation_path}')}, '|||', "
+            f"string(($e/{gi_path}/@value | $e//{sense_path}/{gi_path}/@value)[1]), '|||', "
+            f"count($e//{example_path}), '|||', "
+            f"count($e//{sense_path}/{definition_path}//{text_path}{blank}) "
+            f"+ count($e//{sense_path}/{gloss_path}/{text_path}{blank}), '|||', "
+            f"string-join(for $s in $e//{sense_path} return concat("
+            f"translate(string($s/@id), '~;', '__'), '~~', "
+            f"string(($s/{gi_path}/@value, $egi)[1]), '~~', "
+            f"{flag(f'$s/{definition_path}')}, '~~', "
+            f"{flag(f'$s/{gloss_path}')}, '~~', "
+            f"count($s//{example_path}), '~~', "
+            f"(if (normalize-space(string-join(($s/{definition_path}//{text_path}/string(), "
+            f"$s/{gloss_path}//{text_path}/string()), ' ')) != '') then 1 else 0)"
+            f"), ';;'))"
+        )
+        raw = self.db_connector.execute_query(query) or ""
+
+        records: List[EntryStats] = []
+        for line in raw.split('\n'):
+            parts = line.strip().split('|||')
+            if len(parts) != 11 or not parts[0]:
+                continue
+            senses = []
+            for chunk in parts[10].split(';;'):
+                fields = chunk.split('~~')
+                if len(fields) != 6:
+                    continue
+                senses.append(SenseStats(
+                    sense_id=fields[0],
+                    pos=fields[1],
+                    has_definition=fields[2] == '1',
+                    has_gloss=fields[3] == '1',
+                    example_count=int(fields[4] or 0),
+                    has_text=fields[5] == '1',
+                ))
+            records.append(EntryStats(
+                entry_id=parts[0],
+                headword=parts[1],
+                has_headword=parts[2] == '1',
+                is_variant=parts[3] == '1',
+                has_citation=parts[4] == '1',
+                has_note=parts[5] == '1',
+                has_pronunciation=parts[6] == '1',
+                pos=parts[7],
+                example_count=int(parts[8] or 0),
+                empty_text_count=int(parts[9] or 0),
+                senses=tuple(senses),
+            ))
+        return records
+
     def get_entry(self, entry_id: str, project_id: Optional[int] = None) -> Entry:
         """
         Get an entry by ID.
@@ -1126,6 +1587,8 @@ class DictionaryService:
                     f"{entry.id}: {be}"
                 )
 
+            self._after_entry_write(db_name, entry.id, entry, project_id=project_id)
+
             # Record operation in history (full snapshot so undo can re-create)
             if self.history_service and record_history:
                 self.history_service.record_operation(
@@ -1204,6 +1667,8 @@ class DictionaryService:
 
             self.db_connector.execute_update(query)
 
+            self._after_entry_write(db_name, entry.id, entry, previous_entry, project_id=project_id)
+
             # Record operation in history (full before/after snapshots so undo
             # can restore the pre-update state)
             if self.history_service and record_history:
@@ -1658,6 +2123,8 @@ class DictionaryService:
                         f"{entry_id}: {be}"
                     )
 
+            self._after_entry_write(db_name, entry_id, None, entry_before, project_id=project_id)
+
             # Record operation in history (full snapshot so undo can re-create)
             if self.history_service and record_history:
                 self.history_service.record_operation(
@@ -1860,7 +2327,8 @@ class DictionaryService:
         sort_by: str = "lexical_unit",
         sort_order: str = "asc",
         filter_text: str = "",
-    ) -> Tuple[List[Entry], int]:
+        compact: bool = False,
+    ) -> Tuple[List[Union[Entry, CompactEntry]], int]:
         """
         List entries with filtering and sorting support.
 
@@ -1871,9 +2339,11 @@ class DictionaryService:
             sort_by: Field to sort by (lexical_unit, id, etc.).
             sort_order: Sort order ("asc" or "desc").
             filter_text: Text to filter entries by (searches in lexical_unit).
+            compact: Return read-only ``CompactEntry`` objects (for bulk
+                reads such as exports) instead of ``Entry`` models.
 
         Returns:
-            Tuple of (list of Entry objects, total count).
+            Tuple of (list of Entry or CompactEntry objects, total count).
 
         Raises:
             DatabaseError: If there is an error listing entries.
@@ -1914,99 +2384,9 @@ class DictionaryService:
                 f"Database connection status: {self.db_connector.is_connected()}"
             )
             self.logger.debug(f"Using database: {db_name}")
-            # Use namespace-aware query building
-            has_ns = self._detect_namespace_usage()
-            prologue = self._query_builder.get_namespace_prologue(has_ns)
-            entry_path = self._query_builder.get_element_path("entry", has_ns)
-            lexical_unit_path = self._query_builder.get_element_path(
-                "lexical-unit", has_ns
+            query = self._build_listing_query(
+                db_name, limit, offset, sort_by, sort_order, filter_text
             )
-            form_path = self._query_builder.get_element_path("form", has_ns)
-            text_path = self._query_builder.get_element_path("text", has_ns)
-            citation_path = self._query_builder.get_element_path("citation", has_ns)
-            sense_path = self._query_builder.get_element_path("sense", has_ns)
-            grammatical_info_path = self._query_builder.get_element_path("grammatical-info", has_ns)
-            gloss_path = self._query_builder.get_element_path("gloss", has_ns)
-            definition_path = self._query_builder.get_element_path("definition", has_ns)
-
-            # Build sort expression with namespace-aware paths
-            if sort_by == "lexical_unit":
-                sort_expr = f"lower-case(($entry/{lexical_unit_path}/{form_path}/{text_path})[1])"
-            elif sort_by == "id":
-                sort_expr = "$entry/@id"
-            elif sort_by == "date_modified":
-                sort_expr = "$entry/@dateModified"
-            elif sort_by == "citation_form":
-                # Sort by the first citation form's text, ensuring it exists.
-                # Using lower-case for case-insensitive sorting.
-                sort_expr = f"lower-case(($entry/{citation_path}/{form_path}/{text_path})[1])"
-            elif sort_by == "part_of_speech":
-                # Sort by grammatical-info @value. Prefers entry-level, then first sense.
-                # Using lower-case for case-insensitive sorting.
-                sort_expr = f"""
-                    let $pos_val := ($entry/{grammatical_info_path}/@value,
-                                     ($entry/{sense_path}/{grammatical_info_path}/@value)[1]
-                                    )[1]
-                    return lower-case(string($pos_val))
-                """
-            elif sort_by == "gloss":
-                # Sort by the first gloss text in the first sense. Prefers 'en' language.
-                # Using lower-case for case-insensitive sorting.
-                sort_expr = f"""
-                    let $gloss_text := ($entry/{sense_path}[1]/{gloss_path}[@lang='en']/{text_path},
-                                       ($entry/{sense_path}[1]/{gloss_path}/{text_path})[1]
-                                      )[1]
-                    return lower-case(string($gloss_text))
-                """
-            elif sort_by == "definition":
-                # Sort by the first definition form text in the first sense. Prefers 'en' language.
-                # Using lower-case for case-insensitive sorting.
-                sort_expr = f"""
-                    let $def_text := ($entry/{sense_path}[1]/{definition_path}/{form_path}[@lang='en']/{text_path},
-                                     ($entry/{sense_path}[1]/{definition_path}/{form_path}/{text_path})[1]
-                                    )[1]
-                    return lower-case(string($def_text))
-                """
-            elif sort_by in ["homograph_number", "order"]:
-                sort_expr = "xs:integer(($entry/@order, 0)[1])"
-            else: # Default to lexical_unit if sort_by is unrecognized
-                sort_expr = f"lower-case(($entry/{lexical_unit_path}/{form_path}/{text_path})[1])"
-
-            # Add sort order
-            if sort_order.lower() == "desc":
-                sort_expr += " descending"
-
-            # Handle empty value placement based on sort field type
-            # For date fields, empty values should always go last (bottom)
-            # For text fields, empty values go last for ascending, first for descending
-            if sort_by in ["date_modified", "date_created"]:
-                # Date fields: empty dates always go last
-                # For ascending: empty greatest (empty > all dates, so they go last)
-                # For descending: empty least (empty < all dates, so they go last)
-                sort_expr += " empty least" if sort_order.lower() == "desc" else " empty greatest"
-            else:
-                # Text fields: empty strings are sorted last for ascending, first for descending
-                # This makes columns with missing data more predictable.
-                sort_expr += " empty least" if sort_order.lower() == "asc" else " empty greatest"
-            # Build filter expression with namespace-aware paths
-            filter_expr = ""
-            if filter_text:
-                # Filter by lexical unit text containing the filter text (case-insensitive)
-                # Use 'some' expression to handle multiple forms properly with namespace-aware paths
-                filter_expr = f"[some $form in {lexical_unit_path}/{form_path}/{text_path} satisfies contains(lower-case($form), lower-case('{filter_text}'))]"
-            # Build pagination expression
-            pagination_expr = ""
-            if limit is not None:
-                start = offset + 1
-                end = offset + limit
-                pagination_expr = f"[position() = {start} to {end}]"
-            # Build complete namespace-aware query
-            query = f"""
-            {prologue}
-            (for $entry in collection('{db_name}')//{entry_path}{filter_expr}
-            order by {sort_expr}
-            return $entry){pagination_expr}
-            """
             # Log the constructed query for debugging
             self.logger.debug(f"Constructed query for list_entries: {query}")
             result = self.db_connector.execute_query(query)
@@ -2015,12 +2395,180 @@ class DictionaryService:
                 return [], total_count
             # Use a non-validating parser for listing
             nonvalidating_parser = LIFTParser(validate=False)
-            entries = nonvalidating_parser.parse_string(f"<lift>{result}</lift>")
+            if compact:
+                entries = nonvalidating_parser.parse_string_compact(f"<lift>{result}</lift>")
+            else:
+                entries = nonvalidating_parser.parse_string(f"<lift>{result}</lift>")
             return entries, total_count
         except Exception as e:
             self.logger.error("Error listing entries: %s", str(e))
             raise DatabaseError(f"Failed to list entries: {str(e)}") from e
 
+    def list_entry_ids(
+        self,
+        project_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        sort_by: str = "lexical_unit",
+        sort_order: str = "asc",
+        filter_text: str = "",
+    ) -> Tuple[List[str], int]:
+        """
+        List entry IDs with the same filtering and sorting as ``list_entries``.
+
+        Only the ``@id`` attributes are returned from BaseX, so membership
+        snapshots (e.g. worksets) of tens of thousands of entries do not
+        serialize or parse any entry XML.
+
+        Returns:
+            Tuple of (list of entry IDs in sort order, total count).
+
+        Raises:
+            DatabaseError: If there is an error listing entry IDs.
+        """
+        try:
+            db_name = self._resolve_db_name(project_id)
+            if not db_name:
+                raise DatabaseError(DB_NAME_NOT_CONFIGURED)
+
+            if filter_text:
+                filter_text = filter_text.replace("'", "''")
+
+            query = self._build_listing_query(
+                db_name, limit, offset, sort_by, sort_order, filter_text,
+                ids_only=True,
+            )
+            result = self.db_connector.execute_query(query)
+            entry_ids = [
+                line.strip() for line in (result or "").split('\n') if line.strip()
+            ]
+
+            if limit is None:
+                total_count = len(entry_ids)
+            elif filter_text:
+                total_count = self._count_entries_with_filter(filter_text, project_id=project_id)
+            else:
+                total_count = self.count_entries(project_id=project_id)
+            return entry_ids, total_count
+        except DatabaseError:
+            raise
+        except Exception as e:
+            self.logger.error("Error listing entry IDs: %s", str(e))
+            raise DatabaseError(f"Failed to list entry IDs: {str(e)}") from e
+
+    def _build_listing_query(
+        self,
+        db_name: str,
+        limit: Optional[int],
+        offset: int,
+        sort_by: str,
+        sort_order: str,
+        filter_text: str,
+        ids_only: bool = False,
+    ) -> str:
+        """
+        Build the sorted, filtered and paginated XQuery used for entry listings.
+
+        ``filter_text`` must already be escaped for XQuery string literals.
+        With ``ids_only`` the query returns one entry id per line instead of
+        the entry elements, so callers that only need membership avoid
+        transferring and parsing full entries.
+        """
+        # Use namespace-aware query building
+        has_ns = self._detect_namespace_usage()
+        prologue = self._query_builder.get_namespace_prologue(has_ns)
+        entry_path = self._query_builder.get_element_path("entry", has_ns)
+        lexical_unit_path = self._query_builder.get_element_path(
+            "lexical-unit", has_ns
+        )
+        form_path = self._query_builder.get_element_path("form", has_ns)
+        text_path = self._query_builder.get_element_path("text", has_ns)
+        citation_path = self._query_builder.get_element_path("citation", has_ns)
+        sense_path = self._query_builder.get_element_path("sense", has_ns)
+        grammatical_info_path = self._query_builder.get_element_path("grammatical-info", has_ns)
+        gloss_path = self._query_builder.get_element_path("gloss", has_ns)
+        definition_path = self._query_builder.get_element_path("definition", has_ns)
+
+        # Build sort expression with namespace-aware paths
+        if sort_by == "lexical_unit":
+            sort_expr = f"lower-case(($entry/{lexical_unit_path}/{form_path}/{text_path})[1])"
+        elif sort_by == "id":
+            sort_expr = "$entry/@id"
+        elif sort_by == "date_modified":
+            sort_expr = "$entry/@dateModified"
+        elif sort_by == "citation_form":
+            # Sort by the first citation form's text, ensuring it exists.
+            # Using lower-case for case-insensitive sorting.
+            sort_expr = f"lower-case(($entry/{citation_path}/{form_path}/{text_path})[1])"
+        elif sort_by == "part_of_speech":
+            # Sort by grammatical-info @value. Prefers entry-level, then first sense.
+            # Using lower-case for case-insensitive sorting.
+            sort_expr = f"""
+                let $pos_val := ($entry/{grammatical_info_path}/@value,
+                                 ($entry/{sense_path}/{grammatical_info_path}/@value)[1]
+                                )[1]
+                return lower-case(string($pos_val))
+            """
+        elif sort_by == "gloss":
+            # Sort by the first gloss text in the first sense. Prefers 'en' language.
+            # Using lower-case for case-insensitive sorting.
+            sort_expr = f"""
+                let $gloss_text := ($entry/{sense_path}[1]/{gloss_path}[@lang='en']/{text_path},
+                                   ($entry/{sense_path}[1]/{gloss_path}/{text_path})[1]
+                                  )[1]
+                return lower-case(string($gloss_text))
+            """
+        elif sort_by == "definition":
+            # Sort by the first definition form text in the first sense. Prefers 'en' language.
+            # Using lower-case for case-insensitive sorting.
+            sort_expr = f"""
+                let $def_text := ($entry/{sense_path}[1]/{definition_path}/{form_path}[@lang='en']/{text_path},
+                                 ($entry/{sense_path}[1]/{definition_path}/{form_path}/{text_path})[1]
+                                )[1]
+                return lower-case(string($def_text))
+            """
+        elif sort_by in ["homograph_number", "order"]:
+            sort_expr = "xs:integer(($entry/@order, 0)[1])"
+        else: # Default to lexical_unit if sort_by is unrecognized
+            sort_expr = f"lower-case(($entry/{lexical_unit_path}/{form_path}/{text_path})[1])"
+
+        # Add sort order
+        if sort_order.lower() == "desc":
+            sort_expr += " descending"
+
+        # Handle empty value placement based on sort field type
+        # For date fields, empty values should always go last (bottom)
+        # For text fields, empty values go last for ascending, first for descending
+        if sort_by in ["date_modified", "date_created"]:
+            # Date fields: empty dates always go last
+            # For ascending: empty greatest (empty > all dates, so they go last)
+            # For descending: empty least (empty < all dates, so they go last)
+            sort_expr += " empty least" if sort_order.lower() == "desc" else " empty greatest"
+        else:
+            # Text fields: empty strings are sorted last for ascending, first for descending
+            # This makes columns with missing data more predictable.
+            sort_expr += " empty least" if sort_order.lower() == "asc" else " empty greatest"
+        # Build filter expression with namespace-aware paths
+        filter_expr = ""
+        if filter_text:
+            # Filter by lexical unit text containing the filter text (case-insensitive)
+            # Use 'some' expression to handle multiple forms properly with namespace-aware paths
+            filter_expr = f"[some $form in {lexical_unit_path}/{form_path}/{text_path} satisfies contains(lower-case($form), lower-case('{filter_text}'))]"
+        # Build pagination expression
+        pagination_expr = ""
+        if limit is not None:
+            start = offset + 1
+            end = offset + limit
+            pagination_expr = f"[position() = {start} to {end}]"
+        # Build complete namespace-aware query
+        return_expr = "$entry/@id/string()" if ids_only else "$entry"
+        return f"""
+        {prologue}
+        (for $entry in collection('{db_name}')//{entry_path}{filter_expr}
+        order by {sort_expr}
+        return {return_expr}){pagination_expr}
+        """
+
     def search_entries(
         self,
         query: str = "",
@@ -2675,6 +3223,8 @@ class DictionaryService:
         """
         Count the total number of senses and examples in the dictionary.
 
+        Served from the materialized statistics store (see get_stats_store).
+
         Returns:
             A tuple containing (sense_count, example_count).
 
@@ -2682,26 +3232,7 @@ class DictionaryService:
             DatabaseError: If there is an error accessing the database.
         """
         try:
-            db_name = self.db_connector.database
-            if not db_name:
-                raise DatabaseError(DB_NAME_NOT_CONFIGURED)
-
-            # Use namespace-aware queries
-            has_ns = self._detect_namespace_usage()
-            prologue = self._query_builder.get_namespace_prologue(has_ns)
-            sense_path = self._query_builder.get_element_path("sense", has_ns)
-            example_path = self._query_builder.get_element_path("example", has_ns)
-
-            sense_query = f"{prologue} count(collection('{db_name}')//{sense_path})"
-            sense_result = self.db_connector.execute_query(sense_query)
-            sense_count = int(sense_result) if sense_result else 0
-
-            example_query = f"{prologue} count(collection('{db_name}')//{example_path})"
-            example_result = self.db_connector.execute_query(example_query)
-            example_count = int(example_result) if example_result else 0
-
-            return sense_count, example_count
-
+            return self.get_stats_store(project_id).sense_and_example_counts()
         except Exception as e:
             self.logger.error(
                 "Error counting senses and examples: %s", str(e), exc_info=True
@@ -2710,11 +3241,11 @@ class DictionaryService:
 
     def get_quality_metrics(self, project_id: Optional[int] = None) -> Dict[str, Any]:
         """
-        Compute data quality/completeness metrics from the database.
+        Return data quality/completeness metrics.
 
-        Uses a single-pass XQuery to compute all structural counts, then
-        runs individual lightweight queries for sample entries.  This avoids
-        repeated full-database scans.
+        Read from the materialized statistics store, which is maintained
+        incrementally on save/delete and reconciled against BaseX
+        periodically, so the cost does not grow with dictionary size.
 
         Args:
             project_id: Optional project ID to determine database.
@@ -2724,166 +3255,17 @@ class DictionaryService:
             up to 5 sample entries), and lightweight validation checks.
         """
         try:
-            db_name = self.db_connector.database
-            if project_id:
-                try:
-                    from app.config_manager import ConfigManager
-                    from flask import current_app
-                    cm = current_app.injector.get(ConfigManager)
-                    settings = cm.get_settings_by_id(project_id)
-                    if settings:
-                        db_name = settings.basex_db_name
-                except (ImportError, AttributeError, RuntimeError):
-                    pass
-
-            if not db_name:
-                raise DatabaseError(DB_NAME_NOT_CONFIGURED)
-
-
-            has_ns = self._detect_namespace_usage()
-            prologue = self._query_builder.get_namespace_prologue(has_ns)
-            entry_path = self._query_builder.get_element_path("entry", has_ns)
-            sense_path = self._query_builder.get_element_path("sense", has_ns)
-            pronunciation_path = self._query_builder.get_element_path("pronunciation", has_ns)
-            definition_path = self._query_builder.get_element_path("definition", has_ns)
-            gloss_path = self._query_builder.get_element_path("gloss", has_ns)
-            example_path = self._query_builder.get_element_path("example", has_ns)
-            text_path = self._query_builder.get_element_path("text", has_ns)
-            form_path = self._query_builder.get_element_path("form", has_ns)
-            lexical_unit_path = self._query_builder.get_element_path("lexical-unit", has_ns)
-            relation_path = self._query_builder.get_element_path("relation", has_ns)
-            trait_path = self._query_builder.get_element_path("trait", has_ns)
-
-            C = f"collection('{db_name}')"
-
-            # Entries that are variant forms have a <relation> with <trait name="variant-type">.
-            # These legitimately lack senses and pronunciations, so we exclude them from
-            # structural quality metrics.
-            VARIANT_FILTER = f"not(.//{relation_path}[{trait_path}[@name='variant-type']])"
-
-            def pct(part, total):
-                return round((part / total) * 100, 1) if total > 0 else 0.0
-
-            # --- single-pass count query ---
-            # Returns 7 pipe-delimited integers:
-            # entries | senses | examples | entries_no_sense | senses_no_content | entries_no_pron | senses_no_example
-            count_query = (
-                f"{prologue} let $entries := {C}//{entry_path}, "
-                f"  $non_variant := {C}//{entry_path}[{VARIANT_FILTER}], "
-                f"  $senses := $non_variant//{sense_path}, "
-                f"  $examples := $senses//{example_path} "
-                f"return string-join(("
-                f"  count($entries), "
-                f"  count($senses), "
-                f"  count($examples), "
-                f"  count($non_variant[empty(.//{sense_path})]), "
-                f"  count($senses[empty({definition_path}) and empty({gloss_path})]), "
-                f"  count($non_variant[empty(.//{pronunciation_path})]), "
-                f"  count($senses[empty(.//{example_path})])"
-                f"), '|')"
-            )
-            raw = self.db_connector.execute_query(count_query)
-            parts = raw.strip().split('|') if raw else ['0'] * 7
-            total_entries = int(parts[0]) if len(parts) > 0 else 0
-            total_senses = int(parts[1]) if len(parts) > 1 else 0
-            total_examples = int(parts[2]) if len(parts) > 2 else 0
-            entries_no_sense_count = int(parts[3]) if len(parts) > 3 else 0
-            senses_no_content_count = int(parts[4]) if len(parts) > 4 else 0
-            entries_no_pron_count = int(parts[5]) if len(parts) > 5 else 0
-            senses_no_examples_count = int(parts[6]) if len(parts) > 6 else 0
-
-            # --- lightweight sample queries (limited to 5, fast because they use predicates) ---
-            SAMPLE_LIMIT = 5
-
-            def sample_entries(condition_xpath):
-                q = (
-                    f"{prologue} let $all := {C}//{entry_path}[{condition_xpath}] "
-                    f"for $e at $pos in $all "
-                    f"where $pos <= {SAMPLE_LIMIT} "
-                    f"let $hw := $e/{lexical_unit_path}/{form_path}/{text_path}/string() "
-                    f"return concat($e/@id, '|||', $hw)"
-                )
-                raw = self.db_connector.execute_query(q)
-                if not raw:
-                    return []
-                result = []
-                for row in raw.strip().split('\n'):
-                    row = row.strip()
-                    if not row:
-                        continue
-                    parts = row.split('|||', 1)
-                    eid = parts[0] if len(parts) > 0 else ''
-                    hw = parts[1] if len(parts) > 1 else ''
-                    # Clean up headwords that contain embedded GUIDs or pipes
-                    hw_clean = hw.split('|')[0] if '|' in hw else hw
-                    result.append({'id': eid, 'headword': hw_clean})
-                return result
-
-            entries_no_sense_samples = sample_entries(f"empty(.//{sense_path}) and {VARIANT_FILTER}")
-            senses_no_content_samples = sample_entries(
-                f".//{sense_path}[empty({definition_path}) and empty({gloss_path})] and {VARIANT_FILTER}"
-            )
-            entries_no_pron_samples = sample_entries(f"empty(.//{pronunciation_path}) and {VARIANT_FILTER}")
-
-            # --- lightweight validation checks (single-pass) ---
-            # Empty text nodes under definition/gloss
-            empty_text_count = 0
-            try:
-                etq = (
-                    f"{prologue} let $defs := {C}//{sense_path}/{definition_path}//{text_path}"
-                    f"[string-length(normalize-space(.)) = 0], "
-                    f"  $glosses := {C}//{sense_path}/{gloss_path}/{text_path}"
-                    f"[string-length(normalize-space(.)) = 0] "
-                    f"return string-join((count($defs), count($glosses)), '|')"
-                )
-                et_raw = self.db_connector.execute_query(etq)
-                et_parts = et_raw.strip().split('|') if et_raw else ['0', '0']
-                empty_text_count = int(et_parts[0]) + int(et_parts[1]) if len(et_parts) > 1 else 0
-            except Exception:
-                self.logger.warning("Could not compute empty text node count", exc_info=True)
-
-            return {
-                "totals": {
-                    "entries": total_entries,
-                    "senses": total_senses,
-                    "examples": total_examples,
-                },
-                "entries_without_senses": {
-                    "count": entries_no_sense_count,
-                    "pct": pct(entries_no_sense_count, total_entries),
-                    "samples": entries_no_sense_samples,
-                },
-                "senses_without_content": {
-                    "count": senses_no_content_count,
-                    "pct": pct(senses_no_content_count, total_senses),
-                    "samples": senses_no_content_samples,
-                },
-                "entries_without_pronunciations": {
-                    "count": entries_no_pron_count,
-                    "pct": pct(entries_no_pron_count, total_entries),
-                    "samples": entries_no_pron_samples,
-                },
-                "senses_without_examples": {
-                    "count": senses_no_examples_count,
-                    "pct": pct(senses_no_examples_count, total_senses),
-                    "samples": [],
-                },
-                "validation_checks": {
-                    "empty_text_nodes": {
-                        "count": empty_text_count,
-                        "description": "Empty or whitespace-only text under definition or gloss",
-                    },
-                },
-            }
-
+            return self.get_stats_store(project_id).quality_metrics()
         except Exception as e:
             self.logger.error("Error computing quality metrics: %s", str(e), exc_info=True)
             raise DatabaseError(f"Failed to compute quality metrics: {e}") from e
 
     def get_composition_stats(self, project_id: Optional[int] = None) -> Dict[str, Any]:
         """
-        Compute data-composition statistics: POS distribution, field coverage,
-        senses-per-entry histogram, examples-per-sense, semantic domain coverage.
+        Return data-composition statistics: POS distribution, field coverage,
+        senses-per-entry histogram, examples-per-sense histogram.
+
+        Read from the materialized statistics store (see get_quality_metrics).
 
         Args:
             project_id: Optional project ID to determine database.
@@ -2892,149 +3274,26 @@ class DictionaryService:
             Dict with composition stats.
         """
         try:
-            db_name = self.db_connector.database
-            if project_id:
-                try:
-                    from app.config_manager import ConfigManager
-                    from flask import current_app
-                    cm = current_app.injector.get(ConfigManager)
-                    settings = cm.get_settings_by_id(project_id)
-                    if settings:
-                        db_name = settings.basex_db_name
-                except (ImportError, AttributeError, RuntimeError):
-                    pass
-
-            if not db_name:
-                raise DatabaseError(DB_NAME_NOT_CONFIGURED)
-
-            has_ns = self._detect_namespace_usage()
-            prologue = self._query_builder.get_namespace_prologue(has_ns)
-            entry_path = self._query_builder.get_element_path("entry", has_ns)
-            sense_path = self._query_builder.get_element_path("sense", has_ns)
-            form_path = self._query_builder.get_element_path("form", has_ns)
-            text_path = self._query_builder.get_element_path("text", has_ns)
-            lexical_unit_path = self._query_builder.get_element_path("lexical-unit", has_ns)
-            citation_path = self._query_builder.get_element_path("citation", has_ns)
-            pronunciation_path = self._query_builder.get_element_path("pronunciation", has_ns)
-            definition_path = self._query_builder.get_element_path("definition", has_ns)
-            gloss_path = self._query_builder.get_element_path("gloss", has_ns)
-            example_path = self._query_builder.get_element_path("example", has_ns)
-            note_path = self._query_builder.get_element_path("note", has_ns)
-            grammatical_info_path = self._query_builder.get_element_path("grammatical-info", has_ns)
-            relation_path = self._query_builder.get_element_path("relation", has_ns)
-            trait_path = self._query_builder.get_element_path("trait", has_ns)
-
-            C = f"collection('{db_name}')"
-
-            def pct(part, total):
-                return round((part / total) * 100, 1) if total > 0 else 0.0
-
-            # --- POS distribution ---
-            pos_query = (
-                f"{prologue} let $entries := {C}//{entry_path} "
-                f"let $pos-vals := "
-                f"  for $e in $entries "
-                f"  let $gi := ($e/{grammatical_info_path}/@value | "
-                f"              $e//{sense_path}/{grammatical_info_path}/@value)[1] "
-                f"  return string(($gi, 'UNSPECIFIED')[1]) "
-                f"let $distinct := distinct-values($pos-vals) "
-                f"return string-join("
-                f"  for $v in $distinct "
-                f"  let $c := count($pos-vals[. = $v]) "
-                f"  order by $c descending "
-                f"  return concat($v, '=', $c), '|')"
-            )
-            pos_raw = self.db_connector.execute_query(pos_query)
-            pos_distribution = {}
-            if pos_raw:
-                for pair in pos_raw.strip().split('|'):
-                    pair = pair.strip()
-                    if '=' in pair:
-                        val, count = pair.split('=', 1)
-                        pos_distribution[val] = int(count)
-
-            # --- Field coverage ---
-            field_query = (
-                f"{prologue} let $entries := {C}//{entry_path} "
-                f"let $total := count($entries) "
-                f"return string-join(("
-                f"  $total, "
-                f"  count($entries[{lexical_unit_path}/{form_path}/{text_path}]), "
-                f"  count($entries[{citation_path}/{form_path}/{text_path}]), "
-                f"  count($entries[.//{sense_path}]), "
-                f"  count($entries[.//{definition_path}]), "
-                f"  count($entries[.//{gloss_path}]), "
-                f"  count($entries[.//{example_path}]), "
-                f"  count($entries[.//{pronunciation_path}]), "
-                f"  count($entries[.//{note_path}])"
-                f"), '|')"
-            )
-            field_raw = self.db_connector.execute_query(field_query)
-            field_parts = field_raw.strip().split('|') if field_raw else ['0'] * 9
-            total = int(field_parts[0]) if len(field_parts) > 0 else 0
-            field_coverage = {}
-            field_names = ['headword', 'citation_form', 'sense', 'definition', 'gloss', 'example', 'pronunciation', 'note']
-            for i, name in enumerate(field_names):
-                count = int(field_parts[i + 1]) if len(field_parts) > i + 1 else 0
-                field_coverage[name] = {
-                    'count': count,
-                    'pct': pct(count, total),
-                }
-
-            # --- Senses-per-entry histogram ---
-            sense_hist_query = (
-                f"{prologue} let $entries := {C}//{entry_path} "
-                f"return string-join("
-                f"  (count($entries[count(.//{sense_path}) = 0]), "
-                f"   count($entries[count(.//{sense_path}) = 1]), "
-                f"   count($entries[count(.//{sense_path}) = 2]), "
-                f"   count($entries[count(.//{sense_path}) = 3]), "
-                f"   count($entries[count(.//{sense_path}) = 4]), "
-                f"   count($entries[count(.//{sense_path}) >= 5])"
-                f"), '|')"
-            )
-            sense_hist_raw = self.db_connector.execute_query(sense_hist_query)
-            sense_hist_parts = sense_hist_raw.strip().split('|') if sense_hist_raw else ['0'] * 6
-            senses_per_entry = [
-                {'bucket': '0', 'count': int(sense_hist_parts[0])},
-                {'bucket': '1', 'count': int(sense_hist_parts[1])},
-                {'bucket': '2', 'count': int(sense_hist_parts[2])},
-                {'bucket': '3', 'count': int(sense_hist_parts[3])},
-                {'bucket': '4', 'count': int(sense_hist_parts[4])},
-                {'bucket': '5+', 'count': int(sense_hist_parts[5])},
-            ]
-
-            # --- Examples-per-sense histogram ---
-            ex_hist_query = (
-                f"{prologue} let $senses := {C}//{sense_path} "
-                f"return string-join("
-                f"  (count($senses[count(.//{example_path}) = 0]), "
-                f"   count($senses[count(.//{example_path}) = 1]), "
-                f"   count($senses[count(.//{example_path}) = 2]), "
-                f"   count($senses[count(.//{example_path}) >= 3])"
-                f"), '|')"
-            )
-            ex_hist_raw = self.db_connector.execute_query(ex_hist_query)
-            ex_hist_parts = ex_hist_raw.strip().split('|') if ex_hist_raw else ['0'] * 4
-            examples_per_sense = [
-                {'bucket': '0', 'count': int(ex_hist_parts[0])},
-                {'bucket': '1', 'count': int(ex_hist_parts[1])},
-                {'bucket': '2', 'count': int(ex_hist_parts[2])},
-                {'bucket': '3+', 'count': int(ex_hist_parts[3])},
-            ]
-
-            return {
-                "total_entries": total,
-                "pos_distribution": pos_distribution,
-                "field_coverage": field_coverage,
-                "senses_per_entry": senses_per_entry,
-                "examples_per_sense": examples_per_sense,
-            }
-
+            return self.get_stats_store(project_id).composition_stats()
         except Exception as e:
             self.logger.error("Error computing composition stats: %s", str(e), exc_info=True)
             raise DatabaseError(f"Failed to compute composition stats: {e}") from e
 
+    def get_structural_anomalies(self, project_id: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Return structural anomalies from the statistics store: non-canonical
+        POS values, duplicate and missing headwords, and senses without
+        definition or gloss text.
+
+        Args:
+            project_id: Optional project ID to determine database.
+        """
+        try:
+            return self.get_stats_store(project_id).anomalies()
+        except Exception as e:
+            self.logger.error("Error computing anomalies: %s", str(e), exc_info=True)
+            raise DatabaseError(f"Failed to compute anomalies: {e}") from e
+
     def count_entries(self, project_id: Optional[int] = None) -> int:
         """Number of non-variant entries (fast count query)."""
         try:
@@ -4345,32 +4604,11 @@ class DictionaryService:
         self, relation_type: str, project_id: Optional[int] = None
     ) -> Set[Tuple[str, str]]:
         """Fetch all existing relations of a given type as sorted (source, target) pairs."""
-        linked_pairs: Set[Tuple[str, str]] = set()
         try:
-            db_name = self._resolve_db_name(project_id)
-            has_ns = self._detect_namespace_usage()
-            prologue = self._query_builder.get_namespace_prologue(has_ns)
-            entry_q = self._query_builder.get_element_path("entry", has_ns)
-            relation_q = self._query_builder.get_element_path("relation", has_ns)
-            C = f"collection('{db_name}')"
-            rel_query = (
-                f"{prologue} "
-                f"for $rel in {C}//{entry_q}/{relation_q}[@type='{relation_type}'] "
-                f"return concat($rel/../@id, '|||', $rel/@ref)"
-            )
-            rel_raw = self.db_connector.execute_query(rel_query)
-            for rline in rel_raw.strip().split('\n'):
-                rline = rline.strip()
-                if not rline:
-                    continue
-                rparts = rline.split('|||', 1)
-                if len(rparts) == 2:
-                    a_id, b_id = rparts[0].strip(), rparts[1].strip()
-                    if a_id and b_id:
-                        linked_pairs.add(tuple(sorted([a_id, b_id])))
+            return self.get_relation_index(project_id).pairs(relation_type)
         except Exception:
             self.logger.warning("Failed to batch-fetch existing relations for type '%s'", relation_type)
-        return linked_pairs
+            return set()
 
     def _create_relation(
         self,
@@ -4592,6 +4830,8 @@ class DictionaryService:
         else:
             count = self._import_lift_merge(lift_path)
 
+        self.invalidate_derived_data()
+
         try:
             from app.services.event_bus import event_bus
             event_bus.emit("import_complete", {"project_id": project_id or 1, "count": count})
@@ -4634,10 +4874,13 @@ class DictionaryService:
             if final_ranges_path:
                 self.logger.debug("Auto-detected ranges file: %s", final_ranges_path)
         
-        if mode == "replace":
-            return self._import_lift_replace_with_ranges(lift_path, lift_path_basex, final_ranges_path)
-        else:  # merge
-            return self._import_lift_merge_with_ranges(lift_path, lift_path_basex, final_ranges_path)
+        try:
+            if mode == "replace":
+                return self._import_lift_replace_with_ranges(lift_path, lift_path_basex, final_ranges_path)
+            else:  # merge
+                return self._import_lift_merge_with_ranges(lift_path, lift_path_basex, final_ranges_path)
+        finally:
+            self.invalidate_derived_data()
 
     def _import_lift_merge(self, lift_path: str) -> int:
         """
@@ -6147,21 +6390,7 @@ class DictionaryService:
             # Log raw query result for debugging
             self.logger.debug(f"Raw query result: {entry_xml}")
 
-            # Parse XML to Entry object WITHOUT validation to allow editing invalid entries
-            self.logger.debug("Entry XML: %s...", entry_xml[:100])
-            non_validating_parser = LIFTParser(
-                validate=False
-            )  # CRITICAL: no validation for editing
-            entries = non_validating_parser.parse_string(entry_xml)
-            if not entries or not entries[0]:
-                self.logger.debug("Error parsing entry %s", entry_id)
-                raise NotFoundError(f"Entry with ID '{entry_id}' could not be parsed")
-
-            entry = entries[0]
-            entry._raw_xml = entry_xml
-            self.logger.debug("Entry parsed successfully for editing: %s", entry.id)
-
-            return entry
+            return self._parse_entry_for_editing(entry_id, entry_xml)
 
         except NotFoundError:
             raise
@@ -6173,6 +6402,83 @@ class DictionaryService:
                 f"Failed to retrieve entry for editing: {str(e)}"
             ) from e
 
+    def _parse_entry_for_editing(self, entry_id: str, entry_xml: str) -> Entry:
+        """Parse entry XML without validation, keeping the raw XML for rendering."""
+        # Parse XML to Entry object WITHOUT validation to allow editing invalid entries
+        self.logger.debug("Entry XML: %s...", entry_xml[:100])
+        non_validating_parser = LIFTParser(
+            validate=False
+        )  # CRITICAL: no validation for editing
+        entries = non_validating_parser.parse_string(entry_xml)
+        if not entries or not entries[0]:
+            self.logger.debug("Error parsing entry %s", entry_id)
+            raise NotFoundError(f"Entry with ID '{entry_id}' could not be parsed")
+
+        entry = entries[0]
+        entry._raw_xml = entry_xml
+        self.logger.debug("Entry parsed successfully for editing: %s", entry.id)
+        return entry
+
+    def get_entry_view_bundle(self, entry_id: str, project_id: Optional[int] = None,
+                              include_subentries: bool = False) -> EntryViewBundle:
+        """
+        Load an entry for the edit/view pages together with its relation data.
+
+        One BaseX round trip returns the entry (parsed without validation,
+        as in get_entry_for_editing), labels of all forward and reverse
+        relation targets, reverse relations and sense-relation targets.
+
+        Args:
+            entry_id: ID of the entry to retrieve.
+            project_id: Optional project ID to determine database.
+            include_subentries: Also fetch the XML of the entry's subentries.
+
+        Returns:
+            EntryViewBundle whose ``entry`` attribute holds the parsed Entry.
+
+        Raises:
+            NotFoundError: If the entry does not exist.
+            DatabaseError: If there is an error retrieving the entry.
+        """
+        try:
+            db_name = self._resolve_db_name(project_id)
+            has_namespace = self._detect_namespace_usage()
+            query = self._query_builder.build_entry_view_bundle_query(
+                entry_id, db_name, has_namespace=has_namespace,
+                include_subentries=include_subentries,
+            )
+            bundle = EntryViewBundle.from_xml(self, self.db_connector.execute_query(query))
+            if bundle is None or not bundle.entry_xml:
+                raise NotFoundError(f"Entry with ID '{entry_id}' not found")
+            bundle.entry = self._parse_entry_for_editing(entry_id, bundle.entry_xml)
+            return bundle
+
+        except NotFoundError:
+            raise
+        except Exception as e:
+            self.logger.error("Error retrieving entry view bundle %s: %s", entry_id, e)
+            raise DatabaseError(f"Failed to retrieve entry for editing: {e}") from e
+
+    def resolve_sense_targets(self, sense_ids: List[str],
+                              project_id: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Resolve sense IDs to their owning entry and first gloss in one XQuery.
+
+        Returns:
+            Dict mapping sense ID -> {'entry_id', 'lexical_unit': {lang: text}, 'gloss'}.
+        """
+        ids = list(dict.fromkeys(str(i) for i in sense_ids if i))
+        if not ids:
+            return {}
+        try:
+            query = self._query_builder.build_sense_targets_query(
+                ids, self._resolve_db_name(project_id), self._detect_namespace_usage()
+            )
+            bundle = EntryViewBundle.from_xml(self, self.db_connector.execute_query(query))
+            return bundle.sense_targets if bundle else {}
+        except Exception as e:
+            self.logger.warning("Batch sense target lookup failed: %s", e)
+            return {}
+
     def _detect_namespace_usage(self, project_id: Optional[int] = None) -> bool:
         """
         Check if the dictionary database uses namespaces.
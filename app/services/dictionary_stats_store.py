@@ -0,0 +1,373 @@
+"""
+Materialized dictionary statistics for the dashboard.
+
+Keeps one compact ``EntryStats`` record per entry plus running aggregates
+(quality counters, composition histograms, anomaly sets). The store is built
+from a single BaseX pass on first use, updated per entry from the
+``DictionaryService`` save/delete pipeline, and reconciled against BaseX in a
+background thread once it is older than ``reconcile_interval_seconds`` (which
+also picks up writes made by other worker processes). Dashboard reads only
+format the aggregates, so their cost does not depend on dictionary size.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_LIMIT = 5
+
+SENSES_PER_ENTRY_BUCKETS = ('0', '1', '2', '3', '4', '5+')
+EXAMPLES_PER_SENSE_BUCKETS = ('0', '1', '2', '3+')
+FIELD_NAMES = ('headword', 'citation_form', 'sense', 'definition', 'gloss', 'example', 'pronunciation', 'note')
+
+
+class SenseStats(NamedTuple):
+    sense_id: str
+    pos: str  # sense grammatical-info, falling back to the entry's
+    has_definition: bool
+    has_gloss: bool
+    example_count: int
+    has_text: bool  # non-blank definition or gloss text
+
+
+class EntryStats(NamedTuple):
+    entry_id: str
+    headword: str
+    has_headword: bool
+    is_variant: bool
+    has_citation: bool
+    has_note: bool
+    has_pronunciation: bool
+    pos: str  # first grammatical-info in the entry ('' if none)
+    example_count: int
+    empty_text_count: int  # blank text nodes under definition/gloss
+    senses: Tuple[SenseStats, ...]
+
+
+# Loader signature: given entry IDs (or None for the whole database) return
+# their EntryStats records.
+StatsLoader = Callable[[Optional[List[str]]], Iterable[EntryStats]]
+
+
+def _bucket(value: int, buckets: Tuple[str, ...]) -> str:
+    return buckets[min(value, len(buckets) - 1)]
+
+
+def _shoebox_pos_map() -> Dict[str, str]:
+    from app.services.import_converter import SHOEBOX_POS_MAP
+
+    return SHOEBOX_POS_MAP
+
+
+def _pct(part: int, total: int) -> float:
+    return round((part / total) * 100, 1) if total > 0 else 0.0
+
+
+class DictionaryStatsStore:
+    """Per-entry statistics and incrementally maintained aggregates for one database."""
+
+    def __init__(self, loader: StatsLoader, reconcile_interval_seconds: float = 900.0) -> None:
+        self._loader = loader
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self._lock = threading.RLock()
+        self._reconcile_thread: Optional[threading.Thread] = None
+        self._canonical_pos = set(_shoebox_pos_map().values())
+        self._built_at: Optional[float] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._records: Dict[str, EntryStats] = {}
+        self._counts: Counter = Counter()
+        self._pos: Counter = Counter()
+        # Insertion-ordered "sets" of entry IDs, used for the dashboard samples
+        self._samples: Dict[str, Dict[str, None]] = {
+            'entries_without_senses': {},
+            'senses_without_content': {},
+            'entries_without_pronunciations': {},
+        }
+        self._headwords: Dict[str, Set[str]] = {}
+        self._duplicate_headwords: Set[str] = set()
+        self._missing_headwords: Dict[str, None] = {}
+        self._non_canonical_pos: Dict[str, List[str]] = {}
+        self._empty_senses: Dict[str, List[str]] = {}
+
+    # ---- Lifecycle ----
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    def invalidate(self) -> None:
+        """Drop all statistics; the next read rebuilds them."""
+        with self._lock:
+            self._reset()
+            self._built_at = None
+
+    def rebuild(self) -> None:
+        """Recompute every record from the database (one full pass)."""
+        started = time.monotonic()
+        records = list(self._loader(None))
+        with self._lock:
+            self._reset()
+            for record in records:
+                self._records[record.entry_id] = record
+                self._apply(record, 1)
+            self._built_at = time.monotonic()
+        logger.info(
+            "Built dictionary statistics for %d entries in %.1f ms",
+            len(records), (time.monotonic() - started) * 1000,
+        )
+
+    def reconcile_async(self) -> bool:
+        """Start a background rebuild unless one is already running."""
+        with self._lock:
+            if self._reconcile_thread is not None and self._reconcile_thread.is_alive():
+                return False
+            self._reconcile_thread = threading.Thread(
+                target=self._reconcile, name='dictionary-stats-reconcile', daemon=True
+            )
+            self._reconcile_thread.start()
+            return True
+
+    def _reconcile(self) -> None:
+        try:
+            self.rebuild()
+        except Exception as e:
+            logger.warning("Dictionary statistics reconciliation failed: %s", e)
+
+    def _ensure_fresh(self) -> None:
+        if self._built_at is None:
+            self.rebuild()
+        elif time.monotonic() - self._built_at > self.reconcile_interval_seconds:
+            self.reconcile_async()
+
+    # ---- Incremental maintenance ----
+
+    def refresh_entries(self, entry_ids: Iterable[str]) -> None:
+        """Reload records for saved entries (one query). No-op until built."""
+        ids = [eid for eid in dict.fromkeys(entry_ids) if eid]
+        if not ids or not self.is_built:
+            return
+        loaded = {record.entry_id: record for record in self._loader(ids)}
+        with self._lock:
+            for entry_id in ids:
+                self._replace(entry_id, loaded.get(entry_id))
+
+    def remove_entry(self, entry_id: str) -> None:
+        """Forget a deleted entry. No-op until built."""
+        if not self.is_built:
+            return
+        with self._lock:
+            self._replace(entry_id, None)
+
+    def _replace(self, entry_id: str, record: Optional[EntryStats]) -> None:
+        old = self._records.pop(entry_id, None)
+        if old is not None:
+            self._apply(old, -1)
+        if record is not None:
+            self._records[entry_id] = record
+            self._apply(record, 1)
+
+    def _apply(self, record: EntryStats, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) one record's contribution."""
+        counts = self._counts
+        senses = record.senses
+        eid = record.entry_id
+        adding = sign > 0
+
+        counts['entries'] += sign
+        counts['senses'] += sign * len(senses)
+        counts['examples'] += sign * record.example_count
+        counts['empty_text_nodes'] += sign * record.empty_text_count
+        self._pos[record.pos or 'UNSPECIFIED'] += sign
+
+        fields = {
+            'headword': record.has_headword,
+            'citation_form': record.has_citation,
+            'sense': bool(senses),
+            'definition': any(s.has_definition for s in senses),
+            'gloss': any(s.has_gloss for s in senses),
+            'example': record.example_count > 0,
+            'pronunciation': record.has_pronunciation,
+            'note': record.has_note,
+        }
+        for name, present in fields.items():
+            if present:
+                counts[f'field:{name}'] += sign
+
+        counts[f'senses_per_entry:{_bucket(len(senses), SENSES_PER_ENTRY_BUCKETS)}'] += sign
+        for sense in senses:
+            counts[f'examples_per_sense:{_bucket(sense.example_count, EXAMPLES_PER_SENSE_BUCKETS)}'] += sign
+
+        # Quality metrics exclude variant entries, which legitimately lack
+        # senses and pronunciations.
+        if not record.is_variant:
+            counts['quality:senses'] += sign * len(senses)
+            counts['quality:examples'] += sign * record.example_count
+            no_content = sum(1 for s in senses if not s.has_definition and not s.has_gloss)
+            counts['quality:senses_without_content'] += sign * no_content
+            counts['quality:senses_without_examples'] += sign * sum(1 for s in senses if s.example_count == 0)
+            flags = {
+                'entries_without_senses': not senses,
+                'senses_without_content': no_content > 0,
+                'entries_without_pronunciations': not record.has_pronunciation,
+            }
+            for category, flagged in flags.items():
+                if not flagged:
+                    continue
+                if category != 'senses_without_content':
+                    counts[f'quality:{category}'] += sign
+                if adding:
+                    self._samples[category][eid] = None
+                else:
+                    self._samples[category].pop(eid, None)
+
+        # Anomalies are reported for entries with at least one sense.
+        if not senses:
+            return
+        if not record.headword:
+            if adding:
+                self._missing_headwords[eid] = None
+            else:
+                self._missing_headwords.pop(eid, None)
+        else:
+            ids = self._headwords.setdefault(record.headword, set())
+            if adding:
+                ids.add(eid)
+            else:
+                ids.discard(eid)
+                if not ids:
+                    del self._headwords[record.headword]
+            if len(ids) > 1:
+                self._duplicate_headwords.add(record.headword)
+            else:
+                self._duplicate_headwords.discard(record.headword)
+
+        if adding:
+            pos_values = list(dict.fromkeys(
+                s.pos for s in senses if s.pos and s.pos not in self._canonical_pos
+            ))
+            if pos_values:
+                self._non_canonical_pos[eid] = pos_values
+            empty = [s.sense_id for s in senses if not s.has_text]
+            if empty:
+                self._empty_senses[eid] = empty
+        else:
+            self._non_canonical_pos.pop(eid, None)
+            self._empty_senses.pop(eid, None)
+
+    # ---- Reads ----
+
+    def _sample(self, category: str) -> List[Dict[str, str]]:
+        return [
+            {'id': eid, 'headword': self._records[eid].headword}
+            for eid in islice(self._samples[category], SAMPLE_LIMIT)
+            if eid in self._records
+        ]
+
+    def sense_and_example_counts(self) -> Tuple[int, int]:
+        self._ensure_fresh()
+        with self._lock:
+            return self._counts['senses'], self._counts['examples']
+
+    def quality_metrics(self) -> Dict[str, Any]:
+        """Same shape as DictionaryService.get_quality_metrics()."""
+        self._ensure_fresh()
+        with self._lock:
+            c = self._counts
+            total_entries = c['entries']
+            total_senses = c['quality:senses']
+            return {
+                "totals": {
+                    "entries": total_entries,
+                    "senses": total_senses,
+                    "examples": c['quality:examples'],
+                },
+                "entries_without_senses": {
+                    "count": c['quality:entries_without_senses'],
+                    "pct": _pct(c['quality:entries_without_senses'], total_entries),
+                    "samples": self._sample('entries_without_senses'),
+                },
+                "senses_without_content": {
+                    "count": c['quality:senses_without_content'],
+                    "pct": _pct(c['quality:senses_without_content'], total_senses),
+                    "samples": self._sample('senses_without_content'),
+                },
+                "entries_without_pronunciations": {
+                    "count": c['quality:entries_without_pronunciations'],
+                    "pct": _pct(c['quality:entries_without_pronunciations'], total_entries),
+                    "samples": self._sample('entries_without_pronunciations'),
+                },
+                "senses_without_examples": {
+                    "count": c['quality:senses_without_examples'],
+                    "pct": _pct(c['quality:senses_without_examples'], total_senses),
+                    "samples": [],
+                },
+                "validation_checks": {
+                    "empty_text_nodes": {
+                        "count": c['empty_text_nodes'],
+                        "description": "Empty or whitespace-only text under definition or gloss",
+                    },
+                },
+            }
+
+    def composition_stats(self) -> Dict[str, Any]:
+        """Same shape as DictionaryService.get_composition_stats()."""
+        self._ensure_fresh()
+        with self._lock:
+            c = self._counts
+            total = c['entries']
+            return {
+                "total_entries": total,
+                "pos_distribution": {pos: n for pos, n in self._pos.most_common() if n > 0},
+                "field_coverage": {
+                    name: {'count': c[f'field:{name}'], 'pct': _pct(c[f'field:{name}'], total)}
+                    for name in FIELD_NAMES
+                },
+                "senses_per_entry": [
+                    {'bucket': b, 'count': c[f'senses_per_entry:{b}']} for b in SENSES_PER_ENTRY_BUCKETS
+                ],
+                "examples_per_sense": [
+                    {'bucket': b, 'count': c[f'examples_per_sense:{b}']} for b in EXAMPLES_PER_SENSE_BUCKETS
+                ],
+            }
+
+    def anomalies(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Structural anomalies: non-canonical POS, duplicate/missing headwords, empty senses."""
+        pos_map = _shoebox_pos_map()
+        self._ensure_fresh()
+        with self._lock:
+            non_canonical = [
+                {'entry_id': eid, 'pos_value': pos, 'suggested': pos_map.get(pos.lower())}
+                for eid, pos_values in self._non_canonical_pos.items()
+                for pos in pos_values
+            ]
+            return {
+                'non_canonical_pos': non_canonical,
+                'duplicate_headwords': [
+                    {'headword': hw, 'entry_ids': sorted(self._headwords[hw]), 'count': len(self._headwords[hw])}
+                    for hw in sorted(self._duplicate_headwords)
+                ],
+                'missing_headwords': [{'entry_id': eid} for eid in self._missing_headwords],
+                'empty_senses': [
+                    {'entry_id': eid, 'sense_id': sid}
+                    for eid, sense_ids in self._empty_senses.items()
+                    for sid in sense_ids
+                ],
+            }
+
+    def get_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'built': self.is_built,
+                'entries': len(self._records),
+                'age_seconds': round(time.monotonic() - self._built_at, 1) if self._built_at else None,
+                'reconciling': bool(self._reconcile_thread and self._reconcile_thread.is_alive()),
+            }
@@ -0,0 +1,448 @@
+"""
+Whole-dictionary validation with incremental revalidation.
+
+``DictionaryValidationRunner.run`` validates every entry of a BaseX database
+against the validation rule set and stores one ``EntryValidationResult``
+row per entry. Each row is tagged with the entry's ``dateModified`` and a
+rule-set version, so a re-run only touches:
+
+* entries that are new, whose ``dateModified`` changed or that have none
+  (all rules run);
+* entries validated under another rule-set version. Only the rules whose
+  digest changed run; issues of unchanged rules are kept, and issues of
+  removed rules are dropped without fetching the entry.
+
+Rule digests cover the rule configuration and the project configuration.
+Rules that depend on the rest of the dictionary (relation targets) also
+cover a digest of the target IDs, so adding or deleting entries reruns
+just those rules.
+
+Entry XML is fetched from BaseX in chunks and validated in a process pool,
+because the rules are CPU-bound Python. Parsing and validation run in the
+workers and the main process writes the results. The report gives
+entries/second and the time spent in each rule.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from app.services.relation_target_index import expand_targets
+from app.utils.xquery_builder import XQueryBuilder
+
+logger = logging.getLogger(__name__)
+
+# Custom functions whose result depends on other entries, not just the entry itself
+CONTEXT_FUNCTIONS = frozenset({'validate_relation_targets_exist'})
+
+ProgressCallback = Callable[[int, int, str], None]
+
+
+def _digest(payload: Any) -> str:
+    text = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _issue_dict(error: Any) -> Dict[str, Any]:
+    return {
+        'rule_id': error.rule_id,
+        'rule_name': error.rule_name,
+        'message': error.message,
+        'path': error.path,
+        'priority': error.priority.value,
+        'category': error.category.value,
+    }
+
+
+def _result_row(entry_id: str, date_modified: str, version: str, issues: List[Dict[str, Any]]) -> Dict[str, Any]:
+    priorities = Counter(issue['priority'] for issue in issues)
+    return {
+        'entry_id': entry_id,
+        'date_modified': date_modified,
+        'rule_set_version': version,
+        'is_valid': priorities['critical'] == 0,
+        'error_count': priorities['critical'],
+        'warning_count': priorities['warning'],
+        'info_count': len(issues) - priorities['critical'] - priorities['warning'],
+        'issues': issues,
+    }
+
+
+class ChunkValidator:
+    """Parses and validates chunks of entry XML; one instance per worker process."""
+
+    def __init__(self, rules: Dict[str, Dict[str, Any]], project_config: Dict[str, Any],
+                 relation_targets: Set[str], validation_mode: str) -> None:
+        from app.parsers.lift_parser import LIFTParser
+        from app.services.validation_engine import ValidationEngine
+
+        self.engine = ValidationEngine(project_config=project_config, existing_entry_ids=relation_targets)
+        self.engine.rules = rules
+        self.validation_mode = validation_mode
+        self.rules = self.engine.get_plan().rules_for(validation_mode)
+        self.spelling_rule_ids = self._rule_ids('_validate_hunspell_spelling')
+        self.ipa_rule_ids = self._rule_ids('_validate_ipa_anomaly_detection')
+        self.pos_rule_ids = self._rule_ids('_validate_definition_phrase_coherence')
+        self.parser = LIFTParser(validate=False)
+
+    def _rule_ids(self, function_name: str) -> FrozenSet[str]:
+        return frozenset(
+            rule.rule_id for rule in self.rules
+            if rule.custom and getattr(rule.custom[0], '__name__', '') == function_name
+        )
+
+    def validate(self, chunk_xml: str, only: Dict[str, FrozenSet[str]]) -> Dict[str, Any]:
+        """Validate every entry in ``chunk_xml``.
+
+        Args:
+            chunk_xml: Serialized ``<entry>`` elements.
+            only: Entry ID -> rule IDs to run for entries that need only
+                some rules; other entries run every rule.
+
+        Returns:
+            ``{'results': {entry_id: [issue, ...]}, 'rule_seconds', 'rule_runs',
+            'parse_seconds', 'spell_seconds', 'ipa_seconds', 'pos_seconds', 'pos_docs'}``
+        """
+        from app.services.validation_plan import EntryView
+
+        started = time.perf_counter()
+        entries = self.parser.parse_string(f"<lift>{chunk_xml}</lift>") if chunk_xml.strip() else []
+        datas = [entry.to_dict() for entry in entries]
+        parse_seconds = time.perf_counter() - started
+
+        def needing(rule_ids: FrozenSet[str]) -> List[Dict[str, Any]]:
+            return [data for entry, data in zip(entries, datas)
+                    if only.get(entry.id) is None or only[entry.id] & rule_ids]
+
+        # Check the chunk's distinct tokens once, run the IPA model over all of
+        # its pronunciations in batches and parse all of its definitions in one
+        # spaCy pass; the rules then read cached results.
+        started = time.perf_counter()
+        if self.spelling_rule_ids:
+            self.engine.warm_spelling_cache(needing(self.spelling_rule_ids), self.validation_mode)
+        spell_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        if self.ipa_rule_ids:
+            self.engine.warm_ipa_anomaly_cache(needing(self.ipa_rule_ids), self.validation_mode)
+        ipa_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        pos_docs = 0
+        if self.pos_rule_ids:
+            pos_docs = self.engine.warm_definition_phrase_cache(needing(self.pos_rule_ids), self.validation_mode)['docs']
+        pos_seconds = time.perf_counter() - started
+
+        rule_seconds: Counter = Counter()
+        rule_runs: Counter = Counter()
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        perf_counter = time.perf_counter
+        for entry, data in zip(entries, datas):
+            rule_ids = only.get(entry.id)
+            view = EntryView(data)
+            issues: List[Dict[str, Any]] = []
+            for rule in self.rules:
+                if rule_ids is not None and rule.rule_id not in rule_ids:
+                    continue
+                rule_started = perf_counter()
+                found = rule.apply(self.engine, data, view)
+                rule_seconds[rule.rule_id] += perf_counter() - rule_started
+                rule_runs[rule.rule_id] += 1
+                issues.extend(_issue_dict(error) for error in found)
+            results[entry.id] = issues
+
+        return {
+            'results': results,
+            'rule_seconds': dict(rule_seconds),
+            'rule_runs': dict(rule_runs),
+            'parse_seconds': parse_seconds,
+            'spell_seconds': spell_seconds,
+            'ipa_seconds': ipa_seconds,
+            'pos_seconds': pos_seconds,
+            'pos_docs': pos_docs,
+        }
+
+
+# Per-process validator of pool workers
+_worker: Optional[ChunkValidator] = None
+
+
+def _init_worker(*args: Any) -> None:
+    global _worker
+    _worker = ChunkValidator(*args)
+
+
+def _validate_in_worker(chunk_xml: str, only: Dict[str, FrozenSet[str]]) -> Dict[str, Any]:
+    return _worker.validate(chunk_xml, only)
+
+
+class DictionaryValidationRunner:
+    """Validates a whole dictionary into the persistent results table."""
+
+    BATCH_SIZE = 200
+    MAX_WORKERS = 8
+
+    def __init__(self, dictionary_service: Any) -> None:
+        self.dictionary_service = dictionary_service
+
+    # ---- BaseX access ----
+
+    def _paths(self) -> Tuple[str, str, str]:
+        service = self.dictionary_service
+        has_ns = service._detect_namespace_usage()
+        qb = service._query_builder
+        return (qb.get_namespace_prologue(has_ns), qb.get_element_path('entry', has_ns),
+                qb.get_element_path('sense', has_ns))
+
+    def load_index(self, db_name: str) -> Dict[str, str]:
+        """entry_id -> dateModified for every entry in the database."""
+        prologue, entry_path, _ = self._paths()
+        query = (f"{prologue} for $e in collection('{db_name}')//{entry_path} "
+                 f"return concat(string($e/@id), '|||', string($e/@dateModified))")
+        index: Dict[str, str] = {}
+        for line in (self.dictionary_service.db_connector.execute_query(query) or '').split('\n'):
+            entry_id, _, modified = line.strip().partition('|||')
+            if entry_id:
+                index[entry_id] = modified
+        return index
+
+    def load_relation_targets(self, db_name: str) -> Set[str]:
+        """IDs and GUIDs relations may point to (entries and senses)."""
+        prologue, entry_path, sense_path = self._paths()
+        query = (f"{prologue} for $a in (collection('{db_name}')//{entry_path}/(@id, @guid), "
+                 f"collection('{db_name}')//{sense_path}/(@id, @guid)) return string($a)")
+        raw = self.dictionary_service.db_connector.execute_query(query) or ''
+        return expand_targets(line.strip() for line in raw.split('\n'))
+
+    def fetch_chunk(self, db_name: str, entry_ids: List[str]) -> str:
+        """Serialized ``<entry>`` elements of ``entry_ids``."""
+        prologue, entry_path, _ = self._paths()
+        id_seq = ', '.join(f"'{XQueryBuilder.escape_xquery_string(i)}'" for i in entry_ids)
+        query = f"{prologue} collection('{db_name}')//{entry_path}[@id = ({id_seq})]"
+        return self.dictionary_service.db_connector.execute_query(query) or ''
+
+    # ---- Rule-set versions ----
+
+    @staticmethod
+    def rule_digests(rules: Iterable[Any], project_config: Dict[str, Any],
+                     context_digest: str) -> Dict[str, str]:
+        """Digest of each compiled rule's configuration and inputs."""
+        project_digest = _digest(project_config)
+        digests = {}
+        for rule in rules:
+            validation = rule.config.get('validation')
+            custom = validation.get('custom_function') if isinstance(validation, dict) else None
+            context = context_digest if custom in CONTEXT_FUNCTIONS else ''
+            digests[rule.rule_id] = _digest([rule.config, project_digest, context])
+        return digests
+
+    # ---- Run ----
+
+    def run(self, db_name: Optional[str] = None, project_id: Optional[str] = None, full: bool = False,
+            workers: Optional[int] = None, validation_mode: str = 'save',
+            batch_size: Optional[int] = None, progress: Optional[ProgressCallback] = None,
+            cancel_check: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        """Validate the dictionary, revalidating only what changed since the last run.
+
+        Args:
+            db_name: BaseX database (defaults to the service's database).
+            project_id: Project whose rule set to use.
+            full: Revalidate every entry with every rule.
+            workers: Worker processes (default: CPU count - 1, at most
+                ``MAX_WORKERS``); 1 validates in this process.
+            validation_mode: Validation mode passed to the rules.
+            batch_size: Entries per chunk sent to a worker.
+            progress: Called with (processed, total, message).
+            cancel_check: Returns True to stop after the current chunk.
+
+        Returns:
+            Run report with counts, entries/second and per-rule cost.
+        """
+        from app.models.validation_cache_models import EntryValidationResult, ValidationRuleSetVersion
+        from app.services.validation_engine import ValidationEngine
+
+        started = time.perf_counter()
+        db_name = db_name or self.dictionary_service.db_connector.database
+        batch_size = batch_size or self.BATCH_SIZE
+
+        targets = self.load_relation_targets(db_name)
+        engine = ValidationEngine(project_id=project_id, existing_entry_ids=targets)
+        compiled = engine.get_plan().rules_for(validation_mode)
+        digests = self.rule_digests(compiled, engine.project_config, _digest(sorted(targets)))
+        version = _digest([validation_mode, sorted(digests.items())])
+        ValidationRuleSetVersion.record(version, digests)
+
+        index = self.load_index(db_name)
+        stored = EntryValidationResult.get_index(db_name)
+        removed = [entry_id for entry_id in stored if entry_id not in index]
+        if removed:
+            EntryValidationResult.delete_entries(db_name, removed)
+
+        # entry_id -> None (all rules) or the changed rule IDs to rerun
+        work: Dict[str, Optional[FrozenSet[str]]] = {}
+        # entry_id -> rule IDs whose issues to drop without revalidating
+        drop_only: Dict[str, FrozenSet[str]] = {}
+        changes: Dict[str, Optional[Tuple[FrozenSet[str], FrozenSet[str]]]] = {}
+        for entry_id, modified in index.items():
+            previous = stored.get(entry_id)
+            # Without a dateModified an edit cannot be told apart, so such entries always rerun
+            if full or previous is None or not modified or previous[0] != modified:
+                work[entry_id] = None
+                continue
+            if previous[1] == version:
+                continue
+            if previous[1] not in changes:
+                old = ValidationRuleSetVersion.get_digests(previous[1])
+                changes[previous[1]] = None if old is None else (
+                    frozenset(r for r, d in digests.items() if old.get(r) != d),
+                    frozenset(r for r in old if r not in digests),
+                )
+            change = changes[previous[1]]
+            if change is None:
+                work[entry_id] = None
+            elif change[0]:
+                work[entry_id] = change[0] | change[1]
+            else:
+                drop_only[entry_id] = change[1]
+
+        report: Dict[str, Any] = {
+            'db_name': db_name,
+            'rule_set_version': version,
+            'entries': len(index),
+            'validated': sum(1 for rules in work.values() if rules is None),
+            'revalidated_changed_rules': sum(1 for rules in work.values() if rules is not None),
+            'dropped_rule_issues': len(drop_only),
+            'unchanged': len(index) - len(work) - len(drop_only),
+            'removed': len(removed),
+            'cancelled': False,
+        }
+
+        self._drop_rule_issues(db_name, version, index, drop_only)
+
+        rule_seconds: Counter = Counter()
+        rule_runs: Counter = Counter()
+        parse_seconds = 0.0
+        spell_seconds = 0.0
+        ipa_seconds = 0.0
+        pos_seconds = 0.0
+        pos_docs = 0
+        processed = 0
+        total = len(work)
+        if workers is None:
+            workers = max(1, min(self.MAX_WORKERS, (os.cpu_count() or 2) - 1))
+        else:
+            workers = max(1, min(self.MAX_WORKERS, workers))
+        workers = 1 if total <= batch_size else workers
+        report['workers'] = workers
+
+        init_args = (engine.rules, engine.project_config, targets, validation_mode)
+        executor = None
+        inline = None
+        if workers > 1:
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                           initializer=_init_worker, initargs=init_args)
+        else:
+            inline = ChunkValidator(*init_args)
+
+        def store(chunk_ids: List[str], result: Dict[str, Any]) -> None:
+            nonlocal parse_seconds, spell_seconds, ipa_seconds, pos_seconds, pos_docs, processed
+            rule_seconds.update(result['rule_seconds'])
+            rule_runs.update(result['rule_runs'])
+            parse_seconds += result['parse_seconds']
+            spell_seconds += result['spell_seconds']
+            ipa_seconds += result['ipa_seconds']
+            pos_seconds += result['pos_seconds']
+            pos_docs += result['pos_docs']
+            self._store_results(db_name, version, index, work, chunk_ids, result['results'])
+            processed += len(chunk_ids)
+            if progress:
+                progress(processed, total, f"Validated {processed}/{total} entries")
+
+        pending: deque = deque()
+        work_ids = list(work)
+        try:
+            for start in range(0, total, batch_size):
+                if cancel_check and cancel_check():
+                    report['cancelled'] = True
+                    break
+                chunk_ids = work_ids[start:start + batch_size]
+                chunk_xml = self.fetch_chunk(db_name, chunk_ids)
+                only = {entry_id: work[entry_id] for entry_id in chunk_ids if work[entry_id] is not None}
+                if executor is None:
+                    store(chunk_ids, inline.validate(chunk_xml, only))
+                    continue
+                pending.append((chunk_ids, executor.submit(_validate_in_worker, chunk_xml, only)))
+                while len(pending) >= workers * 2:
+                    chunk, future = pending.popleft()
+                    store(chunk, future.result())
+            while pending:
+                chunk, future = pending.popleft()
+                store(chunk, future.result())
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        elapsed = time.perf_counter() - started
+        report.update({
+            'processed': processed,
+            'elapsed_seconds': round(elapsed, 3),
+            'entries_per_second': round(processed / elapsed, 1) if elapsed and processed else 0.0,
+            'parse_seconds': round(parse_seconds, 3),
+            'spell_seconds': round(spell_seconds, 3),
+            'ipa_seconds': round(ipa_seconds, 3),
+            'pos_seconds': round(pos_seconds, 3),
+            'pos_docs_per_second': round(pos_docs / pos_seconds, 1) if pos_docs and pos_seconds else None,
+            'rule_costs': [
+                {
+                    'rule_id': rule_id,
+                    'seconds': round(seconds, 4),
+                    'runs': rule_runs[rule_id],
+                    'us_per_entry': round(seconds / rule_runs[rule_id] * 1e6, 1) if rule_runs[rule_id] else 0.0,
+                }
+                for rule_id, seconds in rule_seconds.most_common()
+            ],
+        })
+        logger.info("Validated %d entries of %s in %.1fs (%.0f entries/s, %d unchanged)",
+                    processed, db_name, elapsed, report['entries_per_second'], report['unchanged'])
+        return report
+
+    # ---- Result writes ----
+
+    def _store_results(self, db_name: str, version: str, index: Dict[str, str],
+                       work: Dict[str, Optional[FrozenSet[str]]], chunk_ids: List[str],
+                       results: Dict[str, List[Dict[str, Any]]]) -> None:
+        from app.models.validation_cache_models import EntryValidationResult
+
+        partial = [entry_id for entry_id in chunk_ids if work[entry_id] is not None and entry_id in results]
+        previous = EntryValidationResult.get_issues(db_name, partial)
+        rows = []
+        for entry_id in chunk_ids:
+            if entry_id not in results:
+                continue  # deleted since the index was read
+            issues = results[entry_id]
+            rerun = work[entry_id]
+            if rerun is not None:
+                kept = [issue for issue in previous.get(entry_id, []) if issue.get('rule_id') not in rerun]
+                issues = kept + issues
+            rows.append(_result_row(entry_id, index[entry_id], version, issues))
+        EntryValidationResult.replace(db_name, rows)
+
+    def _drop_rule_issues(self, db_name: str, version: str, index: Dict[str, str],
+                          drop_only: Dict[str, FrozenSet[str]]) -> None:
+        from app.models.validation_cache_models import EntryValidationResult
+
+        entry_ids = list(drop_only)
+        for start in range(0, len(entry_ids), self.BATCH_SIZE):
+            chunk = entry_ids[start:start + self.BATCH_SIZE]
+            previous = EntryValidationResult.get_issues(db_name, chunk)
+            EntryValidationResult.replace(db_name, [
+                _result_row(entry_id, index[entry_id], version,
+                            [i for i in previous.get(entry_id, []) if i.get('rule_id') not in drop_only[entry_id]])
+                for entry_id in chunk
+            ])
@@ -7,10 +7,13 @@ and relation discovery for dictionary entries and senses.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import threading
 import time
+import uuid
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from itertools import chain
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
@@ -49,13 +52,28 @@ AVAILABLE_MODELS = [
 MODEL_DIMENSIONS = {m["id"]: m["dimension"] for m in AVAILABLE_MODELS}
 
 
+def sense_point_id(entry_id: str, sense_id: str) -> str:
+    """Deterministic Qdrant point ID for a sense."""
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{entry_id}:{sense_id}"))
+
+
+def sense_content_hash(model_name: str, text: str) -> str:
+    """Hash of what a sense's vector depends on: the model and the composed text."""
+    return hashlib.sha1(f"{model_name}\n{text}".encode("utf-8")).hexdigest()
+
+
 class EmbeddingServiceError(Exception):
     """Base exception for EmbeddingService errors."""
     pass
 
 
 class EmbeddingService:
-    """Service for managing semantic embeddings and Qdrant vector database interactions."""
+    """Service for managing semantic embeddings and vector database interactions.
+
+    Vectors live in Qdrant by default; with ``VECTOR_STORE_BACKEND=local`` they
+    are kept in an embedded memory-mapped store (``LocalVectorStore``) that
+    implements the same client calls, so no external service is needed.
+    """
 
     _model_cache: Dict[str, Any] = {}
     _model_lock = threading.Lock()
@@ -64,23 +82,54 @@ class EmbeddingService:
         self,
         qdrant_host: Optional[str] = None,
         qdrant_port: Optional[int] = None,
+        backend: Optional[str] = None,
+        store_path: Optional[str] = None,
     ):
         from flask import current_app
         try:
-            self.qdrant_host = qdrant_host or current_app.config.get("QDRANT_HOST", "localhost")
-            self.qdrant_port = qdrant_port or current_app.config.get("QDRANT_PORT", 6333)
+            config = current_app.config
+            self.qdrant_host = qdrant_host or config.get("QDRANT_HOST", "localhost")
+            self.qdrant_port = qdrant_port or config.get("QDRANT_PORT", 6333)
         except RuntimeError:
+            config = os.environ
             self.qdrant_host = qdrant_host or os.environ.get("QDRANT_HOST", "localhost")
             self.qdrant_port = qdrant_port or int(os.environ.get("QDRANT_PORT", 6333))
 
+        self.backend = (backend or config.get("VECTOR_STORE_BACKEND") or "qdrant").lower()
+        self.store_path = store_path or config.get("VECTOR_STORE_PATH") or os.path.join("instance", "vectors")
+        self.store_dtype = config.get("VECTOR_STORE_DTYPE") or "float16"
+        self.store_ivf_lists = int(config.get("VECTOR_STORE_IVF_LISTS") or 0)
+
         self._qdrant_client = None
         self._qdrant_lock = threading.Lock()
+        self._encoder = None
+
+    @property
+    def uses_local_store(self) -> bool:
+        return self.backend == "local"
+
+    @property
+    def encoder(self):
+        """Cached, micro-batched encoder for query-time texts (see encoding_service)."""
+        if self._encoder is None:
+            with self._qdrant_lock:
+                if self._encoder is None:
+                    from app.services.encoding_service import create_encoding_service
+                    self._encoder = create_encoding_service(
+                        lambda model_name, device: self._get_model(model_name, device=device)
+                    )
+        return self._encoder
 
     def _get_qdrant_client(self):
-        """Lazy initialization of Qdrant client."""
+        """Lazy initialization of the vector store client (Qdrant or local)."""
         if self._qdrant_client is None:
             with self._qdrant_lock:
-                if self._qdrant_client is None:
+                if self._qdrant_client is None and self.uses_local_store:
+                    from app.services.local_vector_store import LocalVectorStore
+                    self._qdrant_client = LocalVectorStore(
+                        self.store_path, dtype=self.store_dtype, ivf_lists=self.store_ivf_lists,
+                    )
+                elif self._qdrant_client is None:
                     try:
                         from qdrant_client import QdrantClient
                         self._qdrant_client = QdrantClient(
@@ -146,8 +195,6 @@ class EmbeddingService:
         collection_name = self.get_collection_name(project_id)
         dimension = MODEL_DIMENSIONS.get(model_name, 1024)
 
-        from qdrant_client.http import models as rest_models
-
         try:
             exists = client.collection_exists(collection_name)
             if exists and force_recreate:
@@ -156,14 +203,19 @@ class EmbeddingService:
                 exists = False
 
             if not exists:
-                logger.info("Creating Qdrant collection %s with dimension %d", collection_name, dimension)
-                client.create_collection(
-                    collection_name=collection_name,
-                    vectors_config=rest_models.VectorParams(
-                        size=dimension,
-                        distance=rest_models.Distance.COSINE,
-                    ),
-                )
+                logger.info("Creating vector collection %s with dimension %d", collection_name, dimension)
+                if self.uses_local_store:
+                    # Vectors are normalized at encode time, so dot product == cosine
+                    client.create_collection(collection_name=collection_name, vectors_config=dimension)
+                else:
+                    from qdrant_client.http import models as rest_models
+                    client.create_collection(
+                        collection_name=collection_name,
+                        vectors_config=rest_models.VectorParams(
+                            size=dimension,
+                            distance=rest_models.Distance.COSINE,
+                        ),
+                    )
         except Exception as e:
             logger.error("Error creating/checking Qdrant collection %s: %s", collection_name, e)
             raise EmbeddingServiceError(f"Qdrant collection error: {e}")
@@ -180,14 +232,26 @@ class EmbeddingService:
             parts.append(f" [{', '.join(clean_glosses)}]")
         return "".join(parts)
 
-    def extract_senses_from_basex(self, dictionary_service, project_id: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Extract all entry senses from BaseX database for embedding indexing."""
+    def extract_senses_from_basex(
+        self,
+        dictionary_service,
+        project_id: Optional[int] = None,
+        entry_ids: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Extract entry senses from BaseX for embedding indexing (all entries, or only ``entry_ids``)."""
         connector = dictionary_service.db_connector
         db_name = dictionary_service._resolve_db_name(project_id)
 
+        entry_filter = ""
+        if entry_ids is not None:
+            if not entry_ids:
+                return []
+            ids = ", ".join("'" + eid.replace("'", "''") + "'" for eid in entry_ids)
+            entry_filter = f"[@id = ({ids})]"
+
         # XQuery to extract entry_id, headword, sense_id, pos, definition, glosses
         xquery = f"""
-        for $e in collection('{db_name}')//entry
+        for $e in collection('{db_name}')//entry{entry_filter}
         let $eid := string($e/@id)
         let $hw := string(($e/lexical-unit/form/text)[1])
         let $pos := string(($e/grammatical-info/@value)[1])
@@ -257,15 +321,9 @@ class EmbeddingService:
         logger.info("Using device: %s", device_setting or "cpu")
         return device_setting or "cpu"
 
-    def build_index(
-        self,
-        dictionary_service=None,
-        project_id: Optional[int] = None,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None,
-        cancel_check: Optional[Callable[[], bool]] = None,
-    ) -> Dict[str, Any]:
-        """Build or rebuild Qdrant vector index for all senses in BaseX database."""
-        from app.models.project_settings import ProjectSettings, db
+    def _resolve_dictionary_service(self, dictionary_service=None):
+        """Return the given DictionaryService or build one from the app/environment."""
+        from flask import current_app
 
         if dictionary_service is None:
             from app.services.dictionary_service import DictionaryService
@@ -304,18 +362,151 @@ class EmbeddingService:
                     pass
                 connector = BaseXConnector(host=host, port=port, username=username, password=password, database=database)
             dictionary_service = DictionaryService(db_connector=connector)
+        return dictionary_service
+
+    def _load_index_settings(self, project_id: Optional[int] = None) -> Tuple[Any, str, str]:
+        """Return (ProjectSettings or None, model name, device) for a project's index."""
+        from app.models.project_settings import ProjectSettings
 
-        # Get settings
         pid = project_id or 1
         settings = ProjectSettings.query.filter_by(id=pid).first()
         model_name = settings.embedding_model if settings and settings.embedding_model else "jinaai/jina-embeddings-v3"
         device = self._resolve_device(settings.embedding_device if settings else None)
+        return settings, model_name, device
+
+    @staticmethod
+    def _record_index_build(settings, sense_count: int) -> None:
+        if not settings:
+            return
+        from app.models.project_settings import db
+
+        settings.embedding_last_built = datetime.now(timezone.utc)
+        settings.embedding_sense_count = sense_count
+        try:
+            db.session.commit()
+        except Exception as e:
+            logger.warning("Could not update project_settings timestamp: %s", e)
+
+    @staticmethod
+    def _prepare_torch(device: str):
+        """Return torch (or None if unavailable), enabling all CPU threads for CPU encoding."""
+        try:
+            import torch
+        except ImportError:
+            return None
+        try:
+            if device == "cpu" and hasattr(torch, "set_num_threads"):
+                torch.set_num_threads(os.cpu_count() or 4)
+        except Exception:
+            pass
+        return torch
+
+    @staticmethod
+    def _release_device(torch, device: str) -> None:
+        if torch is not None and device == "cuda" and hasattr(torch, "cuda"):
+            try:
+                torch.cuda.empty_cache()
+            except Exception:
+                pass
+
+    @staticmethod
+    def _encode_texts(model, model_name: str, texts: List[str], torch=None):
+        """Encode one batch of texts into normalized embeddings."""
+        encode_kwargs = {
+            "batch_size": len(texts),
+            "normalize_embeddings": True,
+            "show_progress_bar": False,
+        }
+        if "jina" in model_name.lower():
+            encode_kwargs["task"] = "text-matching"
+
+        # Wrap model.encode in torch.no_grad() to avoid autograd memory build-up
+        no_grad = torch.no_grad if torch is not None else nullcontext
+        try:
+            with no_grad():
+                return model.encode(texts, **encode_kwargs)
+        except TypeError:
+            # Fallback if model.encode does not accept task parameter
+            encode_kwargs.pop("task", None)
+            with no_grad():
+                return model.encode(texts, **encode_kwargs)
+
+    def _make_points(self, batch: List[Dict[str, Any]], embeddings) -> list:
+        if self.uses_local_store:
+            from app.services.local_vector_store import LocalPoint as point_cls
+        else:
+            from qdrant_client.http.models import PointStruct as point_cls
+
+        return [
+            point_cls(
+                id=sense_point_id(item["entry_id"], item["sense_id"]),
+                vector=emb.tolist(),
+                payload={
+                    "entry_id": item["entry_id"],
+                    "headword": item["headword"],
+                    "sense_id": item["sense_id"],
+                    "pos": item["pos"],
+                    "definition": item["definition"][:200],
+                    "composed_text": item["text"],
+                    "content_hash": item["content_hash"],
+                },
+            )
+            for item, emb in zip(batch, embeddings)
+        ]
+
+    def _encode_and_upsert(
+        self,
+        senses: List[Dict[str, Any]],
+        model_name: str,
+        device: str,
+        collection_name: str,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        batch_size: int = 64,  # Safer batch size for GPU transformer memory stability
+    ) -> Tuple[int, bool]:
+        """Encode senses in batches and upsert them. Returns (processed, cancelled)."""
+        if not senses:
+            return 0, False
+
+        model = self._get_model(model_name, device=device)
+        client = self._get_qdrant_client()
+        torch = self._prepare_torch(device)
+        total = len(senses)
+        processed = 0
+        try:
+            for i in range(0, total, batch_size):
+                if cancel_check and cancel_check():
+                    logger.info("Indexing operation cancelled at %d/%d senses", processed, total)
+                    return processed, True
+
+                batch = senses[i : i + batch_size]
+                embeddings = self._encode_texts(model, model_name, [item["text"] for item in batch], torch)
+                client.upsert(collection_name=collection_name, points=self._make_points(batch, embeddings))
+                processed += len(batch)
+
+                if progress_callback:
+                    progress_callback(processed, total, f"Indexed {processed}/{total} senses...")
+        finally:
+            self._release_device(torch, device)
+        return processed, False
+
+    def build_index(
+        self,
+        dictionary_service=None,
+        project_id: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """Build or rebuild Qdrant vector index for all senses in BaseX database."""
+        dictionary_service = self._resolve_dictionary_service(dictionary_service)
+
+        settings, model_name, device = self._load_index_settings(project_id)
         logger.info("Building vector index with model=%s on device=%s", model_name, device)
 
         if progress_callback:
             progress_callback(0, 0, f"Loading embedding model {model_name} on {device}...")
 
-        model = self._get_model(model_name, device=device)
+        self._get_model(model_name, device=device)
         self.ensure_collection(project_id, model_name, force_recreate=True)
         collection_name = self.get_collection_name(project_id)
 
@@ -329,108 +520,166 @@ class EmbeddingService:
             logger.warning("No senses found for indexing in project %s", project_id)
             return {"indexed": 0, "total": 0, "model": model_name}
 
+        for item in senses_data:
+            item["content_hash"] = sense_content_hash(model_name, item["text"])
+
         if progress_callback:
             progress_callback(0, total_senses, f"Encoding {total_senses} senses...")
 
-        client = self._get_qdrant_client()
-        from qdrant_client.http import models as rest_models
-        import uuid
+        processed, cancelled = self._encode_and_upsert(
+            senses_data, model_name, device, collection_name,
+            progress_callback=progress_callback, cancel_check=cancel_check,
+        )
+        if cancelled:
+            return {
+                "indexed": processed,
+                "total": total_senses,
+                "model": model_name,
+                "collection": collection_name,
+                "cancelled": True,
+            }
 
-        import os
-        import torch
+        self._record_index_build(settings, processed)
 
-        batch_size = 64  # Safer batch size for GPU transformer memory stability
-        processed = 0
+        logger.info("Successfully rebuilt embedding index for project %s: %d senses", project_id, processed)
+        return {
+            "indexed": processed,
+            "total": total_senses,
+            "model": model_name,
+            "collection": collection_name,
+        }
 
-        # Enable multi-threading for PyTorch CPU if needed
+    def _collection_dimension(self, client, collection_name: str) -> Optional[int]:
         try:
-            if device == "cpu" and hasattr(torch, "set_num_threads"):
-                cores = os.cpu_count() or 4
-                torch.set_num_threads(cores)
+            vectors = client.get_collection(collection_name).config.params.vectors
+            return int(vectors.size)
         except Exception:
-            pass
+            return None
 
-        for i in range(0, total_senses, batch_size):
-            if cancel_check and cancel_check():
-                logger.info("Indexing operation cancelled at %d/%d senses for project %s", processed, total_senses, project_id)
-                if device == "cuda" and hasattr(torch, "cuda"):
-                    torch.cuda.empty_cache()
-                return {
-                    "indexed": processed,
-                    "total": total_senses,
-                    "model": model_name,
-                    "collection": collection_name,
-                    "cancelled": True,
-                }
+    def _load_index_hashes(
+        self,
+        client,
+        collection_name: str,
+        entry_ids: Optional[List[str]] = None,
+        page_size: int = 1024,
+    ) -> Dict[str, Optional[str]]:
+        """Return point ID -> stored content hash (None for points indexed without one)."""
+        scroll_filter = None
+        if entry_ids is not None:
+            scroll_filter = self._payload_filter("entry_id", any_of=entry_ids)
 
-            batch = senses_data[i : i + batch_size]
-            texts = [item["text"] for item in batch]
+        hashes: Dict[str, Optional[str]] = {}
+        offset = None
+        while True:
+            points, offset = client.scroll(
+                collection_name=collection_name,
+                scroll_filter=scroll_filter,
+                limit=page_size,
+                offset=offset,
+                with_payload=["content_hash"],
+                with_vectors=False,
+            )
+            for point in points:
+                hashes[str(point.id)] = (point.payload or {}).get("content_hash")
+            if offset is None:
+                return hashes
+
+    def _payload_filter(self, key: str, value: Any = None, any_of: Optional[List[Any]] = None):
+        """Payload filter on one field (exact value or any of several) for the active backend."""
+        if self.uses_local_store:
+            return {key: list(any_of) if any_of is not None else value}
+        from qdrant_client.http import models as rest_models
+        match = rest_models.MatchAny(any=list(any_of)) if any_of is not None else rest_models.MatchValue(value=value)
+        return rest_models.Filter(must=[rest_models.FieldCondition(key=key, match=match)])
 
-            encode_kwargs = {
-                "batch_size": len(texts),
-                "normalize_embeddings": True,
-                "show_progress_bar": False,
-            }
-            if "jina" in model_name.lower():
-                encode_kwargs["task"] = "text-matching"
+    def _delete_points(self, client, collection_name: str, point_ids: List[str]) -> None:
+        if self.uses_local_store:
+            client.delete(collection_name=collection_name, points_selector=point_ids)
+            return
+        from qdrant_client.http import models as rest_models
 
-            try:
-                # Solution 2: Wrap model.encode in torch.no_grad() to avoid autograd memory build-up
-                with torch.no_grad():
-                    embeddings = model.encode(texts, **encode_kwargs)
-            except TypeError:
-                # Fallback if model.encode does not accept task parameter
-                encode_kwargs.pop("task", None)
-                with torch.no_grad():
-                    embeddings = model.encode(texts, **encode_kwargs)
-
-            points = []
-            for item, emb in zip(batch, embeddings):
-                # Generate deterministic UUID from sense_id or entry_id + sense_id
-                point_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{item['entry_id']}:{item['sense_id']}"))
-                points.append(
-                    rest_models.PointStruct(
-                        id=point_id,
-                        vector=emb.tolist(),
-                        payload={
-                            "entry_id": item["entry_id"],
-                            "headword": item["headword"],
-                            "sense_id": item["sense_id"],
-                            "pos": item["pos"],
-                            "definition": item["definition"][:200],
-                            "composed_text": item["text"],
-                        },
-                    )
-                )
+        client.delete(
+            collection_name=collection_name,
+            points_selector=rest_models.PointIdsList(points=point_ids),
+        )
 
-            client.upsert(collection_name=collection_name, points=points)
-            processed += len(batch)
+    def sync_index(
+        self,
+        dictionary_service=None,
+        project_id: Optional[int] = None,
+        entry_ids: Optional[List[str]] = None,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+    ) -> Dict[str, Any]:
+        """Bring the vector index in line with BaseX, re-encoding only changed senses.
+
+        Each point stores a hash of its model and composed text, so only senses
+        that are new or whose text changed are encoded; points of senses that
+        no longer exist are deleted. With ``entry_ids`` only those entries are
+        reconciled (entry save/delete events); without it the whole database
+        is (after imports). If there is no index yet, or it was built for a
+        model of a different dimension, a full sync builds it from scratch and
+        an entry-level sync does nothing.
+        """
+        dictionary_service = self._resolve_dictionary_service(dictionary_service)
+        settings, model_name, device = self._load_index_settings(project_id)
+        client = self._get_qdrant_client()
+        collection_name = self.get_collection_name(project_id)
 
-            if progress_callback:
-                progress_callback(processed, total_senses, f"Indexed {processed}/{total_senses} senses...")
+        dimension = self._collection_dimension(client, collection_name) if client.collection_exists(collection_name) else 0
+        if dimension == 0 or (dimension is not None and dimension != MODEL_DIMENSIONS.get(model_name, 1024)):
+            if entry_ids is not None:
+                return {"skipped": True, "reason": "index not built", "collection": collection_name}
+            return self.build_index(
+                dictionary_service=dictionary_service,
+                project_id=project_id,
+                progress_callback=progress_callback,
+                cancel_check=cancel_check,
+            )
 
-        # Update ProjectSettings
-        if settings:
-            settings.embedding_last_built = datetime.now(timezone.utc)
-            settings.embedding_sense_count = processed
-            try:
-                db.session.commit()
-            except Exception as e:
-                logger.warning("Could not update project_settings timestamp: %s", e)
+        senses = self.extract_senses_from_basex(dictionary_service, project_id, entry_ids=entry_ids)
+        stored = self._load_index_hashes(client, collection_name, entry_ids)
 
-        if device == "cuda" and hasattr(torch, "cuda"):
-            try:
-                torch.cuda.empty_cache()
-            except Exception:
-                pass
+        current_ids = set()
+        changed: List[Dict[str, Any]] = []
+        for item in senses:
+            point_id = sense_point_id(item["entry_id"], item["sense_id"])
+            if point_id in current_ids:
+                continue
+            current_ids.add(point_id)
+            item["content_hash"] = sense_content_hash(model_name, item["text"])
+            if stored.get(point_id) != item["content_hash"]:
+                changed.append(item)
+        stale = [point_id for point_id in stored if point_id not in current_ids]
 
-        logger.info("Successfully rebuilt embedding index for project %s: %d senses", project_id, processed)
-        return {
-            "indexed": processed,
-            "total": total_senses,
+        if progress_callback:
+            progress_callback(0, len(changed), f"Encoding {len(changed)} changed senses...")
+
+        encoded, cancelled = self._encode_and_upsert(
+            changed, model_name, device, collection_name,
+            progress_callback=progress_callback, cancel_check=cancel_check,
+        )
+        if stale and not cancelled:
+            self._delete_points(client, collection_name, stale)
+
+        if entry_ids is None and not cancelled:
+            self._record_index_build(settings, len(current_ids))
+
+        logger.info(
+            "Synced embedding index for project %s: %d senses checked, %d encoded, %d deleted",
+            project_id, len(current_ids), encoded, 0 if cancelled else len(stale),
+        )
+        result = {
+            "indexed": len(current_ids),
+            "encoded": encoded,
+            "unchanged": len(current_ids) - len(changed),
+            "deleted": 0 if cancelled else len(stale),
             "model": model_name,
             "collection": collection_name,
         }
+        if cancelled:
+            result["cancelled"] = True
+        return result
 
     def _qdrant_search(
         self,
@@ -496,15 +745,10 @@ class EmbeddingService:
         except Exception as e:
             logger.debug("Could not query ProjectSettings, using defaults: %s", e)
 
-        model = self._get_model(model_name, device=device)
         collection_name = self.get_collection_name(project_id)
         client = self._get_qdrant_client()
 
-        encoded = model.encode([query], normalize_embeddings=True)[0]
-        if hasattr(encoded, "tolist"):
-            query_vector = encoded.tolist()
-        else:
-            query_vector = list(encoded)
+        query_vector = self.encoder.encode([query], model_name, device=device)[0].tolist()
 
         search_results = self._qdrant_search(
             client=client,
@@ -631,19 +875,10 @@ class EmbeddingService:
         client = self._get_qdrant_client()
         collection_name = self.get_collection_name(project_id)
 
-        from qdrant_client.http import models as rest_models
-
         # Find points for this entry
         points, _ = client.scroll(
             collection_name=collection_name,
-            scroll_filter=rest_models.Filter(
-                must=[
-                    rest_models.FieldCondition(
-                        key="entry_id",
-                        match=rest_models.MatchValue(value=entry_id),
-                    )
-                ]
-            ),
+            scroll_filter=self._payload_filter("entry_id", entry_id),
             with_vectors=True,
             with_payload=True,
             limit=10,
@@ -733,10 +968,8 @@ class EmbeddingService:
         client = self._get_qdrant_client()
         collection_name = self.get_collection_name(project_id)
 
-        from qdrant_client.http import models as rest_models
-
         if progress_callback:
-            progress_callback(0, 0, "Checking Qdrant collection...")
+            progress_callback(0, 0, "Checking vector collection...")
 
         if not client.collection_exists(collection_name):
             raise EmbeddingServiceError(
@@ -744,16 +977,7 @@ class EmbeddingService:
             )
 
         # --- Phase 1: Scroll metadata only (no vectors) to build entry list ---
-        scroll_filter = None
-        if pos:
-            scroll_filter = rest_models.Filter(
-                must=[
-                    rest_models.FieldCondition(
-                        key="pos",
-                        match=rest_models.MatchValue(value=pos),
-                    )
-                ]
-            )
+        scroll_filter = self._payload_filter("pos", pos) if pos else None
 
         if progress_callback:
             progress_callback(0, 0, "Scanning entry metadata...")
@@ -833,17 +1057,15 @@ class EmbeddingService:
                 from app.services.pos_tagger_service import get_pos_tagger_service
                 tagger = get_pos_tagger_service()
                 pos_map = {"noun": "n", "verb": "v", "adjective": "adj", "adverb": "adv", "preposition": "prep", "pronoun": "pron", "conjunction": "conj", "determiner": "det", "numeral": "num", "interjection": "interj", "particle": "part"}
-                for entry in pending_pos:
-                    hw = (entry.get("headword") or "").strip()
-                    if not hw:
-                        continue
-                    try:
-                        tokens = tagger.tag_text(hw)
-                        if tokens:
-                            tag = tokens[0].get("normalized_pos", "").lower()
-                            entry["pos"] = pos_map.get(tag, tag[:3])
-                    except Exception:
-                        pass
+                headwords = [(entry.get("headword") or "").strip() for entry in pending_pos]
+                try:
+                    tagged = tagger.tag_texts(headwords)
+                except Exception:
+                    tagged = []
+                for entry, tokens in zip(pending_pos, tagged):
+                    if tokens:
+                        tag = tokens[0].get("normalized_pos", "").lower()
+                        entry["pos"] = pos_map.get(tag, tag[:3])
             except Exception:
                 logger.warning("PosTaggerService unavailable for POS fallback")
 
@@ -862,26 +1084,15 @@ class EmbeddingService:
 
         model_name = "jinaai/jina-embeddings-v3"
         device = self._resolve_device()
-        model = self._get_model(model_name, device=device)
-
-        import numpy as np
-        import torch
 
+        # Texts seen by earlier scans come from the encoding cache
         query_vectors = []
-        batch_size = 64
+        batch_size = 512
         for i in range(0, len(texts), batch_size):
             if cancel_check and cancel_check():
                 raise EmbeddingServiceError("Operation cancelled by user")
             batch_texts = texts[i:i + batch_size]
-            encode_kwargs = {
-                "batch_size": len(batch_texts),
-                "normalize_embeddings": True,
-                "show_progress_bar": False,
-                "task": "text-matching",
-            }
-            with torch.no_grad():
-                encoded = model.encode(batch_texts, **encode_kwargs)
-            query_vectors.extend(encoded.cpu().numpy() if hasattr(encoded, 'cpu') else encoded)
+            query_vectors.extend(self.encoder.encode(batch_texts, model_name, device=device, task="text-matching"))
             if progress_callback:
                 progress_callback(total_entries, min(i + batch_size, total_entries),
                                   f"Encoding: {min(i + batch_size, total_entries)}/{total_entries}")
@@ -891,37 +1102,21 @@ class EmbeddingService:
             return []
 
         if progress_callback:
-            progress_callback(n, 0, f"Searching Qdrant for {n} entries...")
-
-        # --- Phase 3: query_batch_points — let Qdrant's HNSW find neighbors ---
-        requests = []
-        for qv in query_vectors:
-            requests.append(
-                rest_models.QueryRequest(
-                    query=qv.tolist(),
-                    limit=top_k,
-                    score_threshold=threshold,
-                    with_payload=True,
-                )
-            )
+            progress_callback(n, 0, f"Searching vector index for {n} entries...")
 
-        # Split into sub-batches of 100 to avoid oversized gRPC messages
-        batch_results = []
-        sub_batch_size = 100
-        for batch_start in range(0, len(requests), sub_batch_size):
-            if cancel_check and cancel_check():
-                raise EmbeddingServiceError("Operation cancelled by user")
-            sub_requests = requests[batch_start:batch_start + sub_batch_size]
-            sub_resp = client.query_batch_points(
-                collection_name=collection_name,
-                requests=sub_requests,
+        if self.uses_local_store:
+            batch_results = self._local_batch_neighbours(
+                client, collection_name, query_vectors, top_k, threshold,
+                progress_callback=progress_callback, cancel_check=cancel_check,
+            )
+        else:
+            batch_results = self._qdrant_batch_neighbours(
+                client, collection_name, query_vectors, top_k, threshold,
+                progress_callback=progress_callback, cancel_check=cancel_check,
             )
-            # Unpack per-query results
-            for qr in sub_resp:
-                batch_results.append(getattr(qr, 'points', []) or [])
-            if progress_callback:
-                p = min(batch_start + sub_batch_size, n)
-                progress_callback(n, p, f"Qdrant search: {p}/{n}")
+
+        # Only pair entries that are part of this scan (matters when sampling)
+        sampled_ids = {e["entry_id"] for e in entries}
 
         # Build lookup: entry_id -> set of POS values this entry has
         entry_pos_set: Dict[str, set] = {}
@@ -1015,6 +1210,77 @@ class EmbeddingService:
 
         return candidates
 
+    def _qdrant_batch_neighbours(
+        self,
+        client,
+        collection_name: str,
+        query_vectors: list,
+        top_k: int,
+        threshold: float,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+    ) -> List[list]:
+        """Neighbours per query via query_batch_points — let Qdrant's HNSW find them."""
+        from qdrant_client.http import models as rest_models
+
+        n = len(query_vectors)
+        requests = [
+            rest_models.QueryRequest(
+                query=qv.tolist(),
+                limit=top_k,
+                score_threshold=threshold,
+                with_payload=True,
+            )
+            for qv in query_vectors
+        ]
+
+        # Split into sub-batches of 100 to avoid oversized gRPC messages
+        batch_results = []
+        sub_batch_size = 100
+        for batch_start in range(0, len(requests), sub_batch_size):
+            if cancel_check and cancel_check():
+                raise EmbeddingServiceError("Operation cancelled by user")
+            sub_requests = requests[batch_start:batch_start + sub_batch_size]
+            sub_resp = client.query_batch_points(
+                collection_name=collection_name,
+                requests=sub_requests,
+            )
+            # Unpack per-query results
+            for qr in sub_resp:
+                batch_results.append(getattr(qr, 'points', []) or [])
+            if progress_callback:
+                p = min(batch_start + sub_batch_size, n)
+                progress_callback(n, p, f"Qdrant search: {p}/{n}")
+        return batch_results
+
+    def _local_batch_neighbours(
+        self,
+        client,
+        collection_name: str,
+        query_vectors: list,
+        top_k: int,
+        threshold: float,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        cancel_check: Optional[Callable[[], bool]] = None,
+        block_size: int = 2048,
+    ) -> List[list]:
+        """Neighbours per query from the local store: one dense matmul per block of queries."""
+        import numpy as np
+
+        queries = np.asarray(query_vectors, dtype=np.float32)
+        n = len(queries)
+        batch_results: List[list] = []
+        for start in range(0, n, block_size):
+            if cancel_check and cancel_check():
+                raise EmbeddingServiceError("Operation cancelled by user")
+            batch_results.extend(client.search_matrix(
+                collection_name, queries[start:start + block_size], limit=top_k, score_threshold=threshold,
+            ))
+            if progress_callback:
+                p = min(start + block_size, n)
+                progress_callback(n, p, f"Vector search: {p}/{n}")
+        return batch_results
+
     def find_batch_subentry_relations(
         self,
         project_id: Optional[int] = None,
@@ -1134,15 +1400,7 @@ class EmbeddingService:
 
         all_points = []
         next_offset = None
-        from qdrant_client.http import models as rest_models
-        sense_filter = rest_models.Filter(
-            must=[
-                rest_models.FieldCondition(
-                    key="sense_id",
-                    match=rest_models.MatchAny(any=list(target_sense_ids)),
-                )
-            ]
-        )
+        sense_filter = self._payload_filter("sense_id", any_of=list(target_sense_ids))
         while True:
             if cancel_check and cancel_check():
                 raise EmbeddingServiceError("Operation cancelled by user")
@@ -1339,6 +1597,8 @@ class EmbeddingService:
             "model_name": settings.embedding_model if settings else "jinaai/jina-embeddings-v3",
             "device": settings.embedding_device if settings else "cpu",
             "last_built": settings.embedding_last_built.isoformat() if settings and settings.embedding_last_built else None,
+            "backend": self.backend,
+            "encoding_cache": self.encoder.get_stats(),
         }
 
 
@@ -1354,20 +1614,96 @@ def get_embedding_service() -> EmbeddingService:
     return _embedding_service_instance
 
 
+def _current_app_or_none():
+    from flask import current_app, has_app_context
+
+    return current_app._get_current_object() if has_app_context() else None
+
+
+def _run_in_app(app, func: Callable[[], Any]) -> Any:
+    if app is None:
+        return func()
+    with app.app_context():
+        return func()
+
+
+class EntrySyncQueue:
+    """Coalesces entry save/delete events into incremental per-project index syncs.
+
+    Events arriving within ``delay_seconds`` of each other are merged, so a
+    burst of edits costs one BaseX query and one encoding batch.
+    """
+
+    def __init__(
+        self,
+        delay_seconds: float = 2.0,
+        sync: Optional[Callable[[int, List[str]], Any]] = None,
+    ) -> None:
+        self.delay_seconds = delay_seconds
+        self._sync = sync or (
+            lambda project_id, entry_ids: get_embedding_service().sync_index(
+                project_id=project_id, entry_ids=entry_ids
+            )
+        )
+        self._pending: Dict[int, set] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._app = None
+
+    def enqueue(self, project_id: int, entry_id: str, app=None) -> None:
+        with self._lock:
+            self._pending.setdefault(project_id, set()).add(entry_id)
+            if app is not None:
+                self._app = app
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay_seconds, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Sync all pending entries now."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            app = self._app
+        for project_id, entry_ids in pending.items():
+            try:
+                _run_in_app(app, lambda: self._sync(project_id, sorted(entry_ids)))
+            except Exception as e:
+                logger.warning("Incremental embedding sync failed for project %s: %s", project_id, e)
+
+
+_entry_sync_queue = EntrySyncQueue()
+
+
+def _on_entry_changed_handler(data: Dict[str, Any]):
+    """Queue an incremental index sync for a saved or deleted entry."""
+    app = _current_app_or_none()
+    if app is None or not app.config.get("EMBEDDING_AUTO_SYNC", True):
+        return
+    entry_id = data.get("entry_id")
+    if entry_id:
+        _entry_sync_queue.enqueue(data.get("project_id") or 1, entry_id, app=app)
+
+
 def _on_import_complete_handler(data: Dict[str, Any]):
     """Background handler when a LIFT import completes."""
+    app = _current_app_or_none()
+    if app is None or not app.config.get("EMBEDDING_AUTO_SYNC", True):
+        return
     project_id = data.get("project_id", 1)
-    logger.info("Auto-rebuilding embedding index following LIFT import for project %s", project_id)
+    logger.info("Syncing embedding index following LIFT import for project %s", project_id)
 
-    def _async_rebuild():
-        from flask import current_app
+    def _async_sync():
         try:
             service = get_embedding_service()
-            service.rebuild_index(project_id=project_id)
+            _run_in_app(app, lambda: service.sync_index(project_id=project_id))
         except Exception as e:
-            logger.error("Auto embedding rebuild failed for project %s: %s", project_id, e)
+            logger.error("Auto embedding sync failed for project %s: %s", project_id, e)
 
-    t = threading.Thread(target=_async_rebuild, daemon=True)
+    t = threading.Thread(target=_async_sync, daemon=True)
     t.start()
 
 
@@ -1375,5 +1711,7 @@ def _on_import_complete_handler(data: Dict[str, Any]):
 try:
     from app.services.event_bus import event_bus
     event_bus.on("import_complete", _on_import_complete_handler)
+    event_bus.on("entry_saved", _on_entry_changed_handler)
+    event_bus.on("entry_deleted", _on_entry_changed_handler)
 except Exception:
     pass
@@ -0,0 +1,350 @@
+"""
+Shared text encoding service for query-time embedding callers.
+
+Wraps the sentence-transformer models used by ``EmbeddingService`` with
+
+* a persistent text -> vector cache: an SQLite file keyed by a hash of
+  (model, task, normalization, text), bounded to ``max_entries`` with
+  least-recently-used eviction, fronted by a small in-memory LRU;
+* micro-batching: concurrent small ``encode`` calls for the same model are
+  queued for a few milliseconds and run as one forward pass;
+* process-wide model reuse (models are cached by ``EmbeddingService``) and an
+  optional background warm-up at application start.
+
+Index building/syncing keeps calling the model directly: it is already
+incremental and would only flush query texts out of the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ModelLoader = Callable[[str, str], Any]
+
+
+def text_cache_key(model_name: str, text: str, task: Optional[str] = None, normalize: bool = True) -> str:
+    raw = f"{model_name}\n{task or ''}\n{int(normalize)}\n{text}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """Persistent, LRU-bounded text-hash -> vector cache (SQLite + in-memory front)."""
+
+    def __init__(self, path: Optional[str], max_entries: int = 100000, memory_entries: int = 4096) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._count = 0
+        if path:
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS vectors ("
+                    "key TEXT PRIMARY KEY, dim INTEGER NOT NULL, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+                )
+                self._conn.execute("CREATE INDEX IF NOT EXISTS idx_vectors_last_used ON vectors(last_used)")
+                self._count = self._conn.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+            except sqlite3.Error as e:
+                logger.warning("Embedding cache at %s unavailable, using memory only: %s", path, e)
+                self._conn = None
+
+    def __len__(self) -> int:
+        return self._count if self._conn is not None else len(self._memory)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+            missing = [k for k in keys if k not in found]
+            if self._conn is None or not missing:
+                return found
+            now = time.time()
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, dim, vector FROM vectors WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, dim, blob in rows:
+                    vector = np.frombuffer(blob, dtype=np.float16).astype(np.float32).reshape(dim)
+                    found[key] = vector
+                    self._remember(key, vector)
+                if rows:
+                    self._conn.executemany(
+                        "UPDATE vectors SET last_used = ? WHERE key = ?", [(now, key) for key, _, _ in rows]
+                    )
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        if not items:
+            return
+        with self._lock:
+            for key, vector in items.items():
+                self._remember(key, vector)
+            if self._conn is None:
+                return
+            now = time.time()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO vectors (key, dim, vector, last_used) VALUES (?, ?, ?, ?)",
+                [(key, int(v.shape[0]), np.asarray(v, dtype=np.float16).tobytes(), now) for key, v in items.items()],
+            )
+            self._count += len(items)
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict(self) -> None:
+        # Trim to 90% so eviction runs once per ~10% of inserts, not on every put
+        self._count = self._conn.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+        excess = self._count - int(self.max_entries * 0.9)
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM vectors WHERE key IN (SELECT key FROM vectors ORDER BY last_used LIMIT ?)", (excess,)
+            )
+            self._count -= excess
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM vectors")
+            self._count = 0
+
+
+class _MicroBatcher:
+    """Merges concurrent encode requests for one model into shared forward passes."""
+
+    def __init__(self, encode_fn: Callable[[List[str]], np.ndarray], max_batch_size: int, max_wait_seconds: float) -> None:
+        self._encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._queue: "queue.Queue[Tuple[List[str], Future]]" = queue.Queue()
+        self.batches = 0
+        self.requests = 0
+        self._thread = threading.Thread(target=self._run, daemon=True, name="encoding-batcher")
+        self._thread.start()
+
+    def submit(self, texts: List[str]) -> Future:
+        future: Future = Future()
+        self._queue.put((texts, future))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            pending = [self._queue.get()]
+            size = len(pending[0][0])
+            deadline = time.monotonic() + self.max_wait_seconds
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending.append(item)
+                size += len(item[0])
+
+            texts = [text for request_texts, _ in pending for text in request_texts]
+            try:
+                vectors = self._encode_fn(texts)
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+            self.batches += 1
+            self.requests += len(pending)
+            offset = 0
+            for request_texts, future in pending:
+                future.set_result(vectors[offset:offset + len(request_texts)])
+                offset += len(request_texts)
+
+
+class EncodingService:
+    """Cached, micro-batched text encoding shared by query-time embedding callers."""
+
+    def __init__(
+        self,
+        model_loader: ModelLoader,
+        cache: Optional[EmbeddingCache] = None,
+        max_batch_size: int = 64,
+        max_wait_seconds: float = 0.005,
+    ) -> None:
+        self._model_loader = model_loader
+        self.cache = cache or EmbeddingCache(None)
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self._batchers: Dict[Tuple[str, str, Optional[str], bool], _MicroBatcher] = {}
+        self._batchers_lock = threading.Lock()
+        self._stats = {"texts": 0, "cache_hits": 0, "encoded": 0}
+
+    def encode(
+        self,
+        texts: Sequence[str],
+        model_name: str,
+        device: str = "cpu",
+        task: Optional[str] = None,
+        normalize: bool = True,
+    ) -> np.ndarray:
+        """Return a float32 ``(len(texts), dim)`` matrix, encoding only uncached texts."""
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        keys = [text_cache_key(model_name, t, task, normalize) for t in texts]
+        found = self.cache.get_many(list(dict.fromkeys(keys)))
+
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+
+        if missing:
+            miss_keys = list(missing)
+            miss_texts = [missing[k] for k in miss_keys]
+            if len(miss_texts) >= self.max_batch_size:
+                vectors = self._encode_chunked(miss_texts, model_name, device, task, normalize)
+            else:
+                vectors = self._batcher(model_name, device, task, normalize).submit(miss_texts).result()
+            encoded = {key: np.asarray(vec, dtype=np.float32) for key, vec in zip(miss_keys, vectors)}
+            self.cache.put_many(encoded)
+            found.update(encoded)
+
+        self._stats["texts"] += len(texts)
+        self._stats["cache_hits"] += len(texts) - len(missing)
+        self._stats["encoded"] += len(missing)
+        return np.stack([found[key] for key in keys])
+
+    def _batcher(self, model_name: str, device: str, task: Optional[str], normalize: bool) -> _MicroBatcher:
+        batch_key = (model_name, device, task, normalize)
+        batcher = self._batchers.get(batch_key)
+        if batcher is None:
+            with self._batchers_lock:
+                batcher = self._batchers.get(batch_key)
+                if batcher is None:
+                    batcher = _MicroBatcher(
+                        lambda texts: self._forward(texts, model_name, device, task, normalize),
+                        self.max_batch_size, self.max_wait_seconds,
+                    )
+                    self._batchers[batch_key] = batcher
+        return batcher
+
+    def _encode_chunked(self, texts: List[str], model_name: str, device: str, task: Optional[str], normalize: bool) -> np.ndarray:
+        chunks = [
+            self._forward(texts[i:i + self.max_batch_size], model_name, device, task, normalize)
+            for i in range(0, len(texts), self.max_batch_size)
+        ]
+        return np.concatenate(chunks)
+
+    def _forward(self, texts: List[str], model_name: str, device: str, task: Optional[str], normalize: bool) -> np.ndarray:
+        model = self._model_loader(model_name, device)
+        kwargs: Dict[str, Any] = {
+            "batch_size": len(texts),
+            "normalize_embeddings": normalize,
+            "show_progress_bar": False,
+        }
+        if task:
+            kwargs["task"] = task
+        try:
+            import torch
+            no_grad = torch.no_grad
+        except ImportError:
+            no_grad = nullcontext
+        with no_grad():
+            try:
+                vectors = model.encode(texts, **kwargs)
+            except TypeError:
+                kwargs.pop("task", None)
+                vectors = model.encode(texts, **kwargs)
+        if hasattr(vectors, "cpu"):
+            vectors = vectors.cpu().numpy()
+        return np.asarray(vectors, dtype=np.float32)
+
+    def warm_up(self, model_name: str, device: str = "cpu") -> None:
+        """Load the model and run one forward pass so the first real query is fast."""
+        started = time.monotonic()
+        self._forward(["warm-up"], model_name, device, None, True)
+        logger.info("Warmed up embedding model %s on %s in %.1fs", model_name, device, time.monotonic() - started)
+
+    def get_stats(self) -> Dict[str, Any]:
+        batches = sum(b.batches for b in self._batchers.values())
+        requests = sum(b.requests for b in self._batchers.values())
+        texts = self._stats["texts"]
+        return {
+            **self._stats,
+            "hit_ratio": round(self._stats["cache_hits"] / texts, 3) if texts else 0.0,
+            "cached_vectors": len(self.cache),
+            "micro_batches": batches,
+            "micro_batched_requests": requests,
+        }
+
+
+def create_encoding_service(model_loader: ModelLoader) -> EncodingService:
+    """Build an EncodingService whose disk cache location comes from the app config.
+
+    ``EMBEDDING_CACHE_PATH`` unset means ``<instance>/embedding_cache.sqlite3``;
+    an empty value keeps the cache in memory only (as does running outside an
+    application context without the environment variable).
+    """
+    try:
+        from flask import current_app
+        config = current_app.config
+        path = config.get("EMBEDDING_CACHE_PATH")
+        if path is None:
+            path = os.path.join(current_app.instance_path, "embedding_cache.sqlite3")
+    except RuntimeError:
+        config = os.environ
+        path = os.environ.get("EMBEDDING_CACHE_PATH")
+    cache = EmbeddingCache(path or None, max_entries=int(config.get("EMBEDDING_CACHE_MAX_ENTRIES") or 100000))
+    return EncodingService(model_loader, cache)
+
+
+def get_encoding_service() -> EncodingService:
+    """The process-wide EncodingService (owned by the EmbeddingService singleton)."""
+    from app.services.embedding_service import get_embedding_service
+
+    return get_embedding_service().encoder
+
+
+def warm_up_in_background(app) -> threading.Thread:
+    """Load the configured project's embedding model off the startup path."""
+
+    def _run() -> None:
+        with app.app_context():
+            try:
+                from app.services.embedding_service import get_embedding_service
+                _, model_name, device = get_embedding_service()._load_index_settings(None)
+                get_encoding_service().warm_up(model_name, device)
+            except Exception as e:
+                logger.info("Embedding model warm-up skipped: %s", e)
+
+    thread = threading.Thread(target=_run, daemon=True, name="embedding-warmup")
+    thread.start()
+    return thread
@@ -1,15 +1,30 @@
 """
 EntryRevisionService — save revision snapshots and compute field-level change reports.
+
+Snapshots are stored as keyframes (full JSON) every ``keyframe_interval``
+revisions with compressed JSON patches in between; see ``make_patch`` /
+``apply_patch`` and ``EntryRevisionService.get_snapshot``.
 """
 
 from __future__ import annotations
 
+import copy
+import json
 import logging
-from datetime import datetime, timezone
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy.dialects import postgresql, sqlite
+
 from app.models.workset_models import db
-from app.models.entry_revision import EntryRevision
+from app.models.entry_revision import (
+    EntryRevision,
+    RevisionDailyRollup,
+    RevisionFieldRollup,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -242,6 +257,183 @@ def _summarize(path: str, kind: str, before: Any, after: Any) -> str:
     return f"{kind} {label}"
 
 
+# ---------------------------------------------------------------------------
+# Snapshot deltas — a compact JSON patch format for the revision chain.
+# Each op is [op, path, arg] where path is a list of dict keys / list indices:
+#   '=' set the value at path     '-' delete the key at path
+#   't' truncate the list at path  '+' extend the list at path
+# ---------------------------------------------------------------------------
+
+def _same(a: Any, b: Any) -> bool:
+    """JSON equality that keeps 1, 1.0 and True apart."""
+    return type(a) is type(b) and a == b
+
+
+def make_patch(prev: Any, curr: Any, path: list | None = None) -> list[list]:
+    """Return the ops that turn *prev* into *curr*."""
+    path = path or []
+    ops: list[list] = []
+    if isinstance(prev, dict) and isinstance(curr, dict):
+        for key in prev:
+            if key not in curr:
+                ops.append(['-', path + [key]])
+        for key, value in curr.items():
+            if key not in prev:
+                ops.append(['=', path + [key], value])
+            elif not _same(prev[key], value):
+                ops.extend(make_patch(prev[key], value, path + [key]))
+    elif isinstance(prev, list) and isinstance(curr, list):
+        common = min(len(prev), len(curr))
+        for i in range(common):
+            if not _same(prev[i], curr[i]):
+                ops.extend(make_patch(prev[i], curr[i], path + [i]))
+        if len(curr) < len(prev):
+            ops.append(['t', path, len(curr)])
+        elif len(curr) > len(prev):
+            ops.append(['+', path, curr[common:]])
+    elif not _same(prev, curr):
+        ops.append(['=', path, curr])
+    return ops
+
+
+def apply_patch(doc: Any, ops: list[list]) -> Any:
+    """Apply ops from ``make_patch`` to a copy of *doc*."""
+    doc = copy.deepcopy(doc)
+    for op in ops:
+        kind, path = op[0], op[1]
+        if kind == '=' and not path:
+            doc = copy.deepcopy(op[2])
+            continue
+        target = doc
+        parent_path = path if kind in ('t', '+') else path[:-1]
+        for key in parent_path:
+            target = target[key]
+        if kind == '=':
+            target[path[-1]] = copy.deepcopy(op[2])
+        elif kind == '-':
+            del target[path[-1]]
+        elif kind == 't':
+            del target[op[2]:]
+        elif kind == '+':
+            target.extend(copy.deepcopy(op[2]))
+        else:
+            raise ValueError(f'Unknown patch op: {kind!r}')
+    return doc
+
+
+def encode_delta(ops: list[list]) -> bytes:
+    return zlib.compress(
+        json.dumps(ops, separators=(',', ':'), ensure_ascii=False).encode('utf-8'), 6)
+
+
+def decode_delta(data: bytes) -> list[list]:
+    return json.loads(zlib.decompress(data).decode('utf-8'))
+
+
+def _dumps(snapshot: Any) -> str:
+    return json.dumps(snapshot, separators=(',', ':'), ensure_ascii=False)
+
+
+def plan_storage(prev: dict | None, curr: dict, depth: int,
+                 interval: int) -> tuple[bool, bytes | None]:
+    """
+    Decide how to store *curr* given the previous snapshot.
+
+    *depth* is the number of revisions since the last keyframe (including
+    the one being stored).  Returns ``(is_keyframe, delta)``; a keyframe is
+    written for the first revision, every *interval* revisions, and whenever
+    the patch would not be meaningfully smaller than the snapshot itself.
+    """
+    if prev is None or interval <= 1 or depth >= interval:
+        return True, None
+    delta = encode_delta(make_patch(prev, curr))
+    if len(delta) * 2 > len(zlib.compress(_dumps(curr).encode('utf-8'), 1)):
+        return True, None
+    return False, delta
+
+
+def encode_chain(snapshots: list[dict], interval: int) -> list[tuple[bool, bytes | None]]:
+    """Storage plan for a full ordered history (used by the migration)."""
+    plan: list[tuple[bool, bytes | None]] = []
+    prev, depth = None, 0
+    for snapshot in snapshots:
+        is_keyframe, delta = plan_storage(prev, snapshot, depth + 1, interval)
+        depth = 0 if is_keyframe else depth + 1
+        plan.append((is_keyframe, delta))
+        prev = snapshot
+    return plan
+
+
+class SnapshotCache:
+    """
+    Bounded LRU of the latest snapshot per recently saved entry.
+
+    Lets ``save_revision`` diff against the previous revision without
+    reading (and possibly reconstructing) it from the database.  Values are
+    kept as JSON text so callers cannot mutate the cached copy.
+
+    The cache is per process, so another worker may have deleted the
+    history and started it again; entries are therefore also keyed by the
+    revision row id, which callers read from the database.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._items: OrderedDict[str, tuple[int, int, int, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def has(self, entry_id: str, revision_number: int) -> bool:
+        item = self._items.get(entry_id)
+        return item is not None and item[0] == revision_number
+
+    def get(self, entry_id: str, revision_number: int,
+            revision_id: int | None) -> tuple[dict, int] | None:
+        """Return ``(snapshot, keyframe_number)`` if that revision row is cached."""
+        with self._lock:
+            item = self._items.get(entry_id)
+            if item is None or item[0] != revision_number or item[1] != revision_id:
+                self.misses += 1
+                return None
+            self._items.move_to_end(entry_id)
+            self.hits += 1
+        return json.loads(item[3]), item[2]
+
+    def put(self, entry_id: str, revision_number: int, revision_id: int,
+            keyframe_number: int, snapshot_text: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._items[entry_id] = (revision_number, revision_id, keyframe_number, snapshot_text)
+            self._items.move_to_end(entry_id)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def invalidate(self, entry_id: str) -> None:
+        with self._lock:
+            self._items.pop(entry_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def missing_revision_columns() -> list[str]:
+    """
+    Delta-storage columns that the ``entry_revisions`` table lacks.
+
+    ``db.create_all()`` does not alter an existing table, so databases
+    created before delta storage need migrations/add_entry_revision_deltas.py.
+    """
+    columns = {c['name'] for c in db.inspect(db.engine).get_columns(EntryRevision.__tablename__)}
+    return [name for name in ('is_keyframe', 'delta') if name not in columns]
+
+
 # ---------------------------------------------------------------------------
 # Service
 # ---------------------------------------------------------------------------
@@ -249,6 +441,9 @@ def _summarize(path: str, kind: str, before: Any, after: Any) -> str:
 class EntryRevisionService:
     """Create and query entry revisions."""
 
+    keyframe_interval = 20
+    snapshot_cache = SnapshotCache()
+
     @staticmethod
     def save_revision(entry_id: str, snapshot: dict,
                       user_id: str | None = None,
@@ -256,7 +451,8 @@ class EntryRevisionService:
         """
         Store a new revision for this entry.
 
-        Computes the field-level diff against the previous revision.
+        Computes the field-level diff against the previous revision and
+        stores either a keyframe or a compressed patch against it.
         Uses optimistic locking via SELECT MAX + retry.
         """
         # Compute revision number (atomic-ish: FOR UPDATE on the row)
@@ -265,31 +461,165 @@ class EntryRevisionService:
         ).filter(EntryRevision.entry_id == entry_id).scalar()
         rev_number = (latest or 0) + 1
 
-        # Fetch the previous snapshot for diff
-        prev_entry = EntryRevision.query\
-            .filter(EntryRevision.entry_id == entry_id,
-                    EntryRevision.revision_number == rev_number - 1)\
-            .order_by(EntryRevision.revision_number.desc()).first()
-        prev_snapshot = prev_entry.snapshot if prev_entry else None
+        # Previous snapshot for diff — from the hot-entry cache when possible
+        prev_snapshot, keyframe_number = EntryRevisionService._previous_state(
+            entry_id, rev_number - 1)
 
         # Compute change report
         change_report = compute_change_report(prev_snapshot, snapshot)
 
+        is_keyframe, delta = plan_storage(
+            prev_snapshot, snapshot,
+            rev_number - (keyframe_number or 0),
+            EntryRevisionService.keyframe_interval,
+        )
+
+        timestamp = datetime.now(timezone.utc)
         revision = EntryRevision(
             entry_id=entry_id,
             revision_number=rev_number,
-            timestamp_utc=datetime.now(timezone.utc),
+            timestamp_utc=timestamp,
             user_id=user_id,
             created_by=created_by or user_id,
-            snapshot=snapshot,
+            snapshot=snapshot if is_keyframe else None,
+            is_keyframe=is_keyframe,
+            delta=delta,
             change_report=change_report if change_report else None,
         )
         db.session.add(revision)
+        db.session.flush()
+        revision_id = revision.id  # read before commit expires the row
+        _record_rollups(entry_id, timestamp, user_id, created_by or user_id, change_report)
         db.session.commit()
-        logger.info("Saved revision %d for entry %s (%d changes)",
-                    rev_number, entry_id, len(change_report))
+        EntryRevisionService.snapshot_cache.put(
+            entry_id, rev_number, revision_id,
+            rev_number if is_keyframe else keyframe_number,
+            _dumps(snapshot),
+        )
+        logger.info("Saved revision %d for entry %s (%d changes, %s)",
+                    rev_number, entry_id, len(change_report),
+                    'keyframe' if is_keyframe else f'{len(delta)}-byte delta')
         return revision
 
+    @staticmethod
+    def _cached_state(entry_id: str,
+                      revision_number: int) -> tuple[dict, int] | None:
+        """Cached ``(snapshot, keyframe_number)``, if it is still the stored row."""
+        cache = EntryRevisionService.snapshot_cache
+        if not cache.has(entry_id, revision_number):
+            return None
+        revision_id = EntryRevision.query.with_entities(EntryRevision.id)\
+            .filter(EntryRevision.entry_id == entry_id,
+                    EntryRevision.revision_number == revision_number).scalar()
+        return cache.get(entry_id, revision_number, revision_id)
+
+    @staticmethod
+    def _previous_state(entry_id: str,
+                        revision_number: int) -> tuple[dict | None, int | None]:
+        """Snapshot and keyframe number of *revision_number* (0 → none)."""
+        if revision_number < 1:
+            return None, None
+        cached = EntryRevisionService._cached_state(entry_id, revision_number)
+        if cached is not None:
+            return cached
+        prev_entry = EntryRevision.query\
+            .filter(EntryRevision.entry_id == entry_id,
+                    EntryRevision.revision_number == revision_number)\
+            .order_by(EntryRevision.revision_number.desc()).first()
+        if prev_entry is None:
+            return None, None
+        if prev_entry.snapshot is not None:
+            return prev_entry.snapshot, revision_number
+        return EntryRevisionService._reconstruct(entry_id, revision_number)
+
+    @staticmethod
+    def _reconstruct(entry_id: str,
+                     revision_number: int) -> tuple[dict | None, int | None]:
+        """Rebuild a snapshot from its keyframe plus the following deltas."""
+        keyframe_number = EntryRevision.query.with_entities(
+            db.func.max(EntryRevision.revision_number)
+        ).filter(EntryRevision.entry_id == entry_id,
+                 EntryRevision.is_keyframe.is_(True),
+                 EntryRevision.revision_number <= revision_number).scalar()
+        if keyframe_number is None:
+            return None, None
+        rows = EntryRevision.query\
+            .filter(EntryRevision.entry_id == entry_id,
+                    EntryRevision.revision_number >= keyframe_number,
+                    EntryRevision.revision_number <= revision_number)\
+            .order_by(EntryRevision.revision_number.asc()).all()
+        snapshot = None
+        for row in rows:
+            if row.snapshot is not None:
+                snapshot = row.snapshot
+            elif row.delta is not None and snapshot is not None:
+                snapshot = apply_patch(snapshot, decode_delta(row.delta))
+            else:
+                logger.warning("Broken revision chain for entry %s at revision %d",
+                               entry_id, row.revision_number)
+                return None, None
+        return snapshot, keyframe_number
+
+    @staticmethod
+    def get_snapshot(entry_id: str, revision_number: int) -> dict | None:
+        """Full snapshot of one revision, reconstructing delta rows."""
+        cached = EntryRevisionService._cached_state(entry_id, revision_number)
+        if cached is not None:
+            return cached[0]
+        return EntryRevisionService._reconstruct(entry_id, revision_number)[0]
+
+    @staticmethod
+    def compact_revisions(entry_id: str) -> int:
+        """
+        Rewrite an entry's history as keyframes + deltas.
+
+        Used to convert rows stored before delta compression.  Returns the
+        number of rows that were turned into deltas.
+        """
+        rows = EntryRevision.query.filter_by(entry_id=entry_id)\
+            .order_by(EntryRevision.revision_number.asc()).all()
+        snapshots = []
+        for row in rows:
+            if row.snapshot is not None:
+                snapshots.append(row.snapshot)
+            elif snapshots and row.delta is not None:
+                snapshots.append(apply_patch(snapshots[-1], decode_delta(row.delta)))
+            else:
+                raise ValueError(
+                    f'Broken revision chain for entry {entry_id} at revision {row.revision_number}')
+        converted = 0
+        plan = encode_chain(snapshots, EntryRevisionService.keyframe_interval)
+        for row, snapshot, (is_keyframe, delta) in zip(rows, snapshots, plan):
+            if not is_keyframe and row.snapshot is not None:
+                converted += 1
+            row.is_keyframe = is_keyframe
+            row.snapshot = snapshot if is_keyframe else None
+            row.delta = delta
+        db.session.commit()
+        EntryRevisionService.snapshot_cache.invalidate(entry_id)
+        return converted
+
+    @staticmethod
+    def delete_revisions(entry_id: str) -> int:
+        """
+        Delete an entry's revisions and take them out of the rollups.
+
+        Both happen in one transaction, so the change statistics keep
+        matching entry_revisions.  Returns the number of revisions deleted.
+        """
+        rows = db.session.query(
+            EntryRevision.timestamp_utc, EntryRevision.user_id,
+            EntryRevision.created_by, EntryRevision.change_report,
+        ).filter(EntryRevision.entry_id == entry_id).all()
+        for ts, uid, created_by, report in rows:
+            _record_rollups(entry_id, ts, uid, created_by, report, sign=-1)
+        deleted = EntryRevision.query.filter_by(entry_id=entry_id).delete()
+        RevisionDailyRollup.query.filter(RevisionDailyRollup.revisions <= 0).delete()
+        RevisionFieldRollup.query.filter(RevisionFieldRollup.changes <= 0).delete()
+        db.session.commit()
+        EntryRevisionService.snapshot_cache.invalidate(entry_id)
+        return deleted
+
     @staticmethod
     def get_revisions(entry_id: str, page: int = 1,
                       per_page: int = 20) -> tuple[list[EntryRevision], int]:
@@ -303,14 +633,21 @@ class EntryRevisionService:
     @staticmethod
     def get_revision(entry_id: str, revision_number: int) -> EntryRevision | None:
         """Get a single revision by entry_id + revision_number.
+        Delta rows get their snapshot reconstructed into ``resolved_snapshot``.
         The change_report is humanized on read so existing revisions benefit too.
         """
         rev = EntryRevision.query.filter_by(
             entry_id=entry_id,
             revision_number=revision_number,
         ).first()
-        if rev and rev.change_report and rev.snapshot:
-            _humanize_paths(rev.change_report, rev.snapshot)
+        if rev is None:
+            return None
+        snapshot = rev.snapshot
+        if snapshot is None:
+            snapshot = EntryRevisionService.get_snapshot(entry_id, revision_number)
+            rev.resolved_snapshot = snapshot
+        if rev.change_report and snapshot:
+            _humanize_paths(rev.change_report, snapshot)
         return rev
 
     @staticmethod
@@ -322,79 +659,214 @@ class EntryRevisionService:
         """
         Aggregate revision stats over a time range.
         Returns by-field change counts, timeline, top entries/editors.
+
+        Answered from the daily rollup tables; a per-entry query groups the
+        entry's own revisions instead (the field rollups are not per entry).
         """
-        from datetime import datetime
-        q = EntryRevision.query
-
-        if from_date:
-            dt_from = datetime.fromisoformat(from_date)
-            q = q.filter(EntryRevision.timestamp_utc >= dt_from)
-        if to_date:
-            from datetime import timedelta
-            dt_to = datetime.fromisoformat(to_date)
-            # End-of-day inclusive: timestamp_utc < dt_to + 1 day
-            q = q.filter(EntryRevision.timestamp_utc < dt_to + timedelta(days=1))
-        if user_id:
-            q = q.filter(EntryRevision.user_id == user_id)
+        day_from = datetime.fromisoformat(from_date).date() if from_date else None
+        day_to = datetime.fromisoformat(to_date).date() if to_date else None
         if entry_id:
-            q = q.filter(EntryRevision.entry_id == entry_id)
-
-        revisions = q.order_by(EntryRevision.timestamp_utc).all()
-
-        total = len(revisions)
-        unique_entries = len(set(r.entry_id for r in revisions))
-        unique_users = len(set(r.user_id for r in revisions if r.user_id))
-
-        # By-field breakdown
-        by_field: dict = {}
-        for r in revisions:
-            if not r.change_report:
-                continue
-            for change in r.change_report:
-                fp = change.get('field_path', 'unknown')
-                kind = change.get('kind', 'modified')
-                # Normalize field path to a group key (strip indices)
-                group = _field_group(fp)
-                if group not in by_field:
-                    by_field[group] = {}
-                by_field[group][kind] = by_field[group].get(kind, 0) + 1
-
-        # Timeline
+            stats = _stats_from_revisions(day_from, day_to, user_id, entry_id)
+        else:
+            stats = _stats_from_rollups(day_from, day_to, user_id)
+
         timeline: dict = {}
-        for r in revisions:
-            key = r.timestamp_utc.strftime('%Y-%m-%d' if granularity == 'day' else '%Y-%W')
-            timeline[key] = timeline.get(key, 0) + 1
-        timeline_sorted = [{'date': k, 'count': v}
-                           for k, v in sorted(timeline.items())]
-
-        # Top edited entries
-        entry_counts: dict = {}
-        for r in revisions:
-            entry_counts[r.entry_id] = entry_counts.get(r.entry_id, 0) + 1
-        top_entries = sorted(entry_counts.items(), key=lambda x: -x[1])[:20]
-
-        # Top editors
-        user_counts: dict = {}
-        for r in revisions:
-            uid = r.created_by or r.user_id or 'unknown'
-            user_counts[uid] = user_counts.get(uid, 0) + 1
-        top_users = sorted(user_counts.items(), key=lambda x: -x[1])[:20]
+        for day_key, count in stats.pop('days'):
+            key = day_key if granularity == 'day' else \
+                date.fromisoformat(day_key).strftime('%Y-%W')
+            timeline[key] = timeline.get(key, 0) + count
 
         return {
             'timespan': {'from': from_date, 'to': to_date},
-            'total_revisions': total,
-            'unique_entries_touched': unique_entries,
-            'unique_users': unique_users,
-            'by_field': by_field,
-            'timeline': timeline_sorted,
+            'total_revisions': stats['total'],
+            'unique_entries_touched': stats['unique_entries'],
+            'unique_users': stats['unique_users'],
+            'by_field': stats['by_field'],
+            'timeline': [{'date': k, 'count': v} for k, v in sorted(timeline.items())],
             'top_edited_entries': [
-                {'entry_id': eid, 'revisions': cnt} for eid, cnt in top_entries
+                {'entry_id': eid, 'revisions': cnt} for eid, cnt in stats['top_entries']
             ],
             'top_editors': [
-                {'user_id': uid, 'revisions': cnt} for uid, cnt in top_users
+                {'user_id': uid, 'revisions': cnt} for uid, cnt in stats['top_users']
             ],
         }
 
+    @staticmethod
+    def rebuild_rollups() -> int:
+        """
+        Recompute both rollup tables from entry_revisions.
+
+        Needed once for revisions saved before the rollups existed.  Only
+        the timestamp, user and change_report columns are read.
+        Returns the number of revisions counted.
+        """
+        RevisionDailyRollup.query.delete()
+        RevisionFieldRollup.query.delete()
+        rows = db.session.query(
+            EntryRevision.entry_id, EntryRevision.timestamp_utc,
+            EntryRevision.user_id, EntryRevision.created_by,
+            EntryRevision.change_report,
+        ).yield_per(1000)
+        daily: dict = {}
+        fields: dict = {}
+        total = 0
+        for entry_id, ts, uid, created_by, report in rows:
+            day = ts.date()
+            key = (day, entry_id, uid or '', created_by or uid or 'unknown')
+            daily[key] = daily.get(key, 0) + 1
+            for (group, kind), count in _field_counts(report).items():
+                fkey = (day, uid or '', group, kind)
+                fields[fkey] = fields.get(fkey, 0) + count
+            total += 1
+        db.session.bulk_insert_mappings(RevisionDailyRollup, [
+            {'day': d, 'entry_id': e, 'user_id': u, 'editor': ed, 'revisions': n}
+            for (d, e, u, ed), n in daily.items()
+        ])
+        db.session.bulk_insert_mappings(RevisionFieldRollup, [
+            {'day': d, 'user_id': u, 'field_group': g, 'kind': k, 'changes': n}
+            for (d, u, g, k), n in fields.items()
+        ])
+        db.session.commit()
+        logger.info("Rebuilt revision rollups from %d revisions", total)
+        return total
+
+
+# ---------------------------------------------------------------------------
+# Change analytics — rollups maintained on save, GROUP BY queries on read
+# ---------------------------------------------------------------------------
+
+def _field_counts(change_report: list[dict] | None) -> dict[tuple[str, str], int]:
+    """Count a change report by (field group, kind)."""
+    counts: dict[tuple[str, str], int] = {}
+    for change in change_report or []:
+        key = (_field_group(change.get('field_path', 'unknown')),
+               change.get('kind', 'modified'))
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def _increment(model, values: dict, column: str, amount: int) -> None:
+    """INSERT … ON CONFLICT DO UPDATE adding *amount* to *column*."""
+    dialect = postgresql if db.session.get_bind().dialect.name != 'sqlite' else sqlite
+    stmt = dialect.insert(model).values(**values, **{column: amount})
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[c.name for c in model.__table__.primary_key.columns],
+        set_={column: getattr(model.__table__.c, column) + stmt.excluded[column]},
+    )
+    db.session.execute(stmt)
+
+
+def _record_rollups(entry_id: str, timestamp: datetime, user_id: str | None,
+                    created_by: str | None, change_report: list[dict],
+                    sign: int = 1) -> None:
+    """Add one saved revision to the daily and per-field rollups (sign=-1 takes it out)."""
+    day = timestamp.date()
+    uid = user_id or ''
+    _increment(RevisionDailyRollup, {
+        'day': day,
+        'entry_id': entry_id,
+        'user_id': uid,
+        'editor': created_by or user_id or 'unknown',
+    }, 'revisions', sign)
+    for (group, kind), count in _field_counts(change_report).items():
+        _increment(RevisionFieldRollup, {
+            'day': day, 'user_id': uid, 'field_group': group, 'kind': kind,
+        }, 'changes', sign * count)
+
+
+def _day_key(value: Any) -> str:
+    return value if isinstance(value, str) else value.isoformat()
+
+
+def _by_field(rows) -> dict:
+    by_field: dict = {}
+    for group, kind, count in rows:
+        kinds = by_field.setdefault(group, {})
+        kinds[kind] = kinds.get(kind, 0) + int(count)
+    return by_field
+
+
+def _stats_from_rollups(day_from: date | None, day_to: date | None,
+                        user_id: str | None) -> dict:
+    R, F = RevisionDailyRollup, RevisionFieldRollup
+    filters, field_filters = [], []
+    if day_from:
+        filters.append(R.day >= day_from)
+        field_filters.append(F.day >= day_from)
+    if day_to:
+        filters.append(R.day <= day_to)
+        field_filters.append(F.day <= day_to)
+    if user_id:
+        filters.append(R.user_id == user_id)
+        field_filters.append(F.user_id == user_id)
+
+    total_col = db.func.sum(R.revisions)
+    total, unique_entries = db.session.query(
+        db.func.coalesce(total_col, 0), db.func.count(db.distinct(R.entry_id))
+    ).filter(*filters).one()
+    unique_users = db.session.query(db.func.count(db.distinct(R.user_id)))\
+        .filter(*filters, R.user_id != '').scalar()
+    days = db.session.query(R.day, total_col).filter(*filters).group_by(R.day).all()
+    top_entries = db.session.query(R.entry_id, total_col).filter(*filters)\
+        .group_by(R.entry_id).order_by(total_col.desc(), R.entry_id).limit(20).all()
+    top_users = db.session.query(R.editor, total_col).filter(*filters)\
+        .group_by(R.editor).order_by(total_col.desc(), R.editor).limit(20).all()
+    fields = db.session.query(F.field_group, F.kind, db.func.sum(F.changes))\
+        .filter(*field_filters).group_by(F.field_group, F.kind).all()
+
+    return {
+        'total': int(total),
+        'unique_entries': unique_entries,
+        'unique_users': unique_users,
+        'days': [(_day_key(d), int(n)) for d, n in days],
+        'top_entries': [(e, int(n)) for e, n in top_entries],
+        'top_users': [(u, int(n)) for u, n in top_users],
+        'by_field': _by_field(fields),
+    }
+
+
+def _stats_from_revisions(day_from: date | None, day_to: date | None,
+                          user_id: str | None, entry_id: str | None) -> dict:
+    E = EntryRevision
+    filters = []
+    if day_from:
+        filters.append(E.timestamp_utc >= datetime.combine(day_from, datetime.min.time()))
+    if day_to:
+        # End-of-day inclusive: timestamp_utc < dt_to + 1 day
+        filters.append(E.timestamp_utc < datetime.combine(day_to + timedelta(days=1),
+                                                          datetime.min.time()))
+    if user_id:
+        filters.append(E.user_id == user_id)
+    if entry_id:
+        filters.append(E.entry_id == entry_id)
+
+    count = db.func.count(E.id)
+    total, unique_entries, unique_users = db.session.query(
+        count, db.func.count(db.distinct(E.entry_id)), db.func.count(db.distinct(E.user_id))
+    ).filter(*filters).one()
+    day = db.func.date(E.timestamp_utc)
+    days = db.session.query(day, count).filter(*filters).group_by(day).all()
+    top_entries = db.session.query(E.entry_id, count).filter(*filters)\
+        .group_by(E.entry_id).order_by(count.desc(), E.entry_id).limit(20).all()
+    editor = db.func.coalesce(E.created_by, E.user_id, 'unknown')
+    top_users = db.session.query(editor, count).filter(*filters)\
+        .group_by(editor).order_by(count.desc(), editor).limit(20).all()
+
+    field_counts: dict[tuple[str, str], int] = {}
+    for (report,) in db.session.query(E.change_report).filter(*filters, E.change_report.isnot(None)):
+        for key, n in _field_counts(report).items():
+            field_counts[key] = field_counts.get(key, 0) + n
+
+    return {
+        'total': total,
+        'unique_entries': unique_entries,
+        'unique_users': unique_users,
+        'days': [(_day_key(d), n) for d, n in days],
+        'top_entries': list(top_entries),
+        'top_users': list(top_users),
+        'by_field': _by_field((g, k, n) for (g, k), n in field_counts.items()),
+    }
+
 
 def _field_group(field_path: str) -> str:
     """Reduce a field path like 'senses[abc].gloss.en' to 'senses.gloss'."""
@@ -0,0 +1,143 @@
+"""
+Entry view bundle.
+
+Everything the entry edit and view pages need from BaseX — the entry, the
+labels of every entry it references or is referenced by, the relations
+pointing at it and the targets of its sense-level relations — fetched with
+one query (``XQueryBuilder.build_entry_view_bundle_query``).
+
+``EntryViewBundle`` exposes the same lookup methods as ``DictionaryService``
+(``get_entry_labels``, ``get_reverse_relations``, ``resolve_headwords_batch``,
+``resolve_sense_targets``) answered from the prefetched data, so it can be
+passed wherever the ``Entry`` enrichment helpers expect a dictionary
+service.  Lookups outside the bundle, and every other attribute, fall
+through to the wrapped service.
+"""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, List, Optional
+
+from app.services.relation_index import RelationRef
+
+
+def _children(root: ET.Element, tag: str) -> List[ET.Element]:
+    element = root.find(tag)
+    return list(element) if element is not None else []
+
+
+def _forms(element: ET.Element) -> Dict[str, str]:
+    return {form.get("lang", ""): form.text or "" for form in element.findall("form")}
+
+
+class EntryViewBundle:
+    """Prefetched relation data for one entry, wrapping a DictionaryService."""
+
+    def __init__(self, dict_service: Any, entry_id: str, entry_xml: str,
+                 labels: Dict[str, Dict[str, Any]],
+                 reverse: List[RelationRef],
+                 sense_targets: Dict[str, Dict[str, Any]],
+                 subentry_xml: Optional[Dict[str, str]] = None) -> None:
+        self._service = dict_service
+        self.entry_id = entry_id
+        self.entry_xml = entry_xml
+        self.labels = labels
+        self.reverse = reverse
+        self.sense_targets = sense_targets
+        self.subentry_xml = subentry_xml
+        self.entry = None
+
+    @classmethod
+    def from_xml(cls, dict_service: Any, xml_result: str) -> Optional["EntryViewBundle"]:
+        """Parse the ``<bundle>`` returned by the bundle query (None if empty)."""
+        if not xml_result or not xml_result.strip():
+            return None
+        root = ET.fromstring(xml_result)
+
+        labels: Dict[str, Dict[str, Any]] = {}
+        for item in _children(root, "labels"):
+            item_id = item.get("id", "")
+            if not item_id or item_id in labels:
+                continue
+            order = item.get("order", "")
+            labels[item_id] = {
+                'lexical_unit': _forms(item),
+                'homograph_number': int(order) if order.isdigit() else None,
+            }
+
+        reverse = []
+        for rel in _children(root, "reverse"):
+            order = rel.get("order", "")
+            reverse.append(RelationRef(
+                source_id=rel.get("source", ""),
+                relation_type=rel.get("type", ""),
+                traits={t.get("name"): t.get("value", "") for t in rel.findall("trait") if t.get("name")},
+                order=int(order) if order.isdigit() else None,
+            ))
+
+        sense_targets: Dict[str, Dict[str, Any]] = {}
+        for sense in _children(root, "senses"):
+            sense_id = sense.get("id", "")
+            if sense_id and sense_id not in sense_targets:
+                sense_targets[sense_id] = {
+                    'entry_id': sense.get("entry", ""),
+                    'lexical_unit': _forms(sense),
+                    'gloss': sense.get("gloss", ""),
+                }
+
+        subentries = root.find("subentries")
+        subentry_xml = None
+        if subentries is not None:
+            subentry_xml = {item.get("id", ""): item.text or "" for item in subentries}
+
+        entry_elem = root.find("entry")
+        return cls(
+            dict_service,
+            entry_id=root.get("id", ""),
+            entry_xml=entry_elem.text if entry_elem is not None and entry_elem.text else "",
+            labels=labels,
+            reverse=reverse,
+            sense_targets=sense_targets,
+            subentry_xml=subentry_xml,
+        )
+
+    # ---- DictionaryService lookups answered from the bundle ----
+
+    def get_entry_labels(self, entry_ids: List[str],
+                         project_id: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        ids = list(dict.fromkeys(str(i) for i in entry_ids if i))
+        result = {i: self.labels[i] for i in ids if i in self.labels}
+        missing = [i for i in ids if i not in self.labels]
+        if missing:
+            result.update(self._service.get_entry_labels(missing, project_id=project_id))
+        return result
+
+    def get_reverse_relations(self, target_id: str, relation_type: Optional[str] = None,
+                              project_id: Optional[int] = None) -> List[RelationRef]:
+        if target_id != self.entry_id:
+            return self._service.get_reverse_relations(target_id, relation_type, project_id=project_id)
+        return [ref for ref in self.reverse
+                if relation_type is None or ref.relation_type == relation_type]
+
+    def resolve_headwords_batch(self, ref_ids: List[str], db_name: str = None) -> Dict[str, str]:
+        result: Dict[str, str] = {}
+        missing = []
+        for ref in ref_ids:
+            label = self.labels.get(ref)
+            if label is None:
+                missing.append(ref)
+                continue
+            headword = next(iter(label['lexical_unit'].values()), '')
+            if headword:
+                result[ref] = headword
+        if missing:
+            result.update(self._service.resolve_headwords_batch(missing, db_name=db_name))
+        return result
+
+    def resolve_sense_targets(self, sense_ids: List[str],
+                              project_id: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        return {sid: self.sense_targets[sid] for sid in sense_ids if sid in self.sense_targets}
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._service, name)
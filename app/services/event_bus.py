@@ -44,3 +44,8 @@ class EventBus:
                 callback(data)
             except Exception as e:
                 logger.warning(f"EventBus subscriber error for '{event}': {e}", exc_info=True)
+
+
+# Process-wide bus: services emit and subscribe through it at import time, and
+# the app binds EventBus to this same instance
+event_bus = EventBus()
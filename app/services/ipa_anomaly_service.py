@@ -16,6 +16,12 @@ is apples-to-apples.
 The model is loaded lazily and cached at the process level. If no trained model
 is available the service reports itself as unavailable and callers simply skip
 the check (it never blocks validation/saving).
+
+``detect_many`` checks many headword/IPA pairs at once: the decompressed
+variants of all pairs are length-bucketed and padded into batched forward
+passes (``G2PAnomalyDetector.detect_batch``), and per-variant results are
+kept in an LRU keyed by (headword, IPA variant, model version) so repeated
+audits and re-validation do not run the model again.
 """
 
 from __future__ import annotations
@@ -26,7 +32,8 @@ import logging
 import os
 import sys
 import threading
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +99,12 @@ class IPAAnomalyService:
     _instance: Optional["IPAAnomalyService"] = None
     _instance_lock = threading.Lock()
 
+    # Pairs per padded forward pass, and the beam width ``detector.detect`` uses.
+    BATCH_SIZE = 64
+    NUM_BEAMS = 5
+    # Per-variant results remembered across calls.
+    RESULT_CACHE_SIZE = 50_000
+
     def __init__(
         self,
         model_dir: Optional[str] = None,
@@ -104,6 +117,9 @@ class IPAAnomalyService:
         self._detector: Any = None
         self._available: Optional[bool] = None
         self._load_lock = threading.Lock()
+        self.model_version: Optional[str] = None
+        self._results: "OrderedDict[Tuple[str, str, Optional[str]], Dict[str, Any]]" = OrderedDict()
+        self._results_lock = threading.Lock()
 
     # ------------------------------------------------------------------ #
     # Configuration / model resolution
@@ -260,6 +276,7 @@ class IPAAnomalyService:
                 bundle[1],
                 confidence_threshold=self.confidence_threshold,
             )
+            self.model_version = self._version_of(bundle[0])
             return
 
         with open(
@@ -272,12 +289,23 @@ class IPAAnomalyService:
             os.path.join(self._model_dir, "phoneme_vocab.json"),
         )
 
+        checkpoint = os.path.join(self._model_dir, "checkpoints", "best_model.pt")
         self._detector = create_anomaly_detector(
-            os.path.join(self._model_dir, "checkpoints", "best_model.pt"),
+            checkpoint,
             config,
             tokenizer,
             confidence_threshold=self.confidence_threshold,
         )
+        self.model_version = self._version_of(checkpoint)
+
+    @staticmethod
+    def _version_of(weights_path: str) -> str:
+        """Identify a model by its weights file, so retraining invalidates cached results."""
+        try:
+            mtime = os.stat(weights_path).st_mtime_ns
+        except OSError:
+            mtime = 0
+        return f"{os.path.abspath(weights_path)}:{mtime}"
 
     # ------------------------------------------------------------------ #
     # Detection
@@ -287,37 +315,116 @@ class IPAAnomalyService:
 
         The IPA is decompressed into all of its parenthetical variants and the
         best-matching variant (highest confidence) is returned. Returns ``None``
-        when the model is unavailable or inputs are empty.
+        when the model is unavailable or inputs are empty. Variants are run
+        through ``detector.detect`` one by one (no padding), sharing the
+        result cache with :meth:`detect_many`.
         """
-        if not headword or not ipa:
-            return None
-        if not self.is_available():
-            return None
+        return self._detect_pairs([(headword, ipa)], batched=False)[0]
 
-        variants = decompress_ipa_variants(ipa)
-        if not variants:
-            variants = [ipa]
+    def detect_many(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Run anomaly detection for many headword/IPA pairs.
+
+        Equivalent to calling :meth:`detect` for each pair, but every uncached
+        (headword, variant) is run through the model in length-bucketed,
+        padded batches of ``batch_size``. Returns one result (or ``None``) per
+        pair, in order.
+        """
+        return self._detect_pairs(pairs, batch_size, batched=True)
 
-        best: Optional[Dict[str, Any]] = None
-        for variant in variants:
+    def _detect_pairs(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+        batched: bool = True,
+    ) -> List[Optional[Dict[str, Any]]]:
+        pairs = list(pairs)
+        if not any(headword and ipa for headword, ipa in pairs) or not self.is_available():
+            return [None] * len(pairs)
+
+        pair_keys: List[List[Tuple[str, str, Optional[str]]]] = []
+        missing: Dict[Tuple[str, str, Optional[str]], None] = {}
+        with self._results_lock:
+            for headword, ipa in pairs:
+                variants = (decompress_ipa_variants(ipa) or [ipa]) if headword and ipa else []
+                keys = [(headword, variant, self.model_version) for variant in variants]
+                pair_keys.append(keys)
+                for key in keys:
+                    if key in self._results:
+                        self._results.move_to_end(key)
+                    else:
+                        missing[key] = None
+
+        computed = self._run_detector(list(missing), batch_size or self.BATCH_SIZE, batched)
+        with self._results_lock:
+            self._results.update(computed)
+            # Read this call's results before trimming the cache.
+            found = {key: self._results.get(key) for keys in pair_keys for key in keys}
+            while len(self._results) > self.RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for keys in pair_keys:
+            best: Optional[Dict[str, Any]] = None
+            for key in keys:
+                candidate = found.get(key)
+                if candidate is None:
+                    continue
+                if best is None or candidate["confidence_score"] > best["confidence_score"]:
+                    best = candidate
+            results.append(dict(best) if best is not None else None)
+        return results
+
+    def _run_detector(
+        self, keys: List[Tuple[str, str, Optional[str]]], batch_size: int, batched: bool = True
+    ) -> Dict[Tuple[str, str, Optional[str]], Dict[str, Any]]:
+        """Detect every (headword, variant) in ``keys``; failed items are left out."""
+        if not keys:
+            return {}
+        raw = None
+        if batched:
             try:
-                result = self._detector.detect(headword, variant)
+                raw = self._detector.detect_batch(
+                    [{"lexeme": headword, "ipa": variant} for headword, variant, _ in keys],
+                    show_progress=False,
+                    batch_size=batch_size,
+                    num_beams=self.NUM_BEAMS,
+                    bucket_by_length=True,
+                )
             except Exception as exc:  # pragma: no cover - model edge cases
-                logger.debug("IPA anomaly detect failed for %r: %s", headword, exc)
-                continue
-
-            candidate = {
+                # One bad item fails its whole batch; retry item by item.
+                logger.debug("Batched IPA anomaly detection failed, retrying singly: %s", exc)
+        if raw is None:
+            raw = []
+            for headword, variant, _ in keys:
+                try:
+                    raw.append(self._detector.detect(headword, variant))
+                except Exception as item_exc:
+                    logger.debug("IPA anomaly detect failed for %r: %s", headword, item_exc)
+                    raw.append(None)
+
+        return {
+            key: {
                 "is_anomaly": result.is_anomaly,
-                "stored_ipa": variant,
+                "stored_ipa": key[1],
                 "predicted_ipa": result.predicted_ipa,
                 "confidence_score": result.confidence_score,
                 "anomaly_type": result.anomaly_type,
                 "per": (result.details or {}).get("per"),
             }
-            if best is None or candidate["confidence_score"] > best["confidence_score"]:
-                best = candidate
-
-        return best
+            for key, result in zip(keys, raw)
+            if result is not None
+        }
+
+    def clear_cache(self) -> int:
+        """Forget all cached detection results."""
+        with self._results_lock:
+            count = len(self._results)
+            self._results.clear()
+        return count
 
 
 __all__ = [
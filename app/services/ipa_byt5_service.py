@@ -15,6 +15,10 @@ Discovery is entirely server-side and mirrors ``IPAAnomalyService``:
   * Models are loaded with ``local_files_only=True`` and
     ``trust_remote_code=False``, so a placed model cannot execute arbitrary
     code and no network access is required at inference time.
+
+``draft_ipa_batch`` drafts many headwords per ``generate`` call: headwords
+are length-bucketed and padded together, and drafts are cached per
+(headword, generation settings, model version).
 """
 
 from __future__ import annotations
@@ -25,7 +29,8 @@ import logging
 import os
 import sys
 import threading
-from typing import Any, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import torch
 
@@ -40,6 +45,10 @@ class IPAByT5Service:
     _instance: Optional["IPAByT5Service"] = None
     _instance_lock = threading.Lock()
 
+    # Headwords per padded ``generate`` call, and drafts remembered across calls.
+    BATCH_SIZE = 16
+    DRAFT_CACHE_SIZE = 10_000
+
     def __init__(
         self,
         model_dir: Optional[str] = None,
@@ -53,6 +62,9 @@ class IPAByT5Service:
         self._device = torch.device("cpu")
         self._available: Optional[bool] = None
         self._load_lock = threading.Lock()
+        self.model_version: Optional[str] = None
+        self._drafts: "OrderedDict[Tuple[Any, ...], List[str]]" = OrderedDict()
+        self._drafts_lock = threading.Lock()
 
     # ------------------------------------------------------------------ #
     # Configuration / model resolution
@@ -156,6 +168,11 @@ class IPAByT5Service:
         self._device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self._model.to(self._device)
         self._model.eval()
+        try:
+            mtime = max(os.stat(os.path.join(model_dir, name)).st_mtime_ns for name in os.listdir(model_dir))
+        except (OSError, ValueError):
+            mtime = 0
+        self.model_version = f"{os.path.abspath(model_dir)}:{mtime}"
 
     # ------------------------------------------------------------------ #
     # Drafting
@@ -175,11 +192,67 @@ class IPAByT5Service:
         """
         if not headword:
             return []
-        if not self.is_available():
-            return []
+        return self.draft_ipa_batch(
+            [headword],
+            num_return_sequences=num_return_sequences,
+            num_beams=num_beams,
+            max_length=max_length,
+        )[0]
+
+    def draft_ipa_batch(
+        self,
+        headwords: Iterable[str],
+        num_return_sequences: int = 1,
+        num_beams: int = 4,
+        max_length: int = 128,
+        batch_size: Optional[int] = None,
+    ) -> List[List[str]]:
+        """Generate candidate IPA pronunciations for many headwords.
 
-        text = (self._source_prefix or "") + headword
-        inputs = self._tokenizer(text, return_tensors="pt").to(self._device)  # type: ignore[union-attr]
+        Same results as :meth:`draft_ipa` per headword, in input order.
+        Uncached headwords are sorted by length and generated ``batch_size``
+        at a time with padding, so one forward pass serves many headwords.
+        """
+        headwords = list(headwords)
+        if not any(headwords) or not self.is_available():
+            return [[] for _ in headwords]
+
+        settings = (num_return_sequences, num_beams, max_length, self.model_version)
+        drafts: Dict[str, List[str]] = {}
+        missing: List[str] = []
+        with self._drafts_lock:
+            for headword in dict.fromkeys(h for h in headwords if h):
+                cached = self._drafts.get((headword,) + settings)
+                if cached is None:
+                    missing.append(headword)
+                else:
+                    self._drafts.move_to_end((headword,) + settings)
+                    drafts[headword] = cached
+
+        missing.sort(key=len)
+        size = batch_size or self.BATCH_SIZE
+        for start in range(0, len(missing), size):
+            chunk = missing[start:start + size]
+            generated = self._generate(chunk, num_return_sequences, num_beams, max_length)
+            with self._drafts_lock:
+                for headword, candidates in zip(chunk, generated):
+                    drafts[headword] = candidates
+                    self._drafts[(headword,) + settings] = candidates
+                while len(self._drafts) > self.DRAFT_CACHE_SIZE:
+                    self._drafts.popitem(last=False)
+
+        return [list(drafts.get(headword, [])) for headword in headwords]
+
+    def _generate(
+        self,
+        headwords: List[str],
+        num_return_sequences: int,
+        num_beams: int,
+        max_length: int,
+    ) -> List[List[str]]:
+        """Run one padded ``generate`` call; returns de-duplicated candidates per headword."""
+        texts = [(self._source_prefix or "") + headword for headword in headwords]
+        inputs = self._tokenizer(texts, padding=True, return_tensors="pt").to(self._device)  # type: ignore[union-attr]
         with torch.no_grad():
             generated = self._model.generate(  # type: ignore[union-attr]
                 **inputs,
@@ -189,20 +262,24 @@ class IPAByT5Service:
                 early_stopping=True,
             )
 
-        candidates: List[str] = []
-        for seq in generated:
-            ipa = self._tokenizer.decode(seq, skip_special_tokens=True).strip()  # type: ignore[union-attr]
-            if ipa:
-                candidates.append(ipa)
-
-        # De-duplicate while preserving order.
-        seen: set = set()
-        unique: List[str] = []
-        for c in candidates:
-            if c not in seen:
-                seen.add(c)
-                unique.append(c)
-        return unique
+        # generate() returns num_return_sequences rows per input, grouped by input.
+        results: List[List[str]] = []
+        for i in range(len(headwords)):
+            candidates: List[str] = []
+            for seq in generated[i * num_return_sequences:(i + 1) * num_return_sequences]:
+                ipa = self._tokenizer.decode(seq, skip_special_tokens=True).strip()  # type: ignore[union-attr]
+                # De-duplicate while preserving order.
+                if ipa and ipa not in candidates:
+                    candidates.append(ipa)
+            results.append(candidates)
+        return results
+
+    def clear_cache(self) -> int:
+        """Forget all cached drafts."""
+        with self._drafts_lock:
+            count = len(self._drafts)
+            self._drafts.clear()
+        return count
 
 
 __all__ = ["IPAByT5Service"]
@@ -0,0 +1,613 @@
+"""
+Embedded vector store backed by memory-mapped NumPy matrices.
+
+An alternative to Qdrant for single-node deployments: each collection is a
+directory holding
+
+* ``vectors.bin`` - a ``(capacity, dimension)`` float16/float32 matrix
+  opened with ``numpy.memmap``;
+* ``points.jsonl`` - an append-only log of upserts (row, id, payload) and
+  deletes, replayed on open and compacted when it grows stale;
+* ``meta.json`` - dimension, dtype and capacity.
+
+Search is exact: scores are computed block by block as ``block @ query``
+(vectors are normalized, so the dot product is the cosine similarity) and
+the top-k are kept with ``argpartition``. Batches of queries become one
+matrix product per block, which is what makes all-pairs neighbour discovery
+cheap. An optional IVF index (k-means centroids, probing the nearest
+``ivf_probe`` lists) trades exactness for speed on large collections.
+
+``LocalVectorStore`` implements the subset of the ``QdrantClient`` API that
+``EmbeddingService`` uses, accepting either qdrant-client model objects or
+plain values (ints, lists, ``{key: [values]}`` filters).
+
+Several processes (e.g. web workers) may share a store: each collection has
+a ``<name>.lock`` file next to its directory, held exclusively (``flock``)
+while writing or compacting and shared while reading, and a process reloads
+its view when ``points.jsonl`` or ``meta.json`` changed under it. Where
+``fcntl`` is unavailable (Windows) there is no such lock, and only one
+process may write to the store.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the elements of one search block, both the float32 copy of
+# the collection rows (rows x dimension) and their scores (queries x rows):
+# 16M elements is 64 MB each.
+SCORE_BLOCK_ELEMENTS = 16 * 1024 * 1024
+
+
+@contextmanager
+def _file_lock(path: str, exclusive: bool):
+    """Hold an advisory ``flock`` on ``path`` (a no-op without ``fcntl``)."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a+b") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class LocalPoint(NamedTuple):
+    """A stored point: the local counterpart of Qdrant's PointStruct/ScoredPoint."""
+
+    id: str
+    payload: Dict[str, Any]
+    vector: Optional[List[float]] = None
+    score: Optional[float] = None
+
+
+PayloadPredicate = Callable[[Dict[str, Any]], bool]
+
+
+def _compile_filter(scroll_filter: Any) -> Optional[PayloadPredicate]:
+    """Turn a ``{key: value | [values]}`` dict or a Qdrant ``Filter(must=[...])`` into a predicate."""
+    if scroll_filter is None:
+        return None
+    conditions: List[Tuple[str, set]] = []
+    if isinstance(scroll_filter, dict):
+        for key, values in scroll_filter.items():
+            allowed = set(values) if isinstance(values, (list, tuple, set, frozenset)) else {values}
+            conditions.append((key, allowed))
+    else:
+        for condition in getattr(scroll_filter, "must", None) or []:
+            match = condition.match
+            any_of = getattr(match, "any", None)
+            allowed = set(any_of) if any_of is not None else {getattr(match, "value", None)}
+            conditions.append((condition.key, allowed))
+    if not conditions:
+        return None
+    return lambda payload: all(payload.get(key) in allowed for key, allowed in conditions)
+
+
+def _point_ids(points_selector: Any) -> List[str]:
+    ids = getattr(points_selector, "points", points_selector)
+    return [str(i) for i in ids]
+
+
+class _Collection:
+    """One collection: memmapped matrix plus id/payload sidecar. Not thread-safe on its own."""
+
+    LOG_COMPACT_RATIO = 3  # compact the sidecar when it holds 3x more records than live points
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.dimension = int(meta["dimension"])
+        self.dtype = np.dtype(meta["dtype"])
+        self.capacity = int(meta["capacity"])
+        self.vectors = self._open_matrix(self.capacity)
+        self.ids: List[Optional[str]] = []
+        self.payloads: List[Optional[Dict[str, Any]]] = []
+        self.row_of: Dict[str, int] = {}
+        self.log_records = 0
+        self.log_size = 0
+        self._replay_log()
+        self.alive = np.zeros(self.capacity, dtype=bool)
+        for row in self.row_of.values():
+            self.alive[row] = True
+        self.ivf: Optional[Dict[str, Any]] = None
+        self._remember_files()
+
+    # ---- Creation / storage ----
+
+    @classmethod
+    def create(cls, path: str, dimension: int, dtype: str, capacity: int = 1024) -> "_Collection":
+        os.makedirs(path, exist_ok=True)
+        np.memmap(os.path.join(path, "vectors.bin"), dtype=dtype, mode="w+", shape=(capacity, dimension)).flush()
+        open(os.path.join(path, "points.jsonl"), "w", encoding="utf-8").close()
+        cls._write_meta(path, dimension, dtype, capacity)
+        return cls(path)
+
+    @staticmethod
+    def _write_meta(path: str, dimension: int, dtype: str, capacity: int) -> None:
+        tmp = os.path.join(path, "meta.json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"dimension": dimension, "dtype": str(dtype), "capacity": capacity}, f)
+        os.replace(tmp, os.path.join(path, "meta.json"))
+
+    def _open_matrix(self, capacity: int) -> np.memmap:
+        return np.memmap(
+            os.path.join(self.path, "vectors.bin"), dtype=self.dtype, mode="r+",
+            shape=(capacity, self.dimension),
+        )
+
+    def _replay_log(self) -> Tuple[List[int], List[int]]:
+        """Apply the log from ``log_size`` on; returns the (upserted, deleted) rows."""
+        upserted: List[int] = []
+        deleted: List[int] = []
+        with open(os.path.join(self.path, "points.jsonl"), "rb") as f:
+            f.seek(self.log_size)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # not fully written yet; read it next time
+                self.log_size += len(line)
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                self.log_records += 1
+                if record.get("op") == "delete":
+                    row = self.row_of.pop(record["id"], None)
+                    if row is not None:
+                        self.ids[row] = None
+                        self.payloads[row] = None
+                        deleted.append(row)
+                    continue
+                row = record["row"]
+                while len(self.ids) <= row:
+                    self.ids.append(None)
+                    self.payloads.append(None)
+                self.ids[row] = record["id"]
+                self.payloads[row] = record.get("payload") or {}
+                self.row_of[record["id"]] = row
+                upserted.append(row)
+        return upserted, deleted
+
+    # ---- Changes made by other processes ----
+
+    def _file_state(self) -> Tuple[int, int, int, int]:
+        """Identity of the files a reload depends on (raises if the collection is gone)."""
+        log = os.stat(os.path.join(self.path, "points.jsonl"))
+        meta = os.stat(os.path.join(self.path, "meta.json"))
+        return log.st_ino, meta.st_ino, meta.st_mtime_ns, meta.st_size
+
+    def _remember_files(self) -> None:
+        self._files = self._file_state()
+
+    def refresh(self) -> "_Collection":
+        """This collection brought up to date with the files; may return a new instance.
+
+        Appends by another process are replayed from where this one stopped
+        reading; a compaction (new ``points.jsonl``) or a grown matrix (new
+        ``meta.json``) means reopening the collection.
+        """
+        state = self._file_state()
+        if state != self._files:
+            return _Collection(self.path)
+        if os.path.getsize(os.path.join(self.path, "points.jsonl")) != self.log_size:
+            upserted, deleted = self._replay_log()
+            self.alive[deleted] = False
+            self.alive[upserted] = True
+            if self.ivf is not None and upserted:
+                rows = np.asarray(upserted, dtype=np.int64)
+                self._ivf_assign(rows, np.asarray(self.vectors[rows], dtype=np.float32))
+        return self
+
+    def _append_log(self, records: Iterable[Dict[str, Any]]) -> None:
+        lines = [json.dumps(r, ensure_ascii=False) for r in records]
+        if not lines:
+            return
+        with open(os.path.join(self.path, "points.jsonl"), "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        self.log_size = os.path.getsize(os.path.join(self.path, "points.jsonl"))
+        self.log_records += len(lines)
+
+    def _grow(self, needed_rows: int) -> None:
+        capacity = self.capacity
+        while capacity < needed_rows:
+            capacity *= 2
+        if capacity == self.capacity:
+            return
+        self.vectors.flush()
+        tmp = os.path.join(self.path, "vectors.bin.tmp")
+        grown = np.memmap(tmp, dtype=self.dtype, mode="w+", shape=(capacity, self.dimension))
+        grown[: self.capacity] = self.vectors[: self.capacity]
+        grown.flush()
+        del grown
+        self.vectors = None
+        os.replace(tmp, os.path.join(self.path, "vectors.bin"))
+        self._write_meta(self.path, self.dimension, str(self.dtype), capacity)
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self.capacity] = self.alive
+        self.alive = alive
+        self.capacity = capacity
+        self.vectors = self._open_matrix(capacity)
+        self._remember_files()
+
+    @property
+    def count(self) -> int:
+        return len(self.row_of)
+
+    @property
+    def used_rows(self) -> int:
+        return len(self.ids)
+
+    # ---- Mutations ----
+
+    def upsert(self, points: Iterable[Any]) -> None:
+        points = list(points)
+        if not points:
+            return
+        records = []
+        rows = []
+        vectors = []
+        for point in points:
+            point_id = str(point.id)
+            row = self.row_of.get(point_id)
+            if row is None:
+                row = len(self.ids)
+                self.ids.append(point_id)
+                self.payloads.append(None)
+                self.row_of[point_id] = row
+            payload = dict(point.payload or {})
+            self.payloads[row] = payload
+            rows.append(row)
+            vectors.append(point.vector)
+            records.append({"op": "upsert", "row": row, "id": point_id, "payload": payload})
+
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.shape[1] != self.dimension:
+            raise ValueError(f"Vector dimension {matrix.shape[1]} does not match collection dimension {self.dimension}")
+        self._grow(len(self.ids))
+        self.vectors[rows] = matrix.astype(self.dtype)
+        self.vectors.flush()
+        self.alive[rows] = True
+        self._append_log(records)
+        if self.ivf is not None:
+            self._ivf_assign(np.asarray(rows), matrix)
+
+    def delete(self, point_ids: Iterable[str]) -> int:
+        records = []
+        for point_id in point_ids:
+            row = self.row_of.pop(point_id, None)
+            if row is None:
+                continue
+            self.ids[row] = None
+            self.payloads[row] = None
+            self.alive[row] = False
+            records.append({"op": "delete", "id": point_id})
+        self._append_log(records)
+        if self.log_records > self.LOG_COMPACT_RATIO * max(self.count, 1024):
+            self.compact()
+        return len(records)
+
+    def compact(self) -> None:
+        """Rewrite the sidecar (and matrix) without deleted rows."""
+        live_rows = sorted(self.row_of.values())
+        ordered = np.asarray(live_rows, dtype=np.int64)
+        vectors = np.array(self.vectors[ordered]) if live_rows else np.zeros((0, self.dimension), self.dtype)
+        self.vectors[: len(live_rows)] = vectors
+        self.vectors.flush()
+        self.ids = [self.ids[r] for r in live_rows]
+        self.payloads = [self.payloads[r] for r in live_rows]
+        self.row_of = {point_id: row for row, point_id in enumerate(self.ids)}
+        self.alive[:] = False
+        self.alive[: len(live_rows)] = True
+
+        tmp = os.path.join(self.path, "points.jsonl.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for row, (point_id, payload) in enumerate(zip(self.ids, self.payloads)):
+                f.write(json.dumps({"op": "upsert", "row": row, "id": point_id, "payload": payload}, ensure_ascii=False) + "\n")
+        self.log_size = os.path.getsize(tmp)
+        os.replace(tmp, os.path.join(self.path, "points.jsonl"))
+        self.log_records = len(self.ids)
+        self.ivf = None
+        self._remember_files()
+
+    # ---- Reads ----
+
+    def record(self, row: int, with_payload: Any = True, with_vectors: bool = False, score: Optional[float] = None) -> LocalPoint:
+        payload = self.payloads[row] or {}
+        if isinstance(with_payload, (list, tuple)):
+            payload = {k: payload[k] for k in with_payload if k in payload}
+        elif not with_payload:
+            payload = {}
+        vector = self.vectors[row].astype(np.float32).tolist() if with_vectors else None
+        return LocalPoint(self.ids[row], payload, vector, score)
+
+    def candidate_rows(self, predicate: Optional[PayloadPredicate]) -> Optional[np.ndarray]:
+        """Rows passing the payload filter (None when unfiltered)."""
+        if predicate is None:
+            return None
+        return np.asarray(
+            [row for row in self.row_of.values() if predicate(self.payloads[row] or {})], dtype=np.int64
+        )
+
+    def top_k(
+        self,
+        queries: np.ndarray,
+        limit: int,
+        score_threshold: Optional[float] = None,
+        rows: Optional[np.ndarray] = None,
+        block_size: Optional[int] = None,
+    ) -> List[List[Tuple[int, float]]]:
+        """Exact top-k (row, score) per query by blocked matrix multiplication.
+
+        Without an explicit ``block_size`` the number of collection rows per
+        block is chosen so neither the vector block nor the score block
+        exceeds ``SCORE_BLOCK_ELEMENTS``.
+        """
+        n_queries = queries.shape[0]
+        if block_size is None:
+            block_size = max(1, SCORE_BLOCK_ELEMENTS // max(n_queries, self.dimension, 1))
+        best_scores = np.full((n_queries, 0), -np.inf, dtype=np.float32)
+        best_rows = np.zeros((n_queries, 0), dtype=np.int64)
+        used = self.used_rows
+        if rows is None:
+            blocks = ((np.arange(start, min(start + block_size, used)), slice(start, min(start + block_size, used)))
+                      for start in range(0, used, block_size))
+        else:
+            blocks = ((rows[start:start + block_size], rows[start:start + block_size])
+                      for start in range(0, len(rows), block_size))
+
+        for row_ids, selector in blocks:
+            if len(row_ids) == 0:
+                continue
+            block = np.asarray(self.vectors[selector], dtype=np.float32)
+            scores = queries @ block.T
+            scores[:, ~self.alive[row_ids]] = -np.inf
+            best_scores = np.concatenate([best_scores, scores], axis=1)
+            best_rows = np.concatenate([best_rows, np.broadcast_to(row_ids, scores.shape)], axis=1)
+            if best_scores.shape[1] > limit:
+                keep = np.argpartition(-best_scores, limit - 1, axis=1)[:, :limit]
+                best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                best_rows = np.take_along_axis(best_rows, keep, axis=1)
+
+        results = []
+        order = np.argsort(-best_scores, axis=1)
+        for qi in range(n_queries):
+            hits = []
+            for j in order[qi]:
+                score = float(best_scores[qi, j])
+                if score == -np.inf or (score_threshold is not None and score < score_threshold):
+                    break
+                hits.append((int(best_rows[qi, j]), score))
+            results.append(hits)
+        return results
+
+    # ---- Approximate (IVF) index ----
+
+    def build_ivf(self, n_lists: int, iterations: int = 10, seed: int = 0) -> None:
+        live_rows = np.asarray(sorted(self.row_of.values()), dtype=np.int64)
+        if len(live_rows) < n_lists:
+            self.ivf = None
+            return
+        data = np.asarray(self.vectors[live_rows], dtype=np.float32)
+        rng = np.random.default_rng(seed)
+        centroids = data[rng.choice(len(data), n_lists, replace=False)]
+        for _ in range(iterations):
+            assignment = np.argmax(data @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = data[assignment == c]
+                if len(members):
+                    centroid = members.mean(axis=0)
+                    centroids[c] = centroid / (np.linalg.norm(centroid) or 1.0)
+        assignment = np.argmax(data @ centroids.T, axis=1)
+        lists = [live_rows[assignment == c].tolist() for c in range(n_lists)]
+        self.ivf = {"centroids": centroids, "lists": lists, "built_count": len(live_rows)}
+
+    def _ivf_assign(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        assignment = np.argmax(vectors @ self.ivf["centroids"].T, axis=1)
+        for row, c in zip(rows.tolist(), assignment.tolist()):
+            self.ivf["lists"][c].append(row)
+
+    def ivf_rows(self, query: np.ndarray, n_probe: int) -> np.ndarray:
+        centroids = self.ivf["centroids"]
+        probe = np.argsort(-(centroids @ query))[:n_probe]
+        rows = sorted({row for c in probe for row in self.ivf["lists"][c]})
+        return np.asarray(rows, dtype=np.int64)
+
+
+class LocalVectorStore:
+    """Qdrant-compatible (subset) client over memory-mapped collections in ``root_dir``."""
+
+    def __init__(
+        self,
+        root_dir: str,
+        dtype: str = "float16",
+        ivf_lists: int = 0,
+        ivf_probe: int = 8,
+        ivf_min_points: int = 50000,
+    ) -> None:
+        self.root_dir = root_dir
+        self.dtype = dtype
+        self.ivf_lists = ivf_lists
+        self.ivf_probe = ivf_probe
+        self.ivf_min_points = ivf_min_points
+        self._collections: Dict[str, _Collection] = {}
+        self._lock = threading.RLock()
+        self._file_locked: set = set()  # collections whose lock file this process holds
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _path(self, collection_name: str) -> str:
+        safe = "".join(ch for ch in collection_name if ch.isalnum() or ch in "-_")
+        return os.path.join(self.root_dir, safe)
+
+    @contextmanager
+    def _locked(self, collection_name: str, exclusive: bool = False):
+        """Hold the in-process lock and the collection's lock file (shared for reads)."""
+        with self._lock:
+            if collection_name in self._file_locked:
+                yield
+                return
+            with _file_lock(self._path(collection_name) + ".lock", exclusive):
+                self._file_locked.add(collection_name)
+                try:
+                    yield
+                finally:
+                    self._file_locked.discard(collection_name)
+
+    def _get(self, collection_name: str) -> _Collection:
+        """The collection, reloaded first if another process changed it. Call under ``_locked``."""
+        collection = self._collections.get(collection_name)
+        if collection is not None:
+            try:
+                collection = self._collections[collection_name] = collection.refresh()
+            except FileNotFoundError:
+                # Deleted by another process
+                self._collections.pop(collection_name, None)
+                collection = None
+        if collection is None:
+            path = self._path(collection_name)
+            if not os.path.exists(os.path.join(path, "meta.json")):
+                raise ValueError(f"Collection {collection_name} does not exist")
+            collection = _Collection(path)
+            self._collections[collection_name] = collection
+        return collection
+
+    # ---- Collections ----
+
+    def collection_exists(self, collection_name: str) -> bool:
+        return os.path.exists(os.path.join(self._path(collection_name), "meta.json"))
+
+    def create_collection(self, collection_name: str, vectors_config: Any) -> bool:
+        """Create a collection; ``vectors_config`` is a dimension or an object with ``.size``."""
+        dimension = int(getattr(vectors_config, "size", vectors_config))
+        with self._locked(collection_name, exclusive=True):
+            self.delete_collection(collection_name)
+            self._collections[collection_name] = _Collection.create(self._path(collection_name), dimension, self.dtype)
+        return True
+
+    def delete_collection(self, collection_name: str) -> bool:
+        with self._locked(collection_name, exclusive=True):
+            self._collections.pop(collection_name, None)
+            path = self._path(collection_name)
+            if os.path.exists(path):
+                shutil.rmtree(path)
+                return True
+        return False
+
+    def get_collection(self, collection_name: str) -> SimpleNamespace:
+        with self._locked(collection_name):
+            collection = self._get(collection_name)
+            return SimpleNamespace(
+                points_count=collection.count,
+                config=SimpleNamespace(params=SimpleNamespace(vectors=SimpleNamespace(size=collection.dimension))),
+                ivf_lists=len(collection.ivf["lists"]) if collection.ivf else 0,
+            )
+
+    # ---- Points ----
+
+    def upsert(self, collection_name: str, points: Iterable[Any], **_: Any) -> None:
+        with self._locked(collection_name, exclusive=True):
+            self._get(collection_name).upsert(points)
+
+    def delete(self, collection_name: str, points_selector: Any, **_: Any) -> int:
+        with self._locked(collection_name, exclusive=True):
+            return self._get(collection_name).delete(_point_ids(points_selector))
+
+    def retrieve(self, collection_name: str, ids: Iterable[Any], with_payload: Any = True,
+                 with_vectors: bool = False, **_: Any) -> List[LocalPoint]:
+        with self._locked(collection_name):
+            collection = self._get(collection_name)
+            rows = [collection.row_of[str(i)] for i in ids if str(i) in collection.row_of]
+            return [collection.record(row, with_payload, with_vectors) for row in rows]
+
+    def scroll(
+        self,
+        collection_name: str,
+        scroll_filter: Any = None,
+        limit: int = 10,
+        offset: Optional[int] = None,
+        with_payload: Any = True,
+        with_vectors: bool = False,
+        **_: Any,
+    ) -> Tuple[List[LocalPoint], Optional[int]]:
+        """Page through live points in row order; the offset is the next row to read."""
+        predicate = _compile_filter(scroll_filter)
+        with self._locked(collection_name):
+            collection = self._get(collection_name)
+            row = int(offset or 0)
+            records: List[LocalPoint] = []
+            while row < collection.used_rows and len(records) < limit:
+                if collection.alive[row] and (predicate is None or predicate(collection.payloads[row] or {})):
+                    records.append(collection.record(row, with_payload, with_vectors))
+                row += 1
+            return records, (row if row < collection.used_rows else None)
+
+    # ---- Search ----
+
+    def search_matrix(
+        self,
+        collection_name: str,
+        queries: Any,
+        limit: int = 10,
+        score_threshold: Optional[float] = None,
+        query_filter: Any = None,
+        with_vectors: bool = False,
+        exact: bool = False,
+    ) -> List[List[LocalPoint]]:
+        """Top-k neighbours for every row of ``queries`` (one matmul per block of the collection)."""
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        predicate = _compile_filter(query_filter)
+        with self._locked(collection_name):
+            collection = self._get(collection_name)
+            if collection.count == 0:
+                return [[] for _ in range(len(queries))]
+            rows = collection.candidate_rows(predicate)
+            use_ivf = not exact and predicate is None and self._ensure_ivf(collection)
+            if use_ivf:
+                hits = [
+                    collection.top_k(q[None, :], limit, score_threshold, rows=collection.ivf_rows(q, self.ivf_probe))[0]
+                    for q in queries
+                ]
+            else:
+                hits = collection.top_k(queries, limit, score_threshold, rows=rows)
+            return [
+                [collection.record(row, True, with_vectors, score) for row, score in query_hits]
+                for query_hits in hits
+            ]
+
+    def query_points(self, collection_name: str, query: Any, limit: int = 10,
+                     score_threshold: Optional[float] = None, query_filter: Any = None, **_: Any) -> SimpleNamespace:
+        return SimpleNamespace(points=self.search_matrix(
+            collection_name, [query], limit, score_threshold, query_filter
+        )[0])
+
+    def search(self, collection_name: str, query_vector: Any, limit: int = 10,
+               score_threshold: Optional[float] = None, query_filter: Any = None, **_: Any) -> List[LocalPoint]:
+        return self.search_matrix(collection_name, [query_vector], limit, score_threshold, query_filter)[0]
+
+    def build_ivf(self, collection_name: str, n_lists: Optional[int] = None) -> None:
+        """(Re)build the approximate index of a collection."""
+        with self._locked(collection_name):
+            self._get(collection_name).build_ivf(n_lists or self.ivf_lists or 256)
+
+    def _ensure_ivf(self, collection: _Collection) -> bool:
+        if self.ivf_lists <= 0 or collection.count < self.ivf_min_points:
+            return False
+        if collection.ivf is None or collection.count > 2 * collection.ivf["built_count"]:
+            collection.build_ivf(self.ivf_lists)
+        return collection.ivf is not None
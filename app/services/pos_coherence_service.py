@@ -12,14 +12,13 @@ from __future__ import annotations
 import logging
 import time
 from collections import Counter
-from typing import Any, Dict, List, Optional, Tuple
-
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import SGDClassifier
-from sklearn.pipeline import Pipeline, make_pipeline
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from app.services.import_converter import normalize_pos
 
+if TYPE_CHECKING:
+    from sklearn.pipeline import Pipeline
+
 logger = logging.getLogger(__name__)
 
 # Module-level cache for model & cached anomalies (TTL 1 hour)
@@ -155,6 +154,8 @@ class POSCoherenceService:
         limit: int = 100,
         cache_ttl_sec: float = 3600.0,
     ) -> List[Dict[str, Any]]:
+        if self.pipeline and (time.time() - self.last_trained < cache_ttl_sec) and self.cached_anomalies:
+            return self.cached_anomalies[:limit]
         data = self._fetch_dataset(dict_service)
         return self.detect_anomalies_from_data(data, min_confidence=min_confidence, limit=limit, cache_ttl_sec=cache_ttl_sec)
 
@@ -185,6 +186,12 @@ class POSCoherenceService:
         if not X:
             return []
 
+        # scikit-learn (and SciPy behind it) is imported on first training run,
+        # not at app startup: pos_tagger_service only needs POS_ROOT_MAP from here.
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.linear_model import SGDClassifier
+        from sklearn.pipeline import make_pipeline
+
         pipeline = make_pipeline(
             TfidfVectorizer(ngram_range=(1, 2), max_features=25000, sublinear_tf=True),
             SGDClassifier(loss="log_loss", max_iter=30, random_state=42, n_jobs=-1, class_weight="balanced"),
@@ -3,16 +3,25 @@ POS Tagger Service — Automatic Part-of-Speech tagging for text and dictionary
 
 Supports spaCy NLP model tagging with Penn Treebank, Universal Dependencies,
 and custom per-language tagset mappings for lexicographer distinction mapping.
+
+Bulk callers use ``tag_texts`` and ``analyze_definition_phrases_batch``, which
+stream all texts through ``nlp.pipe`` with only the pipeline components they
+need. Definition analyses are kept in an in-process LRU (and in Redis when it
+is available).
 """
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from app.services.import_converter import normalize_pos
 from app.services.pos_coherence_service import POS_ROOT_MAP, get_root_pos
@@ -59,6 +68,25 @@ def _get_spacy_nlp_parser() -> Any:
     return _SPACY_NLP_PARSER
 
 
+# Components each analysis reads; the rest of a loaded pipeline is disabled
+# while streaming texts through nlp.pipe.
+_TAGGING_PIPES = ("tok2vec", "tagger", "attribute_ruler")
+_PARSING_PIPES = ("tok2vec", "tagger", "attribute_ruler", "parser")
+
+
+def _pipe(nlp: Any, texts: List[str], needed: Tuple[str, ...], batch_size: int, n_process: int) -> Iterable[Any]:
+    """``nlp.pipe`` over ``texts`` with every component outside ``needed`` disabled."""
+    disable = [name for name in nlp.pipe_names if name not in needed]
+    return nlp.pipe(texts, batch_size=batch_size, n_process=n_process, disable=disable)
+
+
+def _model_id(nlp: Any) -> str:
+    """Identify the pipeline that produced an analysis (or the heuristic fallback)."""
+    if nlp is None or "parser" not in getattr(nlp, "pipe_names", ()):
+        return "heuristic"
+    meta = getattr(nlp, "meta", None) or {}
+    return f"{meta.get('lang', '')}_{meta.get('name', '')}-{meta.get('version', '')}"
+
 
 # Path to persistent tagset mappings JSON file
 TAGSET_MAPPINGS_FILE = Path(__file__).resolve().parent.parent.parent / "config" / "pos_tagset_mappings.json"
@@ -123,24 +151,6 @@ PENN_AND_UD_POS_MAP: Dict[str, str] = {
 }
 
 
-def _get_spacy_nlp() -> Any:
-    global _SPACY_NLP, _SPACY_LOADED
-    if not _SPACY_LOADED:
-        _SPACY_LOADED = True
-        try:
-            import spacy
-            try:
-                _SPACY_NLP = spacy.load(
-                    "en_core_web_sm",
-                    disable=["parser", "ner", "lemmatizer", "attribute_ruler"]
-                )
-            except Exception:
-                _SPACY_NLP = spacy.blank("en")
-        except ImportError:
-            _SPACY_NLP = None
-    return _SPACY_NLP
-
-
 # Maps a top-level root POS category to its phrasal category label.
 PHRASE_CATEGORY_BY_ROOT_POS: Dict[str, str] = {
     "Noun": "Noun Phrase",
@@ -180,8 +190,18 @@ DEFINITION_KEYWORD_RULES: List[Tuple[re.Pattern[str], str]] = [
 class POSTaggerService:
     """POS Tagger service with customizable Penn / Universal / per-language tagset mappings."""
 
+    # nlp.pipe defaults for the batch methods.
+    PIPE_BATCH_SIZE = 256
+    PIPE_N_PROCESS = 1
+    # Definition analyses kept in process (independent of Redis).
+    ANALYSIS_CACHE_SIZE = 20_000
+
     def __init__(self) -> None:
         self._tagset_mappings: Dict[str, Dict[str, str]] = self._load_tagset_mappings()
+        self._analyses: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+        self._analyses_lock = threading.Lock()
+        self._stats: Dict[str, Any] = {"cache_hits": 0, "cache_misses": 0}
+        self.last_batch_stats: Dict[str, Any] = {}
 
     def _load_tagset_mappings(self) -> Dict[str, Dict[str, str]]:
         """Load tagset mappings from config file or return built-in defaults."""
@@ -260,25 +280,46 @@ class POSTaggerService:
 
     def tag_text(self, text: str, lang: str = "en", user_map: Optional[Dict[str, str]] = None) -> List[Dict[str, str]]:
         """Tokenize and tag text with POS labels and canonical LIFT distinctions."""
-        if not text or not text.strip():
-            return []
+        return self.tag_texts([text], lang=lang, user_map=user_map)[0]
+
+    def tag_texts(
+        self,
+        texts: List[str],
+        lang: str = "en",
+        user_map: Optional[Dict[str, str]] = None,
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[List[Dict[str, str]]]:
+        """Tag many texts at once (one ``nlp.pipe`` pass); one token list per text."""
+        results: List[List[Dict[str, str]]] = [[] for _ in texts]
+        pending = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not pending:
+            return results
 
         nlp = _get_spacy_nlp()
         if nlp is not None and hasattr(nlp, "pipe_names") and "tagger" in nlp.pipe_names:
-            doc = nlp(text)
-            tokens = []
-            for token in doc:
-                fine_tag = token.tag_ or token.pos_
-                norm = self.normalize_tag(fine_tag, lang=lang, user_map=user_map) or token.pos_
-                tokens.append({
-                    "text": token.text,
-                    "pos": token.pos_,
-                    "tag": fine_tag,
-                    "normalized_pos": norm,
-                })
-            return tokens
+            docs = _pipe(nlp, [texts[i] for i in pending], _TAGGING_PIPES,
+                         batch_size or self.PIPE_BATCH_SIZE, n_process or self.PIPE_N_PROCESS)
+            for i, doc in zip(pending, docs):
+                tokens = []
+                for token in doc:
+                    fine_tag = token.tag_ or token.pos_
+                    norm = self.normalize_tag(fine_tag, lang=lang, user_map=user_map) or token.pos_
+                    tokens.append({
+                        "text": token.text,
+                        "pos": token.pos_,
+                        "tag": fine_tag,
+                        "normalized_pos": norm,
+                    })
+                results[i] = tokens
+            return results
+
+        for i in pending:
+            results[i] = self._rule_tag_text(texts[i], lang, user_map)
+        return results
 
-        # Fallback regex tokenizer & rule tagger
+    def _rule_tag_text(self, text: str, lang: str, user_map: Optional[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Fallback regex tokenizer & rule tagger."""
         words = re.findall(r"\b\w+\b", text)
         result = []
         for word in words:
@@ -392,25 +433,44 @@ class POSTaggerService:
         Uses the spaCy dependency parser (root token POS) when available, falling
         back to lightweight suffix/keyword heuristics otherwise.
         """
+        return self._phrase_categories([seg], lang)[seg]
+
+    def _phrase_categories(
+        self,
+        segments: List[str],
+        lang: str,
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """Phrase category of each distinct segment, parsing them in one ``nlp.pipe`` pass."""
+        segments = list(dict.fromkeys(segments))
+        if not segments:
+            return {}
         nlp_parser = _get_spacy_nlp_parser()
         if nlp_parser is not None and hasattr(nlp_parser, "pipe_names") and "parser" in nlp_parser.pipe_names:
-            doc = nlp_parser(seg)
-            roots = [tok for tok in doc if tok.dep_ == "ROOT" or tok.head == tok]
-            root_tok = roots[0] if roots else doc[0]
-
-            # A determiner or possessive attaches only to a nominal head, so the
-            # dependency structure identifies a noun phrase even when the tagger
-            # mislabels the head itself. It routinely does on bare fragments: in
-            # "a small domesticated feline mammal" spaCy tags "mammal" as JJ, which
-            # would otherwise make a plain noun phrase read as an Adjective Phrase
-            # and raise a spurious definition-coherence warning.
-            if any(child.dep_ in ("det", "poss") for child in root_tok.children):
-                return "Noun Phrase"
-
-            root_raw = root_tok.tag_ or root_tok.pos_
-            norm_pos = self.normalize_tag(root_raw, lang=lang) or root_tok.pos_
-            return self._phrase_category_for_root_pos(norm_pos)
-
+            docs = _pipe(nlp_parser, segments, _PARSING_PIPES,
+                         batch_size or self.PIPE_BATCH_SIZE, n_process or self.PIPE_N_PROCESS)
+            return {seg: self._phrase_category_from_doc(doc, lang) for seg, doc in zip(segments, docs)}
+        return {seg: self._heuristic_phrase_category(seg) for seg in segments}
+
+    def _phrase_category_from_doc(self, doc: Any, lang: str) -> str:
+        roots = [tok for tok in doc if tok.dep_ == "ROOT" or tok.head == tok]
+        root_tok = roots[0] if roots else doc[0]
+
+        # A determiner or possessive attaches only to a nominal head, so the
+        # dependency structure identifies a noun phrase even when the tagger
+        # mislabels the head itself. It routinely does on bare fragments: in
+        # "a small domesticated feline mammal" spaCy tags "mammal" as JJ, which
+        # would otherwise make a plain noun phrase read as an Adjective Phrase
+        # and raise a spurious definition-coherence warning.
+        if any(child.dep_ in ("det", "poss") for child in root_tok.children):
+            return "Noun Phrase"
+
+        root_raw = root_tok.tag_ or root_tok.pos_
+        norm_pos = self.normalize_tag(root_raw, lang=lang) or root_tok.pos_
+        return self._phrase_category_for_root_pos(norm_pos)
+
+    def _heuristic_phrase_category(self, seg: str) -> str:
         # Fallback: no parser available.
         text = seg.strip().lower()
         if text.startswith("to "):
@@ -421,6 +481,15 @@ class POSTaggerService:
                     return self._phrase_category_for_root_pos(pos_cat)
         return "Noun Phrase"
 
+    @staticmethod
+    def _split_definition(definition_text: str, delimiter: Optional[str]) -> List[str]:
+        delim = delimiter if delimiter else ",;"
+        if len(delim) == 1:
+            delim_pattern = rf"{re.escape(delim)}\s*"
+        else:
+            delim_pattern = rf"[{re.escape(delim)}]\s*"
+        return [s.strip() for s in re.split(delim_pattern, definition_text) if s.strip()]
+
     def analyze_definition_phrases(
         self,
         definition_text: str,
@@ -441,45 +510,110 @@ class POSTaggerService:
           the comma-separated segments (it does NOT compare the definition against
           the headword / entry POS).
         """
-        if not definition_text or not definition_text.strip():
-            return {
-                "is_consistent": True,
-                "segments": [],
-                "contradictions": [],
-            }
-
-        # Check CacheService cache first
+        return self.analyze_definition_phrases_batch(
+            [definition_text], lang=lang, expected_pos=expected_pos, delimiter=delimiter
+        )[0]
+
+    def analyze_definition_phrases_batch(
+        self,
+        definitions: List[str],
+        lang: str = "en",
+        expected_pos: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Analyze many definitions; same result per definition as :meth:`analyze_definition_phrases`.
+
+        Cached analyses are served from the in-process LRU (then Redis); the
+        segments of all remaining definitions are parsed in one ``nlp.pipe``
+        pass. Throughput is recorded in ``last_batch_stats``.
+        """
+        started = time.perf_counter()
+        model_id = _model_id(_get_spacy_nlp_parser())
+        results: List[Optional[Dict[str, Any]]] = [None] * len(definitions)
+        pending: Dict[str, List[int]] = {}
+
+        with self._analyses_lock:
+            for i, text in enumerate(definitions):
+                if not text or not text.strip():
+                    results[i] = {"is_consistent": True, "segments": [], "contradictions": []}
+                    continue
+                cached = self._analyses.get((text, lang, expected_pos, delimiter, model_id))
+                if cached is not None:
+                    self._analyses.move_to_end((text, lang, expected_pos, delimiter, model_id))
+                    self._stats["cache_hits"] += 1
+                    results[i] = copy.deepcopy(cached)
+                else:
+                    pending.setdefault(text, []).append(i)
+
+        # Check CacheService cache next
         from app.services.cache_service import CacheService
-        import json
         import hashlib
 
         cache = CacheService()
-        cache_key = None
+        redis_keys: Dict[str, str] = {}
+        analyses: Dict[str, Dict[str, Any]] = {}
         if cache.is_available():
-            h = hashlib.md5(f"{definition_text}:{lang}:{expected_pos}:{delimiter}".encode('utf-8')).hexdigest()
-            cache_key = f"pos_tagger:analysis:{h}"
-            try:
-                cached_val = cache.get(cache_key)
-                if cached_val:
-                    return json.loads(cached_val)
-            except Exception:
-                pass
-
-        delim = delimiter if delimiter else ",;"
-        if len(delim) == 1:
-            delim_pattern = rf"{re.escape(delim)}\s*"
-        else:
-            delim_pattern = rf"[{re.escape(delim)}]\s*"
-
-        segments = [s.strip() for s in re.split(delim_pattern, definition_text) if s.strip()]
+            for text in pending:
+                h = hashlib.md5(f"{text}:{lang}:{expected_pos}:{delimiter}".encode('utf-8')).hexdigest()
+                redis_keys[text] = f"pos_tagger:analysis:{h}"
+                try:
+                    cached_val = cache.get(redis_keys[text])
+                    if cached_val:
+                        analyses[text] = json.loads(cached_val)
+                except Exception:
+                    pass
+
+        segments_by_text = {
+            text: self._split_definition(text, delimiter) for text in pending if text not in analyses
+        }
+        categories = self._phrase_categories(
+            [seg for segments in segments_by_text.values() for seg in segments],
+            lang, batch_size=batch_size, n_process=n_process,
+        )
+        for text, segments in segments_by_text.items():
+            analyses[text] = self._coherence_analysis(segments, categories, expected_pos)
+            if text in redis_keys:
+                try:
+                    cache.set(redis_keys[text], json.dumps(analyses[text]), ttl=86400 * 7)  # Cache for 7 days
+                except Exception:
+                    pass
+
+        with self._analyses_lock:
+            self._stats["cache_misses"] += len(pending)
+            for text, analysis in analyses.items():
+                self._analyses[(text, lang, expected_pos, delimiter, model_id)] = analysis
+            while len(self._analyses) > self.ANALYSIS_CACHE_SIZE:
+                self._analyses.popitem(last=False)
+
+        for text, positions in pending.items():
+            for i in positions:
+                results[i] = copy.deepcopy(analyses[text])
+
+        seconds = time.perf_counter() - started
+        docs = len(categories)
+        self.last_batch_stats = {
+            "definitions": len(definitions),
+            "analyzed": len(segments_by_text),
+            "docs": docs,
+            "seconds": round(seconds, 4),
+            "docs_per_second": round(docs / seconds, 1) if docs and seconds else None,
+        }
+        if docs > 100:
+            logger.info("Parsed %d definition segments in %.2fs (%.0f docs/s)", docs, seconds, docs / seconds)
+        return results  # type: ignore[return-value]
 
-        analyzed_segments = []
-        for seg in segments:
-            phrase_category = self._detect_phrase_category(seg, lang)
-            analyzed_segments.append({
-                "segment_text": seg,
-                "phrase_category": phrase_category,
-            })
+    def _coherence_analysis(
+        self,
+        segments: List[str],
+        categories: Dict[str, str],
+        expected_pos: Optional[str],
+    ) -> Dict[str, Any]:
+        """Compare each segment's phrase category with the reference category."""
+        analyzed_segments = [
+            {"segment_text": seg, "phrase_category": categories[seg]} for seg in segments
+        ]
 
         # Determine the reference phrase category.
         classified = [
@@ -507,7 +641,7 @@ class POSTaggerService:
                     "expected_pos": reference,
                 })
 
-        res = {
+        return {
             "is_consistent": len(contradictions) == 0,
             "reference_phrase_category": reference,
             "expected_pos": reference,
@@ -515,13 +649,17 @@ class POSTaggerService:
             "contradictions": contradictions,
         }
 
-        if cache.is_available() and cache_key:
-            try:
-                cache.set(cache_key, json.dumps(res), ttl=86400 * 7)  # Cache for 7 days
-            except Exception:
-                pass
-
-        return res
+    def clear_analysis_cache(self) -> int:
+        """Forget the in-process definition analyses."""
+        with self._analyses_lock:
+            count = len(self._analyses)
+            self._analyses.clear()
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Analysis cache counters and the throughput of the last batch."""
+        with self._analyses_lock:
+            return {**self._stats, "cached_analyses": len(self._analyses), "last_batch": dict(self.last_batch_stats)}
 
 
 
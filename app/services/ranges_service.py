@@ -14,6 +14,7 @@ from app.database.basex_connector import BaseXConnector
 from app.parsers.lift_parser import LIFTRangesParser
 from app.utils.exceptions import NotFoundError, ValidationError, DatabaseError
 from app.utils.db_utils import safe_commit
+from app.services.rendered_entry_cache import bump_ranges_version
 
 # Human-friendly labels and descriptions for well-known standard ranges.
 # These are used in the Ranges Editor to present readable labels for
@@ -183,6 +184,8 @@ class RangesService:
         project_id (common in the service methods) properly clear the cache.
         """
         db_name = self.db_connector.database or 'dictionary'
+        # Cached entry renders show range labels/abbreviations
+        bump_ranges_version(self.db_connector.database)
         if project_id is None:
             # Remove all cache entries for this db_name
             keys_to_remove = [k for k in list(self._ranges_cache.keys()) if k[0] == db_name]
@@ -0,0 +1,206 @@
+"""
+Reverse-relation index.
+
+Maps a relation target (entry ID) to the entry-level relations that point at
+it, so "who references this entry?" questions (subentries, incoming variants,
+existing-relation checks during discovery) are answered from memory instead of
+full ``collection()//entry[relation[@ref=...]]`` scans.
+
+The index is built from one BaseX query on first use and then maintained
+incrementally by ``DictionaryService`` on create/update/delete. Imports
+invalidate it. Because each worker process holds its own copy, writes made by
+other processes are picked up by a full rebuild once the index is older than
+``max_age_seconds``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RelationRef(NamedTuple):
+    """One entry-level relation, seen from its target."""
+
+    source_id: str
+    relation_type: str
+    traits: Dict[str, str]
+    order: Optional[int] = None
+
+
+class RelationRow(NamedTuple):
+    """One entry-level relation as stored on its source entry."""
+
+    source_id: str
+    relation_type: str
+    target_id: str
+    traits: Dict[str, str]
+    order: Optional[int] = None
+
+
+# Loader signature: given entry IDs (or None for the whole database) return the
+# relation rows of those entries, in document order.
+RelationLoader = Callable[[Optional[List[str]]], Iterable[RelationRow]]
+
+
+class ReverseRelationIndex:
+    """In-memory target ID -> [RelationRef] index for one database."""
+
+    def __init__(self, loader: RelationLoader, max_age_seconds: float = 300.0) -> None:
+        self._loader = loader
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.RLock()
+        self._by_target: Dict[str, List[RelationRef]] = {}
+        self._by_source: Dict[str, List[RelationRow]] = {}
+        self._built_at: Optional[float] = None
+        self._stats = {'builds': 0, 'lookups': 0, 'incremental_updates': 0}
+
+    # ---- Lifecycle ----
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    def invalidate(self) -> None:
+        """Drop the index; it is rebuilt on the next lookup."""
+        with self._lock:
+            self._by_target = {}
+            self._by_source = {}
+            self._built_at = None
+
+    def rebuild(self) -> None:
+        """Rebuild the whole index from the database."""
+        started = time.monotonic()
+        rows = list(self._loader(None))
+        by_target: Dict[str, List[RelationRef]] = {}
+        by_source: Dict[str, List[RelationRow]] = {}
+        for row in rows:
+            by_source.setdefault(row.source_id, []).append(row)
+            by_target.setdefault(row.target_id, []).append(_as_ref(row))
+        with self._lock:
+            self._by_target = by_target
+            self._by_source = by_source
+            self._built_at = time.monotonic()
+            self._stats['builds'] += 1
+        logger.info(
+            "Built reverse-relation index: %d relations from %d entries in %.1f ms",
+            len(rows), len(by_source), (time.monotonic() - started) * 1000,
+        )
+
+    def _ensure_built(self) -> None:
+        built_at = self._built_at
+        if built_at is None or time.monotonic() - built_at > self.max_age_seconds:
+            self.rebuild()
+
+    # ---- Queries ----
+
+    def lookup(self, target_id: str, relation_type: Optional[str] = None) -> List[RelationRef]:
+        """Return relations pointing at ``target_id``, optionally of one type."""
+        self._ensure_built()
+        with self._lock:
+            self._stats['lookups'] += 1
+            refs = list(self._by_target.get(target_id, ()))
+        if relation_type is not None:
+            refs = [ref for ref in refs if ref.relation_type == relation_type]
+        return refs
+
+    def pairs(self, relation_type: str) -> Set[Tuple[str, str]]:
+        """Return all (source, target) pairs of a relation type as sorted tuples."""
+        self._ensure_built()
+        with self._lock:
+            rows = [row for source_rows in self._by_source.values() for row in source_rows]
+        return {
+            tuple(sorted((row.source_id, row.target_id)))
+            for row in rows
+            if row.relation_type == relation_type and row.source_id and row.target_id
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                'built': self.is_built,
+                'sources': len(self._by_source),
+                'targets': len(self._by_target),
+                'age_seconds': round(time.monotonic() - self._built_at, 1) if self._built_at else None,
+            }
+
+    # ---- Incremental maintenance ----
+
+    def update_source(self, source_id: str, rows: Iterable[RelationRow]) -> None:
+        """Replace the relations stored on ``source_id``. No-op until built."""
+        if not self.is_built:
+            return
+        with self._lock:
+            self._remove_source_locked(source_id)
+            new_rows = [row for row in rows if row.target_id]
+            if new_rows:
+                self._by_source[source_id] = new_rows
+                for row in new_rows:
+                    self._by_target.setdefault(row.target_id, []).append(_as_ref(row))
+            self._stats['incremental_updates'] += 1
+
+    def remove_source(self, source_id: str) -> None:
+        """Forget all relations stored on a deleted entry. No-op until built."""
+        if not self.is_built:
+            return
+        with self._lock:
+            self._remove_source_locked(source_id)
+            self._stats['incremental_updates'] += 1
+
+    def reindex_sources(self, source_ids: Iterable[str]) -> None:
+        """Reload relations of the given entries from the database (one query).
+
+        Used for entries modified as a side effect of a save, e.g. reverse
+        relations written by bidirectional relation handling.
+        """
+        ids = sorted({sid for sid in source_ids if sid})
+        if not ids or not self.is_built:
+            return
+        grouped: Dict[str, List[RelationRow]] = {sid: [] for sid in ids}
+        for row in self._loader(ids):
+            grouped.setdefault(row.source_id, []).append(row)
+        for source_id, rows in grouped.items():
+            self.update_source(source_id, rows)
+
+    def _remove_source_locked(self, source_id: str) -> None:
+        old_rows = self._by_source.pop(source_id, None)
+        if not old_rows:
+            return
+        for target_id in {row.target_id for row in old_rows}:
+            remaining = [ref for ref in self._by_target.get(target_id, ()) if ref.source_id != source_id]
+            if remaining:
+                self._by_target[target_id] = remaining
+            else:
+                self._by_target.pop(target_id, None)
+
+
+def _as_ref(row: RelationRow) -> RelationRef:
+    return RelationRef(row.source_id, row.relation_type, row.traits, row.order)
+
+
+def rows_from_entry(entry: Any) -> List[RelationRow]:
+    """Build index rows from an in-memory ``Entry``'s entry-level relations."""
+    rows: List[RelationRow] = []
+    for relation in getattr(entry, 'relations', None) or []:
+        ref = getattr(relation, 'ref', None)
+        if not ref:
+            continue
+        order = getattr(relation, 'order', None)
+        try:
+            order = int(order) if order is not None else None
+        except (TypeError, ValueError):
+            order = None
+        traits = getattr(relation, 'traits', None)
+        rows.append(RelationRow(
+            source_id=str(entry.id),
+            relation_type=str(getattr(relation, 'type', '') or ''),
+            target_id=str(ref),
+            traits=dict(traits) if isinstance(traits, dict) else {},
+            order=order,
+        ))
+    return rows
@@ -0,0 +1,171 @@
+"""
+Relation-target index.
+
+Answers "does this relation target resolve to something in the dictionary?"
+for rule R5.3.1. A target resolves when it is an entry/sense ID or GUID, when
+it is a suffix of one (``abc`` for ``word_abc``), or when one of them is a
+suffix of it. A linear ``endswith`` scan over every ID costs O(number of IDs)
+per relation; here exact IDs live in a set and suffix lookups are a bisect
+over the sorted reversed IDs, so each check is O(len(target) * log n).
+
+The index is built once per validation run from a set of IDs, or per
+database by ``DictionaryService``, which keeps it in step with
+create/update/delete like the reverse-relation index.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+def expand_targets(ids: Iterable[str]) -> Set[str]:
+    """IDs plus the part after their last underscore (the GUID of ``word_guid`` IDs)."""
+    targets = {i for i in ids if i}
+    for target in list(targets):
+        if '_' in target:
+            suffix = target.rsplit('_', 1)[-1]
+            if suffix:
+                targets.add(suffix)
+    return targets
+
+
+def entry_targets(entry: Any) -> Set[str]:
+    """Relation targets contributed by an in-memory ``Entry`` (entry and sense IDs/GUIDs)."""
+    ids = [getattr(entry, 'id', None), getattr(entry, 'guid', None)]
+    for sense in getattr(entry, 'senses', None) or []:
+        if isinstance(sense, dict):
+            ids.extend((sense.get('id'), sense.get('guid')))
+        else:
+            ids.extend((getattr(sense, 'id', None), getattr(sense, 'guid', None)))
+    return expand_targets(str(i) for i in ids if i)
+
+
+class RelationTargetIndex:
+    """Exact and suffix lookups over the relation targets of one database."""
+
+    def __init__(self, targets: Iterable[str] = (), max_age_seconds: Optional[float] = None) -> None:
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.RLock()
+        self._counts: Dict[str, int] = {}
+        self._by_entry: Dict[str, Tuple[str, ...]] = {}
+        self._reversed: List[str] = []
+        self._lengths: List[int] = []
+        self._built_at: Optional[float] = None
+        self._load({}, {target: 1 for target in targets if target})
+
+    @classmethod
+    def from_entries(cls, entries: Dict[str, Iterable[str]],
+                     max_age_seconds: Optional[float] = None) -> 'RelationTargetIndex':
+        """Build from ``{entry_id: targets}`` so entries can later be updated or removed."""
+        index = cls(max_age_seconds=max_age_seconds)
+        by_entry = {entry_id: tuple(sorted(expand_targets(targets))) for entry_id, targets in entries.items()}
+        counts: Dict[str, int] = {}
+        for targets in by_entry.values():
+            for target in targets:
+                counts[target] = counts.get(target, 0) + 1
+        index._load(by_entry, counts)
+        return index
+
+    def _load(self, by_entry: Dict[str, Tuple[str, ...]], counts: Dict[str, int]) -> None:
+        with self._lock:
+            self._by_entry = by_entry
+            self._counts = counts
+            self._reversed = sorted(target[::-1] for target in counts)
+            self._lengths = sorted({len(target) for target in counts})
+            self._built_at = time.monotonic()
+
+    # ---- Lifecycle ----
+
+    @property
+    def is_stale(self) -> bool:
+        return (self.max_age_seconds is not None and self._built_at is not None
+                and time.monotonic() - self._built_at > self.max_age_seconds)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, target: object) -> bool:
+        return target in self._counts
+
+    def ids(self) -> Set[str]:
+        """All indexed targets."""
+        with self._lock:
+            return set(self._counts)
+
+    # ---- Queries ----
+
+    def resolves(self, target: str) -> bool:
+        """True if ``target`` is an indexed ID, a suffix of one, or ends with one."""
+        if not target:
+            return True
+        counts = self._counts
+        if target in counts:
+            return True
+        with self._lock:
+            # Some ID ends with the target: the reversed target is a prefix of a reversed ID.
+            reversed_target = target[::-1]
+            reversed_ids = self._reversed
+            pos = bisect.bisect_left(reversed_ids, reversed_target)
+            if pos < len(reversed_ids) and reversed_ids[pos].startswith(reversed_target):
+                return True
+            # The target ends with some ID: only suffix lengths that occur among IDs can match.
+            for length in self._lengths:
+                if length >= len(target):
+                    break
+                if target[-length:] in counts:
+                    return True
+        return False
+
+    # ---- Incremental maintenance ----
+
+    def set_entry(self, entry_id: str, targets: Iterable[str]) -> None:
+        """Replace the targets contributed by ``entry_id``."""
+        new_targets = tuple(sorted(expand_targets(targets)))
+        with self._lock:
+            self._release(self._by_entry.pop(entry_id, ()))
+            if new_targets:
+                self._by_entry[entry_id] = new_targets
+                for target in new_targets:
+                    self._acquire(target)
+
+    def remove_entry(self, entry_id: str) -> None:
+        """Forget the targets of a deleted entry."""
+        with self._lock:
+            self._release(self._by_entry.pop(entry_id, ()))
+
+    def _acquire(self, target: str) -> None:
+        count = self._counts.get(target, 0)
+        self._counts[target] = count + 1
+        if count:
+            return
+        bisect.insort(self._reversed, target[::-1])
+        pos = bisect.bisect_left(self._lengths, len(target))
+        if pos == len(self._lengths) or self._lengths[pos] != len(target):
+            self._lengths.insert(pos, len(target))
+
+    def _release(self, targets: Iterable[str]) -> None:
+        for target in targets:
+            count = self._counts.get(target, 0)
+            if count > 1:
+                self._counts[target] = count - 1
+                continue
+            if not count:
+                continue
+            del self._counts[target]
+            reversed_target = target[::-1]
+            pos = bisect.bisect_left(self._reversed, reversed_target)
+            if pos < len(self._reversed) and self._reversed[pos] == reversed_target:
+                del self._reversed[pos]
+            # Stale lengths only cost an extra set lookup; they are dropped on rebuild.
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'targets': len(self._counts),
+                'entries': len(self._by_entry),
+                'distinct_lengths': len(self._lengths),
+                'age_seconds': round(time.monotonic() - self._built_at, 1) if self._built_at else None,
+            }
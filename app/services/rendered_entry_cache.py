@@ -0,0 +1,249 @@
+"""
+Rendered-entry HTML cache.
+
+``CSSMappingService.render_entry`` output only changes when the entry, the
+display profile, the LIFT ranges or the headwords of the entries it refers
+to change.  Fragments are stored in ``CacheService`` under a key built from
+the entry ID, its ``dateModified``, a digest of the XML (so unsaved preview
+XML never collides with the stored entry), the profile ID and version, the
+ranges version and any pre-resolved headword map.
+
+Invalidation uses versioned namespaces:
+
+* one namespace per entry, bumped when the entry is saved or deleted;
+* the ranges namespace (``RANGES_NAMESPACE``), bumped whenever ranges are
+  edited;
+* a per-database namespace, bumped after imports and database resets.
+
+Every stored fragment records the relation targets it displayed, in one
+Redis set per target (``SADD``, so concurrent renders never drop each
+other's entries).  When an
+entry's headword (or sense order, which numbers sense references) changes,
+the namespaces of the entries that displayed it are bumped as well.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.services.cache_service import CacheService
+
+logger = logging.getLogger(__name__)
+
+RENDER_NAMESPACE = 'rendered-entry'
+DEPS_PREFIX = 'rendered-entry-dependents'
+RANGES_NAMESPACE = 'ranges'
+
+_ENTRY_TAG = re.compile(r'<(?:[\w.-]+:)?entry\b([^>]*)>')
+_RELATION_REF = re.compile(r'<(?:[\w.-]+:)?relation\b[^>]*?\bref="([^"]+)"')
+_ATTR = r'\b{}="([^"]*)"'
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=12).hexdigest()
+
+
+def entry_identity(entry_xml: str) -> Tuple[Optional[str], str]:
+    """Return (entry id, dateModified) read from the first ``<entry>`` start tag."""
+    match = _ENTRY_TAG.search(entry_xml)
+    if not match:
+        return None, ''
+    attrs = match.group(1)
+    entry_id = re.search(_ATTR.format('id'), attrs)
+    modified = re.search(_ATTR.format('dateModified'), attrs)
+    return (entry_id.group(1) if entry_id else None), (modified.group(1) if modified else '')
+
+
+def relation_refs(entry_xml: str) -> List[str]:
+    """IDs referenced by ``<relation ref="...">`` anywhere in the entry XML."""
+    return list(dict.fromkeys(_RELATION_REF.findall(entry_xml)))
+
+
+def profile_version(profile: Any) -> str:
+    """Digest of every profile setting that affects rendering."""
+    elements = []
+    for elem in getattr(profile, 'elements', None) or []:
+        elements.append([
+            elem.lift_element, elem.display_order, elem.css_class, elem.prefix, elem.suffix,
+            elem.visibility, elem.config, getattr(elem, 'language_filter', None),
+        ])
+    parts = [
+        getattr(profile, 'updated_at', None), getattr(profile, 'name', None),
+        getattr(profile, 'custom_css', None), getattr(profile, 'show_subentries', None),
+        getattr(profile, 'number_senses', None), elements,
+    ]
+    return _digest(json.dumps(parts, default=str, sort_keys=True))
+
+
+def bump_ranges_version(db_name: Optional[str]) -> None:
+    """Invalidate fragments rendered with the previous ranges of ``db_name``."""
+    try:
+        CacheService().bump_namespace(RANGES_NAMESPACE, db_name or 'default')
+    except Exception as e:
+        logger.debug("Could not bump ranges version for %s: %s", db_name, e)
+
+
+class RenderedEntryCache:
+    """Version-keyed cache of rendered entry HTML with dependency invalidation."""
+
+    TTL_SECONDS = 86400
+    MAX_TRACKED_VIEWS = 10000
+    MAX_WARM_ENTRIES = 500
+
+    def __init__(self, cache: Optional[CacheService] = None) -> None:
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._views: Counter = Counter()
+        self._counters = Counter()
+
+    @property
+    def cache(self) -> CacheService:
+        # Resolved lazily: CacheService is a resettable singleton
+        return self._cache if self._cache is not None else CacheService()
+
+    # ---- Keys ----
+
+    def key_for(self, db_name: str, entry_xml: str, profile: Any,
+                headword_map: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """Build the fragment key, or None when the render cannot be cached."""
+        entry_id, modified = entry_identity(entry_xml)
+        profile_id = getattr(profile, 'id', None) or getattr(profile, 'profile_id', None)
+        if not entry_id or profile_id is None:
+            return None
+        cache = self.cache
+        headwords = _digest(json.dumps(sorted(headword_map.items()))) if headword_map else ''
+        return cache.versioned_key(
+            RENDER_NAMESPACE, f"{db_name}:{entry_id}",
+            modified, _digest(entry_xml), profile_id, profile_version(profile),
+            cache.namespace_version(RANGES_NAMESPACE, db_name),
+            cache.namespace_version(RENDER_NAMESPACE, db_name),
+            headwords,
+        )
+
+    # ---- Lookup ----
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        if key is None:
+            self._count('bypassed')
+            return None
+        html = self.cache.get(key)
+        self._count('hits' if html is not None else 'misses')
+        return html
+
+    def put(self, key: Optional[str], db_name: str, entry_xml: str, html: str) -> None:
+        """Store a fragment and record the relation targets it displays."""
+        if key is None or not html:
+            return
+        cache = self.cache
+        if not cache.set(key, html, ttl=self.TTL_SECONDS):
+            return
+        self._count('stored')
+        entry_id, _ = entry_identity(entry_xml)
+        for ref in relation_refs(entry_xml):
+            if ref != entry_id:
+                cache.add_to_set(f"{DEPS_PREFIX}:{db_name}:{ref}", [entry_id], ttl=self.TTL_SECONDS)
+
+    def get_or_render(self, db_name: Optional[str], entry_xml: str, profile: Any,
+                      render: Callable[[], str],
+                      headword_map: Optional[Dict[str, str]] = None) -> str:
+        """Return the cached fragment, rendering and storing it on a miss."""
+        key = self.key_for(db_name, entry_xml, profile, headword_map) if db_name else None
+        html = self.get(key)
+        if html is not None:
+            return html
+        html = render()
+        if not html.startswith('<div class="entry-render-error"'):
+            self.put(key, db_name, entry_xml, html)
+        return html
+
+    # ---- Invalidation ----
+
+    def invalidate_entry(self, db_name: str, entry_id: str, label_changed: bool = True,
+                         sense_ids: Iterable[str] = ()) -> int:
+        """Drop an entry's fragments and, if its label changed, those displaying it.
+
+        Args:
+            db_name: Database the entry lives in.
+            entry_id: The saved or deleted entry.
+            label_changed: Whether its headword or sense order changed.
+            sense_ids: Its sense IDs (other entries may reference those).
+
+        Returns:
+            Number of entry namespaces bumped.
+        """
+        cache = self.cache
+        stale = {entry_id}
+        if label_changed:
+            for ref in [entry_id, *sense_ids]:
+                stale.update(cache.pop_set(f"{DEPS_PREFIX}:{db_name}:{ref}"))
+        for source_id in stale:
+            cache.bump_namespace(RENDER_NAMESPACE, f"{db_name}:{source_id}", ttl=self.TTL_SECONDS)
+        self._count('invalidations', len(stale))
+        return len(stale)
+
+    def invalidate_all(self, db_name: str) -> None:
+        """Drop every fragment rendered from ``db_name``."""
+        self.cache.bump_namespace(RENDER_NAMESPACE, db_name, ttl=self.TTL_SECONDS)
+        self._count('invalidations')
+
+    # ---- Popularity and warming ----
+
+    def record_view(self, entry_id: str) -> None:
+        with self._lock:
+            self._views[entry_id] += 1
+            if len(self._views) > self.MAX_TRACKED_VIEWS:
+                self._views = Counter(dict(self._views.most_common(self.MAX_TRACKED_VIEWS // 2)))
+
+    def most_viewed(self, limit: int = 50) -> List[Tuple[str, int]]:
+        with self._lock:
+            return self._views.most_common(limit)
+
+    def warm(self, render_one: Callable[[str], Any], limit: int = 50) -> Dict[str, Any]:
+        """Render the ``limit`` most-viewed entries so their fragments are cached.
+
+        Args:
+            render_one: Renders one entry by ID through the normal page path.
+            limit: How many of the most-viewed entries to render (at most
+                ``MAX_WARM_ENTRIES``).
+        """
+        limit = min(limit, self.MAX_WARM_ENTRIES)
+        warmed, failed = [], []
+        for entry_id, _ in self.most_viewed(limit):
+            try:
+                render_one(entry_id)
+                warmed.append(entry_id)
+            except Exception as e:
+                logger.warning("Render cache warm-up failed for %s: %s", entry_id, e)
+                failed.append(entry_id)
+        self._count('warmed', len(warmed))
+        return {'warmed': len(warmed), 'failed': failed, 'entries': warmed}
+
+    # ---- Stats ----
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = {name: self._counters[name] for name in
+                     ('hits', 'misses', 'bypassed', 'stored', 'invalidations', 'warmed')}
+            stats['tracked_entries'] = len(self._views)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        stats['cache'] = self.cache.get_prefix_stats().get(RENDER_NAMESPACE, {})
+        return stats
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._counters.clear()
+
+
+# Shared by CSSMappingService and the entry write path
+rendered_entry_cache = RenderedEntryCache()
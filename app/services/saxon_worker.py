@@ -0,0 +1,259 @@
+"""
+Long-lived Saxon worker for XSLT2 Schematron validation.
+
+Running ``java -jar saxon`` per validation pays JVM startup and stylesheet
+compilation on every call. ``SaxonWorker`` starts
+``tools/schematron/SchematronWorker.java`` once, keeps the compiled
+Schematron stylesheet loaded, and exchanges documents over the worker's
+stdin/stdout (length-prefixed frames, see the Java source; stdout is read by
+a thread so timeouts also work where pipes cannot be ``select``-ed, i.e. on
+Windows). Workers are
+shared per (jar, stylesheet) through ``get_saxon_worker`` and stopped at
+interpreter exit.
+
+``split_svrl_by_entry`` maps the SVRL of a batch document (many ``<entry>``
+elements under one root) back to the entries it came from.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import re
+import subprocess
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WORKER_SOURCE = Path(__file__).resolve().parent.parent.parent / 'tools' / 'schematron' / 'SchematronWorker.java'
+
+SVRL_NS = 'http://purl.oclc.org/dsdl/svrl'
+
+# The entry step of an SVRL location in a batch document (ISO skeleton XSLT2
+# notation), e.g. "/lift[1]/entry[12]/..." or
+# "/*:lift[namespace-uri()='ns'][1]/*:entry[namespace-uri()='ns'][12]/...".
+_NS_TEST = r"(?:\[namespace-uri\(\)='[^']*'\])?"
+_ENTRY_STEP = re.compile(rf"^/(?:\*:|Q\{{[^}}]*\}})?[\w.-]+{_NS_TEST}\[1\]/(?:\*:|Q\{{[^}}]*\}})?entry{_NS_TEST}\[(\d+)\]")
+
+
+class SaxonWorkerError(RuntimeError):
+    """The worker could not be started or failed to answer."""
+
+
+class SaxonWorker:
+    """One JVM running SchematronWorker.java over a compiled stylesheet."""
+
+    START_TIMEOUT_SECONDS = 60.0
+
+    def __init__(self, saxon_jar: str, compiled_xsl: str, xmlresolver_jar: Optional[str] = None,
+                 timeout: float = 30.0) -> None:
+        self.saxon_jar = saxon_jar
+        self.compiled_xsl = compiled_xsl
+        self.xmlresolver_jar = xmlresolver_jar
+        self.timeout = timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._chunks: Optional[queue.Queue] = None
+        self._buffer = b''
+        self._stderr: deque = deque(maxlen=50)
+        self._lock = threading.Lock()
+        self._stats = {'starts': 0, 'transforms': 0, 'transform_seconds': 0.0}
+        self._retired = False
+        self.stylesheet_mtime: Optional[float] = None
+
+    def _command(self) -> List[str]:
+        classpath = self.saxon_jar
+        if self.xmlresolver_jar and Path(self.xmlresolver_jar).exists():
+            classpath = f'{classpath}{os.pathsep}{self.xmlresolver_jar}'
+        return ['java', '-cp', classpath, str(WORKER_SOURCE), self.compiled_xsl]
+
+    # ---- Lifecycle ----
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """Start the JVM and wait until the stylesheet is compiled."""
+        self.close()
+        try:
+            process = subprocess.Popen(self._command(), stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                       stderr=subprocess.PIPE)
+        except OSError as e:
+            raise SaxonWorkerError(f"Could not start Saxon worker: {e}") from e
+        self._process = process
+        self._chunks = queue.Queue()
+        self._buffer = b''
+        threading.Thread(target=self._read_stdout, args=(process, self._chunks), daemon=True).start()
+        threading.Thread(target=self._drain_stderr, args=(process,), daemon=True).start()
+        started = time.monotonic()
+        try:
+            header = self._read_line(self.START_TIMEOUT_SECONDS)
+        except SaxonWorkerError as e:
+            self.close()
+            raise SaxonWorkerError(f"Saxon worker failed to start: {e} {self._stderr_tail()}".strip()) from e
+        if header != b'READY':
+            self.close()
+            raise SaxonWorkerError(f"Saxon worker failed to start: {self._stderr_tail() or header!r}")
+        self._stats['starts'] += 1
+        logger.info("Started Saxon worker for %s in %.0f ms", self.compiled_xsl,
+                    (time.monotonic() - started) * 1000)
+
+    def close(self) -> None:
+        """Stop the JVM (it exits when its stdin closes)."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except Exception:
+            process.kill()
+
+    def retire(self) -> None:
+        """Stop for good once a transform in flight is done; later calls go to the shared worker."""
+        with self._lock:
+            self._retired = True
+            self.close()
+
+    def get_stats(self) -> Dict[str, float]:
+        return {**self._stats, 'running': self.is_running}
+
+    # ---- Transforms ----
+
+    def transform(self, xml: str) -> bytes:
+        """Return the SVRL report for one XML document, (re)starting the worker if needed."""
+        payload = xml.encode('utf-8')
+        with self._lock:
+            retired = self._retired
+            if not retired:
+                status, body = self._exchange(payload)
+        if retired:
+            # Replaced after its stylesheet was recompiled
+            return get_saxon_worker(self.saxon_jar, self.compiled_xsl, self.xmlresolver_jar).transform(xml)
+        if status != b'OK':
+            raise SaxonWorkerError(f"Saxon transform failed: {body.decode('utf-8', 'replace')}")
+        return body
+
+    def _exchange(self, payload: bytes) -> Tuple[bytes, bytes]:
+        """Send one document and read the (status, body) answer; the caller holds ``_lock``."""
+        if not self.is_running:
+            self.start()
+        started = time.perf_counter()
+        try:
+            self._process.stdin.write(b'%d\n' % len(payload) + payload)
+            self._process.stdin.flush()
+            status, _, length = self._read_line(self.timeout).partition(b' ')
+            body = self._read_exact(int(length or 0), self.timeout)
+        except (OSError, ValueError, SaxonWorkerError) as e:
+            # A half-read response leaves the pipe out of sync; start afresh next time.
+            self.close()
+            raise SaxonWorkerError(f"Saxon worker failed: {e} {self._stderr_tail()}".strip()) from e
+        self._stats['transforms'] += 1
+        self._stats['transform_seconds'] += time.perf_counter() - started
+        return status, body
+
+    def _read_line(self, timeout: float) -> bytes:
+        deadline = time.monotonic() + timeout
+        while b'\n' not in self._buffer:
+            self._fill(deadline)
+        line, _, self._buffer = self._buffer.partition(b'\n')
+        return line.strip()
+
+    def _read_exact(self, length: int, timeout: float) -> bytes:
+        deadline = time.monotonic() + timeout
+        while len(self._buffer) < length:
+            self._fill(deadline)
+        data, self._buffer = self._buffer[:length], self._buffer[length:]
+        return data
+
+    def _fill(self, deadline: float) -> None:
+        remaining = deadline - time.monotonic()
+        try:
+            if remaining <= 0:
+                raise queue.Empty
+            chunk = self._chunks.get(timeout=remaining)
+        except queue.Empty:
+            raise SaxonWorkerError("timed out waiting for Saxon worker") from None
+        if not chunk:
+            raise SaxonWorkerError("Saxon worker exited")
+        self._buffer += chunk
+
+    @staticmethod
+    def _read_stdout(process: subprocess.Popen, chunks: queue.Queue) -> None:
+        """Move the worker's stdout into ``chunks``; an empty chunk marks its end."""
+        try:
+            for chunk in iter(lambda: process.stdout.read1(65536), b''):
+                chunks.put(chunk)
+        except (OSError, ValueError):
+            pass
+        finally:
+            chunks.put(b'')
+
+    def _drain_stderr(self, process: subprocess.Popen) -> None:
+        for line in iter(process.stderr.readline, b''):
+            self._stderr.append(line.decode('utf-8', 'replace').rstrip())
+
+    def _stderr_tail(self) -> str:
+        return ' | '.join(list(self._stderr)[-5:])
+
+
+_workers: Dict[Tuple[str, str, Optional[str]], SaxonWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_saxon_worker(saxon_jar: str, compiled_xsl: str, xmlresolver_jar: Optional[str] = None) -> SaxonWorker:
+    """Return the shared worker for a Saxon jar and compiled stylesheet.
+
+    A worker whose stylesheet was recompiled since it started is replaced;
+    the old one is stopped after the transform it is running, if any.
+    """
+    key = (saxon_jar, compiled_xsl, xmlresolver_jar)
+    try:
+        mtime = os.stat(compiled_xsl).st_mtime
+    except OSError:
+        mtime = None
+    stale = None
+    with _workers_lock:
+        worker = _workers.get(key)
+        if worker is not None and worker.stylesheet_mtime != mtime:
+            stale, worker = worker, None
+        if worker is None:
+            worker = _workers[key] = SaxonWorker(saxon_jar, compiled_xsl, xmlresolver_jar)
+            worker.stylesheet_mtime = mtime
+    if stale is not None:
+        stale.retire()
+    return worker
+
+
+@atexit.register
+def shutdown_saxon_workers() -> None:
+    """Stop every shared worker."""
+    with _workers_lock:
+        workers = list(_workers.values())
+        _workers.clear()
+    for worker in workers:
+        worker.close()
+
+
+def split_svrl_by_entry(svrl_root, entry_count: int) -> Tuple[Dict[int, list], list]:
+    """Group SVRL ``failed-assert`` elements by 1-based entry position in a batch document.
+
+    Returns ``(by_position, unplaced)``; asserts whose location is not inside
+    an ``entry`` child of the root end up in ``unplaced``.
+    """
+    by_position: Dict[int, list] = {}
+    unplaced: list = []
+    for failed in svrl_root.iter(f'{{{SVRL_NS}}}failed-assert'):
+        match = _ENTRY_STEP.match(failed.get('location') or '')
+        position = int(match.group(1)) if match else 0
+        if 1 <= position <= entry_count:
+            by_position.setdefault(position, []).append(failed)
+        else:
+            unplaced.append(failed)
+    return by_position, unplaced
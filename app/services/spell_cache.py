@@ -0,0 +1,139 @@
+"""
+Spell-check verdict cache.
+
+Hunspell ``spell()`` and especially ``suggest()`` are called word by word for
+every field of every entry, while the same tokens recur across thousands of
+entries. ``SpellVerdictCache`` remembers the verdict and suggestions per
+(dictionary, language, word) in one bounded LRU shared by the validation
+engine and the Hunspell validators.
+
+A dictionary is identified by its loaded Hunspell instance: reloading a
+dictionary (after an upload, or when ``DictionaryLoader`` drops its cached
+instances) yields a new instance and therefore a fresh set of verdicts.
+Cached instances are pinned so their ``id()`` cannot be reused, and
+``forget()`` releases one together with its verdicts.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+class SpellVerdictCache:
+    """Bounded LRU of Hunspell verdicts and suggestions."""
+
+    def __init__(self, max_entries: int = 100_000) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # (id(dictionary), lang, word) -> [verdict, suggestions or None]
+        self._entries: 'OrderedDict[Tuple[int, str, str], list]' = OrderedDict()
+        self._dictionaries: Dict[int, Any] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'spell_calls': 0, 'suggest_calls': 0, 'evictions': 0}
+
+    # ---- Lookups ----
+
+    def spell(self, hunspell: Any, word: str, lang: str = '') -> bool:
+        """``hunspell.spell(word)``, cached."""
+        return self.spell_many(hunspell, (word,), lang)[word]
+
+    def suggest(self, hunspell: Any, word: str, lang: str = '') -> List[str]:
+        """``hunspell.suggest(word)``, cached (callers slice the list)."""
+        self.spell(hunspell, word, lang)  # make sure the word has an entry to attach suggestions to
+        with self._lock:
+            key = self._key(hunspell, lang, word)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None:
+                self._entries.move_to_end(key)
+                return entry[1]
+        suggestions = list(hunspell.suggest(word)) if hasattr(hunspell, 'suggest') else []
+        with self._lock:
+            self._stats['suggest_calls'] += 1
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[1] = suggestions
+        return suggestions
+
+    def spell_many(self, hunspell: Any, words: Iterable[str], lang: str = '') -> Dict[str, bool]:
+        """Verdicts for many words; each distinct uncached word reaches Hunspell once."""
+        verdicts: Dict[str, bool] = {}
+        missing: List[str] = []
+        with self._lock:
+            for word in words:
+                if word in verdicts:
+                    continue
+                key = self._key(hunspell, lang, word)
+                entry = self._entries.get(key)
+                if entry is None:
+                    verdicts[word] = False
+                    missing.append(word)
+                else:
+                    self._entries.move_to_end(key)
+                    verdicts[word] = entry[0]
+                    self._stats['hits'] += 1
+        if not missing:
+            return verdicts
+        checked = [(word, bool(hunspell.spell(word))) for word in missing]
+        with self._lock:
+            self._stats['misses'] += len(checked)
+            self._stats['spell_calls'] += len(checked)
+            for word, verdict in checked:
+                verdicts[word] = verdict
+                self._store(self._key(hunspell, lang, word), [verdict, None])
+        return verdicts
+
+    def _key(self, hunspell: Any, lang: str, word: str) -> Tuple[int, str, str]:
+        dictionary_id = id(hunspell)
+        if dictionary_id not in self._dictionaries:
+            self._dictionaries[dictionary_id] = hunspell
+        return dictionary_id, lang or '', word
+
+    def _store(self, key: Tuple[int, str, str], entry: list) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    # ---- Invalidation ----
+
+    def forget(self, hunspell: Optional[Any]) -> int:
+        """Drop the verdicts of one dictionary instance and unpin it."""
+        if hunspell is None:
+            return 0
+        dictionary_id = id(hunspell)
+        with self._lock:
+            if self._dictionaries.get(dictionary_id) is not hunspell:
+                return 0
+            del self._dictionaries[dictionary_id]
+            stale = [key for key in self._entries if key[0] == dictionary_id]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._dictionaries.clear()
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['misses']
+            return {
+                **self._stats,
+                'entries': len(self._entries),
+                'dictionaries': len(self._dictionaries),
+                'hit_rate': round(self._stats['hits'] / lookups, 3) if lookups else None,
+            }
+
+
+# Singleton instance
+spell_verdict_cache = SpellVerdictCache()
+
+
+def get_spell_verdict_cache() -> SpellVerdictCache:
+    """Get the global spell verdict cache."""
+    return spell_verdict_cache
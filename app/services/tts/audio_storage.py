@@ -160,9 +160,19 @@ def migrate_legacy_audio(
     if not static_audio.is_dir():
         return 0
 
+    # Runs on every app start: skip the directory scan when the legacy dir has
+    # not changed (its mtime moves whenever a file is added) since the last pass.
+    target = get_project_audio_dir("dictionary")
+    marker = target / ".legacy_audio_migrated"
+    stamp = f"{static_audio.resolve()}:{static_audio.stat().st_mtime_ns}"
+    try:
+        if marker.read_text(encoding="utf-8") == stamp:
+            return 0
+    except OSError:
+        pass
+
     # Only carry over audio files; skip anything else that may have landed there.
     audio_extensions = {".mp3", ".wav", ".ogg", ".opus", ".m4a", ".aac", ".flac", ".webm"}
-    target = get_project_audio_dir("dictionary")
     copied = 0
     for src in static_audio.iterdir():
         if not src.is_file():
@@ -182,4 +192,8 @@ def migrate_legacy_audio(
             logger.warning("Failed to migrate legacy audio %s: %s", src, e)
     if copied:
         logger.info("Migrated %d legacy audio file(s) to %s", copied, target)
+    try:
+        marker.write_text(stamp, encoding="utf-8")
+    except OSError as e:
+        logger.debug("Could not record legacy audio migration: %s", e)
     return copied
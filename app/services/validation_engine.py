@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import copy
 import json
+import logging
 import os
 import re
 import threading
@@ -24,6 +25,9 @@ import jsonpath_ng
 import jsonschema
 from flasgger import swag_from
 
+from app.services.relation_target_index import RelationTargetIndex
+from app.services.validation_plan import EntryView, ValidationPlan
+
 
 class ValidationPriority(Enum):
     """Validation rule priority levels."""
@@ -100,13 +104,50 @@ class ValidationEngine:
     # Guards mutation of the shared class-level caches below.
     _rules_lock = threading.Lock()
 
+    # Compiled execution plans keyed by (id() of the rules dictionary, engine class)
+    _plan_cache: dict[tuple, ValidationPlan] = {}
+    MAX_CACHED_PLANS = 32
+
+    # custom_function name -> (method name, whether it takes the JSONPath matches)
+    _CUSTOM_VALIDATORS: Dict[str, tuple] = {
+        'validate_sense_content_or_variant': ('_validate_sense_content_or_variant', False),
+        'validate_sense_required_non_variant': ('_validate_sense_required_non_variant', False),
+        'validate_unique_note_types': ('_validate_unique_note_types', False),
+        'validate_note_content': ('_validate_note_content', True),
+        'validate_synonym_antonym_exclusion': ('_validate_synonym_antonym_exclusion', False),
+        'validate_subsense_depth': ('_validate_subsense_depth', False),
+        'validate_unique_languages_in_multitext': ('_validate_unique_languages_in_multitext', False),
+        'validate_language_codes': ('_validate_language_codes', True),
+        'validate_language_code_format': ('_validate_language_code_format', True),
+        'validate_pronunciation_language_codes': ('_validate_pronunciation_language_codes', True),
+        'validate_date_fields': ('_validate_date_fields', True),
+        'validate_definition_content_source_lang_exception': ('_validate_definition_content_source_lang_exception', True),
+        'validate_multilingual_note_structure': ('_validate_multilingual_note_structure', True),
+        'validate_pos_consistency': ('_validate_pos_consistency', True),
+        'validate_definition_phrase_coherence': ('_validate_definition_phrase_coherence', True),
+        'validate_conflicting_pos': ('_validate_conflicting_pos', True),
+        'validate_no_circular_components': ('_validate_no_circular_components', True),
+        'validate_no_circular_sense_relations': ('_validate_no_circular_sense_relations', True),
+        'validate_no_circular_entry_relations': ('_validate_no_circular_entry_relations', True),
+        'validate_relation_targets_exist': ('_validate_relation_targets_exist', False),
+        'validate_ipa_characters': ('_validate_ipa_characters', True),
+        'validate_no_double_stress': ('_validate_no_double_stress', True),
+        'validate_no_double_length': ('_validate_no_double_length', True),
+        'validate_hunspell_spelling': ('_validate_hunspell_spelling', True),
+        'validate_redundant_variants_allomorphs': ('_validate_redundant_variants_allomorphs', False),
+        'validate_duplicate_allomorphs': ('_validate_duplicate_allomorphs', False),
+        'validate_duplicate_variant_relations': ('_validate_duplicate_variant_relations', False),
+        'validate_redundant_gloss': ('_validate_redundant_gloss', False),
+        'validate_ipa_anomaly_detection': ('_validate_ipa_anomaly_detection', True),
+    }
+
     def __init__(
         self,
         rules_file: Optional[str] = None,
         project_config: Optional[Dict[str, Any]] = None,
         project_id: Optional[str] = None,
         project_rules: Optional[Dict[str, Dict[str, Any]]] = None,
-        existing_entry_ids: Optional[Set[str]] = None
+        existing_entry_ids: Optional[Union[Set[str], RelationTargetIndex]] = None
     ):
         """
         Initialize the validation engine.
@@ -116,14 +157,19 @@ class ValidationEngine:
             project_config: Optional project configuration with source/target languages
             project_id: Optional project identifier for loading project-specific rules
             project_rules: Optional pre-loaded project-specific rules dict
-            existing_entry_ids: Optional set of existing entry IDs for relation target validation
+            existing_entry_ids: Optional set of existing entry IDs (or a prebuilt
+                RelationTargetIndex) for relation target validation
         """
         self.rules_file = rules_file or "validation_rules.json"
         self.project_config = project_config or {}
         self.project_id = project_id
 
-        # Store existing entry IDs for relation target validation
+        # Store existing entry IDs for relation target validation; a plain set is
+        # indexed on the first relation check.
         self._existing_entry_ids = existing_entry_ids
+        self._relation_targets: Optional[RelationTargetIndex] = (
+            existing_entry_ids if isinstance(existing_entry_ids, RelationTargetIndex) else None
+        )
 
         # Always reload rules to ensure validation_mode changes are picked up
         self._load_rules(project_rules=project_rules)
@@ -294,9 +340,39 @@ class ValidationEngine:
         """
         cls._project_rules_cache[project_id] = rules
 
+    def get_plan(self) -> ValidationPlan:
+        """Compiled execution plan for this engine's rule set.
+
+        Plans are shared between engines that use the same rules dictionary
+        (the default rules are loaded once into the class cache). Loading
+        rules always creates a new dictionary, so a reload gets a new plan;
+        code that edits ``self.rules`` in place must call ``reset_plan``.
+        """
+        rules = self.rules
+        key = (id(rules), type(self))
+        cached = ValidationEngine._plan_cache.get(key)
+        if cached is not None and cached.rules is rules:
+            return cached
+        plan = ValidationPlan(rules, type(self))
+        with ValidationEngine._rules_lock:
+            if len(ValidationEngine._plan_cache) >= self.MAX_CACHED_PLANS:
+                ValidationEngine._plan_cache.pop(next(iter(ValidationEngine._plan_cache)))
+            ValidationEngine._plan_cache[key] = plan
+        return plan
+
+    @classmethod
+    def reset_plan(cls) -> None:
+        """Drop compiled plans (after editing a loaded rules dictionary in place)."""
+        with cls._rules_lock:
+            cls._plan_cache.clear()
+
     def validate_json(self, data: Dict[str, Any], validation_mode: str = "save", rule_id_filter: Optional[str] = None) -> ValidationResult:
         """
         Validate JSON data against all applicable rules.
+
+        Rules run through the compiled plan of the current rule set (see
+        ``app.services.validation_plan``), which gives the same results as
+        applying each rule with ``_apply_rule``.
         
         Args:
             data: Dictionary representing entry data from form
@@ -309,35 +385,21 @@ class ValidationEngine:
         errors: List[ValidationError] = []
         warnings: List[ValidationError] = []
         info: List[ValidationError] = []
-        
-        for rule_id, rule_config in self.rules.items():
-            if rule_id_filter and rule_id != rule_id_filter:
-                continue
-                
-            # Skip server-side only rules if this is client-side validation
-            if not rule_config.get('client_side', True):
-                continue
-                
-            # Check validation mode restrictions
-            rule_mode = rule_config.get('validation_mode', 'all')
-            if rule_mode == 'save_only' and validation_mode in ['delete', 'draft']:
-                continue
-            elif rule_mode == 'delete_only' and validation_mode != 'delete':
-                continue
-            elif rule_mode == 'draft_only' and validation_mode not in ['draft', 'all']:
+
+        view = EntryView(data)
+        for rule in self.get_plan().rules_for(validation_mode):
+            if rule_id_filter and rule.rule_id != rule_id_filter:
                 continue
-                
-            validation_errors = self._apply_rule(rule_id, rule_config, data)
-            
+
             # Categorize errors by priority
-            for error in validation_errors:
+            for error in rule.apply(self, data, view):
                 if error.priority == ValidationPriority.CRITICAL:
                     errors.append(error)
                 elif error.priority == ValidationPriority.WARNING:
                     warnings.append(error)
                 else:
                     info.append(error)
-        
+
         is_valid = len(errors) == 0
         return ValidationResult(is_valid, errors, warnings, info)
     
@@ -424,16 +486,21 @@ class ValidationEngine:
                 
         except Exception as e:
             # Log validation rule application error
-            errors.append(ValidationError(
-                rule_id=rule_id,
-                rule_name=rule_config.get('name', 'unknown'),
-                message=f"Error applying validation rule: {str(e)}",
-                path="",
-                priority=ValidationPriority.CRITICAL,
-                category=ValidationCategory.ENTRY_LEVEL
-            ))
+            errors.append(self._rule_application_error(rule_id, rule_config, e))
         
         return errors
+
+    @staticmethod
+    def _rule_application_error(rule_id: str, rule_config: Dict[str, Any], exc: Exception) -> ValidationError:
+        """Error reported when a rule itself fails to run."""
+        return ValidationError(
+            rule_id=rule_id,
+            rule_name=rule_config.get('name', 'unknown'),
+            message=f"Error applying validation rule: {str(exc)}",
+            path="",
+            priority=ValidationPriority.CRITICAL,
+            category=ValidationCategory.ENTRY_LEVEL
+        )
     
     def validate_entry(self, entry_data: Union[Dict[str, Any], Any], validation_mode: str = "save") -> ValidationResult:
         """
@@ -659,8 +726,10 @@ class ValidationEngine:
                 loader = get_dictionary_loader()
                 hunspell = loader.load_system_dictionary(lang_code)
 
-                if hunspell and not hunspell.spell(word):
-                    return False  # Misspelling found
+                if hunspell:
+                    from app.services.spell_cache import get_spell_verdict_cache
+                    if not get_spell_verdict_cache().spell(hunspell, word, lang_code):
+                        return False  # Misspelling found
 
         return True
 
@@ -738,66 +807,16 @@ class ValidationEngine:
         """Apply custom validation functions."""
         errors: List[ValidationError] = []
         custom_function = rule_config['validation'].get('custom_function')
-        
-        if custom_function == 'validate_sense_content_or_variant':
-            errors.extend(self._validate_sense_content_or_variant(rule_id, rule_config, data))
-        elif custom_function == 'validate_sense_required_non_variant':
-            errors.extend(self._validate_sense_required_non_variant(rule_id, rule_config, data))
-        elif custom_function == 'validate_unique_note_types':
-            errors.extend(self._validate_unique_note_types(rule_id, rule_config, data))
-        elif custom_function == 'validate_note_content':
-            errors.extend(self._validate_note_content(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_synonym_antonym_exclusion':
-            errors.extend(self._validate_synonym_antonym_exclusion(rule_id, rule_config, data))
-        elif custom_function == 'validate_subsense_depth':
-            errors.extend(self._validate_subsense_depth(rule_id, rule_config, data))
-        elif custom_function == 'validate_unique_languages_in_multitext':
-            errors.extend(self._validate_unique_languages_in_multitext(rule_id, rule_config, data))
-        elif custom_function == 'validate_language_codes':
-            errors.extend(self._validate_language_codes(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_language_code_format':
-            errors.extend(self._validate_language_code_format(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_pronunciation_language_codes':
-            errors.extend(self._validate_pronunciation_language_codes(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_date_fields':
-            errors.extend(self._validate_date_fields(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_definition_content_source_lang_exception':
-            errors.extend(self._validate_definition_content_source_lang_exception(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_multilingual_note_structure':
-            errors.extend(self._validate_multilingual_note_structure(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_pos_consistency':
-            errors.extend(self._validate_pos_consistency(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_definition_phrase_coherence':
-            errors.extend(self._validate_definition_phrase_coherence(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_conflicting_pos':
-
-            errors.extend(self._validate_conflicting_pos(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_no_circular_components':
-            errors.extend(self._validate_no_circular_components(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_no_circular_sense_relations':
-            errors.extend(self._validate_no_circular_sense_relations(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_no_circular_entry_relations':
-            errors.extend(self._validate_no_circular_entry_relations(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_relation_targets_exist':
-            errors.extend(self._validate_relation_targets_exist(rule_id, rule_config, data))
-        elif custom_function == 'validate_ipa_characters':
-            errors.extend(self._validate_ipa_characters(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_no_double_stress':
-            errors.extend(self._validate_no_double_stress(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_no_double_length':
-            errors.extend(self._validate_no_double_length(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_hunspell_spelling':
-            errors.extend(self._validate_hunspell_spelling(rule_id, rule_config, data, matches))
-        elif custom_function == 'validate_redundant_variants_allomorphs':
-            errors.extend(self._validate_redundant_variants_allomorphs(rule_id, rule_config, data))
-        elif custom_function == 'validate_duplicate_allomorphs':
-            errors.extend(self._validate_duplicate_allomorphs(rule_id, rule_config, data))
-        elif custom_function == 'validate_duplicate_variant_relations':
-            errors.extend(self._validate_duplicate_variant_relations(rule_id, rule_config, data))
-        elif custom_function == 'validate_redundant_gloss':
-            errors.extend(self._validate_redundant_gloss(rule_id, rule_config, data))
-        elif custom_function == 'validate_ipa_anomaly_detection':
-            errors.extend(self._validate_ipa_anomaly_detection(rule_id, rule_config, data, matches))
+        handler = self._CUSTOM_VALIDATORS.get(custom_function)
+        if handler is None:
+            return errors
+
+        method_name, takes_matches = handler
+        method = getattr(self, method_name)
+        if takes_matches:
+            errors.extend(method(rule_id, rule_config, data, matches))
+        else:
+            errors.extend(method(rule_id, rule_config, data))
 
         return errors
 
@@ -1627,10 +1646,18 @@ class ValidationEngine:
             return True
         if target in existing_ids:
             return True
-        for eid in existing_ids:
-            if eid.endswith(target) or target.endswith(eid):
-                return True
-        return False
+        return self._relation_target_index(existing_ids).resolves(target)
+
+    def _relation_target_index(self, existing_ids: Union[Set[str], RelationTargetIndex]) -> RelationTargetIndex:
+        """Suffix index over ``existing_ids``, built once per engine."""
+        if isinstance(existing_ids, RelationTargetIndex):
+            return existing_ids
+        index = self._relation_targets
+        if index is None or existing_ids is not self._existing_entry_ids:
+            index = RelationTargetIndex(existing_ids)
+            if existing_ids is self._existing_entry_ids:
+                self._relation_targets = index
+        return index
 
 
     def _validate_ipa_characters(self, rule_id: str, rule_config: Dict[str, Any],
@@ -1820,6 +1847,38 @@ class ValidationEngine:
         """
         errors: List[ValidationError] = []
 
+        service = self._ipa_anomaly_service(rule_config)
+        if service is None:
+            return errors
+
+        # An entry has few pronunciations; batching across entries happens in
+        # warm_ipa_anomaly_cache(), whose results detect() then reads from cache.
+        for lang_code, headword, pron_value in self._ipa_anomaly_targets(rule_config, data):
+            result = service.detect(headword, pron_value)
+            if result is None or not result['is_anomaly']:
+                continue
+
+            message = (
+                f"Pronunciation anomaly: stored IPA '{pron_value}' diverges from "
+                f"the model-predicted pronunciation "
+                f"'{result['predicted_ipa']}' "
+                f"(confidence {result['confidence_score']:.2f}, "
+                f"type {result['anomaly_type']})."
+            )
+            errors.append(ValidationError(
+                rule_id=rule_id,
+                rule_name=rule_config['name'],
+                message=message,
+                path=f"$.pronunciations.{lang_code}",
+                priority=ValidationPriority(rule_config['priority']),
+                category=ValidationCategory(rule_config['category']),
+                value=pron_value
+            ))
+
+        return errors
+
+    def _ipa_anomaly_service(self, rule_config: Dict[str, Any]) -> Optional[Any]:
+        """The IPAAnomalyService for an R4.3.1 rule config, or None if no model is available."""
         validation = rule_config.get('validation', {}) or {}
         ipa_ws = validation.get('ipa_ws') or 'seh-fonipa'
         threshold = validation.get('confidence_threshold')
@@ -1835,13 +1894,17 @@ class ValidationEngine:
             from app.services.ipa_anomaly_service import IPAAnomalyService
         except Exception as exc:  # pragma: no cover - import edge cases
             self.logger.debug("IPA anomaly service import failed: %s", exc)
-            return errors
+            return None
 
         service = IPAAnomalyService.get_instance(
             ipa_ws=ipa_ws, confidence_threshold=threshold
         )
-        if not service.is_available():
-            return errors
+        return service if service.is_available() else None
+
+    @staticmethod
+    def _ipa_anomaly_targets(rule_config: Dict[str, Any], data: Dict[str, Any]) -> List[tuple]:
+        """(writing system, headword, stored IPA) pairs an R4.3.1 rule checks in an entry."""
+        ipa_ws = (rule_config.get('validation', {}) or {}).get('ipa_ws') or 'seh-fonipa'
 
         # Resolve the headword (grapheme) used to predict the pronunciation.
         lexical_unit = data.get('lexical_unit') or {}
@@ -1853,40 +1916,42 @@ class ValidationEngine:
         elif isinstance(lexical_unit, str):
             headword = lexical_unit
         if not headword:
-            return errors
+            return []
 
         pronunciations = data.get('pronunciations') or {}
         if not isinstance(pronunciations, dict):
-            return errors
+            return []
 
-        for lang_code, pron_value in pronunciations.items():
-            if lang_code != ipa_ws:
-                continue
-            if not isinstance(pron_value, str) or not pron_value.strip():
-                continue
+        return [
+            (lang_code, headword, pron_value)
+            for lang_code, pron_value in pronunciations.items()
+            if lang_code == ipa_ws and isinstance(pron_value, str) and pron_value.strip()
+        ]
 
-            result = service.detect(headword, pron_value)
-            if result is None or not result['is_anomaly']:
-                continue
+    def warm_ipa_anomaly_cache(self, entries: List[Dict[str, Any]], validation_mode: str = 'save') -> int:
+        """Run the IPA anomaly model over the pronunciations of many entries in batches.
 
-            message = (
-                f"Pronunciation anomaly: stored IPA '{pron_value}' diverges from "
-                f"the model-predicted pronunciation "
-                f"'{result['predicted_ipa']}' "
-                f"(confidence {result['confidence_score']:.2f}, "
-                f"type {result['anomaly_type']})."
-            )
-            errors.append(ValidationError(
-                rule_id=rule_id,
-                rule_name=rule_config['name'],
-                message=message,
-                path=f"$.pronunciations.{lang_code}",
-                priority=ValidationPriority(rule_config['priority']),
-                category=ValidationCategory(rule_config['category']),
-                value=pron_value
-            ))
+        Fills the ``IPAAnomalyService`` result cache, so validating the
+        entries afterwards does not run the model per entry.
 
-        return errors
+        Returns:
+            Number of headword/IPA pairs checked
+        """
+        checked = 0
+        for rule in self.get_plan().rules_for(validation_mode):
+            if not rule.custom or getattr(rule.custom[0], '__name__', '') != '_validate_ipa_anomaly_detection':
+                continue
+            service = self._ipa_anomaly_service(rule.config)
+            if service is None:
+                continue
+            pairs = [
+                (headword, pron_value)
+                for data in entries
+                for _, headword, pron_value in self._ipa_anomaly_targets(rule.config, data)
+            ]
+            service.detect_many(pairs)
+            checked += len(pairs)
+        return checked
 
     def _validate_definition_phrase_coherence(
         self,
@@ -1910,18 +1975,7 @@ class ValidationEngine:
         tagger = get_pos_tagger_service()
 
         for i, match in enumerate(matches):
-            sense = match.value if hasattr(match, "value") else match
-            if not isinstance(sense, dict):
-                continue
-
-            definitions = sense.get("definition") or sense.get("gloss") or {}
-            def_texts = []
-            if isinstance(definitions, dict):
-                def_texts = [str(v) for v in definitions.values() if v]
-            elif isinstance(definitions, str):
-                def_texts = [definitions]
-
-            for def_str in def_texts:
+            for def_str in self._definition_texts(match):
                 analysis = tagger.analyze_definition_phrases(
                     def_str,
                     delimiter=delimiter,
@@ -1950,6 +2004,53 @@ class ValidationEngine:
 
         return errors
 
+    @staticmethod
+    def _definition_texts(match: Any) -> List[str]:
+        """Definition (or gloss) strings of a sense matched by a definition-coherence rule."""
+        sense = match.value if hasattr(match, "value") else match
+        if not isinstance(sense, dict):
+            return []
+
+        definitions = sense.get("definition") or sense.get("gloss") or {}
+        if isinstance(definitions, dict):
+            return [str(v) for v in definitions.values() if v]
+        if isinstance(definitions, str):
+            return [definitions]
+        return []
+
+    def warm_definition_phrase_cache(self, entries: List[Dict[str, Any]],
+                                     validation_mode: str = 'save') -> Dict[str, Any]:
+        """Analyze the definitions of many entries in one ``nlp.pipe`` pass per rule.
+
+        Fills the POS tagger's analysis cache, so the definition-coherence rule
+        does not parse definitions one by one while validating the entries.
+
+        Returns:
+            The tagger's ``last_batch_stats`` (``docs``, ``seconds``,
+            ``docs_per_second``, ...) summed over the rules
+        """
+        from app.services.pos_tagger_service import get_pos_tagger_service
+
+        tagger = get_pos_tagger_service()
+        totals: Dict[str, Any] = {'definitions': 0, 'docs': 0, 'seconds': 0.0}
+        for rule in self.get_plan().rules_for(validation_mode):
+            if not rule.custom or getattr(rule.custom[0], '__name__', '') != '_validate_definition_phrase_coherence':
+                continue
+            delimiter = rule.config.get('validation', {}).get('delimiter', ',')
+            texts: Dict[str, None] = {}
+            for data in entries:
+                try:
+                    matches = EntryView(data).find(rule.path)
+                except Exception:
+                    continue
+                for match in matches:
+                    texts.update(dict.fromkeys(self._definition_texts(match)))
+            tagger.analyze_definition_phrases_batch(list(texts), delimiter=delimiter)
+            for key in totals:
+                totals[key] += tagger.last_batch_stats.get(key) or 0
+        totals['docs_per_second'] = round(totals['docs'] / totals['seconds'], 1) if totals['docs'] else None
+        return totals
+
 
     def _get_hunspell_for_language(self, lang_code: str) -> Optional[Any]:
         """Get hunspell dictionary for a language code with fallback logic.
@@ -2000,10 +2101,39 @@ class ValidationEngine:
         - ignoreWords: List of words to ignore
         - targetField: JSONPath to the field to validate (if matches not provided)
 
+        Verdicts and suggestions come from the shared SpellVerdictCache.
+
         Returns list of ValidationError for any misspellings found.
         """
-        import re
+        from app.services.spell_cache import get_spell_verdict_cache
         errors: List[ValidationError] = []
+        spell_cache = get_spell_verdict_cache()
+        error_message = rule_config.get('error_message', 'Spelling error detected')
+
+        for match, target_lang, hunspell, words in self._hunspell_targets(rule_config, matches):
+            verdicts = spell_cache.spell_many(hunspell, words, target_lang)
+            for word in words:
+                # Check spelling
+                if not verdicts[word]:
+                    # Get suggestions
+                    suggestions = spell_cache.suggest(hunspell, word, target_lang)[:3]
+                    suggestion_text = f" (suggestions: {', '.join(suggestions)})" if suggestions else ""
+
+                    errors.append(ValidationError(
+                        rule_id=rule_id,
+                        rule_name=rule_config['name'],
+                        message=f"{error_message}: '{word}'{suggestion_text}",
+                        path=str(match.full_path),
+                        priority=ValidationPriority(rule_config.get('priority', 'warning')),
+                        category=ValidationCategory(rule_config.get('category', 'language_validation')),
+                        value=word
+                    ))
+
+        return errors
+
+    def _hunspell_targets(self, rule_config: Dict[str, Any], matches: List[Any]):
+        """Yield (match, language, hunspell, words to check) for a spelling rule's matches."""
+        import re
 
         # Get configuration
         validation_config = rule_config.get('validation', {})
@@ -2011,7 +2141,6 @@ class ValidationEngine:
         auto_detect = validation_config.get('auto_detect_languages', True)  # Default to True for multilingual
         min_word_length = validation_config.get('minWordLength', 3)
         ignore_words = validation_config.get('ignoreWords', [])
-        error_message = rule_config.get('error_message', 'Spelling error detected')
 
         # Build ignore set for fast lookup
         ignore_set = {w.lower() for w in ignore_words}
@@ -2055,34 +2184,54 @@ class ValidationEngine:
 
             # Extract words (Unicode-aware so non-ASCII scripts like Polish are not
             # shattered into ASCII shards that then fail an English spell-check)
-            words = re.findall(r"[^\W\d_]+(?:'[^\W\d_]+)?", value)
-
-            for word in words:
-                word_lower = word.lower()
-
+            words = [
+                word for word in re.findall(r"[^\W\d_]+(?:'[^\W\d_]+)?", value)
                 # Skip short words and ignored words
-                if len(word_lower) < min_word_length:
-                    continue
-                if word_lower in ignore_set:
-                    continue
+                if len(word.lower()) >= min_word_length and word.lower() not in ignore_set
+            ]
+            if words:
+                yield match, target_lang, hunspell, words
 
-                # Check spelling
-                if not hunspell.spell(word):
-                    # Get suggestions
-                    suggestions = hunspell.suggest(word)[:3]
-                    suggestion_text = f" (suggestions: {', '.join(suggestions)})" if suggestions else ""
+    def warm_spelling_cache(self, entries: List[Dict[str, Any]], validation_mode: str = 'save') -> Dict[str, int]:
+        """Check the distinct tokens of many entries against Hunspell in one pass.
 
-                    errors.append(ValidationError(
-                        rule_id=rule_id,
-                        rule_name=rule_config['name'],
-                        message=f"{error_message}: '{word}'{suggestion_text}",
-                        path=str(match.full_path),
-                        priority=ValidationPriority(rule_config.get('priority', 'warning')),
-                        category=ValidationCategory(rule_config.get('category', 'language_validation')),
-                        value=word
-                    ))
+        Collects every word the spelling rules would check in ``entries``,
+        deduplicated per (dictionary, language), and fills the shared verdict
+        cache, so validating the entries afterwards touches Hunspell only for
+        suggestions of misspelled words.
 
-        return errors
+        Returns:
+            Dict mapping language to the number of distinct tokens checked
+        """
+        from app.services.spell_cache import get_spell_verdict_cache
+
+        spelling_rules = [
+            rule for rule in self.get_plan().rules_for(validation_mode)
+            if rule.custom and getattr(rule.custom[0], '__name__', '') == '_validate_hunspell_spelling'
+        ]
+        if not spelling_rules:
+            return {}
+
+        tokens: Dict[tuple, Dict[str, None]] = {}
+        hunspells: Dict[tuple, Any] = {}
+        for data in entries:
+            view = EntryView(data)
+            for rule in spelling_rules:
+                try:
+                    matches = view.find(rule.path)
+                except Exception:
+                    continue
+                for _, target_lang, hunspell, words in self._hunspell_targets(rule.config, matches):
+                    key = (id(hunspell), target_lang)
+                    hunspells[key] = hunspell
+                    tokens.setdefault(key, {}).update(dict.fromkeys(words))
+
+        spell_cache = get_spell_verdict_cache()
+        checked: Dict[str, int] = {}
+        for key, words in tokens.items():
+            spell_cache.spell_many(hunspells[key], words, key[1])
+            checked[key[1]] = checked.get(key[1], 0) + len(words)
+        return checked
 
     def _validate_redundant_variants_allomorphs(self, rule_id: str, rule_config: Dict[str, Any],
                                                  data: Dict[str, Any]) -> List[ValidationError]:
@@ -2236,6 +2385,12 @@ class ValidationEngine:
         return errors
 
 
+logger = logging.getLogger(__name__)
+
+# Opening tag of a serialized entry and its id attribute.
+_ENTRY_ID = re.compile(r"""\s*<(?:[\w.-]+:)?entry\b[^>]*?\sid=(["'])(.*?)\1""")
+
+
 class SchematronValidator:
     """
     Schematron validator for XML validation.
@@ -2296,7 +2451,7 @@ class SchematronValidator:
 
                 # Compile schema into an XSLT validator using Saxon
                 try:
-                    compiled_dir = Path('compiled/schematron')
+                    compiled_dir = Path(os.getenv('SCHEMATRON_COMPILED_DIR', 'compiled/schematron'))
                     compiled_dir.mkdir(parents=True, exist_ok=True)
                     compiled_xsl = compiled_dir / (schema_path.stem + '.xsl')
 
@@ -2438,43 +2593,15 @@ class SchematronValidator:
                     ], [], [])
 
                 import subprocess
-                import tempfile
-
-                with tempfile.NamedTemporaryFile(mode='w+', suffix='.xml', delete=False) as xml_file:
-                    xml_file.write(xml_content)
-                    xml_path = xml_file.name
-
-                with tempfile.NamedTemporaryFile(mode='w+', suffix='.svrl.xml', delete=False) as svrl_file:
-                    svrl_path = svrl_file.name
+                from app.services.saxon_worker import SaxonWorkerError
 
                 try:
-                    # Prefer classpath invocation if xmlresolver is available
-                    xmlresolver_jar = getattr(self, '_xmlresolver_jar', os.getenv('XMLRESOLVER_JAR'))
-                    if xmlresolver_jar and Path(xmlresolver_jar).exists():
-                        cmd = ['java', '-cp', f'{saxon_jar}:{xmlresolver_jar}', 'net.sf.saxon.Transform', f'-s:{xml_path}', f'-xsl:{compiled_xsl}', f'-o:{svrl_path}']
-                    else:
-                        cmd = ['java', '-jar', saxon_jar, f'-s:{xml_path}', f'-xsl:{compiled_xsl}', f'-o:{svrl_path}']
-                    subprocess.run(cmd, check=True, timeout=30)
-
-                    svrl_doc = etree.parse(svrl_path)
-                    ns = {'svrl': 'http://purl.oclc.org/dsdl/svrl'}
-                    for failed in svrl_doc.findall('.//svrl:failed-assert', namespaces=ns):
-                        text_el = failed.find('svrl:text', namespaces=ns)
-                        msg = text_el.text if text_el is not None else ''.join(failed.itertext())
-                        location = failed.get('location') or ''
-                        errors.append(ValidationError(
-                            rule_id=self._extract_rule_id(msg),
-                            rule_name='schematron_validation',
-                            message=msg.strip(),
-                            path=location,
-                            priority=ValidationPriority.CRITICAL,
-                            category=ValidationCategory.ENTRY_LEVEL
-                        ))
-
+                    svrl_doc = etree.fromstring(self._saxon_svrl(xml_content), parser=self._svrl_parser())
+                    errors.extend(self._svrl_errors(svrl_doc.iter('{http://purl.oclc.org/dsdl/svrl}failed-assert')))
                     is_valid = len(errors) == 0
                     return ValidationResult(is_valid, errors, warnings, info)
 
-                except subprocess.CalledProcessError as e:
+                except (subprocess.CalledProcessError, SaxonWorkerError) as e:
                     return ValidationResult(False, [
                         ValidationError(
                             rule_id="SCHEMATRON_ERROR",
@@ -2486,16 +2613,6 @@ class SchematronValidator:
                         )
                     ], [], [])
 
-                finally:
-                    try:
-                        Path(xml_path).unlink()
-                    except Exception as e:
-                        self.logger.debug(f"Caught exception: {e}")
-                    try:
-                        Path(svrl_path).unlink()
-                    except Exception as e:
-                        self.logger.debug(f"Caught exception: {e}")
-
             # lxml-based validator
             # Harden XML parsing: no DTD, no external entity resolution, no network.
             parser = etree.XMLParser(resolve_entities=False, no_network=True, load_dtd=False)
@@ -2527,6 +2644,145 @@ class SchematronValidator:
                 )
             ], [], [])
     
+    # Entries per Saxon transform in validate_batch.
+    SAXON_BATCH_SIZE = 1000
+
+    def validate_batch(self, entries_xml: List[str]) -> Dict[str, ValidationResult]:
+        """
+        Validate many ``<entry>`` elements, keyed by entry ID.
+
+        With the XSLT2/Saxon validator the entries are validated in one
+        transform per ``SAXON_BATCH_SIZE`` entries and the SVRL report is split
+        back per entry; otherwise each entry goes through ``validate_xml``.
+        Entries without an ID are keyed ``#<position>`` (1-based).
+
+        Args:
+            entries_xml: Serialized ``<entry>`` elements
+
+        Returns:
+            Dict mapping entry ID to its ValidationResult
+        """
+        keys = []
+        for position, xml in enumerate(entries_xml, 1):
+            match = _ENTRY_ID.match(xml or '')
+            keys.append(match.group(2) if match else f'#{position}')
+
+        if self._validator is None:
+            self._setup_validator()
+        if not (isinstance(self._validator, tuple) and self._validator[0] == 'saxon'):
+            return {key: self.validate_xml(xml) for key, xml in zip(keys, entries_xml)}
+
+        results: Dict[str, ValidationResult] = {}
+        pending = []
+        for key, xml in zip(keys, entries_xml):
+            lowered = (xml or '').lower()
+            if '<!doctype' in lowered or '<!entity' in lowered or '<?xml' in lowered[:100]:
+                # Cannot be embedded in a batch document; validate (and reject) on its own.
+                results[key] = self.validate_xml(xml)
+            else:
+                pending.append((key, xml))
+
+        for offset in range(0, len(pending), self.SAXON_BATCH_SIZE):
+            chunk = pending[offset:offset + self.SAXON_BATCH_SIZE]
+            results.update(self._validate_saxon_chunk(chunk))
+        return results
+
+    def _validate_saxon_chunk(self, chunk: List[tuple]) -> Dict[str, ValidationResult]:
+        """Validate (key, entry XML) pairs in one Saxon transform."""
+        import subprocess
+        from lxml import etree
+        from app.services.saxon_worker import SaxonWorkerError, split_svrl_by_entry
+
+        document = '<lift>' + ''.join(xml for _, xml in chunk) + '</lift>'
+        try:
+            svrl_doc = etree.fromstring(self._saxon_svrl(document), parser=self._svrl_parser())
+        except (subprocess.CalledProcessError, SaxonWorkerError, etree.XMLSyntaxError):
+            # One malformed entry fails the whole transform; fall back to per-entry results.
+            return {key: self.validate_xml(xml) for key, xml in chunk}
+
+        by_position, unplaced = split_svrl_by_entry(svrl_doc, len(chunk))
+        if unplaced:
+            logger.debug("Ignoring %d batch-level Schematron asserts", len(unplaced))
+        results = {}
+        for position, (key, _) in enumerate(chunk, 1):
+            errors = self._svrl_errors(by_position.get(position, ()))
+            results[key] = ValidationResult(not errors, errors, [], [])
+        return results
+
+    def _saxon_svrl(self, xml_content: str) -> bytes:
+        """SVRL report for a document, from the shared Saxon worker when it can run.
+
+        If the worker cannot start (e.g. Java older than 11), fall back to one
+        ``java`` process per call for the life of this validator.
+        """
+        compiled_xsl = self._validator[1]
+        xmlresolver_jar = getattr(self, '_xmlresolver_jar', os.getenv('XMLRESOLVER_JAR'))
+        if os.getenv('SCHEMATRON_SAXON_WORKER', '1') != '0' and not getattr(self, '_saxon_worker_failed', False):
+            from app.services.saxon_worker import SaxonWorkerError, get_saxon_worker
+
+            worker = get_saxon_worker(self._saxon_jar, compiled_xsl, xmlresolver_jar)
+            if not worker.is_running:
+                try:
+                    worker.start()
+                except SaxonWorkerError as e:
+                    logger.warning("Saxon worker unavailable, using one JVM per validation: %s", e)
+                    self._saxon_worker_failed = True
+            if not getattr(self, '_saxon_worker_failed', False):
+                return worker.transform(xml_content)
+        return self._saxon_svrl_subprocess(xml_content, compiled_xsl, xmlresolver_jar)
+
+    def _saxon_svrl_subprocess(self, xml_content: str, compiled_xsl: str,
+                               xmlresolver_jar: Optional[str]) -> bytes:
+        """SVRL report from a one-off ``java`` Saxon run (temp files in and out)."""
+        import subprocess
+        import tempfile
+
+        saxon_jar = self._saxon_jar
+        with tempfile.NamedTemporaryFile(mode='w+', suffix='.xml', delete=False) as xml_file:
+            xml_file.write(xml_content)
+            xml_path = xml_file.name
+
+        with tempfile.NamedTemporaryFile(mode='w+', suffix='.svrl.xml', delete=False) as svrl_file:
+            svrl_path = svrl_file.name
+
+        try:
+            # Prefer classpath invocation if xmlresolver is available
+            if xmlresolver_jar and Path(xmlresolver_jar).exists():
+                cmd = ['java', '-cp', f'{saxon_jar}:{xmlresolver_jar}', 'net.sf.saxon.Transform', f'-s:{xml_path}', f'-xsl:{compiled_xsl}', f'-o:{svrl_path}']
+            else:
+                cmd = ['java', '-jar', saxon_jar, f'-s:{xml_path}', f'-xsl:{compiled_xsl}', f'-o:{svrl_path}']
+            subprocess.run(cmd, check=True, timeout=30)
+            return Path(svrl_path).read_bytes()
+        finally:
+            for path in (xml_path, svrl_path):
+                try:
+                    Path(path).unlink()
+                except Exception as e:
+                    logger.debug(f"Caught exception: {e}")
+
+    @staticmethod
+    def _svrl_parser():
+        from lxml import etree
+        return etree.XMLParser(resolve_entities=False, no_network=True, load_dtd=False, huge_tree=True)
+
+    def _svrl_errors(self, failed_asserts) -> List[ValidationError]:
+        """ValidationErrors for SVRL ``failed-assert`` elements."""
+        ns = {'svrl': 'http://purl.oclc.org/dsdl/svrl'}
+        errors = []
+        for failed in failed_asserts:
+            text_el = failed.find('svrl:text', namespaces=ns)
+            msg = text_el.text if text_el is not None else ''.join(failed.itertext())
+            msg = msg or ''
+            errors.append(ValidationError(
+                rule_id=self._extract_rule_id(msg),
+                rule_name='schematron_validation',
+                message=msg.strip(),
+                path=failed.get('location') or '',
+                priority=ValidationPriority.CRITICAL,
+                category=ValidationCategory.ENTRY_LEVEL
+            ))
+        return errors
+
     def _extract_rule_id(self, message: str) -> str:
         """Extract rule ID from Schematron error message."""
         # Messages should start with rule ID like "R1.1.1 Violation:"
@@ -0,0 +1,391 @@
+"""
+Precompiled execution plan for ``ValidationEngine.validate_json``.
+
+Rule sets are compiled once (per loaded rule dictionary) into a plan that:
+
+* pre-filters rules per validation mode, so mode and ``client_side`` checks
+  are not repeated for every entry;
+* resolves custom validation functions to the engine methods up front
+  instead of dispatching through string comparisons;
+* turns ``validation`` blocks of the built-in value types (string, array,
+  object, number, boolean) into closures over their limits and
+  precompiled regexes;
+* evaluates JSONPath expressions against an :class:`EntryView`, which
+  memoises every path prefix, so ``$.senses[*]``, ``$.senses[*].id`` and
+  ``$.senses[*].gloss.*.text`` share one walk over the senses.
+
+Paths made only of ``$``, ``.field``, ``.*``, ``[a,b]`` and ``[*]`` steps are
+resolved by the view itself, yielding the same values and ``full_path``
+strings as ``jsonpath_ng``; any other expression, and any value the fast
+steps do not model, is handed to ``jsonpath_ng``.  Rules are applied in
+rule-set order, so results are identical to the rule-by-rule
+``ValidationEngine._apply_rule`` path.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import jsonpath_ng
+from jsonpath_ng.jsonpath import Child, Fields, Root, Slice
+
+# Steps of a compiled path
+_FIELDS = 'fields'
+_WILDCARD = 'wildcard'
+_SLICE = 'slice'
+
+
+class _Unsupported(Exception):
+    """A value the fast path steps do not model; use jsonpath_ng instead."""
+
+
+class PathMatch:
+    """Minimal stand-in for a ``jsonpath_ng`` match (``value`` and ``full_path``)."""
+
+    __slots__ = ('value', 'full_path')
+
+    def __init__(self, value: Any, full_path: str) -> None:
+        self.value = value
+        self.full_path = full_path
+
+    def __repr__(self) -> str:
+        return f"PathMatch({self.full_path!r}, {self.value!r})"
+
+
+@lru_cache(maxsize=4096)
+def _field_str(name: str) -> str:
+    # jsonpath_ng quotes field names that contain lexer literals
+    return str(Fields(name))
+
+
+def _join(parent: str, child: str) -> str:
+    return f"{parent}.{child}" if parent else child
+
+
+def compile_path(expr: Any) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """Translate a parsed JSONPath into fast-path steps, or None if unsupported."""
+    if isinstance(expr, Root):
+        return ()
+    if isinstance(expr, Child):
+        left = compile_path(expr.left)
+        right = compile_path(expr.right)
+        if left is None or right is None:
+            return None
+        return left + right
+    if isinstance(expr, Fields):
+        if not all(isinstance(f, str) for f in expr.fields):
+            return None
+        if '*' in expr.fields:
+            return ((_WILDCARD, None),)
+        return ((_FIELDS, tuple(expr.fields)),)
+    if type(expr) is Slice and expr.start is None and expr.end is None and expr.step is None:
+        return ((_SLICE, None),)
+    return None
+
+
+def _step(kind: str, arg: Any, matches: List[PathMatch]) -> List[PathMatch]:
+    result: List[PathMatch] = []
+    append = result.append
+    if kind == _SLICE:
+        for match in matches:
+            value = match.value
+            if not value:
+                continue
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    append(PathMatch(item, _join(match.full_path, f"[{i}]")))
+            elif isinstance(value, (dict, int, str)):
+                # jsonpath_ng treats a scalar or object as a one-element list
+                append(PathMatch(value, _join(match.full_path, "[0]")))
+            else:
+                raise _Unsupported
+        return result
+
+    for match in matches:
+        value = match.value
+        if not isinstance(value, dict):
+            if hasattr(value, 'get'):
+                raise _Unsupported
+            continue
+        names = value.keys() if kind == _WILDCARD else arg
+        for name in names:
+            if name in value:
+                if not isinstance(name, str):
+                    raise _Unsupported
+                append(PathMatch(value[name], _join(match.full_path, _field_str(name))))
+    return result
+
+
+class EntryView:
+    """Memoised JSONPath resolution over one entry dictionary."""
+
+    __slots__ = ('data', '_prefixes', '_paths')
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.data = data
+        self._prefixes: Dict[Tuple[Tuple[str, Any], ...], List[PathMatch]] = {(): [PathMatch(data, '')]}
+        self._paths: Dict[str, Any] = {}
+
+    def _resolve(self, steps: Tuple[Tuple[str, Any], ...]) -> List[PathMatch]:
+        cached = self._prefixes.get(steps)
+        if cached is None:
+            parent = self._resolve(steps[:-1])
+            kind, arg = steps[-1]
+            cached = self._prefixes[steps] = _step(kind, arg, parent)
+        return cached
+
+    def find(self, path: 'CompiledPath') -> List[Any]:
+        """Return the matches of ``path``; a failing lookup raises on every call."""
+        result = self._paths.get(path.path)
+        if result is None:
+            try:
+                if path.steps is None:
+                    raise _Unsupported
+                result = self._resolve(path.steps)
+            except _Unsupported:
+                try:
+                    result = path.expr.find(self.data)
+                except Exception as e:
+                    result = e
+            self._paths[path.path] = result
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@dataclass(frozen=True)
+class CompiledPath:
+    path: str
+    expr: Any
+    steps: Optional[Tuple[Tuple[str, Any], ...]]
+
+
+def _compile_value_check(validation: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """Closure equivalent to ``ValidationEngine._validate_value`` for built-in types.
+
+    Returns None for types that need the engine (e.g. ``hunspell``); unknown
+    types always pass, as in ``_validate_value``.
+    """
+    val_type = validation.get('type')
+
+    if val_type == 'string':
+        min_length = validation.get('minLength')
+        max_length = validation.get('maxLength')
+        pattern = validation.get('compiled_pattern')
+        not_pattern = validation.get('compiled_not_pattern')
+
+        def check_string(value: Any) -> bool:
+            if not isinstance(value, str):
+                return False
+            if min_length is not None and len(value) < min_length:
+                return False
+            if max_length is not None and len(value) > max_length:
+                return False
+            if pattern and not pattern.match(value):
+                return False
+            if not_pattern and not_pattern.search(value):
+                return False
+            return True
+        return check_string
+
+    sized = {'array': (list, 'minItems', 'maxItems'), 'object': (dict, 'minProperties', 'maxProperties')}
+    if val_type in sized:
+        kind, low_key, high_key = sized[val_type]
+        low, high = validation.get(low_key), validation.get(high_key)
+
+        def check_sized(value: Any) -> bool:
+            if not isinstance(value, kind):
+                return False
+            if low is not None and len(value) < low:
+                return False
+            if high is not None and len(value) > high:
+                return False
+            return True
+        return check_sized
+
+    if val_type == 'number':
+        minimum, maximum = validation.get('minimum'), validation.get('maximum')
+
+        def check_number(value: Any) -> bool:
+            if not isinstance(value, (int, float)):
+                return False
+            if minimum is not None and value < minimum:
+                return False
+            if maximum is not None and value > maximum:
+                return False
+            return True
+        return check_number
+
+    if val_type == 'boolean':
+        return lambda value: isinstance(value, bool)
+
+    if val_type == 'hunspell':
+        return None
+
+    return lambda value: True
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """One rule with its mode filter, path and validators resolved."""
+
+    rule_id: str
+    config: Dict[str, Any]
+    path: CompiledPath
+    condition_type: str
+    when: Optional[Dict[str, Any]]
+    is_array_path: bool
+    custom: Optional[Tuple[Callable[..., Any], bool]]
+    value_check: Optional[Callable[[Any], bool]]
+
+    def check_value(self, engine: Any, value: Any) -> bool:
+        if self.value_check is not None:
+            return self.value_check(value)
+        return engine._validate_value(value, self.config['validation'])
+
+    def run_custom(self, engine: Any, data: Dict[str, Any], matches: List[Any]) -> List[Any]:
+        if self.custom is None:
+            return []
+        function, takes_matches = self.custom
+        if takes_matches:
+            return function(engine, self.rule_id, self.config, data, matches)
+        return function(engine, self.rule_id, self.config, data)
+
+    def apply(self, engine: Any, data: Dict[str, Any], view: EntryView) -> List[Any]:
+        """Mirror of ``ValidationEngine._apply_rule`` using the shared view."""
+        rule_id, config = self.rule_id, self.config
+        errors: List[Any] = []
+        try:
+            matches = view.find(self.path)
+            condition_type = self.condition_type
+
+            if condition_type == 'custom':
+                return self.run_custom(engine, data, matches)
+
+            if condition_type == 'if_present':
+                if self.custom is not None:
+                    return self.run_custom(engine, data, matches)
+                for match in matches:
+                    if match.value is not None and not self.check_value(engine, match.value):
+                        errors.append(engine._create_error(rule_id, config, str(match.full_path), match.value))
+                return errors
+
+            if condition_type == 'required':
+                if self.is_array_path and self.custom is not None:
+                    return self.run_custom(engine, data, matches)
+            elif condition_type != 'conditional':
+                # Other condition types only resolve their path, as in _apply_rule
+                return errors
+            elif not (self.when and engine._evaluate_condition(self.when, data)):
+                # conditional rule whose condition is not met
+                return errors
+
+            if not matches and not (condition_type == 'required' and self.is_array_path):
+                errors.append(engine._create_error(rule_id, config, self.path.path, None))
+            for match in matches:
+                if not self.check_value(engine, match.value):
+                    errors.append(engine._create_error(rule_id, config, str(match.full_path), match.value))
+        except Exception as e:
+            errors.append(engine._rule_application_error(rule_id, config, e))
+        return errors
+
+
+@dataclass(frozen=True)
+class LegacyRule:
+    """A rule the plan could not compile; applied through ``_apply_rule``."""
+
+    rule_id: str
+    config: Dict[str, Any]
+
+    def apply(self, engine: Any, data: Dict[str, Any], view: EntryView) -> List[Any]:
+        return engine._apply_rule(self.rule_id, self.config, data)
+
+
+class ValidationPlan:
+    """Rules of one rule set compiled for repeated validation."""
+
+    MODES = ('save', 'delete', 'draft', 'all')
+
+    def __init__(self, rules: Dict[str, Dict[str, Any]], engine_cls: type) -> None:
+        self.rules = rules
+        self.paths: Dict[str, CompiledPath] = {}
+        self.compiled: List[Tuple[Any, str]] = []
+        self.legacy: List[str] = []
+        self._by_mode: Dict[str, Tuple[Any, ...]] = {}
+
+        self._parsed = getattr(engine_cls, '_jsonpath_cache', {})
+        for rule_id, config in rules.items():
+            if not config.get('client_side', True):
+                continue
+            try:
+                rule = self._compile_rule(rule_id, config, engine_cls)
+            except Exception:
+                # Malformed rules keep the per-rule path, which reports them as errors
+                rule = LegacyRule(rule_id, config)
+                self.legacy.append(rule_id)
+            self.compiled.append((rule, config.get('validation_mode', 'all')))
+
+    def _compile_path(self, path: str) -> CompiledPath:
+        compiled = self.paths.get(path)
+        if compiled is None:
+            expr = self._parsed.get(path)
+            if expr is None:
+                expr = self._parsed[path] = jsonpath_ng.parse(path)
+            compiled = self.paths[path] = CompiledPath(path, expr, compile_path(expr))
+        return compiled
+
+    def _compile_rule(self, rule_id: str, config: Dict[str, Any], engine_cls: type) -> CompiledRule:
+        path = config['path']
+        condition = config['condition']
+        validation = config['validation']
+        condition_type = condition if isinstance(condition, str) else condition.get('type')
+
+        custom = None
+        function_name = validation.get('custom_function')
+        if condition_type == 'custom' or (validation.get('type') == 'custom' and function_name):
+            handler = engine_cls._CUSTOM_VALIDATORS.get(function_name)
+            if handler is not None:
+                method_name, takes_matches = handler
+                custom = (getattr(engine_cls, method_name), takes_matches)
+
+        return CompiledRule(
+            rule_id=rule_id,
+            config=config,
+            path=self._compile_path(path),
+            condition_type=condition_type,
+            when=condition.get('when') if condition_type == 'conditional' else None,
+            is_array_path='[*]' in path,
+            custom=custom,
+            value_check=_compile_value_check(validation),
+        )
+
+    @staticmethod
+    def _mode_allows(rule_mode: str, validation_mode: str) -> bool:
+        if rule_mode == 'save_only':
+            return validation_mode not in ('delete', 'draft')
+        if rule_mode == 'delete_only':
+            return validation_mode == 'delete'
+        if rule_mode == 'draft_only':
+            return validation_mode in ('draft', 'all')
+        return True
+
+    def rules_for(self, validation_mode: str) -> Tuple[Any, ...]:
+        """Compiled rules that run in ``validation_mode``, in rule-set order."""
+        rules = self._by_mode.get(validation_mode)
+        if rules is None:
+            rules = self._by_mode[validation_mode] = tuple(
+                rule for rule, rule_mode in self.compiled if self._mode_allows(rule_mode, validation_mode)
+            )
+        return rules
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'rules': len(self.rules),
+            'compiled': len(self.compiled),
+            'legacy': len(self.legacy),
+            'paths': len(self.paths),
+            'fast_paths': sum(1 for p in self.paths.values() if p.steps is not None),
+            'modes': {mode: len(self.rules_for(mode)) for mode in self.MODES},
+        }
@@ -13,12 +13,16 @@ import time
 import json
 from datetime import datetime
 from flask import current_app
+from psycopg2.extras import execute_values
 
 from app.models.workset import Workset, WorksetQuery, BulkOperation, WorksetProgress
 from app.api.entries import get_dictionary_service
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT/UPDATE statement when writing workset membership.
+MEMBERSHIP_PAGE_SIZE = 1000
+
 
 class WorksetService:
     """Service for managing worksets and bulk operations."""
@@ -30,7 +34,7 @@ class WorksetService:
         """Create a new workset from query criteria."""
         try:
             dictionary_service = get_dictionary_service()
-            entries, total_count = self._execute_query(query, dictionary_service)
+            entry_ids, total_count = self._execute_id_query(query, dictionary_service)
 
             workset = Workset.create(name, query)
             workset.total_entries = total_count
@@ -44,12 +48,7 @@ class WorksetService:
                     )
                     workset.id, workset.created_at, workset.updated_at = cur.fetchone()
 
-                    entry_ids = [entry['id'] for entry in entries]
-                    for entry_id in entry_ids:
-                        cur.execute(
-                            "INSERT INTO workset_entries (workset_id, entry_id) VALUES (%s, %s)",
-                            (workset.id, entry_id)
-                        )
+                    self._insert_workset_entries(cur, workset.id, entry_ids)
                 conn.commit()
             finally:
                 current_app.pg_pool.putconn(conn)
@@ -138,16 +137,21 @@ class WorksetService:
                     )
 
                     cur.execute(
-                        "SELECT entry_id FROM workset_entries WHERE workset_id = %s LIMIT %s OFFSET %s",
+                        "SELECT entry_id FROM workset_entries WHERE workset_id = %s "
+                        "ORDER BY position NULLS LAST, id LIMIT %s OFFSET %s",
                         (workset_id, limit, offset)
                     )
                     entry_ids = [row[0] for row in cur.fetchall()]
 
+                    # Hydrate the whole page with one batched BaseX query and
+                    # restore the workset order from the membership rows.
                     dictionary_service = get_dictionary_service()
+                    fetched = dictionary_service.get_entries_by_ids(entry_ids) if entry_ids else []
+                    entries_by_id = {entry.id: entry for entry in fetched}
                     entries = []
                     missing_entry_ids = []
                     for entry_id in entry_ids:
-                        entry = dictionary_service.get_entry(entry_id)
+                        entry = entries_by_id.get(entry_id)
                         if entry is None:
                             missing_entry_ids.append(entry_id)
                             continue
@@ -195,10 +199,16 @@ class WorksetService:
             return []
 
     def update_workset_query(self, workset_id: int, query: WorksetQuery) -> Optional[int]:
-        """Update workset query criteria and refresh entries."""
+        """Update workset query criteria and refresh entries.
+
+        The refresh is incremental: only entries that left the result set are
+        deleted and only new ones inserted, so curation status and notes on
+        retained entries survive and unchanged worksets cost no row writes
+        beyond re-sequencing ``position``.
+        """
         try:
             dictionary_service = get_dictionary_service()
-            entries, total_count = self._execute_query(query, dictionary_service)
+            entry_ids, total_count = self._execute_id_query(query, dictionary_service)
 
             conn = current_app.pg_pool.getconn()
             try:
@@ -207,14 +217,7 @@ class WorksetService:
                         "UPDATE worksets SET query = %s, total_entries = %s, updated_at = %s WHERE id = %s",
                         (json.dumps(query.to_dict()), total_count, datetime.now(), workset_id)
                     )
-                    cur.execute("DELETE FROM workset_entries WHERE workset_id = %s", (workset_id,))
-
-                    entry_ids = [entry['id'] for entry in entries]
-                    for entry_id in entry_ids:
-                        cur.execute(
-                            "INSERT INTO workset_entries (workset_id, entry_id) VALUES (%s, %s)",
-                            (workset_id, entry_id)
-                        )
+                    self._sync_workset_entries(cur, workset_id, entry_ids)
                 conn.commit()
 
             finally:
@@ -343,34 +346,81 @@ class WorksetService:
                 'performance_estimate': 'unknown'
             }
     
-    def _execute_query(self, query: WorksetQuery, dictionary_service) -> tuple[List[Dict[str, Any]], int]:
-        """Execute workset query against dictionary service."""
-        try:
-            # This is a simplified conversion. A more robust implementation would
-            # map all query filters to the search_entries parameters.
-            search_term = ""
-            fields = []
-            for f in query.filters:
-                if f.field == 'lexical_unit':
-                    search_term = f.value
-                    fields.append('lexical_unit')
-
-            # Use list_entries instead of search_entries since it supports sorting
-            # list_entries has filter_text, sort_by, and sort_order parameters
-            entries, total_count = dictionary_service.list_entries(
-                filter_text=search_term if search_term else "",
-                limit=10000,  # Large limit for workset
-                offset=0,
-                sort_by=query.sort_by if query.sort_by else "lexical_unit",
-                sort_order=query.sort_order if query.sort_order else "asc"
+    def _execute_id_query(self, query: WorksetQuery, dictionary_service) -> tuple[List[str], int]:
+        """Execute workset query returning only matching entry IDs, in sort order.
+
+        The result is not capped, and no entry XML is fetched or parsed;
+        membership only needs the IDs.
+
+        Errors propagate: the result replaces stored membership, so a failed
+        query must never be mistaken for an empty result set.
+        """
+        search_term = ""
+        for f in query.filters:
+            if f.field == 'lexical_unit':
+                search_term = f.value
+
+        entry_ids, _ = dictionary_service.list_entry_ids(
+            filter_text=search_term if search_term else "",
+            sort_by=query.sort_by if query.sort_by else "lexical_unit",
+            sort_order=query.sort_order if query.sort_order else "asc"
+        )
+        # Keep the first occurrence of any duplicated ID.
+        entry_ids = list(dict.fromkeys(entry_ids))
+        return entry_ids, len(entry_ids)
+
+    def _insert_workset_entries(self, cur, workset_id: int, entry_ids: List[str]) -> None:
+        """Bulk-insert membership rows with multi-row INSERTs, preserving order in ``position``."""
+        if not entry_ids:
+            return
+        execute_values(
+            cur,
+            "INSERT INTO workset_entries (workset_id, entry_id, position) VALUES %s",
+            [(workset_id, entry_id, position) for position, entry_id in enumerate(entry_ids)],
+            page_size=MEMBERSHIP_PAGE_SIZE,
+        )
+
+    def _sync_workset_entries(self, cur, workset_id: int, entry_ids: List[str]) -> None:
+        """Apply the difference between stored membership and ``entry_ids``."""
+        cur.execute("SELECT entry_id FROM workset_entries WHERE workset_id = %s", (workset_id,))
+        existing_ids = {row[0] for row in cur.fetchall()}
+        wanted_ids = set(entry_ids)
+
+        removed_ids = list(existing_ids - wanted_ids)
+        if removed_ids:
+            cur.execute(
+                "DELETE FROM workset_entries WHERE workset_id = %s AND entry_id = ANY(%s)",
+                (workset_id, removed_ids)
             )
 
-            entry_dicts = [entry.to_dict() for entry in entries]
-            return entry_dicts, total_count
+        added_ids = [entry_id for entry_id in entry_ids if entry_id not in existing_ids]
+        retained = [
+            (entry_id, position) for position, entry_id in enumerate(entry_ids)
+            if entry_id in existing_ids
+        ]
+        if retained:
+            execute_values(
+                cur,
+                "UPDATE workset_entries AS we SET position = v.position "
+                "FROM (VALUES %s) AS v(entry_id, position) "
+                f"WHERE we.workset_id = {int(workset_id)} AND we.entry_id = v.entry_id "
+                "AND we.position IS DISTINCT FROM v.position",
+                retained,
+                page_size=MEMBERSHIP_PAGE_SIZE,
+            )
+        if added_ids:
+            positions = {entry_id: position for position, entry_id in enumerate(entry_ids)}
+            execute_values(
+                cur,
+                "INSERT INTO workset_entries (workset_id, entry_id, position) VALUES %s",
+                [(workset_id, entry_id, positions[entry_id]) for entry_id in added_ids],
+                page_size=MEMBERSHIP_PAGE_SIZE,
+            )
 
-        except Exception as e:
-            logger.error(f"Failed to execute workset query: {e}")
-            return [], 0
+        logger.debug(
+            "Workset %s membership sync: +%d -%d =%d",
+            workset_id, len(added_ids), len(removed_ids), len(retained),
+        )
 
     def _perform_bulk_operation(self, workset: Workset, operation: BulkOperation, progress: WorksetProgress) -> int:
         """Perform bulk operation on workset entries."""
@@ -444,12 +494,15 @@ class WorksetService:
                     )
                     workset.id, workset.created_at, workset.updated_at = cur.fetchone()
 
-                    for prop in proposals:
-                        eid = prop.get("entry_id")
-                        notes_data = json.dumps(prop)
-                        cur.execute(
-                            "INSERT INTO workset_entries (workset_id, entry_id, status, notes) VALUES (%s, %s, %s, %s)",
-                            (workset.id, eid, "pending_review", notes_data)
+                    if proposals:
+                        execute_values(
+                            cur,
+                            "INSERT INTO workset_entries (workset_id, entry_id, status, notes, position) VALUES %s",
+                            [
+                                (workset.id, prop.get("entry_id"), "pending_review", json.dumps(prop), position)
+                                for position, prop in enumerate(proposals)
+                            ],
+                            page_size=MEMBERSHIP_PAGE_SIZE,
                         )
                 conn.commit()
             finally:
@@ -0,0 +1,45 @@
+"""
+Wall-clock phase timing for application startup.
+
+``create_app`` marks the end of each startup phase; the result is kept on
+``app.startup_profile`` and logged, and a warning is logged when the total
+exceeds ``STARTUP_BUDGET_MS``.  ``scripts/profile_startup.py`` combines it
+with a ``python -X importtime`` breakdown.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class StartupProfile:
+    """Records the duration of consecutive startup phases."""
+
+    def __init__(self, started: Optional[float] = None) -> None:
+        self.started = started if started is not None else time.perf_counter()
+        self._last = self.started
+        self.phases: List[Tuple[str, float]] = []
+
+    def mark(self, name: str) -> float:
+        """End the current phase, naming it ``name``; returns its duration in ms."""
+        now = time.perf_counter()
+        elapsed = (now - self._last) * 1000
+        self.phases.append((name, elapsed))
+        self._last = now
+        return elapsed
+
+    @property
+    def total_ms(self) -> float:
+        return (self._last - self.started) * 1000
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'total_ms': round(self.total_ms, 1),
+            'phases': [{'name': name, 'ms': round(ms, 1)} for name, ms in self.phases],
+        }
+
+    def format(self) -> str:
+        slowest = sorted(self.phases, key=lambda p: p[1], reverse=True)[:5]
+        parts = ", ".join(f"{name} {ms:.0f} ms" for name, ms in slowest)
+        return f"{self.total_ms:.0f} ms ({parts})"
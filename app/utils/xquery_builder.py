@@ -5,7 +5,7 @@ This module provides utilities for building namespace-aware XQuery expressions
 for LIFT XML operations in BaseX database.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -651,3 +651,107 @@ class XQueryBuilder:
             query = f"({query})[position() <= {limit}]"
 
         return prologue + "\n" + query
+
+    @staticmethod
+    def build_entry_view_bundle_query(
+        entry_id: str,
+        db_name: str,
+        has_namespace: bool = True,
+        include_subentries: bool = False,
+    ) -> str:
+        """
+        Build the single query behind the entry edit/view pages.
+
+        Returns a ``<bundle>`` with the serialized entry, labels (lexical
+        unit forms + order) for every entry it references or is referenced
+        by, the relations pointing at it, and the entry/gloss behind each
+        sense-level relation target.  With ``include_subentries`` the
+        serialized entries holding a ``_component-lexeme`` relation to it
+        are added as well.  Returns an empty result if the entry is missing.
+
+        Args:
+            entry_id: ID or GUID of the entry (same matching as build_entry_by_id_query)
+            db_name: Name of the database
+            has_namespace: Whether XML uses namespaces
+            include_subentries: Whether to include serialized subentries
+
+        Returns:
+            Complete XQuery string
+        """
+        safe_id = XQueryBuilder.escape_xquery_string(entry_id)
+        prologue = XQueryBuilder.get_namespace_prologue(has_namespace)
+        E, S, R, T, LU, F, X = (
+            XQueryBuilder.get_element_path(name, has_namespace)
+            for name in ("entry", "sense", "relation", "trait", "lexical-unit", "form", "text")
+        )
+        subentries = ""
+        if include_subentries:
+            subentries = f"""
+              <subentries>{{
+                for $src in $incoming[{R}[@ref = $id][@type = '_component-lexeme']]
+                return <item id="{{string($src/@id)}}">{{serialize($src)}}</item>
+              }}</subentries>"""
+
+        return f"""{prologue}
+        let $db := collection('{db_name}')
+        for $entry in ($db//{E}[@id="{safe_id}" or @guid="{safe_id}" or ends-with(@id, "_{safe_id}") or {S}/@id="{safe_id}" or {S}/@guid="{safe_id}"])[1]
+        let $id := string($entry/@id)
+        let $incoming := $db//{E}[{R}/@ref = $id]
+        let $sense-refs := distinct-values($entry//{S}/{R}/@ref)
+        let $targets := $db//{E}[@id = ($entry/{R}/@ref, $sense-refs, $incoming/@id)]
+        return
+          <bundle id="{{$id}}">
+            <entry>{{serialize($entry)}}</entry>
+            <labels>{{
+              for $t in $targets
+              return <item id="{{string($t/@id)}}" order="{{string($t/@order)}}">{{
+                for $form in $t/{LU}/{F}
+                return <form lang="{{string($form/@lang)}}">{{string($form/{X}[1])}}</form>
+              }}</item>
+            }}</labels>
+            <reverse>{{
+              for $src in $incoming, $rel in $src/{R}[@ref = $id]
+              return <rel source="{{string($src/@id)}}" type="{{string($rel/@type)}}" order="{{string($rel/@order)}}">{{
+                for $t in $rel/{T}
+                return <trait name="{{normalize-space($t/@name)}}" value="{{normalize-space($t/@value)}}"/>
+              }}</rel>
+            }}</reverse>
+            {XQueryBuilder._sense_targets_fragment("$db", "$sense-refs", has_namespace)}{subentries}
+          </bundle>
+        """
+
+    @staticmethod
+    def build_sense_targets_query(
+        sense_ids: List[str], db_name: str, has_namespace: bool = True
+    ) -> str:
+        """
+        Build query resolving sense IDs to their owning entry and first gloss.
+
+        Returns a ``<bundle>`` holding only ``<senses>`` so the result parses
+        with the same code as the entry view bundle.
+        """
+        prologue = XQueryBuilder.get_namespace_prologue(has_namespace)
+        id_seq = ", ".join(
+            f'"{XQueryBuilder.escape_xquery_string(i)}"' for i in sense_ids
+        )
+        return f"""{prologue}
+        let $db := collection('{db_name}')
+        return <bundle>{XQueryBuilder._sense_targets_fragment("$db", f"({id_seq})", has_namespace)}</bundle>
+        """
+
+    @staticmethod
+    def _sense_targets_fragment(db_var: str, ids_expr: str, has_namespace: bool) -> str:
+        """``<senses>`` constructor listing owner entry forms and gloss per sense."""
+        E, S, LU, F, X, G, D = (
+            XQueryBuilder.get_element_path(name, has_namespace)
+            for name in ("entry", "sense", "lexical-unit", "form", "text", "gloss", "definition")
+        )
+        return f"""<senses>{{
+              for $s in {db_var}//{S}[@id = {ids_expr}]
+              let $owner := $s/ancestor::{E}[1]
+              return <sense id="{{string($s/@id)}}" entry="{{string($owner/@id)}}"
+                            gloss="{{string(($s/{G}/{X}, $s/{D}/{F}/{X})[1])}}">{{
+                for $form in $owner/{LU}/{F}
+                return <form lang="{{string($form/@lang)}}">{{string($form/{X}[1])}}</form>
+              }}</sense>
+            }}</senses>"""
@@ -338,6 +338,26 @@ class CacheableValidator(Validator, ABC):
         self.db_session = db_session
         self.ttl = ttl
 
+    def _versioned_cache_key(self, prefix: str, scope: str, *parts: Any) -> str:
+        """
+        Cache key inside the versioned namespace (prefix, scope).
+
+        Invalidation bumps the namespace (``_bump_cache_namespace``) instead of
+        deleting keys by pattern, which could not reach other workers' L1.
+        The version is read from Redis on every lookup, so a result cached
+        before another worker's bump is never served.
+        """
+        if self.cache_service:
+            return self.cache_service.versioned_key(prefix, scope, *parts, fresh=True)
+        return ':'.join(str(p) for p in (prefix, scope, *parts))
+
+    def _bump_cache_namespace(self, prefix: str, scope: str) -> int:
+        """Invalidate every key of namespace (prefix, scope); 1 if bumped, else 0."""
+        if not self.cache_service:
+            return 0
+        self.cache_service.bump_namespace(prefix, scope, ttl=self.ttl)
+        return 1
+
     def _get_from_cache(self, cache_key: str) -> Optional[ValidationResult]:
         """Try to get result from Redis cache."""
         if not self.cache_service:
@@ -10,8 +10,11 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
+import time
 from typing import Any, Dict, List, Optional
 
+from app.services.dictionary_loader import DictionaryLoader
+from app.services.spell_cache import get_spell_verdict_cache
 from app.validators.base import (
     Validator,
     ValidationResult,
@@ -58,6 +61,7 @@ class HunspellValidator(CacheableValidator, BatchValidatorMixin, BatchValidator)
 
         # Lazy-loaded hunspell instances per language
         self._hunspell_instances: Dict[str, Any] = {}
+        self._missing: Dict[str, float] = {}  # lang -> time of the failed lookup
         self._hunspell_available = None  # None = not checked yet
 
     @property
@@ -95,6 +99,10 @@ class HunspellValidator(CacheableValidator, BatchValidatorMixin, BatchValidator)
         if lang in self._hunspell_instances:
             return self._hunspell_instances[lang]
 
+        missed_at = self._missing.get(lang)
+        if missed_at is not None and time.monotonic() - missed_at <= DictionaryLoader.MISSING_TTL_SECONDS:
+            return None
+
         if not self.hunspell_available:
             return None
 
@@ -132,9 +140,15 @@ class HunspellValidator(CacheableValidator, BatchValidatorMixin, BatchValidator)
                 except Exception as e:
                     self.logger.debug(f"Caught exception: {e}")
 
+            # Remember misses for a while, so languages without a dictionary
+            # are not looked up on disk again for every text but one that is
+            # installed later is still picked up
             if hunspell_obj:
                 self._hunspell_instances[lang] = hunspell_obj
+                self._missing.pop(lang, None)
                 self.logger.debug(f"Loaded hunspell dictionary: {lang}")
+            else:
+                self._missing[lang] = time.monotonic()
 
             return hunspell_obj
 
@@ -245,11 +259,13 @@ class HunspellValidator(CacheableValidator, BatchValidatorMixin, BatchValidator)
 
         misspellings = []
         all_suggestions: Dict[str, List[str]] = {}
+        spell_cache = get_spell_verdict_cache()
+        verdicts = spell_cache.spell_many(hunspell, words, lang)
 
         for word in words:
-            if not hunspell.spell(word):
+            if not verdicts[word]:
                 misspellings.append(word)
-                suggestions = hunspell.suggest(word)[:5]  # Top 5 suggestions
+                suggestions = spell_cache.suggest(hunspell, word, lang)[:5]  # Top 5 suggestions
                 all_suggestions[word] = suggestions
 
         return {
@@ -378,8 +394,9 @@ class HunspellValidator(CacheableValidator, BatchValidatorMixin, BatchValidator)
         if self.hunspell_available:
             hunspell = self._get_hunspell(language)
             if hunspell:
-                is_valid = hunspell.spell(word)
-                suggestions = hunspell.suggest(word)[:5] if not is_valid else []
+                spell_cache = get_spell_verdict_cache()
+                is_valid = spell_cache.spell(hunspell, word, language)
+                suggestions = spell_cache.suggest(hunspell, word, language)[:5] if not is_valid else []
             else:
                 is_valid = True
                 suggestions = []
@@ -415,7 +432,7 @@ class HunspellValidator(CacheableValidator, BatchValidatorMixin, BatchValidator)
         """
         content_hash = self._get_content_hash(text)
         lang = kwargs.get('lang', self.default_lang)
-        return f"hunspell:{lang}:{entry_id}:{content_hash}"
+        return self._versioned_cache_key('hunspell', entry_id, lang, content_hash)
 
     def _get_content_hash(self, text: str) -> str:
         """Get truncated SHA256 hash of text."""
@@ -454,9 +471,8 @@ class HunspellValidator(CacheableValidator, BatchValidatorMixin, BatchValidator)
         """
         count = 0
 
-        # Clear Redis cache
-        if self.cache_service:
-            count += self.cache_service.clear_pattern(f"hunspell:*:{entry_id}:*")
+        # Move the entry's cache keys to a new namespace version (all workers)
+        count += self._bump_cache_namespace('hunspell', entry_id)
 
         # Clear DB cache
         try:
@@ -479,7 +495,7 @@ class HunspellValidator(CacheableValidator, BatchValidatorMixin, BatchValidator)
         lang: Optional[str] = None
     ) -> Dict[str, ValidationResult]:
         """
-        Validate multiple words at once.
+        Validate multiple words at once (each distinct word is checked once).
 
         Args:
             words: List of words to validate
@@ -491,7 +507,11 @@ class HunspellValidator(CacheableValidator, BatchValidatorMixin, BatchValidator)
         language = lang or self.default_lang
         results = {}
 
-        for word in words:
+        hunspell = self._get_hunspell(language) if self.hunspell_available else None
+        if hunspell:
+            get_spell_verdict_cache().spell_many(hunspell, words, language)
+
+        for word in dict.fromkeys(words):
             results[word] = self.validate_word(word, language)
 
         return results
@@ -518,6 +538,6 @@ class HunspellValidator(CacheableValidator, BatchValidatorMixin, BatchValidator)
         if self.hunspell_available:
             hunspell = self._get_hunspell(language)
             if hunspell:
-                return hunspell.suggest(word)[:max_suggestions]
+                return get_spell_verdict_cache().suggest(hunspell, word, language)[:max_suggestions]
 
         return []
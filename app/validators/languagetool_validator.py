@@ -391,14 +391,13 @@ class LanguageToolValidator(CacheableValidator, BatchValidatorMixin, BatchValida
             Cache key string
         """
         # Include relevant parameters in key
-        key_parts = [
+        return self._versioned_cache_key(
             'lt',
             entry_id,
             self._get_content_hash(text),
             kwargs.get('lang', 'unknown'),
             kwargs.get('target_lang', '')
-        ]
-        return ':'.join(str(p) for p in key_parts)
+        )
 
     def _get_content_hash(self, text: str) -> str:
         """Get truncated SHA256 hash of text."""
@@ -416,9 +415,8 @@ class LanguageToolValidator(CacheableValidator, BatchValidatorMixin, BatchValida
         """
         count = 0
 
-        # Clear Redis cache
-        if self.cache_service:
-            count += self.cache_service.clear_pattern(f"lt:{entry_id}:*")
+        # Move the entry's cache keys to a new namespace version (all workers)
+        count += self._bump_cache_namespace('lt', entry_id)
 
         # Clear DB cache
         try:
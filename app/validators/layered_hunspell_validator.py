@@ -17,6 +17,7 @@ from app.models.project_settings import ProjectSettings
 from app.services.cache_service import cache_service, CacheService
 from app.services.dictionary_loader import get_dictionary_loader, DictionaryLoader
 from app.services.field_language_detector import get_language_detector, FieldLanguageDetector
+from app.services.spell_cache import get_spell_verdict_cache
 from app.validators.base import ValidationResult
 
 
@@ -131,14 +132,13 @@ class LayeredHunspellValidator:
         words = self._extract_words(text)
         misspellings = []
         all_suggestions: Dict[str, List[str]] = {}
+        spell_cache = get_spell_verdict_cache()
+        verdicts = spell_cache.spell_many(hunspell, words, lang_code)
 
         for word in words:
-            if not hunspell.spell(word):
+            if not verdicts[word]:
                 misspellings.append(word)
-                suggestions = []
-                if hasattr(hunspell, 'suggest'):
-                    suggestions = hunspell.suggest(word)[:5]
-                all_suggestions[word] = suggestions
+                all_suggestions[word] = spell_cache.suggest(hunspell, word, lang_code)[:5]
 
         result = ValidationResult(
             is_valid=len(misspellings) == 0,
@@ -293,8 +293,9 @@ class LayeredHunspellValidator:
                 'warning': 'No dictionary available'
             }
 
-        valid = hunspell.spell(word)
-        suggestions = hunspell.suggest(word)[:5] if not valid else []
+        spell_cache = get_spell_verdict_cache()
+        valid = spell_cache.spell(hunspell, word, lang_code)
+        suggestions = spell_cache.suggest(hunspell, word, lang_code)[:5] if not valid else []
 
         return {
             'valid': valid,
@@ -326,7 +327,7 @@ class LayeredHunspellValidator:
         if not hunspell:
             return []
 
-        return hunspell.suggest(word)[:10]
+        return get_spell_verdict_cache().suggest(hunspell, word, lang_code)[:10]
 
     def _get_lang_code_for_field(
         self,
@@ -386,7 +387,9 @@ class LayeredHunspellValidator:
     def _make_cache_key(self, text: str, lang_code: str) -> str:
         """Generate cache key for validation result."""
         content_hash = hashlib.md5(text.encode()).hexdigest()[:16]
-        return f"hunspell:{self.project_id}:{lang_code}:{content_hash}"
+        if self.cache_service:
+            return self.cache_service.versioned_key('hunspell_project', str(self.project_id), lang_code, content_hash)
+        return f"hunspell_project:{self.project_id}:{lang_code}:{content_hash}"
 
     def _get_from_cache(self, cache_key: str) -> Optional[ValidationResult]:
         """Get validation result from cache."""
@@ -420,13 +423,14 @@ class LayeredHunspellValidator:
         self.cache_service.set(cache_key, cache_data, ttl=86400)
 
     def clear_cache(self) -> int:
-        """Clear cached validation results."""
+        """Clear cached validation results (1 if the project's cache namespace was bumped)."""
         if not self.cache_service:
             return 0
 
-        count = self.cache_service.clear_pattern(f"hunspell:{self.project_id}:*")
+        # A namespace bump also reaches other workers' L1, unlike a pattern delete
+        self.cache_service.bump_namespace('hunspell_project', str(self.project_id), ttl=86400)
         self._hunspell_cache.clear()
-        return count
+        return 1
 
 
 # Factory function for creating validators
@@ -5,6 +5,7 @@ Views for the Lexicographic Curation Workbench's frontend.
 import logging
 import os
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from flask import (
     Blueprint,
@@ -26,6 +27,7 @@ from flask import (
 from app.services.dictionary_service import DictionaryService
 from app.services.cache_service import CacheService
 from app.models.entry import Entry, RelationGroups
+from app.utils.auth_decorators import admin_required
 from app.utils.exceptions import NotFoundError, ValidationError
 from app.utils.multilingual_form_processor import merge_form_data_with_entry_data
 from app.utils.language_utils import get_project_languages, get_language_choices_for_forms
@@ -147,82 +149,46 @@ def index():
 
     recent_activity = []
 
-    # Try to get cached dashboard data first (new key, then old keys for migration)
     cache = CacheService()
-    cache_key = DASHBOARD_CACHE_KEY
-    if cache.is_available():
-        cached_data = cache.get(cache_key)
-        # Try old keys for cache migration
-        if not cached_data:
-            for old_key in OLD_CACHE_KEYS:
-                cached_data = cache.get(old_key)
-                if cached_data:
-                    # Migrate to new key
-                    cache.set(cache_key, cached_data, ttl=300)
-                    logger.info("Migrated dashboard cache from '%s' to '%s'", old_key, cache_key)
-                    break
-        if cached_data:
-            try:
-                # Cached data may already be deserialized by CacheService.get() (dict),
-                # or it may be a JSON string. Handle both cases gracefully.
-                if isinstance(cached_data, (str, bytes)):
-                    cached_stats = json.loads(cached_data)
-                else:
-                    cached_stats = cached_data
-
-                stats = cached_stats.get("stats", stats)
-                system_status = cached_stats.get("system_status", system_status)
-                recent_activity = cached_stats.get("recent_activity", recent_activity)
-                logger.info("Using cached dashboard stats")
-                return render_template(
-                    "index.html",
-                    stats=stats,
-                    system_status=system_status,
-                    recent_activity=recent_activity,
-                )
-            except (json.JSONDecodeError, KeyError, TypeError) as e:
-                logger.warning(f"Invalid cached dashboard data: {e}")
 
-    # Get actual stats from the database if possible
-    try:
-        dict_service = current_app.injector.get(DictionaryService)
-        entry_count = dict_service.count_entries()
-        stats["entries"] = entry_count
+    def build_dashboard_data():
+        # Reuse data cached under an old key (migrated to the new key by get_or_set)
+        for old_key in OLD_CACHE_KEYS:
+            old_data = cache.get(old_key)
+            if old_data:
+                logger.info("Migrated dashboard cache from '%s' to '%s'", old_key, DASHBOARD_CACHE_KEY)
+                return old_data
 
-        # Get sense and example counts
+        dict_service = current_app.injector.get(DictionaryService)
         sense_count, example_count = dict_service.count_senses_and_examples()
-        stats["senses"] = sense_count
-        stats["examples"] = example_count
-
-        # Get recent activity
-        recent_activity = dict_service.get_recent_activity(limit=5)
-
-        # Get system status
         system_status = dict_service.get_system_status()
         logger.info(f"System status retrieved: {system_status}")
-
-        # Check system_status type to debug issues
-        logger.info(f"system_status type: {type(system_status)}")
-        logger.info(
-            f"system_status keys: {system_status.keys() if hasattr(system_status, 'keys') else 'N/A'}"
-        )
-        logger.info(f"db_connected value: {system_status.get('db_connected', 'ERROR')}")
-        logger.info(f"last_backup value: {system_status.get('last_backup', 'ERROR')}")
-        logger.info(
-            f"storage_percent value: {system_status.get('storage_percent', 'ERROR')}"
-        )
-
-        # Cache the dashboard data for 10 minutes (600 seconds)
-        if cache.is_available():
-            cache_data = {
-                "stats": stats,
-                "system_status": system_status,
-                "recent_activity": recent_activity,
-            }
-            # Store the Python object directly; CacheService handles JSON serialization.
-            cache.set(cache_key, cache_data, ttl=600)
-            logger.info("Cached dashboard stats for 10 minutes")
-
+        return {
+            "stats": {
+                "entries": dict_service.count_entries(),
+                "senses": sense_count,
+                "examples": example_count,
+            },
+            "system_status": system_status,
+            "recent_activity": dict_service.get_recent_activity(limit=5),
+        }
+
+    # Get the stats from the cache or the database; cached for 10 minutes and
+    # concurrent misses share one computation
+    try:
+        dashboard_data = cache.get_or_set(DASHBOARD_CACHE_KEY, build_dashboard_data, ttl=600)
+        # Cached data may already be deserialized by CacheService.get() (dict),
+        # or it may be a JSON string. Handle both cases gracefully.
+        if isinstance(dashboard_data, (str, bytes)):
+            dashboard_data = json.loads(dashboard_data)
+
+        stats = dashboard_data.get("stats", stats)
+        system_status = dashboard_data.get("system_status", system_status)
+        recent_activity = dashboard_data.get("recent_activity", recent_activity)
+
+    except json.JSONDecodeError as e:
+        logger.warning(f"Invalid cached dashboard data: {e}")
+        cache.delete(DASHBOARD_CACHE_KEY)
     except Exception as e:
         logger.error(f"Error getting dashboard data: {e}", exc_info=True)
         flash(f"Error loading dashboard data: {str(e)}", "danger")
@@ -272,123 +238,40 @@ def view_entry(entry_id):
         # Get dictionary service
         dict_service = current_app.injector.get(DictionaryService)
 
-        # Get entry (use non-validating method to allow viewing invalid entries)
-        entry = dict_service.get_entry_for_editing(entry_id)
-
-        # Batch-resolve all relation ref IDs to headwords in one query
-        all_ref_ids = list(set(
-            str(r.ref) for r in entry.relations
-            if hasattr(r, 'ref') and r.ref
-        ))
-        headword_cache = dict_service.resolve_headwords_batch(all_ref_ids) if all_ref_ids else {}
-
-        # Get component relations (main entries this is a subentry of)
-        component_relations = entry.get_component_relations(dict_service, headword_cache=headword_cache)
-
-        # Get subentries (reverse component relations)
-        subentries = entry.get_subentries(dict_service)
+        # Get entry and its relation data (and subentries, if the profile
+        # shows them) in one query (non-validating parse to allow viewing
+        # invalid entries)
+        profile = _default_display_profile_or_none()
+        bundle = dict_service.get_entry_view_bundle(
+            entry_id, include_subentries=_shows_subentries(profile))
+        entry = bundle.entry
 
         # Get LIFT ranges for relation type grouping
         project_id = session.get('project_id', 1)
         ranges = dict_service.get_lift_ranges(project_id=project_id)
 
-        # Enrich entry-level relations (grouped_relations) with display text
-        enriched_grouped_relations = RelationGroups(entry.relations, ranges)
-        enriched_grouped_relations.enrich_with_display_text(dict_service, headword_cache=headword_cache)
-
-        # Variant relations (both directions) — always rendered
-        variant_relations = entry.get_complete_variant_relations(dict_service)
+        # Relation data for the page, all answered from the bundle
+        (component_relations, subentries, enriched_grouped_relations,
+         variant_relations) = _entry_page_relations(bundle, ranges)
 
         # Annotations and custom fields — always rendered (hidden by default in client JS)
         custom_fields = entry.custom_fields
         annotations = entry.annotations
 
         # Get CSS-rendered HTML for the entry using default profile
-        from app.services.css_mapping_service import CSSMappingService
-        from app.services.display_profile_service import DisplayProfileService
-
-        css_service = current_app.injector.get(CSSMappingService)
-        profile_service = DisplayProfileService()
-
-        # Get default profile or create one if it doesn't exist
-        default_profile = profile_service.get_default_profile()
-        if not default_profile:
-            # Create a default profile from registry
-            default_profile = profile_service.create_from_registry_default(
-                name="Default Display Profile",
-                description="Auto-created default profile"
-            )
-            profile_service.set_default_profile(default_profile.id)
-
-        # Build a headword map from already resolved relations
-        # so the CSS pipeline can skip re-resolving them
-        headword_map = {}
-        for rel in enriched_grouped_relations.all_relations:
-            ref = rel.get('ref')
-            text = rel.get('ref_display_text')
-            if ref and text:
-                headword_map[ref] = text
-        for rel in variant_relations:
-            ref = rel.get('ref')
-            text = rel.get('ref_display_text')
-            if ref and text:
-                headword_map[ref] = text
-        for comp in component_relations:
-            ref = comp.get('ref')
-            text = comp.get('ref_display_text')
-            if ref and text:
-                headword_map[ref] = text
-
-        # Render entry with CSS using the raw XML from the parsed entry
+        # (served from the rendered-entry cache when nothing it shows has changed)
         css_html = None
         try:
-            entry_xml = getattr(entry, '_raw_xml', None)
-            if entry_xml:
-                # Check Redis cache for rendered CSS HTML
-                cache_key_css = f"entry_css:v1:{entry_id}:{getattr(default_profile, 'id', 'default')}"
-                cache = CacheService()
-                cached_css = cache.get(cache_key_css) if cache.is_available() else None
-                if cached_css:
-                    css_html = cached_css
-                else:
-                    css_html = css_service.render_entry(
-                        entry_xml,
-                        profile=default_profile,
-                        dict_service=dict_service,
-                        headword_map=headword_map
-                    )
-                    # Cache for 5 minutes
-                    if css_html and cache.is_available():
-                        cache.set(cache_key_css, css_html, ttl=300)
-
-                # If show_subentries is enabled, fetch and render all subentries in one query
-                if default_profile.show_subentries and subentries:
-                    try:
-                        subentry_html_parts = []
-                        ids = [s["id"] for s in subentries if s.get("id")]
-                        if ids:
-                            preds = " or ".join(f"@id='{i}'" for i in ids)
-                            subentries_xml = dict_service.db_connector.execute_query(
-                                f"xquery collection()//entry[{preds}]"
-                            )
-                            if subentries_xml:
-                                wrapped = f"<root>{subentries_xml}</root>"
-                                root = ET.fromstring(wrapped)
-                                for child, sub_id in zip(root, ids):
-                                    full_xml = ET.tostring(child, encoding="unicode")
-                                    rendered = css_service.render_entry(
-                                        full_xml,
-                                        profile=default_profile,
-                                        dict_service=dict_service,
-                                    )
-                                    subentry_html_parts.append(
-                                        f'<div class="subentry" data-subentry-id="{sub_id}">{rendered}</div>'
-                                    )
-                        if subentry_html_parts:
-                            css_html += "\n".join(subentry_html_parts)
-                    except Exception as e:
-                        logger.warning("Error rendering subentries: %s", e)
-
+            from app.services.css_mapping_service import CSSMappingService
+
+            css_service = current_app.injector.get(CSSMappingService)
+            css_service.render_cache.record_view(entry.id)
+            css_html = _render_entry_css(
+                css_service, profile or _get_default_display_profile(), entry, dict_service, subentries,
+                _relation_headword_map(enriched_grouped_relations.all_relations,
+                                       variant_relations, component_relations),
+                bundle,
+            )
         except Exception as e:
             logger.warning("Error rendering entry with CSS: %s", e)
 
@@ -526,6 +409,9 @@ def _handle_edit_entry_post(dict_service, entry_id):
             else:
                 raise
 
+        dict_service.after_external_entry_write(
+            entry_id, entry=entry, previous_entry=existing_entry, db_name=db_name, project_id=project_id
+        )
         return jsonify({"id": entry_id, "message": "Entry updated successfully"})
     except Exception as update_error:
         logger.error(f"[EDIT_ENTRY] Update/create failed: {update_error}", exc_info=True)
@@ -539,83 +425,244 @@ def _handle_edit_entry_post(dict_service, entry_id):
             pass
 
 
-def _handle_edit_entry_get(dict_service, entry_id):
-    """Render the entry edit page (GET).
+def _run_in_app_context(app, func, *args, **kwargs):
+    """Run ``func`` inside an app context (for work handed to a thread)."""
+    with app.app_context():
+        return func(*args, **kwargs)
 
-    Loads the entry (creating an empty one if it does not exist yet), enriches
-    its relations with display text, renders the CSS preview and returns the
-    populated ``entry_form.html`` template.
-    """
-    # Try to load the entry for editing
-    entry = None
-    project_id = session.get('project_id')
+
+def _validate_entry_for_guidance(entry):
+    """Validation results shown as guidance (not as blockers) on the edit page."""
+    from app.services.validation_engine import ValidationEngine
+
+    return ValidationEngine().validate_entry(entry)
+
+
+def _get_default_display_profile():
+    """Return the default display profile, creating it from the registry if missing."""
+    from app.services.display_profile_service import DisplayProfileService
+
+    profile_service = DisplayProfileService()
+    default_profile = profile_service.get_default_profile()
+    if not default_profile:
+        # Create a default profile from registry
+        default_profile = profile_service.create_from_registry_default(
+            name="Default Display Profile",
+            description="Auto-created default profile"
+        )
+        profile_service.set_default_profile(default_profile.id)
+    return default_profile
+
+
+def _default_display_profile_or_none():
+    """The default display profile, or None if it cannot be loaded (the preview is then skipped)."""
     try:
-        entry = dict_service.get_entry_for_editing(
-            entry_id, project_id=project_id
-        )  # Use non-validating method for editing
-    except NotFoundError:
-        logger.debug("Entry %s not found in database %s", entry_id, dict_service.db_connector.database)
+        return _get_default_display_profile()
+    except Exception as e:
+        logger.warning("Could not load the default display profile: %s", e)
+        return None
+
+
+def _shows_subentries(profile):
+    """Whether the entry preview rendered with ``profile`` includes subentries."""
+    return bool(getattr(profile, 'show_subentries', False))
+
+
+def _render_subentries_html(css_service, profile, subentries, dict_service, bundle=None):
+    """Render the subentries of an entry (one query unless the bundle has their XML)."""
+    ids = [s["id"] for s in subentries if s.get("id")]
+    if not ids:
+        return ""
+    xml_by_id = bundle.subentry_xml if bundle is not None and bundle.subentry_xml is not None else None
+    if xml_by_id is None:
+        preds = " or ".join(f"@id='{i}'" for i in ids)
+        subentries_xml = dict_service.db_connector.execute_query(
+            f"xquery collection()//entry[{preds}]"
+        )
+        xml_by_id = {}
+        if subentries_xml:
+            for child in ET.fromstring(f"<root>{subentries_xml}</root>"):
+                xml_by_id[child.get("id")] = ET.tostring(child, encoding="unicode")
+
+    parts = []
+    for sub_id in ids:
+        full_xml = xml_by_id.get(sub_id)
+        if not full_xml:
+            continue
+        rendered = css_service.render_entry(full_xml, profile=profile, dict_service=dict_service)
+        parts.append(f'<div class="subentry" data-subentry-id="{sub_id}">{rendered}</div>')
+    return "\n".join(parts)
+
+
+def _relation_headword_map(*relation_lists):
+    """Map relation refs to the display text already resolved for the page."""
+    headword_map = {}
+    for relations in relation_lists:
+        for rel in relations:
+            ref = rel.get('ref')
+            text = rel.get('ref_display_text')
+            if ref and text:
+                headword_map[ref] = text
+    return headword_map
+
+
+def _entry_page_relations(bundle, ranges):
+    """Resolve the relation data shown on the entry view page from a view bundle.
+
+    Returns:
+        (component_relations, subentries, enriched_grouped_relations, variant_relations)
+    """
+    entry = bundle.entry
+
+    # Batch-resolve all relation ref IDs to headwords (answered from the bundle)
+    all_ref_ids = list(set(
+        str(r.ref) for r in entry.relations
+        if hasattr(r, 'ref') and r.ref
+    ))
+    headword_cache = bundle.resolve_headwords_batch(all_ref_ids) if all_ref_ids else {}
+
+    # Component relations (main entries this is a subentry of) and subentries
+    component_relations = entry.get_component_relations(bundle, headword_cache=headword_cache)
+    subentries = entry.get_subentries(bundle)
+
+    # Enrich entry-level relations (grouped_relations) with display text
+    enriched_grouped_relations = RelationGroups(entry.relations, ranges)
+    enriched_grouped_relations.enrich_with_display_text(bundle, headword_cache=headword_cache)
+
+    # Variant relations (both directions)
+    variant_relations = entry.get_complete_variant_relations(bundle)
+    return component_relations, subentries, enriched_grouped_relations, variant_relations
+
+
+def _render_entry_css(css_service, profile, entry, dict_service, subentries, headword_map, bundle=None):
+    """Render the CSS preview of an entry (plus its subentries if the profile shows them)."""
+    # Render entry with CSS using the raw XML from the parsed entry
+    entry_xml = getattr(entry, '_raw_xml', None)
+    if not entry_xml:
+        return None
+    css_html = css_service.render_entry(
+        entry_xml,
+        profile=profile,
+        dict_service=dict_service,
+        headword_map=headword_map
+    )
+
+    # If show_subentries is enabled, render all subentries (fetched in one query)
+    if profile.show_subentries and subentries:
         try:
-            all_entries, count = dict_service.list_entries(project_id=project_id, limit=100)
-            logger.debug("Available entries (%d): %s", count, [e.id for e in all_entries])
+            subentry_html = _render_subentries_html(css_service, profile, subentries, dict_service, bundle)
+            if subentry_html:
+                css_html += subentry_html
         except Exception as e:
-            logger.debug("Error listing entries: %s", e)
-        # Entry doesn't exist yet - create a new empty entry with the given ID
-        entry = Entry(id_=entry_id)
+            logger.warning("Error rendering subentries: %s", e)
+    return css_html
+
+
+def _warm_entry_render(dict_service, css_service, profile, entry_id, project_id=None):
+    """Render an entry the way the view page does, filling the rendered-entry cache."""
+    bundle = dict_service.get_entry_view_bundle(
+        entry_id, project_id=project_id, include_subentries=_shows_subentries(profile))
+    ranges = dict_service.get_lift_ranges(project_id=project_id or 1)
+    component_relations, subentries, grouped, variant_relations = _entry_page_relations(bundle, ranges)
+    return _render_entry_css(
+        css_service, profile, bundle.entry, dict_service, subentries,
+        _relation_headword_map(grouped.all_relations, variant_relations, component_relations),
+        bundle,
+    )
 
-    # Apply POS inheritance when loading entry for editing
-    if entry:
-        entry._apply_pos_inheritance()
 
-    ranges = dict_service.get_lift_ranges(project_id=project_id)
+def _handle_edit_entry_get(dict_service, entry_id):
+    """Render the entry edit page (GET).
+
+    Loads the entry with all its relation data in one BaseX round trip
+    (creating an empty one if it does not exist yet), enriches its relations
+    with display text, renders the CSS preview and returns the populated
+    ``entry_form.html`` template. Validation runs on a worker thread while
+    the relations and preview are assembled.
+    """
+    project_id = session.get('project_id')
+    app = current_app._get_current_object()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ranges_future = pool.submit(
+            _run_in_app_context, app, dict_service.get_lift_ranges, project_id=project_id)
 
-    # Get validation results for the entry to show as guidance (not as blockers)
-    validation_result = None
-    if entry:
-        from app.services.validation_engine import ValidationEngine
+        # Load the entry and everything the page needs (subentries included
+        # when the preview shows them) from BaseX in one query
+        profile = _default_display_profile_or_none()
+        bundle = None
+        try:
+            bundle = dict_service.get_entry_view_bundle(
+                entry_id, project_id=project_id, include_subentries=_shows_subentries(profile))
+            entry = bundle.entry  # Parsed without validation for editing
+        except NotFoundError:
+            logger.debug("Entry %s not found in database %s", entry_id, dict_service.db_connector.database)
+            # Entry doesn't exist yet - create a new empty entry with the given ID
+            entry = Entry(id_=entry_id)
+        lookup = bundle if bundle is not None else dict_service
+
+        # Apply POS inheritance when loading entry for editing
+        entry._apply_pos_inheritance()
 
-        validation_engine = ValidationEngine()
-        validation_result = validation_engine.validate_entry(entry)
+        # Get validation results for the entry to show as guidance (not as blockers)
+        validation_future = pool.submit(_run_in_app_context, app, _validate_entry_for_guidance, entry)
 
-    # Explicitly extract enriched variant_relations for template (with display text and error markers)
-    variant_relations_data = []
-    component_relations_data = []
-    forward_component_relations_data = []
-    subentries_data = []
-    if entry:
         logger.debug("========== [DEBUG VIEW EDIT] Entry %s ==========", entry.id)
         logger.debug("[DEBUG VIEW] Number of entry relations: %d", len(entry.relations))
-        for rel in entry.relations:
-            logger.debug("  Relation: type=%s, ref=%s, traits=%s", rel.type, rel.ref, rel.traits)
 
-        # Batch-resolve all relation ref IDs to headwords in one query
+        # Batch-resolve all relation ref IDs to headwords (answered from the bundle)
         all_ref_ids = list(set(
             str(r.ref) for r in entry.relations
             if hasattr(r, 'ref') and r.ref
         ))
-        headword_cache = dict_service.resolve_headwords_batch(all_ref_ids) if all_ref_ids else {}
+        headword_cache = lookup.resolve_headwords_batch(all_ref_ids) if all_ref_ids else {}
 
-        variant_relations_data = entry.get_complete_variant_relations(dict_service)
+        # Explicitly extract enriched variant_relations for template (with display text and error markers)
+        variant_relations_data = entry.get_complete_variant_relations(lookup)
         logger.debug("[DEBUG VIEW] variant_relations_data returned: %d items", len(variant_relations_data))
         # Extract enriched component_relations for template (with display text for main entries)
-        component_relations_data = entry.get_component_relations(dict_service, headword_cache=headword_cache)
+        component_relations_data = entry.get_component_relations(lookup, headword_cache=headword_cache)
         # Extract forward component relations (where this entry HAS components)
-        forward_component_relations_data = entry.get_forward_component_relations(dict_service)
+        forward_component_relations_data = entry.get_forward_component_relations(lookup)
         # Extract subentries (reverse component relations)
-        subentries_data = entry.get_subentries(dict_service)
+        subentries_data = entry.get_subentries(lookup)
 
         # Create enriched grouped_relations for template (can't set on entry because it's a property)
+        ranges = ranges_future.result()
         enriched_grouped_relations = RelationGroups(entry.relations, ranges)
-        enriched_grouped_relations.enrich_with_display_text(dict_service, headword_cache=headword_cache)
+        enriched_grouped_relations.enrich_with_display_text(lookup, headword_cache=headword_cache)
 
-        # Enrich sense relations with display text
-        for sense in entry.senses:
-            if hasattr(sense, 'relations') and sense.relations:
-                sense.relations = sense.enrich_relations_with_display_text(dict_service)
+        # Enrich sense relations with display text (assigned once validation is done with the entry)
+        enriched_sense_relations = [
+            (sense, sense.enrich_relations_with_display_text(lookup))
+            for sense in entry.senses
+            if hasattr(sense, 'relations') and sense.relations
+        ]
 
-    # Get project languages for multilingual fields
-    languages = get_project_languages()
-    available_languages = get_language_choices_for_forms()
+        # Get project languages for multilingual fields
+        languages = get_project_languages()
+        available_languages = get_language_choices_for_forms()
+
+        # Get CSS-rendered HTML for the entry using default profile
+        css_html = None
+        try:
+            from app.services.css_mapping_service import CSSMappingService
+
+            css_service = current_app.injector.get(CSSMappingService)
+            if bundle is not None:
+                css_service.render_cache.record_view(entry.id)
+            css_html = _render_entry_css(
+                css_service, profile or _get_default_display_profile(), entry, dict_service, subentries_data,
+                _relation_headword_map(enriched_grouped_relations.all_relations,
+                                       variant_relations_data, component_relations_data),
+                bundle,
+            )
+        except Exception as e:
+            logger.warning("Error rendering entry with CSS: %s", e)
+
+        validation_result = validation_future.result()
+        for sense, relations in enriched_sense_relations:
+            sense.relations = relations
 
     # Define note types for the dropdown
     note_types = [
@@ -631,87 +678,7 @@ def _handle_edit_entry_get(dict_service, entry_id):
         ('bibliography', 'Bibliography')
     ]
 
-    # Get CSS-rendered HTML for the entry using default profile
-    css_html = None
-    try:
-        from app.services.css_mapping_service import CSSMappingService
-        from app.services.display_profile_service import DisplayProfileService
-
-        css_service = current_app.injector.get(CSSMappingService)
-        profile_service = DisplayProfileService()
-
-        # Get default profile or create one if it doesn't exist
-        default_profile = profile_service.get_default_profile()
-        if not default_profile:
-            # Create a default profile from registry
-            default_profile = profile_service.create_from_registry_default(
-                name="Default Display Profile",
-                description="Auto-created default profile"
-            )
-            profile_service.set_default_profile(default_profile.id)
-
-        # Build a headword map from already resolved relations
-        headword_map = {}
-        if entry:
-            for rel in enriched_grouped_relations.all_relations:
-                ref = rel.get('ref')
-                text = rel.get('ref_display_text')
-                if ref and text:
-                    headword_map[ref] = text
-            for rel in variant_relations_data:
-                ref = rel.get('ref')
-                text = rel.get('ref_display_text')
-                if ref and text:
-                    headword_map[ref] = text
-            for comp in component_relations_data:
-                ref = comp.get('ref')
-                text = comp.get('ref_display_text')
-                if ref and text:
-                    headword_map[ref] = text
-
-        # Render entry with CSS using the raw XML from the parsed entry
-        entry_xml = getattr(entry, '_raw_xml', None) if entry else None
-        if entry_xml:
-            css_html = css_service.render_entry(
-                entry_xml,
-                profile=default_profile,
-                dict_service=dict_service,
-                headword_map=headword_map
-            )
-
-            # If show_subentries is enabled, fetch and render all subentries in one query
-            if default_profile.show_subentries and subentries_data:
-                try:
-                    subentry_html_parts = []
-                    ids = [s["id"] for s in subentries_data if s.get("id")]
-                    if ids:
-                        preds = " or ".join(f"@id='{i}'" for i in ids)
-                        subentries_xml = dict_service.db_connector.execute_query(
-                            f"xquery collection()//entry[{preds}]"
-                        )
-                        if subentries_xml:
-                            wrapped = f"<root>{subentries_xml}</root>"
-                            root = ET.fromstring(wrapped)
-                            for child, sub_id in zip(root, ids):
-                                full_xml = ET.tostring(child, encoding="unicode")
-                                rendered = css_service.render_entry(
-                                    full_xml,
-                                    profile=default_profile,
-                                    dict_service=dict_service,
-                                )
-                                subentry_html_parts.append(
-                                    f'<div class="subentry" data-subentry-id="{sub_id}">{rendered}</div>'
-                                )
-                    if subentry_html_parts:
-                        css_html += "\n".join(subentry_html_parts)
-                except Exception as e:
-                    logger.warning("Error rendering subentries: %s", e)
-
-    except Exception as e:
-        logger.warning("Error rendering entry with CSS: %s", e)
-
     logger.debug("[DEBUG VIEW] RENDERING with variant_relations=%d items", len(variant_relations_data))
-    logger.debug("[DEBUG VIEW] variant_relations_data: %s", variant_relations_data)
 
     return render_template(
         "entry_form.html",
@@ -2158,6 +2125,53 @@ def api_system_status():
         return jsonify({"error": str(e)}), 500
 
 
+@main_bp.route("/api/render-cache/stats")
+@admin_required
+def api_render_cache_stats():
+    """
+    Get rendered-entry cache hit rates and the most-viewed entries.
+    """
+    try:
+        from app.services.css_mapping_service import CSSMappingService
+
+        render_cache = current_app.injector.get(CSSMappingService).render_cache
+        limit = min(max(1, request.args.get("limit", 10, type=int)), 100)
+        stats = render_cache.get_stats()
+        stats["most_viewed"] = [
+            {"entry_id": entry_id, "views": views} for entry_id, views in render_cache.most_viewed(limit)
+        ]
+        return jsonify(stats)
+    except Exception as e:
+        logger.error(f"Error getting render cache stats: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+@main_bp.route("/api/render-cache/warm", methods=["POST"])
+@admin_required
+def api_render_cache_warm():
+    """
+    Render the most-viewed entries with the default display profile so
+    their HTML is served from the rendered-entry cache.
+    """
+    try:
+        from app.services.css_mapping_service import CSSMappingService
+
+        css_service = current_app.injector.get(CSSMappingService)
+        dict_service = current_app.injector.get(DictionaryService)
+        profile = _get_default_display_profile()
+        project_id = session.get("project_id")
+        limit = min(max(1, request.args.get("limit", 50, type=int)), css_service.render_cache.MAX_WARM_ENTRIES)
+
+        result = css_service.render_cache.warm(
+            lambda entry_id: _warm_entry_render(dict_service, css_service, profile, entry_id, project_id),
+            limit=limit,
+        )
+        return jsonify(result)
+    except Exception as e:
+        logger.error(f"Error warming render cache: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
 @main_bp.route("/api/activity")
 def api_activity():
     """
@@ -33,6 +33,11 @@ class Config:
     BASEX_PASSWORD = os.environ.get('BASEX_PASSWORD') or 'admin'
     BASEX_DATABASE = os.environ.get('BASEX_DATABASE') or 'dictionary'
     
+    # BaseX queries at least this slow go to the slow-query log (see app/database/query_profiler.py)
+    BASEX_SLOW_QUERY_MS = float(os.environ.get('BASEX_SLOW_QUERY_MS') or 250)
+    # Report per-request BaseX time in a Server-Timing response header
+    SERVER_TIMING_ENABLED = os.environ.get('SERVER_TIMING_ENABLED', 'true').lower() == 'true'
+    
     # Force BaseX connection (disable mock database)
     DEVELOPMENT_MODE = os.environ.get('DEVELOPMENT_MODE', 'false').lower() == 'true'
     USE_MOCK_DATABASE = os.environ.get('USE_MOCK_DATABASE', 'false').lower() == 'true'
@@ -64,6 +69,25 @@ class Config:
     # Qdrant vector database (semantic embeddings)
     QDRANT_HOST = os.environ.get('QDRANT_HOST') or 'localhost'
     QDRANT_PORT = int(os.environ.get('QDRANT_PORT') or 6333)
+    # Vector store for embeddings: 'qdrant' (external service) or 'local'
+    # (memory-mapped NumPy matrices under VECTOR_STORE_PATH, no extra service;
+    # worker processes sharing it coordinate through flock, so on platforms
+    # without fcntl only one process may write to it)
+    VECTOR_STORE_BACKEND = os.environ.get('VECTOR_STORE_BACKEND') or 'qdrant'
+    VECTOR_STORE_PATH = os.environ.get('VECTOR_STORE_PATH') or os.path.join('instance', 'vectors')
+    VECTOR_STORE_DTYPE = os.environ.get('VECTOR_STORE_DTYPE') or 'float16'
+    # >0 enables the approximate IVF index on large local collections
+    VECTOR_STORE_IVF_LISTS = int(os.environ.get('VECTOR_STORE_IVF_LISTS') or 0)
+    # Persistent text -> vector cache for query-time encoding (unset: instance
+    # folder, empty: memory only) and background model warm-up at startup
+    # (off by default; turn on where semantic search is in use)
+    EMBEDDING_CACHE_PATH = os.environ.get('EMBEDDING_CACHE_PATH')
+    EMBEDDING_CACHE_MAX_ENTRIES = int(os.environ.get('EMBEDDING_CACHE_MAX_ENTRIES') or 100000)
+    EMBEDDING_WARMUP = os.environ.get('EMBEDDING_WARMUP', 'false').lower() == 'true'
+    # Re-embed senses of saved/deleted entries in the background
+    EMBEDDING_AUTO_SYNC = os.environ.get('EMBEDDING_AUTO_SYNC', 'true').lower() == 'true'
+    # create_app logs a warning when startup takes longer than this (0 disables)
+    STARTUP_BUDGET_MS = int(os.environ.get('STARTUP_BUDGET_MS') or 1500)
     
     # Application base URL for generating password reset links
     # In production, set this to your public domain (e.g., 'https://example.com')
@@ -108,6 +132,11 @@ class TestingConfig(Config):
     # Disable Redis caching during tests to ensure test isolation
     # Each test should start with a clean state without cached data from previous tests
     REDIS_ENABLED = False
+
+    # No background embedding sync/warm-up and no on-disk vector cache during tests
+    EMBEDDING_AUTO_SYNC = False
+    EMBEDDING_WARMUP = False
+    EMBEDDING_CACHE_PATH = ''
     
     # PostgreSQL test configuration
     PG_HOST = os.environ.get('POSTGRES_TEST_HOST') or 'localhost'
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Migration script for delta-compressed entry revisions.
+
+Adds ``is_keyframe`` and ``delta`` to entry_revisions and makes ``snapshot``
+nullable.  Existing rows stay valid as keyframes.  With ``--compact`` the
+history of every entry is rewritten as keyframes + compressed patches
+(same policy as EntryRevisionService.save_revision).
+
+Required on every database whose entry_revisions table predates delta
+storage: ``db.create_all()`` does not add columns to an existing table, and
+saving a revision fails until this has run (the app logs an error at
+startup while the columns are missing). Run it before deploying the code.
+
+Usage:
+    python migrations/add_entry_revision_deltas.py
+    python migrations/add_entry_revision_deltas.py --compact [--interval 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import psycopg2
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.entry_revision_service import (  # noqa: E402
+    EntryRevisionService,
+    apply_patch,
+    decode_delta,
+    encode_chain,
+)
+
+# Get PostgreSQL connection params from environment
+PG_HOST = os.environ.get('POSTGRES_HOST', 'localhost')
+PG_PORT = os.environ.get('POSTGRES_PORT', 5432)
+PG_DB = os.environ.get('POSTGRES_DB', 'dictionary_analytics')
+PG_USER = os.environ.get('POSTGRES_USER', 'dict_user')
+PG_PASSWORD = os.environ.get('POSTGRES_PASSWORD', 'dict_pass')
+
+
+def add_columns(cur):
+    print("Adding is_keyframe column...")
+    cur.execute("""
+        ALTER TABLE entry_revisions
+        ADD COLUMN IF NOT EXISTS is_keyframe BOOLEAN NOT NULL DEFAULT TRUE;
+    """)
+    print("Adding delta column...")
+    cur.execute("""
+        ALTER TABLE entry_revisions
+        ADD COLUMN IF NOT EXISTS delta BYTEA;
+    """)
+    print("Making snapshot nullable...")
+    cur.execute("""
+        ALTER TABLE entry_revisions
+        ALTER COLUMN snapshot DROP NOT NULL;
+    """)
+
+
+def compact_entry(cur, entry_id, interval):
+    """Rewrite one entry's history; returns rows converted to deltas."""
+    cur.execute("""
+        SELECT id, snapshot, delta FROM entry_revisions
+        WHERE entry_id = %s ORDER BY revision_number
+    """, (entry_id,))
+    rows = cur.fetchall()
+    snapshots = []
+    for _, snapshot, delta in rows:
+        if snapshot is not None:
+            snapshots.append(snapshot)
+        elif snapshots and delta is not None:
+            snapshots.append(apply_patch(snapshots[-1], decode_delta(bytes(delta))))
+        else:
+            print(f"  skipping {entry_id}: broken revision chain")
+            return 0
+    converted = 0
+    for (row_id, old_snapshot, _), snapshot, (is_keyframe, delta) in zip(
+            rows, snapshots, encode_chain(snapshots, interval)):
+        if not is_keyframe and old_snapshot is not None:
+            converted += 1
+        cur.execute("""
+            UPDATE entry_revisions
+            SET is_keyframe = %s, snapshot = %s, delta = %s
+            WHERE id = %s
+        """, (
+            is_keyframe,
+            json.dumps(snapshot) if is_keyframe else None,
+            psycopg2.Binary(delta) if delta is not None else None,
+            row_id,
+        ))
+    return converted
+
+
+def run_migration(compact=False, interval=EntryRevisionService.keyframe_interval):
+    """Add delta columns and optionally compact existing histories."""
+    conn = None
+    try:
+        print(f"Connecting to PostgreSQL at {PG_HOST}:{PG_PORT}...")
+        conn = psycopg2.connect(
+            host=PG_HOST,
+            port=PG_PORT,
+            database=PG_DB,
+            user=PG_USER,
+            password=PG_PASSWORD
+        )
+        with conn.cursor() as cur:
+            add_columns(cur)
+            conn.commit()
+
+            if compact:
+                cur.execute("SELECT pg_total_relation_size('entry_revisions')")
+                before = cur.fetchone()[0]
+                cur.execute("SELECT DISTINCT entry_id FROM entry_revisions")
+                entry_ids = [r[0] for r in cur.fetchall()]
+                print(f"Compacting {len(entry_ids)} entry histories (keyframe every {interval})...")
+                converted = 0
+                for i, entry_id in enumerate(entry_ids, start=1):
+                    converted += compact_entry(cur, entry_id, interval)
+                    if i % 500 == 0:
+                        conn.commit()
+                        print(f"  {i}/{len(entry_ids)} entries")
+                conn.commit()
+                print(f"  Converted {converted} revisions to deltas")
+                print("  Run VACUUM FULL entry_revisions to return the space to the OS")
+                cur.execute("SELECT pg_total_relation_size('entry_revisions')")
+                print(f"  Table size before: {before} bytes, now: {cur.fetchone()[0]} bytes")
+
+            print("\n✓ Migration completed successfully!")
+            print("  Added columns: is_keyframe, delta")
+
+    except psycopg2.Error as e:
+        print(f"Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        if conn:
+            conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--compact', action='store_true',
+                        help='rewrite existing revisions as keyframes + deltas')
+    parser.add_argument('--interval', type=int,
+                        default=EntryRevisionService.keyframe_interval,
+                        help='revisions per keyframe')
+    args = parser.parse_args()
+    run_migration(compact=args.compact, interval=args.interval)
@@ -0,0 +1,50 @@
+"""
+Migration: Add change-analytics rollup tables and backfill them.
+
+This migration creates:
+1. revision_daily_rollups — revisions per day, entry and editor
+2. revision_field_rollups — change counts per day, field group and kind
+
+and fills both from the existing entry_revisions rows.  New saves keep
+them current; re-running the script rebuilds them from scratch.
+"""
+
+import sys
+import os
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app
+from app.models.entry_revision import RevisionDailyRollup, RevisionFieldRollup
+from app.models.workset_models import db
+from app.services.entry_revision_service import EntryRevisionService
+
+
+def migrate():
+    """Create the rollup tables and backfill them."""
+    app = create_app('development')
+
+    with app.app_context():
+        try:
+            print("Creating rollup tables...")
+            db.metadata.create_all(db.engine, tables=[
+                RevisionDailyRollup.__table__,
+                RevisionFieldRollup.__table__,
+            ])
+
+            print("Backfilling rollups from entry_revisions...")
+            total = EntryRevisionService.rebuild_rollups()
+            print(f"✓ Migration completed successfully! Rollups rebuilt from {total} revisions")
+        except Exception as e:
+            db.session.rollback()
+            print(f"Migration failed: {e}")
+            raise
+
+
+if __name__ == '__main__':
+    migrate()
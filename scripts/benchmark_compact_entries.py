@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory held by parsed entries: Entry models vs CompactEntry.
+
+For each size, parses a synthetic dictionary (scripts/synthetic_lift.py) in
+chunks and keeps every entry, once as ``Entry`` models (``parse_string``) and
+once as ``CompactEntry`` (``parse_string_compact``), and reports the memory
+still allocated afterwards (tracemalloc), per entry and in total, with the
+parse time. Also times ``to_entry()`` (what opening a compact entry for
+editing costs) and checks that rebuilt entries have the same ``to_dict()``
+as the models they were packed from.
+
+Usage:
+    python scripts/benchmark_compact_entries.py
+    python scripts/benchmark_compact_entries.py --sizes 10000 100000 --output compact.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+
+from app.models.compact_entry import CompactEntry  # noqa: E402
+from app.parsers.lift_parser import LIFTParser  # noqa: E402
+from synthetic_lift import generate_entries  # noqa: E402
+
+CHUNK_SIZE = 1000
+
+
+def chunks(count: int, seed: int):
+    """LIFT documents of up to CHUNK_SIZE synthetic entries each."""
+    batch = []
+    for _, xml in generate_entries(count, seed):
+        batch.append(xml)
+        if len(batch) == CHUNK_SIZE:
+            yield f"<lift>{''.join(batch)}</lift>"
+            batch = []
+    if batch:
+        yield f"<lift>{''.join(batch)}</lift>"
+
+
+def retained(parse, documents):
+    """(entries, bytes still allocated once all documents are parsed, seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    entries = []
+    for document in documents:
+        entries.extend(parse(document))
+    seconds = time.perf_counter() - start
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return entries, held, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark memory of Entry vs CompactEntry')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--verify', type=int, default=2000,
+                        help='entries per size checked for an identical to_entry() (0 for all)')
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    lift_parser = LIFTParser(validate=False)
+    results = {'seed': args.seed, 'sizes': {}}
+    mismatches = 0
+    print(f"{'entries':>8} {'form':<8}{'MB':>10}{'bytes/entry':>13}{'parse s':>9}")
+    for size in args.sizes:
+        documents = list(chunks(size, args.seed))
+        models, model_bytes, model_seconds = retained(lift_parser.parse_string, documents)
+        # Generated IDs (examples, variants, relations) differ between parses,
+        # so rebuilt entries are compared with the models they were packed from
+        sample = models[:args.verify] if args.verify else models
+        expected = [entry.to_dict() for entry in sample]
+        packed = [CompactEntry.from_entry(entry) for entry in sample]
+        del models, sample
+        compact, compact_bytes, compact_seconds = retained(lift_parser.parse_string_compact, documents)
+
+        start = time.perf_counter()
+        rebuilt = [entry.to_entry() for entry in packed]
+        to_entry_us = (time.perf_counter() - start) / max(len(rebuilt), 1) * 1e6
+        size_mismatches = sum(1 for a, b in zip(expected, rebuilt) if a != b.to_dict())
+        mismatches += size_mismatches
+
+        results['sizes'][size] = {
+            'entry_bytes': model_bytes,
+            'compact_bytes': compact_bytes,
+            'entry_bytes_per_entry': model_bytes / size,
+            'compact_bytes_per_entry': compact_bytes / size,
+            'ratio': model_bytes / compact_bytes if compact_bytes else None,
+            'entry_parse_seconds': model_seconds,
+            'compact_parse_seconds': compact_seconds,
+            'to_entry_us': to_entry_us,
+            'verified_entries': len(rebuilt),
+            'mismatched_entries': size_mismatches,
+        }
+        for form, held, seconds in (('Entry', model_bytes, model_seconds),
+                                    ('compact', compact_bytes, compact_seconds)):
+            print(f"{size:>8} {form:<8}{held / 1e6:>10.1f}{held / size:>13.0f}{seconds:>9.1f}")
+        print(f"{'':>8} {model_bytes / compact_bytes:.1f}x smaller, to_entry() {to_entry_us:.0f}us, "
+              f"{size_mismatches} of {len(rebuilt)} rebuilt entries differ")
+        del compact, packed, rebuilt, documents
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark entry edit/view page time-to-first-byte against a running server.
+
+Requests the given pages repeatedly and reports time-to-first-byte (time
+until the response status line arrives) and total time. Run it once before
+and once after a change to compare.
+
+Usage:
+    python scripts/benchmark_entry_page.py --entry ENTRY_ID
+    python scripts/benchmark_entry_page.py --url http://localhost:5000 --entry a --entry b --iterations 30
+    python scripts/benchmark_entry_page.py --entry ENTRY_ID --cookie "session=..." --output report.json
+"""
+
+import argparse
+import http.client
+import json
+import statistics
+import time
+from urllib.parse import quote, urlsplit
+
+
+def fetch(host: str, port: int, path: str, cookie: str = None) -> tuple:
+    """Return (status, ttfb_ms, total_ms) for one GET request."""
+    conn = http.client.HTTPConnection(host, port, timeout=120)
+    headers = {'Cookie': cookie} if cookie else {}
+    start = time.perf_counter()
+    conn.request('GET', path, headers=headers)
+    response = conn.getresponse()
+    ttfb = time.perf_counter() - start
+    response.read()
+    total = time.perf_counter() - start
+    conn.close()
+    return response.status, ttfb * 1000, total * 1000
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run(base_url: str, page: str, entry_ids: list, iterations: int, cookie: str = None) -> dict:
+    parts = urlsplit(base_url)
+    host, port = parts.hostname or 'localhost', parts.port or 80
+    paths = [f"/entries/{quote(entry_id)}{'/edit' if page == 'edit' else ''}" for entry_id in entry_ids]
+
+    for path in paths:  # warm caches and connection pools
+        fetch(host, port, path, cookie)
+
+    ttfb, total, statuses = [], [], set()
+    for _ in range(iterations):
+        for path in paths:
+            status, first_byte, whole = fetch(host, port, path, cookie)
+            statuses.add(status)
+            ttfb.append(first_byte)
+            total.append(whole)
+
+    return {
+        'page': page,
+        'requests': len(ttfb),
+        'statuses': sorted(statuses),
+        'ttfb_ms_mean': statistics.mean(ttfb),
+        'ttfb_ms_p50': percentile(ttfb, 50),
+        'ttfb_ms_p95': percentile(ttfb, 95),
+        'total_ms_mean': statistics.mean(total),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark entry page time-to-first-byte')
+    parser.add_argument('--url', default='http://localhost:5000')
+    parser.add_argument('--entry', action='append', required=True, help='entry ID (repeatable)')
+    parser.add_argument('--page', choices=['edit', 'view', 'both'], default='both')
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--cookie', help='Cookie header for an authenticated session')
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    pages = ['edit', 'view'] if args.page == 'both' else [args.page]
+    results = [run(args.url, page, args.entry, args.iterations, args.cookie) for page in pages]
+
+    print(f"{'page':<6}{'requests':>9}{'ttfb ms':>9}{'p50':>9}{'p95':>9}{'total ms':>10}  status")
+    for r in results:
+        print(f"{r['page']:<6}{r['requests']:>9}{r['ttfb_ms_mean']:>9.1f}{r['ttfb_ms_p50']:>9.1f}"
+              f"{r['ttfb_ms_p95']:>9.1f}{r['total_ms_mean']:>10.1f}  {r['statuses']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
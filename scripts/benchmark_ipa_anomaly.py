@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark IPA anomaly detection throughput (pairs/second) on CPU.
+
+Runs the same headword/IPA pairs three ways:
+  per-item  G2PAnomalyDetector.detect, one forward pass per pair (the old path)
+  batched   IPAAnomalyService.detect_many with an empty result cache
+  cached    IPAAnomalyService.detect_many again (every pair cached)
+
+and checks that per-item and batched runs agree on the predicted IPA. Uses the
+deployed model for --ws from --model-dir (default: the service's own model
+directory); with --random-model it builds an untrained model from synthetic
+pairs, which is enough to measure throughput. Needs torch.
+
+Usage:
+    python scripts/benchmark_ipa_anomaly.py --random-model
+    python scripts/benchmark_ipa_anomaly.py --model-dir instance/ipa_models --pairs 2000 --output ipa.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'scripts', 'ipa_training'))
+
+from app.services.ipa_anomaly_service import IPAAnomalyService, decompress_ipa_variants  # noqa: E402
+
+GRAPHEMES = 'abcdefghiklmnoprstuwyz'
+PHONEMES = 'abdefɡhiklmnoprstuwzəɪʊæɒʃˈ'
+
+
+def synthetic_pairs(count: int, seed: int = 7) -> list:
+    """Headword/IPA pairs of varied length (2-14 graphemes), some IPA with optional segments."""
+    rng = random.Random(seed)
+    pairs = []
+    for i in range(count):
+        headword = ''.join(rng.choice(GRAPHEMES) for _ in range(rng.randint(2, 14)))
+        ipa = 'ˈ' + ''.join(rng.choice(PHONEMES[:-1]) for _ in range(len(headword)))
+        if i % 5 == 0:
+            ipa = ipa[:3] + '(ə)' + ipa[3:]
+        pairs.append((headword, ipa))
+    return pairs
+
+
+def write_random_bundle(directory: str, ws: str, pairs: list) -> None:
+    """An untrained sidecar bundle (see IPAAnomalyService._discover_bundle)."""
+    import torch
+    from g2p import G2PModel, ModelConfig, G2PTokenizer, build_vocab_from_data
+
+    graphemes, phonemes = build_vocab_from_data(pairs)
+    tokenizer = G2PTokenizer(grapheme_vocab=graphemes, phoneme_vocab=phonemes)
+    config = ModelConfig(grapheme_vocab_size=len(graphemes), phoneme_vocab_size=len(phonemes),
+                         pad_token_id=tokenizer.PAD_ID, bos_token_id=tokenizer.BOS_ID,
+                         eos_token_id=tokenizer.EOS_ID)
+    torch.save({'model_state_dict': G2PModel(config).state_dict()},
+               os.path.join(directory, 'ipa_anomaly_bench.pt'))
+    with open(os.path.join(directory, 'ipa_anomaly_bench.json'), 'w', encoding='utf-8') as f:
+        json.dump({'ipa_writing_system': ws, 'model_config': config.__dict__,
+                   'grapheme_vocab': tokenizer.grapheme_vocab, 'phoneme_vocab': tokenizer.phoneme_vocab}, f)
+
+
+def per_item(detector, pairs: list) -> list:
+    """Best variant per pair, one ``detect`` call per variant (what the service used to do)."""
+    return [max((detector.detect(headword, variant) for variant in decompress_ipa_variants(ipa) or [ipa]),
+                key=lambda result: result.confidence_score)
+            for headword, ipa in pairs]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return time.perf_counter() - start, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark IPA anomaly detection')
+    parser.add_argument('--pairs', type=int, default=500)
+    parser.add_argument('--per-item-pairs', type=int, default=100,
+                        help='pairs for the (slow) one-pass-per-pair path')
+    parser.add_argument('--batch-size', type=int, default=IPAAnomalyService.BATCH_SIZE)
+    parser.add_argument('--ws', default='seh-fonipa')
+    parser.add_argument('--model-dir', help='directory with ipa_anomaly_*.pt bundles')
+    parser.add_argument('--random-model', action='store_true',
+                        help='benchmark an untrained model built from synthetic pairs')
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    pairs = synthetic_pairs(args.pairs)
+    with tempfile.TemporaryDirectory(prefix='ipa_bench_') as tmp:
+        model_dir = args.model_dir
+        if args.random_model:
+            write_random_bundle(tmp, args.ws, pairs)
+            model_dir = tmp
+        service = IPAAnomalyService(model_dir=model_dir, ipa_ws=args.ws)
+        if not service.is_available():
+            sys.exit(f"No IPA anomaly model for {args.ws} (try --random-model)")
+
+        sample = pairs[:args.per_item_pairs]
+        per_item_seconds, per_item_results = timed(lambda: per_item(service._detector, sample))
+        batched_seconds, batched = timed(lambda: service.detect_many(pairs, batch_size=args.batch_size))
+        cached_seconds, _ = timed(lambda: service.detect_many(pairs, batch_size=args.batch_size))
+
+    mismatches = sum(1 for a, b in zip(per_item_results, batched) if a.predicted_ipa != b['predicted_ipa'])
+    results = {
+        'pairs': args.pairs,
+        'per_item_pairs': len(sample),
+        'batch_size': args.batch_size,
+        'per_item_pairs_per_s': len(sample) / per_item_seconds,
+        'batched_pairs_per_s': args.pairs / batched_seconds,
+        'cached_pairs_per_s': args.pairs / cached_seconds,
+        'anomalies': sum(1 for r in batched if r and r['is_anomaly']),
+        'mismatched_pairs': mismatches,
+    }
+
+    print(f"{'path':<10}{'pairs/s':>12}")
+    for name in ('per_item', 'batched', 'cached'):
+        print(f"{name:<10}{results[name + '_pairs_per_s']:>12.1f}")
+    print(f"{results['anomalies']} anomalies, {mismatches} pairs with differing predictions")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
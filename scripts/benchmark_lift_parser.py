@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark LIFTParser throughput (entries/second).
+
+Parses the same synthetic dictionary (scripts/synthetic_lift.py) in a plain
+and a LIFT-namespaced copy, and checks both copies read as the same entries.
+Generated IDs (variants, relations, examples without one in the XML) are
+ignored in the comparison.
+
+Usage:
+    python scripts/benchmark_lift_parser.py
+    python scripts/benchmark_lift_parser.py --entries 20000 --repeat 5 --output parser.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+
+from app.parsers.lift_parser import LIFTParser  # noqa: E402
+from synthetic_lift import LIFT_FOOTER, LIFT_HEADER, generate_entries  # noqa: E402
+
+LIFT_NS = 'http://fieldworks.sil.org/schemas/lift/0.13'
+
+
+def without_generated_ids(value, xml: str):
+    if isinstance(value, dict):
+        return {k: without_generated_ids(v, xml) for k, v in value.items()
+                if not (k == 'id' and isinstance(v, str) and f'"{v}"' not in xml)}
+    if isinstance(value, list):
+        return [without_generated_ids(v, xml) for v in value]
+    return value
+
+
+def best_of(repeat: int, fn):
+    """Fastest of ``repeat`` runs, and the last result."""
+    best, value = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark LIFTParser throughput')
+    parser.add_argument('--entries', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=3, help='runs per document; the fastest counts')
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    body = ''.join(xml for _, xml in generate_entries(args.entries, args.seed))
+    documents = {
+        'plain': LIFT_HEADER + body + LIFT_FOOTER,
+        'namespaced': LIFT_HEADER.replace('<lift ', f'<lift xmlns="{LIFT_NS}" ') + body + LIFT_FOOTER,
+    }
+    reader = LIFTParser(validate=False)
+
+    results = {'entries': args.entries, 'seed': args.seed, 'documents': {}}
+    parsed = {}
+    print(f"{'document':<12}{'entries/s':>12}")
+    for doc_name, xml in documents.items():
+        seconds, entries = best_of(args.repeat, lambda: reader.parse_string(xml))
+        parsed[doc_name] = [without_generated_ids(e.to_dict(), xml) for e in entries]
+        results['documents'][doc_name] = {'seconds': seconds, 'entries_per_s': len(entries) / seconds}
+        print(f"{doc_name:<12}{len(entries) / seconds:>12.1f}")
+
+    mismatches = sum(1 for a, b in zip(parsed['plain'], parsed['namespaced']) if a != b)
+    mismatches += abs(len(parsed['plain']) - len(parsed['namespaced']))
+    results['mismatched_entries'] = mismatches
+    print(f"{mismatches} entries read differently from the two documents")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Benchmark entry revision storage: full snapshots vs keyframes + deltas.
+
+Saves a synthetic edit history into a throwaway SQLite database twice —
+once with every revision stored as a full snapshot (the pre-delta layout,
+no snapshot cache) and once with the default keyframe interval — and
+reports table size, save latency and revision read latency.
+
+Usage:
+    python scripts/benchmark_revision_storage.py
+    python scripts/benchmark_revision_storage.py --entries 50 --edits 40
+    python scripts/benchmark_revision_storage.py --output report.json
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask  # noqa: E402
+
+from app.models.entry_revision import EntryRevision  # noqa: E402
+from app.models.workset_models import db  # noqa: E402
+from app.services.entry_revision_service import EntryRevisionService  # noqa: E402
+
+
+def synthetic_entry(entry_id: str, rng: random.Random) -> dict:
+    """An entry snapshot shaped like the form serializer output."""
+    words = ['house', 'water', 'stone', 'light', 'river', 'green', 'quick', 'table']
+    return {
+        'id': entry_id,
+        'lexical_unit': {'en': rng.choice(words)},
+        'grammatical_info': 'Noun',
+        'pronunciations': {'seh-fonipa': 'haʊs'},
+        'senses': [
+            {
+                'id': f'{entry_id}_s{i}',
+                'gloss': {'pl': ' '.join(rng.choices(words, k=3))},
+                'definition': {'en': {'text': ' '.join(rng.choices(words, k=15))}},
+                'examples': [
+                    {'id': f'{entry_id}_s{i}_x{j}',
+                     'form': {'en': ' '.join(rng.choices(words, k=10))},
+                     'translation': {'pl': ' '.join(rng.choices(words, k=10))}}
+                    for j in range(2)
+                ],
+            }
+            for i in range(4)
+        ],
+        'notes': {},
+    }
+
+
+def edit(snapshot: dict, rng: random.Random) -> dict:
+    """One small form edit: change a gloss, a note or an example."""
+    snapshot = json.loads(json.dumps(snapshot))
+    sense = rng.choice(snapshot['senses'])
+    choice = rng.random()
+    if choice < 0.4:
+        sense['gloss']['pl'] += ' x'
+    elif choice < 0.7:
+        snapshot['notes']['general'] = f'note {rng.randint(0, 10 ** 6)}'
+    else:
+        sense['examples'][0]['form']['en'] += ' again'
+    return snapshot
+
+
+def run(mode: str, entries: int, edits: int, seed: int) -> dict:
+    """Save the synthetic history and measure it."""
+    rng = random.Random(seed)
+    handle, path = tempfile.mkstemp(suffix='.sqlite3')
+    os.close(handle)
+    app = Flask(__name__)
+    app.config.update({
+        'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}',
+        'SQLALCHEMY_TRACK_MODIFICATIONS': False,
+    })
+    db.init_app(app)
+
+    interval = EntryRevisionService.keyframe_interval
+    cache_size = EntryRevisionService.snapshot_cache.max_entries
+    if mode == 'full':
+        EntryRevisionService.keyframe_interval = 1
+        EntryRevisionService.snapshot_cache.max_entries = 0
+    EntryRevisionService.snapshot_cache.clear()
+
+    save_times, read_times = [], []
+    try:
+        with app.app_context():
+            EntryRevision.__table__.create(db.engine)
+            histories = {f'entry_{i}': synthetic_entry(f'entry_{i}', rng) for i in range(entries)}
+            for _ in range(edits):
+                for entry_id, snapshot in histories.items():
+                    start = time.perf_counter()
+                    EntryRevisionService.save_revision(entry_id, snapshot, user_id='bench')
+                    save_times.append((time.perf_counter() - start) * 1000)
+                    histories[entry_id] = edit(snapshot, rng)
+
+            EntryRevisionService.snapshot_cache.clear()
+            for entry_id in list(histories)[:10]:
+                for number in range(1, edits + 1):
+                    start = time.perf_counter()
+                    EntryRevisionService.get_revision(entry_id, number)
+                    read_times.append((time.perf_counter() - start) * 1000)
+
+            keyframes = EntryRevision.query.filter_by(is_keyframe=True).count()
+            db.session.remove()
+            with db.engine.connect() as conn:
+                conn.exec_driver_sql('VACUUM')
+            db.engine.dispose()
+    finally:
+        EntryRevisionService.keyframe_interval = interval
+        EntryRevisionService.snapshot_cache.max_entries = cache_size
+        EntryRevisionService.snapshot_cache.clear()
+        size = os.path.getsize(path)
+        os.remove(path)
+
+    save_times.sort()
+    return {
+        'mode': mode,
+        'revisions': entries * edits,
+        'keyframes': keyframes,
+        'table_bytes': size,
+        'save_ms_mean': round(statistics.mean(save_times), 3),
+        'save_ms_p95': round(save_times[int(len(save_times) * 0.95)], 3),
+        'read_ms_mean': round(statistics.mean(read_times), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark entry revision storage')
+    parser.add_argument('--entries', type=int, default=20)
+    parser.add_argument('--edits', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    results = [run(mode, args.entries, args.edits, args.seed) for mode in ('full', 'delta')]
+    print(f"{'mode':<8}{'revisions':>10}{'keyframes':>10}{'table KiB':>11}"
+          f"{'save ms':>9}{'save p95':>9}{'read ms':>9}")
+    for r in results:
+        print(f"{r['mode']:<8}{r['revisions']:>10}{r['keyframes']:>10}"
+              f"{r['table_bytes'] / 1024:>11.1f}{r['save_ms_mean']:>9.2f}"
+              f"{r['save_ms_p95']:>9.2f}{r['read_ms_mean']:>9.2f}")
+    ratio = results[0]['table_bytes'] / max(results[1]['table_bytes'], 1)
+    print(f"\nDelta storage is {ratio:.1f}x smaller")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
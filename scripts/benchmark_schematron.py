@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark XSLT2 Schematron validation throughput (entries/second).
+
+Validates synthetic LIFT entries three ways against the Saxon-compiled
+schema:
+  per-call  one ``java`` process and two temp files per entry (the old path)
+  worker    one entry per request to the long-lived Saxon worker
+  batch     SchematronValidator.validate_batch (one transform per chunk)
+
+and checks all three report the same rule IDs per entry. Needs SAXON_JAR
+(see tools/schematron/install_saxon.sh) and Java 11+ for the worker.
+
+Usage:
+    SAXON_JAR=tools/saxon/saxon-he.jar python scripts/benchmark_schematron.py
+    python scripts/benchmark_schematron.py --entries 2000 --per-call-entries 20 --output schematron.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lxml import etree  # noqa: E402
+
+from app.services.validation_engine import SchematronValidator  # noqa: E402
+
+LIFT_NS = 'http://code.google.com/p/lift-standard'
+
+
+def synthetic_entry(index: int) -> str:
+    """A LIFT entry; every tenth one has no sense (R1.1.3)."""
+    sense = '' if index % 10 == 0 else (
+        f'<sense id="e{index}_s1"><gloss lang="pl"><text>glosa {index}</text></gloss></sense>')
+    return (f'<entry xmlns="{LIFT_NS}" id="e{index}">'
+            f'<lexical-unit><form lang="en"><text>word{index}</text></form></lexical-unit>{sense}</entry>')
+
+
+def rule_ids(result) -> list:
+    return sorted(e.rule_id for e in result.errors)
+
+
+def per_call(validator: SchematronValidator, entries: list) -> list:
+    compiled_xsl = validator._validator[1]
+    resolver = getattr(validator, '_xmlresolver_jar', os.getenv('XMLRESOLVER_JAR'))
+    results = []
+    for xml in entries:
+        svrl = etree.fromstring(validator._saxon_svrl_subprocess(xml, compiled_xsl, resolver))
+        errors = validator._svrl_errors(svrl.iter('{http://purl.oclc.org/dsdl/svrl}failed-assert'))
+        results.append(sorted(e.rule_id for e in errors))
+    return results
+
+
+def timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return time.perf_counter() - start, value
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark XSLT2 Schematron validation')
+    parser.add_argument('--entries', type=int, default=1000)
+    parser.add_argument('--per-call-entries', type=int, default=20,
+                        help='entries for the (slow) one-JVM-per-call path')
+    parser.add_argument('--schema', default='schemas/lift_validation.sch')
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    validator = SchematronValidator(schema_file=args.schema)
+    if not (isinstance(validator._validator, tuple) and validator._validator[0] == 'saxon'):
+        sys.exit(f"Saxon validator not available: {getattr(validator, '_xslt2_reason', 'not xslt2')}")
+
+    entries = [synthetic_entry(i) for i in range(args.entries)]
+    sample = entries[:args.per_call_entries]
+
+    validator.validate_xml(entries[0])  # start the worker outside the timings
+    per_call_seconds, per_call_ids = timed(lambda: per_call(validator, sample))
+    worker_seconds, worker_results = timed(lambda: [validator.validate_xml(xml) for xml in entries])
+    batch_seconds, batch_results = timed(lambda: validator.validate_batch(entries))
+
+    worker_ids = [rule_ids(r) for r in worker_results]
+    batch_ids = [rule_ids(batch_results[f'e{i}']) for i in range(args.entries)]
+    mismatches = sum(1 for a, b in zip(per_call_ids, worker_ids) if a != b)
+    mismatches += sum(1 for a, b in zip(worker_ids, batch_ids) if a != b)
+
+    results = {
+        'entries': args.entries,
+        'per_call_entries': len(sample),
+        'per_call_entries_per_s': len(sample) / per_call_seconds,
+        'worker_entries_per_s': args.entries / worker_seconds,
+        'batch_entries_per_s': args.entries / batch_seconds,
+        'invalid_entries': sum(1 for ids in batch_ids if ids),
+        'mismatched_entries': mismatches,
+    }
+
+    print(f"{'path':<10}{'entries/s':>12}")
+    for name in ('per_call', 'worker', 'batch'):
+        print(f"{name:<10}{results[name + '_entries_per_s']:>12.1f}")
+    print(f"{results['invalid_entries']} invalid entries, {mismatches} entries with differing results")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,514 @@
+#!/usr/bin/env python3
+"""
+Repeatable benchmark suite over a synthetic LIFT dictionary.
+
+Generates a dictionary with scripts/synthetic_lift.py and times the main
+dictionary operations on it:
+  parse         LIFTParser.parse_string over the whole file
+  serialize     DictionaryService._prepare_entry_xml per entry
+  get           DictionaryService.get_entry
+  list_pages    DictionaryService.list_entries, page by page
+  search        DictionaryService.search_entries for common substrings
+  save          DictionaryService.update_entry
+  bulk_pos      BulkOperationsService.update_pos_bulk
+  duplicates    DictionaryService.get_duplicate_candidates
+  export        DictionaryService.export_lift
+  validation    ChunkValidator (what the dictionary validation runner does per chunk)
+  stats         DictionaryStatsStore.rebuild plus the dashboard aggregates
+
+By default the database is ``InMemoryBaseX``, a MockDatabaseConnector that
+holds the synthetic entries and answers the query shapes above (lookups by
+id, sorted/filtered listings, substring searches, counts, node updates, the
+whole-document export and the per-entry projections of the duplicate scan
+and the statistics store). Queries it cannot evaluate are counted and the
+benchmark that issued them is reported as skipped; pass --basex to run
+everything against a scratch database on a real BaseX server (configured
+with the BASEX_* variables, see scripts/README.md), which is dropped
+afterwards.
+
+Results (with the commit, backend and sizes) are printed as a table and
+written as JSON with --output, so runs of different commits can be
+compared directly.
+
+Usage:
+    python scripts/benchmark_suite.py
+    python scripts/benchmark_suite.py --entries 50000 --only parse serialize validation
+    python scripts/benchmark_suite.py --basex --entries 100000 --output bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+
+from app.database.mock_connector import MockDatabaseConnector  # noqa: E402
+from synthetic_lift import LIFT_FOOTER, LIFT_HEADER, generate_entries  # noqa: E402
+
+PAGE_SIZE = 50
+SEARCH_TERMS = ['ra', 'st', 'oon', 'place', 'woda']
+CHUNK_SIZE = 200
+
+ENTRY_FOR = re.compile(r"for \$entry in collection\('[^']*'\)//(?:lift:)?entry")
+CONTAINS_TERM = re.compile(r"contains\(lower-case\(\$\w+\), (?:lower-case\()?'((?:[^']|'')*)'")
+WINDOW = re.compile(r"\[position\(\) (?:= (\d+) to (\d+)|>= (\d+))\]\s*$")
+HEADWORD = re.compile(r'<lexical-unit>\s*<form lang="[^"]*">\s*<text>([^<]*)</text>')
+TEXT = re.compile(r'<text>([^<]*)</text>')
+ENTRY_ID = re.compile(r'entry\[@id="([^"]+)"')
+REVERSE_RELATION = re.compile(
+    r"let \$t := collection\('[^']*'\)//(?:lift:)?entry\[@id='([^']+)'\]\s+"
+    r"return exists\(\$t/(?:lift:)?relation\[@type='([^']+)' and @ref='([^']+)'\]\)$")
+PLAIN_COUNT = re.compile(
+    r"^count\(collection\('[^']*'\)//(?:lift:)?entry(\[not\(\.//relation\[trait\[@name='variant-type'\]\]\)\])?\)$")
+# DictionaryService.get_duplicate_candidates and _fetch_entry_stats
+DUPLICATE_ROWS = re.compile(r"let \$glosses := string-join\(.*'\|\|\|', \$defs, '\|\|\|', \$glosses\)$", re.S)
+SAMPLE_LIMIT = re.compile(r"where \$i <= (\d+)")
+STATS_ROWS = re.compile(r"^for \$e in collection\('[^']*'\)//entry(?:\[@id = \(([^)]*)\)\])? let \$egi := ")
+QUOTED = re.compile(r"'((?:[^']|'')*)'")
+
+
+class UnsupportedQuery(NotImplementedError):
+    """A query InMemoryBaseX cannot evaluate."""
+
+
+class InMemoryBaseX(MockDatabaseConnector):
+    """MockDatabaseConnector holding a synthetic dictionary.
+
+    Listings are always ordered by headword and searches match a substring
+    of any text in the entry; that is close enough to BaseX to exercise the
+    Python side of each operation, not to compare database time.
+    """
+
+    def __init__(self, entries: Dict[str, str], database: str = 'benchmark') -> None:
+        super().__init__(database=database)
+        self._entries = dict(entries)
+        self._sorted_ids: Optional[List[str]] = None
+        self._texts: Dict[str, str] = {}
+        self._elements: Dict[str, ET.Element] = {}
+        self.unsupported: Counter = Counter()
+
+    def _initialize_sample_data(self) -> None:
+        pass
+
+    def _ordered_ids(self) -> List[str]:
+        if self._sorted_ids is None:
+            def headword(entry_id: str) -> str:
+                match = HEADWORD.search(self._entries[entry_id])
+                return match.group(1).lower() if match else '￿'
+            self._sorted_ids = sorted(self._entries, key=lambda entry_id: (headword(entry_id), entry_id))
+        return self._sorted_ids
+
+    def _text(self, entry_id: str) -> str:
+        text = self._texts.get(entry_id)
+        if text is None:
+            text = self._texts[entry_id] = '\n'.join(TEXT.findall(self._entries[entry_id])).lower()
+        return text
+
+    def _element(self, entry_id: str) -> ET.Element:
+        element = self._elements.get(entry_id)
+        if element is None:
+            element = self._elements[entry_id] = ET.fromstring(self._entries[entry_id])
+        return element
+
+    def _unsupported(self, query: str) -> UnsupportedQuery:
+        self.unsupported[' '.join(query.split())[:80]] += 1
+        return UnsupportedQuery(query)
+
+    def execute_query(self, query: str, db_name: str = None) -> str:
+        q = query.strip()
+        if q.startswith('xquery '):
+            q = q[len('xquery '):].strip()
+        if 'exists(' in q and 'lift:lift' in q:
+            return 'false'
+        if 'lift-ranges' in q:  # the synthetic dictionary has no ranges document
+            return 'false' if q.startswith('exists(') else ''
+        if q == '/*':
+            return LIFT_HEADER.split('\n', 1)[1] + ''.join(self._entries.values()) + LIFT_FOOTER
+        match = PLAIN_COUNT.match(q)
+        if match:
+            if match.group(1):
+                return str(sum(1 for xml in self._entries.values() if 'variant-type' not in xml))
+            return str(len(self._entries))
+        match = REVERSE_RELATION.match(q)
+        if match:
+            entry_id, relation_type, ref = match.groups()
+            return str(f'<relation type="{relation_type}" ref="{ref}"' in self._entries.get(entry_id, '')).lower()
+        if ENTRY_FOR.search(q):
+            return self._listing(q)
+        if DUPLICATE_ROWS.search(q):
+            return self._duplicate_rows(q)
+        match = STATS_ROWS.match(' '.join(q.split()))
+        if match:
+            ids = [i.replace("''", "'") for i in QUOTED.findall(match.group(1))] if match.group(1) else None
+            return self._stats_rows(ids)
+        match = ENTRY_ID.search(q)
+        if match and 'concat(' not in q:
+            return self._entries.get(match.group(1), '')
+        raise self._unsupported(query)
+
+    def _listing(self, q: str) -> str:
+        """Sorted, optionally filtered and paginated entries (or their count)."""
+        term = None
+        if ' where ' in q or '[some $form' in q:
+            match = CONTAINS_TERM.search(q)
+            if match is None:
+                if 'where true()' not in q:
+                    raise self._unsupported(q)
+            else:
+                term = match.group(1).replace("''", "'").lower()
+        ids = self._ordered_ids()
+        if term:
+            ids = [entry_id for entry_id in ids if term in self._text(entry_id)]
+        if q.startswith('count('):
+            return str(len(ids))
+        window = WINDOW.search(q)
+        if window:
+            start = int(window.group(1) or window.group(3)) - 1
+            ids = ids[start:int(window.group(2))] if window.group(2) else ids[start:]
+        elif not q.endswith(('return $entry', 'return $entry)')) and 'return $entry/@id/string()' not in q:
+            raise self._unsupported(q)
+        if '$entry/@id/string()' in q:
+            return '\n'.join(ids)
+        return ''.join(self._entries[entry_id] for entry_id in ids)
+
+    def _duplicate_rows(self, q: str) -> str:
+        """id|||headword|||citation|||pos|||senses|||definitions|||glosses of non-variant entries."""
+        rows = []
+        for entry_id in self._entries:
+            entry = self._element(entry_id)
+            if _is_variant(entry):
+                continue
+            senses = entry.findall('.//sense')
+            definitions = [t for s in senses for t in _strings(s.findall('definition/form/text')) if t]
+            glosses = [t for s in senses for t in _strings(s.findall('gloss/text')) if t]
+            rows.append('|||'.join([
+                entry.get('id', ''), _first(entry, 'lexical-unit/form/text'), _first(entry, 'citation/form/text'),
+                _entry_pos(entry), str(len(senses)), ', '.join(definitions), ' '.join(glosses),
+            ]))
+        limit = SAMPLE_LIMIT.search(q)
+        return '\n'.join(rows[:int(limit.group(1))] if limit else rows)
+
+    def _stats_rows(self, entry_ids: Optional[List[str]]) -> str:
+        """The statistics store's one line per entry (see DictionaryService._fetch_entry_stats)."""
+        rows = []
+        for entry_id in self._entries if entry_ids is None else [i for i in entry_ids if i in self._entries]:
+            entry = self._element(entry_id)
+            entry_pos = entry.find('grammatical-info')
+            entry_pos = entry_pos.get('value', '') if entry_pos is not None else ''
+            senses = []
+            for sense in entry.iter('sense'):
+                sense_pos = sense.find('grammatical-info')
+                texts = _strings(sense.findall('definition//text') + sense.findall('gloss//text'))
+                senses.append('~~'.join([
+                    sense.get('id', '').translate(str.maketrans('~;', '__')),
+                    sense_pos.get('value', '') if sense_pos is not None else entry_pos,
+                    _flag(sense.find('definition')), _flag(sense.find('gloss')),
+                    str(len(list(sense.iter('example')))),
+                    '1' if ' '.join(' '.join(texts).split()) else '0',
+                ]))
+            blank = [t for s in entry.iter('sense') for t in _strings(s.findall('definition//text') + s.findall('gloss/text'))
+                     if not t.strip()]
+            rows.append('|||'.join([
+                entry_id, ' '.join(_first(entry, 'lexical-unit/form/text').split()),
+                _flag(entry.find('lexical-unit/form/text')), '1' if _is_variant(entry) else '0',
+                _flag(entry.find('citation/form/text')), _flag(entry.find('.//note')),
+                _flag(entry.find('.//pronunciation')), _entry_pos(entry),
+                str(len(list(entry.iter('example')))), str(len(blank)), ';;'.join(senses),
+            ]))
+        return '\n'.join(rows)
+
+    def execute_update(self, query: str, db_name: str = None) -> None:
+        lowered = query.lower()
+        if 'insert node' not in lowered and 'replace node' not in lowered:
+            raise self._unsupported(query)
+        self._sorted_ids = None
+        match = ENTRY_ID.search(query)
+        if match:
+            self._texts.pop(match.group(1), None)
+            self._elements.pop(match.group(1), None)
+        return super().execute_update(query, db_name)
+
+    def execute_command(self, command: str) -> str:
+        if command.startswith('OPEN '):
+            return ''
+        return super().execute_command(command)
+
+
+def _strings(elements: List[ET.Element]) -> List[str]:
+    return [''.join(element.itertext()) for element in elements]
+
+
+def _first(entry: ET.Element, path: str) -> str:
+    return next(iter(_strings(entry.findall(path))), '')
+
+
+def _flag(element: Optional[ET.Element]) -> str:
+    return '0' if element is None else '1'
+
+
+def _is_variant(entry: ET.Element) -> bool:
+    return any(trait.get('name') == 'variant-type' for trait in entry.findall('.//relation/trait'))
+
+
+def _entry_pos(entry: ET.Element) -> str:
+    """First grammatical-info of the entry or of a sense, in document order."""
+    for parent in entry.iter():
+        if parent is entry or parent.tag == 'sense':
+            for child in parent:
+                if child.tag == 'grammatical-info':
+                    return child.get('value', '')
+    return ''
+
+
+def basex_connector(database: str, lift_xml: str):
+    """A scratch BaseX database loaded with the synthetic dictionary."""
+    from app.database.basex_connector import BaseXConnector
+
+    connector = BaseXConnector(
+        host=os.getenv('BASEX_HOST', 'localhost'),
+        port=int(os.getenv('BASEX_PORT', '1984')),
+        username=os.getenv('BASEX_USERNAME', 'admin'),
+        password=os.getenv('BASEX_PASSWORD', 'admin'),
+        database=None,
+    )
+    connector.connect()
+    connector.create_database(database)
+    connector.database = database
+    connector.add_resource('synthetic.lift', lift_xml, db_name=database)
+    return connector
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ---- Benchmarks ----
+# Each takes the shared context and returns (operations, extra result fields).
+
+def bench_parse(ctx: Dict[str, Any]):
+    from app.parsers.lift_parser import LIFTParser
+
+    entries = LIFTParser(validate=False).parse_string(ctx['lift_xml'])
+    ctx['parsed'] = entries
+    return len(entries), {}
+
+
+def bench_serialize(ctx: Dict[str, Any]):
+    service = ctx['service']
+    entries = parsed(ctx)[:ctx['sample']]
+    size = sum(len(service._prepare_entry_xml(entry)) for entry in entries)
+    return len(entries), {'bytes': size}
+
+
+def bench_get(ctx: Dict[str, Any]):
+    service = ctx['service']
+    for entry_id in ctx['sample_ids']:
+        service.get_entry(entry_id)
+    return len(ctx['sample_ids']), {}
+
+
+def bench_list_pages(ctx: Dict[str, Any]):
+    service = ctx['service']
+    pages = max(1, min(ctx['sample'] // PAGE_SIZE, len(ctx['ids']) // PAGE_SIZE))
+    step = max(1, len(ctx['ids']) // PAGE_SIZE // pages)
+    for page in range(pages):
+        service.list_entries(limit=PAGE_SIZE, offset=page * step * PAGE_SIZE)
+    return pages, {'page_size': PAGE_SIZE}
+
+
+def bench_search(ctx: Dict[str, Any]):
+    service = ctx['service']
+    hits = 0
+    for term in SEARCH_TERMS:
+        _, total = service.search_entries(term, limit=PAGE_SIZE, offset=0)
+        hits += total
+    return len(SEARCH_TERMS), {'hits': hits}
+
+
+def bench_save(ctx: Dict[str, Any]):
+    service = ctx['service']
+    entries = [service.get_entry(entry_id) for entry_id in ctx['sample_ids']]
+    started = time.perf_counter()
+    for entry in entries:
+        service.update_entry(entry, record_history=False)
+    return len(entries), {'seconds_excluding_reads': time.perf_counter() - started}
+
+
+def bench_bulk_pos(ctx: Dict[str, Any]):
+    from app.services.bulk_service import BulkOperationsService
+
+    bulk = BulkOperationsService(ctx['service'], workset_service=None)
+    result = bulk.update_pos_bulk(list(ctx['sample_ids']), 'Noun')
+    failed = sum(1 for r in result['results'] if r.get('status') != 'success')
+    return len(ctx['sample_ids']), {'failed': failed}
+
+
+def bench_duplicates(ctx: Dict[str, Any]):
+    result = ctx['service'].get_duplicate_candidates(mode='all')
+    return len(ctx['ids']), {'groups': len(result.get('groups', []))}
+
+
+def bench_export(ctx: Dict[str, Any]):
+    lift = ctx['service'].export_lift()
+    return len(ctx['ids']), {'bytes': len(lift)}
+
+
+def bench_validation(ctx: Dict[str, Any]):
+    from app.services.dictionary_validation_runner import ChunkValidator
+    from app.services.validation_engine import ValidationEngine
+    from app.services.relation_target_index import expand_targets
+
+    targets = expand_targets(ctx['ids'] + [f"{entry_id}_s{i}" for entry_id in ctx['ids'] for i in range(4)])
+    engine = ValidationEngine(existing_entry_ids=targets)
+    validator = ChunkValidator(engine.rules, engine.project_config, targets, 'save')
+    xmls = ctx['entry_xmls'][:ctx['sample']]
+    issues = 0
+    for start in range(0, len(xmls), CHUNK_SIZE):
+        result = validator.validate(''.join(xmls[start:start + CHUNK_SIZE]), {})
+        issues += sum(len(found) for found in result['results'].values())
+    return len(xmls), {'issues': issues}
+
+
+def bench_stats(ctx: Dict[str, Any]):
+    service = ctx['service']
+    store = service.get_stats_store()
+    store.rebuild()
+    store.quality_metrics()
+    store.composition_stats()
+    store.anomalies()
+    return len(ctx['ids']), {}
+
+
+def parsed(ctx: Dict[str, Any]) -> list:
+    if 'parsed' not in ctx:
+        bench_parse(ctx)
+    return ctx['parsed']
+
+
+BENCHMARKS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    'parse': bench_parse,
+    'serialize': bench_serialize,
+    'get': bench_get,
+    'list_pages': bench_list_pages,
+    'search': bench_search,
+    'save': bench_save,
+    'bulk_pos': bench_bulk_pos,
+    'duplicates': bench_duplicates,
+    'export': bench_export,
+    'validation': bench_validation,
+    'stats': bench_stats,
+}
+
+
+def run_benchmark(name: str, ctx: Dict[str, Any], repeat: int) -> Dict[str, Any]:
+    """Best of ``repeat`` runs; skipped when the stand-in could not answer a query."""
+    connector = ctx['connector']
+    best = None
+    for _ in range(repeat):
+        before = sum(getattr(connector, 'unsupported', Counter()).values())
+        started = time.perf_counter()
+        error = None
+        try:
+            ops, extra = BENCHMARKS[name](ctx)
+        except Exception as e:  # services wrap UnsupportedQuery in their own errors
+            error = f'{type(e).__name__}: {e}'
+        seconds = time.perf_counter() - started
+        unsupported = sum(getattr(connector, 'unsupported', Counter()).values()) - before
+        if unsupported:
+            return {'skipped': f'{unsupported} queries need BaseX (run with --basex)'}
+        if error:
+            return {'error': error}
+        if best is None or seconds < best['seconds']:
+            best = {'ops': ops, 'seconds': seconds, 'ops_per_s': ops / seconds if seconds else None, **extra}
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dictionary operations on a synthetic LIFT dictionary')
+    parser.add_argument('--entries', type=int, default=2000, help='dictionary size (1k-500k)')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--sample', type=int, default=200,
+                        help='entries used by the per-entry benchmarks (get, save, bulk, serialize, validation)')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per benchmark; the best is reported')
+    parser.add_argument('--only', nargs='+', choices=sorted(BENCHMARKS), help='run only these benchmarks')
+    parser.add_argument('--basex', action='store_true', help='use a scratch database on a real BaseX server')
+    parser.add_argument('--database', default='benchmark_suite', help='scratch database name')
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    import logging
+    logging.disable(logging.ERROR)
+
+    started = time.perf_counter()
+    generated = list(generate_entries(args.entries, args.seed))
+    ids = [entry_id for entry_id, _ in generated]
+    entry_xmls = [xml for _, xml in generated]
+    lift_xml = LIFT_HEADER + '\n'.join(entry_xmls) + '\n' + LIFT_FOOTER
+    generate_seconds = time.perf_counter() - started
+
+    if args.basex:
+        connector = basex_connector(args.database, lift_xml)
+    else:
+        connector = InMemoryBaseX(dict(generated), database=args.database)
+
+    from app.services.dictionary_service import DictionaryService
+
+    step = max(1, len(ids) // args.sample)
+    ctx = {
+        'connector': connector,
+        'service': DictionaryService(db_connector=connector),
+        'ids': ids,
+        'entry_xmls': entry_xmls,
+        'lift_xml': lift_xml,
+        'sample': min(args.sample, len(ids)),
+        'sample_ids': ids[::step][:args.sample],
+    }
+
+    results: Dict[str, Any] = {
+        'commit': git_commit(),
+        'backend': 'basex' if args.basex else 'in-memory',
+        'python': platform.python_version(),
+        'entries': args.entries,
+        'seed': args.seed,
+        'sample': ctx['sample'],
+        'repeat': args.repeat,
+        'lift_bytes': len(lift_xml),
+        'generate_seconds': generate_seconds,
+        'benchmarks': {},
+    }
+    try:
+        for name in args.only or BENCHMARKS:
+            results['benchmarks'][name] = run_benchmark(name, ctx, args.repeat)
+    finally:
+        if args.basex:
+            connector.drop_database(args.database)
+
+    print(f"{results['entries']} entries, {results['backend']} backend, commit {results['commit']}")
+    print(f"{'benchmark':<12}{'ops':>8}{'seconds':>10}{'ops/s':>12}")
+    for name, result in results['benchmarks'].items():
+        if 'skipped' in result or 'error' in result:
+            print(f"{name:<12}  {result.get('skipped') or 'failed: ' + result['error']}")
+        else:
+            print(f"{name:<12}{result['ops']:>8}{result['seconds']:>10.3f}{result['ops_per_s'] or 0:>12.1f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
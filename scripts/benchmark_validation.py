@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark ValidationEngine.validate_json throughput (entries/second).
+
+Validates synthetic entries with the default rule set twice: rule by rule
+through ``_apply_rule`` (the path validate_json used before compiled plans)
+and through the compiled plan, checks both give the same issues, and
+reports entries/second for each.
+
+Usage:
+    python scripts/benchmark_validation.py
+    python scripts/benchmark_validation.py --entries 5000 --senses 3 --mode save
+    python scripts/benchmark_validation.py --output validation.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.validation_engine import ValidationEngine  # noqa: E402
+
+
+def synthetic_entry(index: int, senses: int, rng: random.Random) -> dict:
+    """An entry dict shaped like Entry.to_dict(), with occasional defects."""
+    word = f"word{index}"
+    entry = {
+        'id': f"entry_{index}" if rng.random() > 0.02 else '',
+        'lexical_unit': {'en': word, 'pl': f"słowo{index}"},
+        'pronunciations': {'seh-fonipa': 'wɜːd'},
+        'notes': {'general': {'en': 'a general note'}},
+        'date_created': '2024-01-01T00:00:00Z',
+        'date_modified': '2024-06-01T12:00:00Z',
+        'relations': [{'type': 'synonym', 'ref': f"entry_{index + 1}"}],
+        'variants': [],
+        'senses': [],
+    }
+    for s in range(senses):
+        entry['senses'].append({
+            'id': f"entry_{index}_s{s}",
+            'definition': {'en': {'text': 'a short definition of the word'}},
+            'gloss': {'pl': {'text': 'glosa' if rng.random() > 0.05 else ' '}},
+            'grammatical_info': rng.choice(['Noun', 'Verb', 'Adjective']),
+            'examples': [{'text': {'en': f"An example using {word}."}}],
+            'relations': [],
+        })
+    return entry
+
+
+def legacy_validate(engine: ValidationEngine, data: dict, mode: str) -> list:
+    issues = []
+    for rule_id, rule_config in engine.rules.items():
+        if not rule_config.get('client_side', True):
+            continue
+        rule_mode = rule_config.get('validation_mode', 'all')
+        if rule_mode == 'save_only' and mode in ['delete', 'draft']:
+            continue
+        elif rule_mode == 'delete_only' and mode != 'delete':
+            continue
+        elif rule_mode == 'draft_only' and mode not in ['draft', 'all']:
+            continue
+        issues.extend(engine._apply_rule(rule_id, rule_config, data))
+    return issues
+
+
+def plan_validate(engine: ValidationEngine, data: dict, mode: str) -> list:
+    result = engine.validate_json(data, mode)
+    return result.errors + result.warnings + result.info
+
+
+def timed(fn, engine: ValidationEngine, entries: list, mode: str) -> tuple:
+    for entry in entries[:20]:  # warm lazily loaded validators
+        fn(engine, entry, mode)
+    start = time.perf_counter()
+    issues = [fn(engine, entry, mode) for entry in entries]
+    return time.perf_counter() - start, issues
+
+
+def signature(issues: list) -> list:
+    return sorted(repr((e.rule_id, e.message, e.path, e.priority.value)) for e in issues)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark validate_json throughput')
+    parser.add_argument('--entries', type=int, default=2000)
+    parser.add_argument('--senses', type=int, default=3, help='senses per entry')
+    parser.add_argument('--mode', default='save', choices=['save', 'delete', 'draft', 'all'])
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    entries = [synthetic_entry(i, args.senses, rng) for i in range(args.entries)]
+    engine = ValidationEngine()
+
+    legacy_seconds, legacy_issues = timed(legacy_validate, engine, entries, args.mode)
+    plan_seconds, plan_issues = timed(plan_validate, engine, entries, args.mode)
+    mismatches = sum(1 for a, b in zip(legacy_issues, plan_issues) if signature(a) != signature(b))
+
+    results = {
+        'entries': args.entries,
+        'senses_per_entry': args.senses,
+        'mode': args.mode,
+        'plan': engine.get_plan().stats(),
+        'rule_by_rule_entries_per_s': args.entries / legacy_seconds,
+        'plan_entries_per_s': args.entries / plan_seconds,
+        'speedup': legacy_seconds / plan_seconds,
+        'issues': sum(len(i) for i in plan_issues),
+        'mismatched_entries': mismatches,
+    }
+
+    print(f"{'path':<14}{'entries/s':>12}")
+    print(f"{'rule by rule':<14}{results['rule_by_rule_entries_per_s']:>12.0f}")
+    print(f"{'plan':<14}{results['plan_entries_per_s']:>12.0f}")
+    print(f"speedup {results['speedup']:.2f}x, {results['issues']} issues, "
+          f"{mismatches} entries with differing results")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
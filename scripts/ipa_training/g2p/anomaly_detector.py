@@ -254,7 +254,8 @@ class G2PAnomalyDetector:
                      show_progress: bool = True,
                      batch_size: int = 64,
                      num_beams: Optional[int] = None,
-                     max_length: Optional[int] = None) -> List[AnomalyResult]:
+                     max_length: Optional[int] = None,
+                     bucket_by_length: bool = False) -> List[AnomalyResult]:
         """
         Detect anomalies for a batch of entries using batched generation (GPU-friendly).
 
@@ -264,20 +265,27 @@ class G2PAnomalyDetector:
             batch_size: Number of entries per batch
             num_beams: Override model beam size for generation
             max_length: Override max generation length
+            bucket_by_length: Batch entries of similar grapheme length together,
+                so short headwords are not padded to the longest one in the input.
+                Results are still returned in input order.
 
         Returns:
-            List of AnomalyResult objects
+            List of AnomalyResult objects, one per entry, in input order
         """
-        results: List[AnomalyResult] = []
+        results: List[Optional[AnomalyResult]] = [None] * len(entries)
         total = len(entries)
         if num_beams is None:
             num_beams = getattr(self.model.config, 'num_beams', 1)
 
+        order = list(range(total))
+        if bucket_by_length:
+            order.sort(key=lambda i: len(entries[i]['lexeme']))
+
         from math import ceil
-        from tqdm import tqdm
 
         it = range(0, total, batch_size)
         if show_progress:
+            from tqdm import tqdm
             it = tqdm(it, total=ceil(total / batch_size), desc="Detecting anomalies")
 
         import time
@@ -285,7 +293,8 @@ class G2PAnomalyDetector:
         for start in it:
             batch_start_time = time.perf_counter()
 
-            batch = entries[start:start + batch_size]
+            positions = order[start:start + batch_size]
+            batch = [entries[i] for i in positions]
             lexemes = [e['lexeme'] for e in batch]
             stored_ipas = [e['ipa'] for e in batch]
             locations = [e.get('location') for e in batch]
@@ -389,16 +398,17 @@ class G2PAnomalyDetector:
                     'confidence_threshold': self.confidence_threshold,
                     'reconstruction_error': recon_err,
                     'reconstruction_threshold': self.reconstruction_threshold,
+                    'location': loc,
                 }
-                results.append(result)
+                results[positions[j]] = result
 
             batch_time = time.perf_counter() - batch_start_time
             samples = len(batch)
             throughput = samples / batch_time if batch_time > 0 else 0.0
 
             # Update progress bar with timings if present
-            try:
-                iterator.set_postfix({
+            if show_progress:
+                it.set_postfix({
                     'batch_time_s': f"{batch_time:.2f}",
                     'token_s': f"{token_time:.2f}",
                     'gen_s': f"{gen_time:.2f}",
@@ -406,9 +416,6 @@ class G2PAnomalyDetector:
                     'auto_s': f"{auto_time:.2f}",
                     's/s': f"{throughput:.2f}"
                 })
-            except Exception:
-                # iterator may be a simple range if show_progress=False
-                print(f"Batch {start}/{total}: batch_time={batch_time:.2f}s, gen={gen_time:.2f}s, s/s={throughput:.2f}")
 
         return results
 
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Profile application startup (worker spawn) time.
+
+Starts fresh interpreters that import the app and call ``create_app`` under
+``python -X importtime`` and reports:
+
+* wall time of each run (import + create_app), and the median;
+* the per-phase profile recorded by create_app (``app.startup_profile``);
+* import time attributed to each top-level package (self time, so the
+  numbers add up) and the slowest ``app.*`` modules (cumulative);
+* optional heavy dependencies that got imported during startup.
+
+With ``--budget-ms`` the script exits with status 1 when the median run is
+over budget, so it can gate CI.
+
+Usage:
+    python scripts/profile_startup.py
+    python scripts/profile_startup.py --runs 5 --config testing --budget-ms 1500
+    python scripts/profile_startup.py --output startup.json
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Optional stacks that should only load on first use
+HEAVY_MODULES = ('sklearn', 'scipy', 'torch', 'sentence_transformers', 'transformers',
+                 'spacy', 'qdrant_client', 'saxonche')
+
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+from app import create_app
+app = create_app({config!r})
+wall_ms = (time.perf_counter() - started) * 1000
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print('@@STARTUP@@' + json.dumps({{'wall_ms': wall_ms, 'profile': app.startup_profile, 'heavy': heavy}}))
+"""
+
+_IMPORT_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def run_once(config: str) -> dict:
+    code = CHILD.format(config=config, heavy=HEAVY_MODULES)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT,
+                          capture_output=True, text=True, timeout=600)
+    marker = next((line for line in proc.stdout.splitlines() if line.startswith('@@STARTUP@@')), None)
+    if marker is None:
+        raise RuntimeError(f"create_app failed:\n{proc.stderr[-2000:]}")
+    result = json.loads(marker[len('@@STARTUP@@'):])
+
+    by_package = defaultdict(int)
+    app_modules = {}
+    for match in _IMPORT_LINE.finditer(proc.stderr):
+        self_us, cumulative_us, name = int(match.group(1)), int(match.group(2)), match.group(4)
+        by_package[name.split('.')[0]] += self_us
+        if name.startswith('app.') or name == 'app':
+            app_modules[name] = max(app_modules.get(name, 0), cumulative_us)
+    result['import_ms_by_package'] = {k: v / 1000 for k, v in by_package.items()}
+    result['app_modules_ms'] = {k: v / 1000 for k, v in app_modules.items()}
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile app startup time')
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--config', default='testing', help='create_app config name')
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--budget-ms', type=float, help='fail when the median run is slower')
+    parser.add_argument('--output', help='write the results as JSON')
+    args = parser.parse_args()
+
+    runs = [run_once(args.config) for _ in range(args.runs)]
+    walls = [r['wall_ms'] for r in runs]
+    median = statistics.median(walls)
+    last = runs[-1]
+
+    print(f"startup wall time: median {median:.0f} ms  "
+          f"(runs: {', '.join(f'{w:.0f}' for w in walls)})\n")
+    print("create_app phases (last run):")
+    for phase in last['profile']['phases']:
+        print(f"  {phase['name']:<34}{phase['ms']:>9.1f} ms")
+
+    print(f"\nimport time by package (self time, last run, top {args.top}):")
+    packages = sorted(last['import_ms_by_package'].items(), key=lambda kv: kv[1], reverse=True)
+    for name, ms in packages[:args.top]:
+        print(f"  {name:<34}{ms:>9.1f} ms")
+
+    print(f"\nslowest app modules (cumulative, last run, top {args.top}):")
+    modules = sorted(last['app_modules_ms'].items(), key=lambda kv: kv[1], reverse=True)
+    for name, ms in modules[:args.top]:
+        print(f"  {name:<50}{ms:>9.1f} ms")
+
+    heavy = sorted({m for r in runs for m in r['heavy']})
+    print(f"\nheavy optional modules loaded at startup: {', '.join(heavy) or 'none'}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'median_ms': median, 'runs': runs}, f, indent=2)
+
+    if args.budget_ms is not None and median > args.budget_ms:
+        print(f"\nOVER BUDGET: {median:.0f} ms > {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
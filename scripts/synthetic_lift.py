@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Generate deterministic synthetic LIFT dictionaries for benchmarking.
+
+Entries get 1-4 senses with glosses, definitions, grammatical info and
+examples, plus pronunciations, variants, notes and relations to other
+entries. Every 40th headword repeats an earlier one (exact duplicates) and
+every 25th differs from an earlier one by one letter (near duplicates), so
+duplicate scans have something to find. The same ``--entries``/``--seed``
+always produce the same file, which keeps benchmark results comparable
+across commits.
+
+Usage:
+    python scripts/synthetic_lift.py --entries 10000 --output /tmp/synthetic_10k.lift
+    python scripts/synthetic_lift.py --entries 500000 --seed 3 --output /tmp/synthetic_500k.lift
+"""
+
+import argparse
+import os
+import random
+import sys
+import uuid
+from typing import Iterator, List, Tuple
+from xml.sax.saxutils import escape
+
+ONSETS = ['', 'b', 'br', 'd', 'f', 'g', 'h', 'k', 'kl', 'l', 'm', 'n', 'p', 'pr', 'r', 's', 'st', 't', 'tr', 'w']
+NUCLEI = ['a', 'e', 'i', 'o', 'u', 'ai', 'ea', 'oo']
+CODAS = ['', '', 'n', 'r', 's', 't', 'k', 'nd', 'st']
+IPA = {'a': 'æ', 'e': 'ɛ', 'i': 'ɪ', 'o': 'ɒ', 'u': 'ʌ', 'ai': 'ɑɪ', 'ea': 'iː', 'oo': 'uː'}
+POS = ['Noun', 'Verb', 'Adjective', 'Adverb', 'Preposition']
+RELATION_TYPES = ['synonym', 'antonym', '_component-lexeme', 'compare']
+GLOSS_WORDS = ['dom', 'woda', 'droga', 'czas', 'ręka', 'słowo', 'miasto', 'praca', 'rzecz', 'strona']
+DEFINITION_WORDS = ['a', 'the', 'small', 'large', 'kind', 'of', 'place', 'person', 'thing', 'used', 'for',
+                    'making', 'moving', 'quickly', 'something', 'that', 'is', 'old', 'new', 'open']
+NOTE_EVERY = 7
+VARIANT_EVERY = 11
+EXACT_DUPLICATE_EVERY = 40
+NEAR_DUPLICATE_EVERY = 25
+
+LIFT_HEADER = '<?xml version="1.0" encoding="UTF-8"?>\n<lift version="0.13">\n'
+LIFT_FOOTER = '</lift>\n'
+
+
+def _syllable(rng: random.Random) -> Tuple[str, str]:
+    onset, nucleus, coda = rng.choice(ONSETS), rng.choice(NUCLEI), rng.choice(CODAS)
+    return onset + nucleus + coda, onset.replace('g', 'ɡ') + IPA[nucleus] + coda
+
+
+def _headwords(count: int, rng: random.Random) -> List[Tuple[str, str]]:
+    """(headword, IPA) pairs, with planted exact and near duplicates."""
+    words: List[Tuple[str, str]] = []
+    for index in range(count):
+        if index and index % EXACT_DUPLICATE_EVERY == 0:
+            words.append(words[rng.randrange(index)])
+            continue
+        if index and index % NEAR_DUPLICATE_EVERY == 0:
+            word, ipa = words[rng.randrange(index)]
+            position = rng.randrange(len(word))
+            words.append((word[:position] + rng.choice('aeiou') + word[position + 1:], ipa))
+            continue
+        syllables = [_syllable(rng) for _ in range(rng.randint(1, 3))]
+        words.append((''.join(s[0] for s in syllables), 'ˈ' + ''.join(s[1] for s in syllables)))
+    return words
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    return ' '.join(rng.choice(DEFINITION_WORDS) for _ in range(length))
+
+
+def _form(lang: str, text: str) -> str:
+    return f'<form lang="{lang}"><text>{escape(text)}</text></form>'
+
+
+def generate_entries(count: int, seed: int = 1) -> Iterator[Tuple[str, str]]:
+    """Yield ``(entry_id, entry_xml)`` for ``count`` synthetic entries."""
+    rng = random.Random(seed)
+    words = _headwords(count, rng)
+    ids = [f"{word}_{uuid.UUID(int=rng.getrandbits(128), version=4)}" for word, _ in words]
+
+    for index, ((word, ipa), entry_id) in enumerate(zip(words, ids)):
+        day = 1 + index % 28
+        parts = [
+            f'<entry id="{entry_id}" guid="{entry_id.rsplit("_", 1)[1]}" '
+            f'dateCreated="2024-01-{day:02d}T10:00:00Z" dateModified="2024-06-{day:02d}T12:00:00Z">',
+            f'<lexical-unit>{_form("en", word)}</lexical-unit>',
+            f'<pronunciation>{_form("seh-fonipa", ipa)}</pronunciation>',
+        ]
+        if index % VARIANT_EVERY == 0:
+            parts.append(f'<variant>{_form("en", word + "s")}</variant>')
+        if index % NOTE_EVERY == 0:
+            parts.append(f'<note type="general">{_form("en", _sentence(rng, 6))}</note>')
+        for _ in range(rng.randint(0, 2)):
+            target = ids[rng.randrange(count)]
+            relation_type = rng.choice(RELATION_TYPES)
+            if target != entry_id:  # a self-reference would fail entry validation
+                parts.append(f'<relation type="{relation_type}" ref="{target}"/>')
+
+        pos = rng.choice(POS)
+        for order in range(rng.choices([1, 2, 3, 4], weights=[50, 30, 15, 5])[0]):
+            sense = [
+                f'<sense id="{entry_id}_s{order}" order="{order}">',
+                f'<grammatical-info value="{pos}"/>',
+                f'<gloss lang="pl"><text>{rng.choice(GLOSS_WORDS)}</text></gloss>',
+                f'<definition>{_form("en", _sentence(rng, rng.randint(4, 12)))}</definition>',
+            ]
+            for _ in range(rng.randint(0, 2)):
+                sense.append(
+                    f'<example>{_form("en", f"The {word} is {_sentence(rng, 4)}.")}'
+                    f'<translation>{_form("pl", rng.choice(GLOSS_WORDS))}</translation></example>'
+                )
+            sense.append('</sense>')
+            parts.append(''.join(sense))
+        parts.append('</entry>')
+        yield entry_id, ''.join(parts)
+
+
+def write_lift(path: str, count: int, seed: int = 1) -> int:
+    """Stream a synthetic LIFT file to ``path``; returns the number of entries written."""
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(LIFT_HEADER)
+        for _, entry_xml in generate_entries(count, seed):
+            f.write(entry_xml)
+            f.write('\n')
+            written += 1
+        f.write(LIFT_FOOTER)
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic LIFT dictionary')
+    parser.add_argument('--entries', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', required=True, help='LIFT file to write')
+    args = parser.parse_args()
+
+    written = write_lift(args.output, args.entries, args.seed)
+    print(f"Wrote {written} entries ({os.path.getsize(args.output) / 1e6:.1f} MB) to {args.output}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,7 +12,7 @@ from app.services.validation_engine import SchematronValidator
 
 
 @pytest.mark.integration
-def test_schematron_xslt2_with_saxon(tmp_path: Path):
+def test_schematron_xslt2_with_saxon(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     saxon_jar = os.getenv('SAXON_JAR')
     if not saxon_jar or not Path(saxon_jar).exists():
         pytest.skip('Saxon JAR not configured (set SAXON_JAR env var to run)')
@@ -38,6 +38,7 @@ def test_schematron_xslt2_with_saxon(tmp_path: Path):
     except Exception as e:
         pytest.skip(f'iso_svrl_for_xslt2.xsl is invalid: {e}')
 
+    monkeypatch.setenv('SCHEMATRON_COMPILED_DIR', str(tmp_path / 'compiled'))
     validator = SchematronValidator(schema_file=str(schema_file))
 
     # Validator should be configured as saxon-based
@@ -0,0 +1,27 @@
+"""
+Smoke test for scripts/benchmark_suite.py on the in-memory backend.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.mark.skip_et_mock
+def test_every_benchmark_runs_without_basex(tmp_path):
+    output = tmp_path / "results.json"
+    subprocess.run(
+        [sys.executable, str(ROOT / "scripts" / "benchmark_suite.py"),
+         "--entries", "50", "--repeat", "1", "--output", str(output)],
+        cwd=ROOT, check=True, capture_output=True, timeout=600,
+    )
+
+    benchmarks = json.loads(output.read_text())["benchmarks"]
+    assert {name: result for name, result in benchmarks.items() if "ops" not in result} == {}
+    assert benchmarks["duplicates"]["ops"] == benchmarks["stats"]["ops"] == 50
+    assert benchmarks["bulk_pos"]["failed"] == 0
@@ -3,11 +3,14 @@ Test suite for Redis caching implementation.
 """
 from __future__ import annotations
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, patch
 import redis
 
-from app.services.cache_service import CacheService
+from app.services.cache_service import CacheService, LocalCache, _MISSING
 
 
 class TestCacheService:
@@ -95,3 +98,185 @@ class TestCacheService:
             cache_service.set('test', {'data': 'test'})
             result = cache_service.get('test')
             assert result is None
+
+
+class TestTwoTierCache:
+    """Test the in-process L1 tier, namespaces and single-flight."""
+
+    def setup_method(self):
+        CacheService._instance = None
+        CacheService._connection_attempted = False
+
+    def _service(self, mock_redis):
+        mock_client = Mock()
+        mock_redis.return_value = mock_client
+        mock_client.ping.return_value = True
+        mock_client.setex.return_value = True
+        mock_client.get.return_value = None
+        mock_client.ttl.return_value = 60
+        mock_client.set.return_value = True
+        return CacheService(), mock_client
+
+    def test_l1_hit_skips_redis(self):
+        with patch.dict('os.environ', {'REDIS_ENABLED': 'true'}), patch('redis.Redis') as mock_redis:
+            cache_service, mock_client = self._service(mock_redis)
+
+            cache_service.set('entries:a', {'n': 1}, 300)
+            first = cache_service.get('entries:a')
+            first['n'] = 2
+
+            assert cache_service.get('entries:a') == {'n': 1}
+            mock_client.get.assert_not_called()
+            assert cache_service.get_prefix_stats()['entries']['l1_hits'] == 2
+
+    def test_l2_hit_is_promoted_to_l1(self):
+        with patch.dict('os.environ', {'REDIS_ENABLED': 'true'}), patch('redis.Redis') as mock_redis:
+            cache_service, mock_client = self._service(mock_redis)
+            mock_client.get.return_value = b'[1, 2]'
+
+            assert cache_service.get('stats:x') == [1, 2]
+            assert cache_service.get('stats:x') == [1, 2]
+            assert mock_client.get.call_count == 1
+            stats = cache_service.get_prefix_stats()['stats']
+            assert (stats['l1_hits'], stats['l2_hits']) == (1, 1)
+
+    def test_local_cache_lru_and_ttl(self):
+        local = LocalCache(max_entries=2)
+        local.set('a', 1, 60)
+        local.set('b', 2, 60)
+        local.get('a')
+        local.set('c', 3, 60)
+        local.set('d', 4, -1)
+
+        assert local.get('b') is _MISSING
+        assert (local.get('a'), local.get('c'), local.get('d')) == (1, 3, _MISSING)
+        assert local.evictions == 1
+
+        with patch('app.services.cache_service.time.monotonic', return_value=time.monotonic() + 120):
+            assert local.get('a') is _MISSING
+
+    def test_bump_namespace_changes_versioned_keys(self):
+        with patch.dict('os.environ', {'REDIS_ENABLED': 'true'}), patch('redis.Redis') as mock_redis:
+            cache_service, mock_client = self._service(mock_redis)
+            pipeline = mock_client.pipeline.return_value
+            pipeline.execute.side_effect = [[1, True], [2, True]]
+
+            before = cache_service.versioned_key('entries', 'dict', 10, 0)
+            assert before == 'entries:dict:v1:10:0'
+            assert cache_service.bump_namespace('entries', 'dict') == 2
+            assert cache_service.versioned_key('entries', 'dict', 10, 0) == 'entries:dict:v2:10:0'
+            pipeline.incr.assert_called_with('entries:version:dict', 1)
+
+    def test_bump_namespace_without_redis(self):
+        with patch.dict('os.environ', {'REDIS_ENABLED': 'true'}), patch('redis.Redis') as mock_redis:
+            mock_redis.side_effect = redis.ConnectionError("Redis unavailable")
+            cache_service = CacheService()
+
+            cache_service.set('entries:dict:v1:k', 'old')
+            cache_service.bump_namespace('entries', 'dict')
+
+            assert cache_service.versioned_key('entries', 'dict', 'k') == 'entries:dict:v2:k'
+            assert cache_service.get('entries:dict:v2:k') is None
+
+    def test_get_or_set_coalesces_concurrent_misses(self):
+        with patch.dict('os.environ', {'REDIS_ENABLED': 'true'}), patch('redis.Redis') as mock_redis:
+            cache_service, _ = self._service(mock_redis)
+            calls = []
+
+            def factory():
+                calls.append(1)
+                time.sleep(0.1)
+                return {'value': 42}
+
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(cache_service.get_or_set('dash:k', factory, 60)))
+                for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+            assert len(calls) == 1
+            assert results == [{'value': 42}] * 5
+
+    def test_sets_use_atomic_redis_commands(self):
+        with patch.dict('os.environ', {'REDIS_ENABLED': 'true'}), patch('redis.Redis') as mock_redis:
+            cache_service, mock_client = self._service(mock_redis)
+            pipeline = mock_client.pipeline.return_value
+            pipeline.execute.return_value = [{b'a', b'b'}, 1]
+
+            assert cache_service.add_to_set('deps:x', ['a'], ttl=60)
+            assert sorted(cache_service.pop_set('deps:x')) == ['a', 'b']
+
+            pipeline.sadd.assert_called_once_with('deps:x', 'a')
+            pipeline.smembers.assert_called_once_with('deps:x')
+            pipeline.delete.assert_called_once_with('deps:x')
+            mock_client.get.assert_not_called()
+
+    def test_sets_without_redis(self):
+        with patch.dict('os.environ', {'REDIS_ENABLED': 'true'}), patch('redis.Redis') as mock_redis:
+            mock_redis.side_effect = redis.ConnectionError("Redis unavailable")
+            cache_service = CacheService()
+
+            cache_service.add_to_set('deps:x', ['a', 'b'])
+            cache_service.add_to_set('deps:x', ['b', 'c'])
+
+            assert cache_service.pop_set('deps:x') == ['a', 'b', 'c']
+            assert cache_service.pop_set('deps:x') == []
+
+    def test_local_only_when_redis_unavailable(self):
+        with patch.dict('os.environ', {'REDIS_ENABLED': 'true'}), patch('redis.Redis') as mock_redis:
+            mock_redis.side_effect = redis.ConnectionError("Redis unavailable")
+            cache_service = CacheService()
+
+            assert cache_service.is_available() and not cache_service.is_redis_available()
+            cache_service.set('test', {'data': 'test'})
+            assert cache_service.get('test') == {'data': 'test'}
+            assert cache_service.get_stats()['status'] == 'local_only'
+
+    def test_disabled_cache_stores_nothing(self):
+        with patch.dict('os.environ', {'REDIS_ENABLED': 'false'}):
+            cache_service = CacheService()
+
+            assert cache_service.set('test', 1) is False
+            assert cache_service.get('test') is None
+            assert cache_service.get_or_set('test', lambda: 5) == 5
+
+    def test_validators_invalidate_entries_by_namespace(self):
+        from app.validators.hunspell_validator import HunspellValidator
+        from app.validators.languagetool_validator import LanguageToolValidator
+
+        with patch.dict('os.environ', {'REDIS_ENABLED': 'true'}), patch('redis.Redis') as mock_redis:
+            mock_redis.side_effect = redis.ConnectionError("Redis unavailable")
+            cache_service = CacheService()
+
+            for validator in (HunspellValidator(cache_service=cache_service),
+                              LanguageToolValidator(cache_service=cache_service)):
+                key = validator.get_cache_key('e1', 'a text', lang='en')
+                other_key = validator.get_cache_key('e2', 'a text', lang='en')
+                cache_service.set(key, {'is_valid': False})
+
+                validator.invalidate_for_entry('e1')
+
+                new_key = validator.get_cache_key('e1', 'a text', lang='en')
+                assert new_key != key and cache_service.get(new_key) is None
+                assert validator.get_cache_key('e2', 'a text', lang='en') == other_key
+
+    def test_validator_keys_see_other_workers_bumps_at_once(self):
+        from app.validators.hunspell_validator import HunspellValidator
+
+        with patch.dict('os.environ', {'REDIS_ENABLED': 'true'}), patch('redis.Redis') as mock_redis:
+            cache_service, mock_client = self._service(mock_redis)
+            validator = HunspellValidator(cache_service=cache_service)
+
+            key = validator.get_cache_key('e1', 'a text', lang='en')
+            mock_client.get.return_value = b'2'  # bumped by another process
+
+            assert validator.get_cache_key('e1', 'a text', lang='en') != key
+            # Other namespaces keep the refresh window
+            cache_service.namespace_version('entries', 'dict')
+            reads = mock_client.get.call_count
+            cache_service.namespace_version('entries', 'dict')
+            assert mock_client.get.call_count == reads
@@ -0,0 +1,118 @@
+"""
+Unit tests for the compact read-only entry representation.
+"""
+
+import pytest
+
+from app.models.compact_entry import CompactEntry, multitext_get, pack_multitext, unpack_multitext
+from app.models.entry import Entry
+from app.models.example import Example
+from app.models.sense import Sense
+from app.parsers.lift_entry_writer import write_entry_xml
+from app.parsers.lift_parser import LIFTParser
+
+pytestmark = pytest.mark.skip_et_mock
+
+LIFT = '''<lift>
+  <entry id="house_1" dateCreated="2024-01-01T10:00:00Z" order="1">
+    <lexical-unit><form lang="en"><text>house</text></form><form lang="pl"><text>dom</text></form></lexical-unit>
+    <pronunciation><form lang="seh-fonipa"><text>haʊs</text></form></pronunciation>
+    <variant type="spelling"><form lang="en"><text>hous</text></form><trait name="dialect" value="old"/></variant>
+    <trait name="status" value="draft"/>
+    <relation type="synonym" ref="home_2"><trait name="strength" value="high"/></relation>
+    <etymology type="borrowed" source="Old English"><form lang="ang"><text>hūs</text></form></etymology>
+    <note type="usage"><form lang="en"><text>Common.</text></form></note>
+    <sense id="house_1_s0">
+      <grammatical-info value="Noun"/>
+      <gloss lang="pl"><text>dom</text></gloss>
+      <definition><form lang="en"><text>a building</text></form></definition>
+      <example id="ex1"><form lang="en"><text>A big house.</text></form>
+        <translation><form lang="pl"><text>Duży dom.</text></form></translation></example>
+      <trait name="semantic-domain-ddp4" value="6.5.1"/>
+      <subsense id="house_1_s0_0"><gloss lang="pl"><text>domostwo</text></gloss></subsense>
+    </sense>
+  </entry>
+  <entry id="home_2">
+    <lexical-unit><form lang="en"><text>home</text></form></lexical-unit>
+    <sense id="home_2_s0"><grammatical-info value="Noun"/><gloss lang="pl"><text>dom</text></gloss></sense>
+  </entry>
+</lift>'''
+
+
+def test_multitext_packing():
+    packed = pack_multitext({'en': 'house', 'pl': 'dom'})
+
+    assert packed == ('en', 'house', 'pl', 'dom')
+    assert unpack_multitext(packed) == {'en': 'house', 'pl': 'dom'}
+    assert multitext_get(packed, 'pl') == 'dom' and multitext_get(packed, 'de') is None
+    assert pack_multitext({}) == () and pack_multitext(None) == ()
+
+
+def test_parsed_entries_round_trip():
+    parser = LIFTParser(validate=False)
+    for entry in parser.parse_string(LIFT):
+        rebuilt = CompactEntry.from_entry(entry).to_entry()
+
+        assert isinstance(rebuilt, Entry)
+        assert rebuilt.to_dict() == entry.to_dict()
+        assert write_entry_xml(rebuilt) == write_entry_xml(entry)
+
+
+def test_snapshot_shapes_round_trip():
+    sense = Sense(id_='s1', glosses={'en': 'x'},
+                  examples=[{'en': 'legacy example'}],
+                  subsenses=[{'id': 's1_0', 'glosses': {'en': 'from dict'}}])
+    entry = Entry(id_='e1', lexical_unit={'en': 'x'}, morph_type='stem', senses=[sense],
+                  domain_type=['general'], citations=[{'en': 'x!'}])
+
+    assert CompactEntry.from_entry(entry).to_entry().to_dict() == entry.to_dict()
+
+
+def test_parse_string_compact():
+    compact = LIFTParser(validate=False).parse_string_compact(LIFT)
+
+    assert [type(e) for e in compact] == [CompactEntry, CompactEntry]
+    house, home = compact
+    assert house.headword == 'house' and house.lexical_unit == ('en', 'house', 'pl', 'dom')
+    assert house.senses[0].examples[0].translations == ('pl', 'Duży dom.')
+    assert house.senses[0].subsenses[0].glosses == ('pl', 'domostwo')
+    assert house.relations[0].traits == {'strength': 'high'}
+    assert house.extra['notes'] and home.extra is None
+
+    # Language codes and grammatical info are shared between entries
+    assert house.senses[0].glosses[0] is home.senses[0].glosses[0]
+    assert house.senses[0].grammatical_info is home.senses[0].grammatical_info
+
+
+def test_compact_entries_are_read_only():
+    entry = LIFTParser(validate=False).parse_string_compact(LIFT)[0]
+
+    with pytest.raises(AttributeError):
+        entry.lexical_unit = ('en', 'hut')
+    with pytest.raises(AttributeError):
+        entry.senses[0].examples[0].form = ()
+    with pytest.raises(AttributeError):
+        entry.new_field = 1
+
+    # Editing the rebuilt model leaves the compact entry alone
+    rebuilt = entry.to_entry()
+    rebuilt.notes['usage']['en'] = 'Rare.'
+    rebuilt.senses[0].examples.append(Example(id_='ex2', form={'en': 'Another.'}))
+    assert entry.extra['notes']['usage'] != rebuilt.notes['usage']
+    assert len(entry.senses[0].examples) == 1
+
+
+def test_markdown_export_reads_compact_entries(tmp_path):
+    from unittest.mock import MagicMock
+    from app.exporters.markdown_exporter import MarkdownExporter
+
+    full = LIFTParser(validate=False).parse_string(LIFT)
+    compact = [CompactEntry.from_entry(e) for e in full]
+    dictionary_service = MagicMock()
+    dictionary_service.list_entries.return_value = (compact, len(compact))
+
+    exported = MarkdownExporter(dictionary_service).export(str(tmp_path / 'compact.md'))
+    expected = MarkdownExporter(dictionary_service).export(str(tmp_path / 'full.md'), entries=full)
+
+    dictionary_service.list_entries.assert_called_once_with(limit=None, compact=True)
+    assert open(exported, encoding='utf-8').read() == open(expected, encoding='utf-8').read()
@@ -0,0 +1,140 @@
+"""
+Unit tests for the materialized dashboard statistics store.
+"""
+
+from unittest.mock import MagicMock
+
+from app.services.dictionary_service import DictionaryService
+from app.services.dictionary_stats_store import DictionaryStatsStore, EntryStats, SenseStats
+
+
+def _sense(sid, pos='Noun', definition=True, gloss=False, examples=0, text=True):
+    return SenseStats(sid, pos, definition, gloss, examples, text)
+
+
+def _entry(eid, headword, senses=(), variant=False, pron=True, pos='Noun', examples=0):
+    return EntryStats(
+        entry_id=eid, headword=headword, has_headword=bool(headword), is_variant=variant,
+        has_citation=False, has_note=False, has_pronunciation=pron, pos=pos,
+        example_count=examples, empty_text_count=0, senses=tuple(senses),
+    )
+
+
+def _records():
+    return {
+        'e1': _entry('e1', 'cat', [_sense('s1', examples=1)], examples=1),
+        'e2': _entry('e2', 'cat', [_sense('s2', pos='n', definition=False, text=False)], pron=False),
+        'e3': _entry('e3', 'colour', [], variant=True, pron=False, pos=''),
+        'e4': _entry('e4', 'dog', [], pron=False),
+    }
+
+
+def _store(records):
+    loader = MagicMock(side_effect=lambda ids: [
+        r for eid, r in records.items() if ids is None or eid in ids
+    ])
+    return DictionaryStatsStore(loader), loader
+
+
+class TestDictionaryStatsStore:
+
+    def test_quality_metrics_exclude_variants(self):
+        store, _ = _store(_records())
+        metrics = store.quality_metrics()
+
+        assert metrics['totals'] == {'entries': 4, 'senses': 2, 'examples': 1}
+        assert metrics['entries_without_senses']['count'] == 1
+        assert metrics['entries_without_senses']['samples'] == [{'id': 'e4', 'headword': 'dog'}]
+        assert metrics['entries_without_pronunciations']['count'] == 2
+        assert metrics['senses_without_content']['count'] == 1
+        assert metrics['senses_without_examples']['count'] == 1
+
+    def test_composition_stats(self):
+        store, _ = _store(_records())
+        stats = store.composition_stats()
+
+        assert stats['total_entries'] == 4
+        assert stats['pos_distribution'] == {'Noun': 3, 'UNSPECIFIED': 1}
+        assert stats['field_coverage']['sense'] == {'count': 2, 'pct': 50.0}
+        assert [b['count'] for b in stats['senses_per_entry']] == [2, 2, 0, 0, 0, 0]
+        assert [b['count'] for b in stats['examples_per_sense']] == [1, 1, 0, 0]
+
+    def test_anomalies(self):
+        store, _ = _store(_records())
+        anomalies = store.anomalies()
+
+        assert anomalies['duplicate_headwords'] == [{'headword': 'cat', 'entry_ids': ['e1', 'e2'], 'count': 2}]
+        assert anomalies['non_canonical_pos'][0]['entry_id'] == 'e2'
+        assert anomalies['non_canonical_pos'][0]['pos_value'] == 'n'
+        assert anomalies['empty_senses'] == [{'entry_id': 'e2', 'sense_id': 's2'}]
+        assert anomalies['missing_headwords'] == []
+
+    def test_incremental_update_matches_rebuild(self):
+        records = _records()
+        store, loader = _store(records)
+        store.quality_metrics()
+
+        records['e2'] = _entry('e2', 'kitten', [_sense('s2'), _sense('s3', examples=2)], examples=2)
+        records['e5'] = _entry('e5', '', [_sense('s5')])
+        store.refresh_entries(['e2', 'e5'])
+        store.remove_entry('e4')
+        del records['e4']
+        loader.assert_called_with(['e2', 'e5'])
+
+        fresh, _ = _store(records)
+        assert store.quality_metrics() == fresh.quality_metrics()
+        assert store.composition_stats() == fresh.composition_stats()
+        assert store.anomalies() == fresh.anomalies()
+        assert store.anomalies()['missing_headwords'] == [{'entry_id': 'e5'}]
+        assert store.anomalies()['duplicate_headwords'] == []
+
+    def test_updates_ignored_until_built(self):
+        store, loader = _store(_records())
+        store.refresh_entries(['e1'])
+        store.remove_entry('e1')
+        assert loader.call_count == 0
+
+    def test_stale_store_reconciles_in_background(self):
+        records = _records()
+        store, loader = _store(records)
+        store.sense_and_example_counts()
+        store.reconcile_interval_seconds = 0
+
+        store.sense_and_example_counts()
+        store._reconcile_thread.join(timeout=5)
+        assert loader.call_count == 2
+
+
+class TestDictionaryServiceStats:
+
+    def test_load_entry_stats_parses_rows(self):
+        connector = MagicMock()
+        connector.database = 'dictionary'
+        connector.execute_query.return_value = (
+            "e1|||cat|||1|||0|||0|||1|||1|||Noun|||3|||1|||s1~~Noun~~1~~0~~2~~1;;s2~~n~~0~~0~~1~~0\n"
+            "e2||||||0|||1|||0|||0|||0||||||0|||0|||\n"
+        )
+        service = DictionaryService(db_connector=connector)
+
+        records = service._load_entry_stats('dictionary')
+
+        assert records[0].headword == 'cat'
+        assert records[0].has_note and records[0].has_pronunciation and not records[0].is_variant
+        assert records[0].senses == (
+            SenseStats('s1', 'Noun', True, False, 2, True),
+            SenseStats('s2', 'n', False, False, 1, False),
+        )
+        assert records[1].is_variant and records[1].senses == () and not records[1].has_headword
+
+    def test_quality_metrics_read_from_store(self):
+        connector = MagicMock()
+        connector.database = 'dictionary'
+        connector.execute_query.return_value = "e1|||cat|||1|||0|||0|||0|||1|||Noun|||0|||0|||s1~~Noun~~1~~0~~0~~1"
+        service = DictionaryService(db_connector=connector)
+
+        assert service.get_quality_metrics()['totals'] == {'entries': 1, 'senses': 1, 'examples': 0}
+        calls = connector.execute_query.call_count
+
+        assert service.count_senses_and_examples() == (1, 0)
+        assert service.get_composition_stats()['total_entries'] == 1
+        assert connector.execute_query.call_count == calls
@@ -0,0 +1,230 @@
+"""
+Unit tests for the whole-dictionary validation runner.
+"""
+
+from __future__ import annotations
+
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from app.services.dictionary_validation_runner import DictionaryValidationRunner
+from app.services.validation_engine import ValidationEngine
+from app.utils.xquery_builder import XQueryBuilder
+
+
+def _entry_xml(entry_id, modified='2024-01-01T00:00:00Z', word='word', gloss='glosa'):
+    return (f'<entry id="{entry_id}" dateModified="{modified}">'
+            f'<lexical-unit><form lang="en"><text>{word}</text></form></lexical-unit>'
+            f'<sense id="{entry_id}_s1"><gloss lang="pl"><text>{gloss}</text></gloss></sense></entry>')
+
+
+class _FakeBaseX:
+    """Answers the runner's three queries from an in-memory set of entries."""
+
+    def __init__(self, entries):
+        self.database = 'dict'
+        self.entries = entries  # entry_id -> (dateModified, xml)
+        self.fetched = []
+
+    def execute_query(self, query):
+        if "'|||'" in query:
+            return '\n'.join(f"{i}|||{m}" for i, (m, _) in self.entries.items())
+        if '@guid' in query:
+            return '\n'.join(list(self.entries) + [f"{i}_s1" for i in self.entries])
+        ids = re.findall(r"'([^']*)'", query.split('@id = (', 1)[1])
+        self.fetched.extend(ids)
+        return ''.join(self.entries[i][1] for i in ids if i in self.entries)
+
+
+def _rule(rule_id, path, pattern=None, message='bad'):
+    validation = {'type': 'string', 'minLength': 1}
+    if pattern:
+        validation['pattern'] = pattern
+    return {'name': rule_id, 'path': path, 'condition': 'if_present', 'validation': validation,
+            'priority': 'critical', 'category': 'entry_level', 'error_message': message}
+
+
+@pytest.fixture
+def results_app():
+    from flask import Flask
+    from app.models.workset_models import db
+    from app.models.validation_cache_models import (
+        EntryValidationResult, ValidationRuleSetVersion, ValidationRunLock,
+    )
+
+    app = Flask(__name__)
+    app.config.update({'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:', 'SQLALCHEMY_TRACK_MODIFICATIONS': False})
+    db.init_app(app)
+    with app.app_context():
+        db.metadata.create_all(db.engine, tables=[
+            EntryValidationResult.__table__, ValidationRuleSetVersion.__table__,
+            ValidationRunLock.__table__])
+        yield app
+        db.session.remove()
+    ValidationEngine.clear_project_cache()
+
+
+@pytest.fixture
+def basex():
+    return _FakeBaseX({
+        'a': ('2024-01-01T00:00:00Z', _entry_xml('a')),
+        'b': ('2024-01-01T00:00:00Z', _entry_xml('b', word='Bad1')),
+        'c': ('2024-01-01T00:00:00Z', _entry_xml('c')),
+    })
+
+
+@pytest.fixture
+def runner(basex):
+    service = SimpleNamespace(db_connector=basex, _query_builder=XQueryBuilder(),
+                              _detect_namespace_usage=lambda: False)
+    return DictionaryValidationRunner(service)
+
+
+def _issues(entry_id):
+    """Stored issues of the test rules (project rules extend the default set)."""
+    from app.models.validation_cache_models import EntryValidationResult
+    row = EntryValidationResult.query.filter_by(db_name='dict', entry_id=entry_id).one()
+    return sorted(issue['rule_id'] for issue in row.issues if issue['rule_id'].startswith('NO_'))
+
+
+@pytest.mark.skip_et_mock
+class TestDictionaryValidationRunner:
+
+    def _set_rules(self, *rules):
+        ValidationEngine.set_project_rules('p', {rule_id: config for rule_id, config in rules})
+
+    def test_rerun_validates_only_changed_entries(self, results_app, runner, basex):
+        self._set_rules(('NO_DIGITS', _rule('NO_DIGITS', '$.lexical_unit.*', pattern=r'^\D*$')))
+
+        first = runner.run(project_id='p', workers=1)
+        assert (first['entries'], first['validated'], first['processed']) == (3, 3, 3)
+        assert _issues('b') == ['NO_DIGITS'] and _issues('a') == []
+        assert first['entries_per_second'] > 0
+        assert {cost['rule_id'] for cost in first['rule_costs']} >= {'NO_DIGITS'}
+
+        basex.fetched.clear()
+        second = runner.run(project_id='p', workers=1)
+        assert (second['validated'], second['unchanged'], basex.fetched) == (0, 3, [])
+
+        basex.entries['b'] = ('2024-02-01T00:00:00Z', _entry_xml('b', word='fixed'))
+        del basex.entries['c']
+        third = runner.run(project_id='p', workers=1)
+        assert (third['validated'], third['removed']) == (1, 1)
+        # Dropping 'c' changes the relation-target set, so 'a' reruns only the rules that read it
+        assert (third['revalidated_changed_rules'], sorted(basex.fetched)) == (1, ['a', 'b'])
+        assert {c['rule_id']: c['runs'] for c in third['rule_costs']}['R5.3.1'] == 2
+        assert _issues('b') == []
+
+    def test_entries_without_date_modified_always_rerun(self, results_app, runner, basex):
+        self._set_rules(('NO_DIGITS', _rule('NO_DIGITS', '$.lexical_unit.*', pattern=r'^\D*$')))
+        basex.entries['b'] = ('', _entry_xml('b', modified='', word='Bad1'))
+        runner.run(project_id='p', workers=1)
+
+        basex.entries['b'] = ('', _entry_xml('b', modified='', word='fixed'))
+        report = runner.run(project_id='p', workers=1)
+
+        assert (report['validated'], report['unchanged']) == (1, 2)
+        assert _issues('b') == []
+
+    def test_rule_change_reruns_only_changed_rules(self, results_app, runner, basex):
+        digits = ('NO_DIGITS', _rule('NO_DIGITS', '$.lexical_unit.*', pattern=r'^\D*$'))
+        upper = ('NO_UPPER', _rule('NO_UPPER', '$.lexical_unit.*', pattern=r'^[^A-Z]*$'))
+        self._set_rules(digits, upper)
+        runner.run(project_id='p', workers=1)
+        assert _issues('b') == ['NO_DIGITS', 'NO_UPPER']
+
+        # NO_UPPER now allows upper case; NO_DIGITS is untouched
+        self._set_rules(digits, ('NO_UPPER', _rule('NO_UPPER', '$.lexical_unit.*', pattern=r'.*')))
+        report = runner.run(project_id='p', workers=1)
+        assert (report['validated'], report['revalidated_changed_rules']) == (0, 3)
+        assert [c['rule_id'] for c in report['rule_costs']] == ['NO_UPPER']
+        assert _issues('b') == ['NO_DIGITS']
+
+        # Removing a rule drops its issues without fetching entries
+        basex.fetched.clear()
+        self._set_rules(upper)
+        report = runner.run(project_id='p', workers=1)
+        assert report['dropped_rule_issues'] == 0 and report['revalidated_changed_rules'] == 3
+        self._set_rules(upper, digits)
+        runner.run(project_id='p', workers=1)
+        basex.fetched.clear()
+        self._set_rules(upper)
+        report = runner.run(project_id='p', workers=1)
+        assert (report['dropped_rule_issues'], basex.fetched) == (3, [])
+        assert _issues('b') == ['NO_UPPER']
+
+    def test_process_pool_matches_inline(self, results_app, runner):
+        self._set_rules(('NO_DIGITS', _rule('NO_DIGITS', '$.lexical_unit.*', pattern=r'^\D*$')))
+
+        report = runner.run(project_id='p', workers=2, batch_size=1, full=True)
+
+        assert (report['workers'], report['processed']) == (2, 3)
+        assert _issues('b') == ['NO_DIGITS'] and _issues('c') == []
+
+
+class TestDictionaryValidationRunEndpoint:
+
+    @pytest.fixture
+    def client(self, results_app, basex):
+        from unittest.mock import patch
+        from app.api.validation import validation_bp
+
+        results_app.register_blueprint(validation_bp)
+        results_app.injector = SimpleNamespace(get=lambda _cls: SimpleNamespace(db_connector=basex))
+        self.user = SimpleNamespace(is_admin=True)
+        with patch('app.utils.auth_decorators.get_current_user', lambda: self.user), \
+                patch('app.api.validation.threading.Thread'):
+            yield results_app.test_client()
+
+    def test_one_run_at_a_time(self, client):
+        from app.models.validation_cache_models import ValidationRunLock
+
+        first = client.post('/api/validation/dictionary/run', json={})
+        second = client.post('/api/validation/dictionary/run', json={})
+
+        assert first.status_code == 202
+        assert second.status_code == 409
+        assert second.get_json()['job_id'] == first.get_json()['job_id']
+
+        ValidationRunLock.release('dict', first.get_json()['job_id'])
+        assert client.post('/api/validation/dictionary/run', json={}).status_code == 202
+
+    def test_stale_lock_is_taken_over(self, client):
+        from app.models.validation_cache_models import ValidationRunLock
+
+        assert ValidationRunLock.acquire('dict', 'old') is None
+        ValidationRunLock.query.filter_by(db_name='dict').one().heartbeat_at -= \
+            ValidationRunLock.STALE_AFTER * 2
+
+        assert client.post('/api/validation/dictionary/run', json={}).status_code == 202
+        assert ValidationRunLock.query.filter_by(db_name='dict').one().job_id != 'old'
+
+    def test_admin_only(self, client):
+        self.user = SimpleNamespace(is_admin=False)
+
+        assert client.post('/api/validation/dictionary/run', json={}).status_code == 403
+        assert client.post('/api/validation/dictionary/run/some-job/stop').status_code == 403
+
+    def test_workers_are_clamped(self, client):
+        from app.api import validation
+
+        assert client.post('/api/validation/dictionary/run', json={'workers': 'many'}).status_code == 400
+        with patch.object(DictionaryValidationRunner, 'run', return_value={'cancelled': False}) as run:
+            response = client.post('/api/validation/dictionary/run', json={'workers': 10 ** 6})
+            validation.threading.Thread.call_args.kwargs['target']()
+
+        assert response.status_code == 202
+        assert run.call_args.kwargs['workers'] == DictionaryValidationRunner.MAX_WORKERS
+
+    def test_finished_jobs_are_evicted(self, client):
+        from app.api import validation
+
+        validation._update_job('old', {'status': 'completed'})
+        validation._job_finished_at['old'] -= validation.JOB_RETENTION_SECONDS + 1
+        validation._update_job('running', {'status': 'running'})
+
+        assert client.get('/api/validation/dictionary/run/old').status_code == 404
+        assert client.get('/api/validation/dictionary/run/running').status_code == 200
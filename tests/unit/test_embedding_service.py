@@ -12,8 +12,11 @@ from app.api.embedding_api import embedding_bp
 from app.services.embedding_service import (
     EmbeddingService,
     EmbeddingServiceError,
+    EntrySyncQueue,
     AVAILABLE_MODELS,
     get_embedding_service,
+    sense_content_hash,
+    sense_point_id,
 )
 
 
@@ -108,6 +111,93 @@ class TestEmbeddingServiceUnit(unittest.TestCase):
         self.assertEqual(results[0]["score"], 0.88)
 
 
+MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+def _sense(entry_id, sense_id, text):
+    return {"entry_id": entry_id, "headword": text, "sense_id": sense_id,
+            "pos": "", "definition": "", "glosses": [], "text": text}
+
+
+class TestIncrementalEmbeddingSync(unittest.TestCase):
+    """Unit tests for hash-based incremental index maintenance."""
+
+    def setUp(self):
+        self.service = EmbeddingService(qdrant_host="localhost", qdrant_port=6333)
+        self.client = MagicMock()
+        self.client.collection_exists.return_value = True
+        self.client.get_collection.return_value.config.params.vectors.size = 384
+        patches = [
+            patch.object(EmbeddingService, "_get_qdrant_client", return_value=self.client),
+            patch.object(EmbeddingService, "_resolve_dictionary_service", return_value=MagicMock()),
+            patch.object(EmbeddingService, "_load_index_settings", return_value=(None, MODEL, "cpu")),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.encode = patch.object(EmbeddingService, "_encode_and_upsert", side_effect=lambda s, *a, **k: (len(s), False)).start()
+        self.delete = patch.object(EmbeddingService, "_delete_points").start()
+        self.addCleanup(patch.stopall)
+
+    def _stored(self, *senses):
+        return {sense_point_id(e, s): sense_content_hash(MODEL, t) for e, s, t in senses}
+
+    def test_only_changed_senses_are_encoded(self):
+        senses = [_sense("e1", "s1", "cat"), _sense("e1", "s2", "kitten"), _sense("e2", "s3", "dog")]
+        stored = self._stored(("e1", "s1", "cat"), ("e1", "s2", "kitty"), ("e9", "s9", "gone"))
+        stored[sense_point_id("e2", "s3")] = None  # indexed before hashes were stored
+
+        with patch.object(EmbeddingService, "extract_senses_from_basex", return_value=senses), \
+                patch.object(EmbeddingService, "_load_index_hashes", return_value=stored):
+            result = self.service.sync_index(project_id=1)
+
+        encoded = self.encode.call_args[0][0]
+        self.assertEqual([s["sense_id"] for s in encoded], ["s2", "s3"])
+        self.delete.assert_called_once_with(self.client, "project_1_senses", [sense_point_id("e9", "s9")])
+        self.assertEqual((result["encoded"], result["unchanged"], result["deleted"]), (2, 1, 1))
+
+    def test_entry_sync_is_scoped_and_removes_deleted_senses(self):
+        stored = self._stored(("e1", "s1", "cat"))
+
+        with patch.object(EmbeddingService, "extract_senses_from_basex", return_value=[]) as extract, \
+                patch.object(EmbeddingService, "_load_index_hashes", return_value=stored) as load:
+            result = self.service.sync_index(project_id=1, entry_ids=["e1"])
+
+        self.assertEqual(extract.call_args.kwargs["entry_ids"], ["e1"])
+        self.assertEqual(load.call_args[0][2], ["e1"])
+        self.assertEqual(result["deleted"], 1)
+        self.assertEqual(self.encode.call_args[0][0], [])
+
+    def test_entry_sync_skips_missing_index_and_full_sync_builds_it(self):
+        self.client.collection_exists.return_value = False
+
+        with patch.object(EmbeddingService, "build_index", return_value={"indexed": 3}) as build:
+            self.assertTrue(self.service.sync_index(project_id=1, entry_ids=["e1"])["skipped"])
+            build.assert_not_called()
+            self.assertEqual(self.service.sync_index(project_id=1), {"indexed": 3})
+            build.assert_called_once()
+
+    def test_model_dimension_change_triggers_full_build(self):
+        self.client.get_collection.return_value.config.params.vectors.size = 1024
+
+        with patch.object(EmbeddingService, "build_index", return_value={"indexed": 0}) as build:
+            self.service.sync_index(project_id=1)
+            build.assert_called_once()
+
+    def test_entry_sync_queue_coalesces_events(self):
+        sync = MagicMock()
+        queue = EntrySyncQueue(delay_seconds=60, sync=sync)
+        queue.enqueue(1, "e2")
+        queue.enqueue(1, "e1")
+        queue.enqueue(1, "e2")
+        queue.enqueue(2, "e3")
+        queue.flush()
+
+        sync.assert_any_call(1, ["e1", "e2"])
+        sync.assert_any_call(2, ["e3"])
+        self.assertEqual(sync.call_count, 2)
+
+
 class TestEmbeddingAPIEndpoints(unittest.TestCase):
     """Test Flask API endpoints for embedding blueprint."""
 
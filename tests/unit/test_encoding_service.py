@@ -0,0 +1,106 @@
+"""
+Unit tests for the cached, micro-batched encoding service.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from app.services.encoding_service import EmbeddingCache, EncodingService, text_cache_key
+
+
+class _CountingModel:
+    """Fake sentence-transformer returning a vector derived from each text."""
+
+    def __init__(self, delay=0.0):
+        self.calls = []
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def encode(self, texts, **kwargs):
+        with self._lock:
+            self.calls.append(list(texts))
+        time.sleep(self.delay)
+        return np.array([[len(t), float(sum(map(ord, t)) % 97), 1.0] for t in texts], dtype=np.float32)
+
+
+def _service(model, cache=None, **kwargs):
+    return EncodingService(lambda name, device: model, cache or EmbeddingCache(None), **kwargs)
+
+
+class TestEmbeddingCache:
+
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        EmbeddingCache(path).put_many({"k": np.array([0.5, 1.5], dtype=np.float32)})
+
+        found = EmbeddingCache(path).get_many(["k", "missing"])
+
+        assert list(found) == ["k"]
+        np.testing.assert_allclose(found["k"], [0.5, 1.5])
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        cache = EmbeddingCache(str(tmp_path / "cache.sqlite3"), max_entries=10, memory_entries=0)
+        for i in range(10):
+            cache.put_many({f"k{i}": np.array([float(i)])})
+            time.sleep(0.002)
+        cache.get_many(["k0"])
+        cache.put_many({"k10": np.array([10.0])})
+
+        assert len(cache) == 9
+        remaining = cache.get_many([f"k{i}" for i in range(11)])
+        assert "k0" in remaining and "k10" in remaining and "k1" not in remaining
+
+
+class TestEncodingService:
+
+    def test_cached_texts_skip_the_model(self):
+        model = _CountingModel()
+        service = _service(model)
+
+        first = service.encode(["cat", "dog", "cat"], "m")
+        second = service.encode(["dog", "cat"], "m")
+
+        assert model.calls == [["cat", "dog"]]
+        np.testing.assert_allclose(first[0], first[2])
+        np.testing.assert_allclose(second, first[[1, 0]])
+        assert service.get_stats()["cache_hits"] == 3
+
+    def test_cache_key_includes_model_and_task(self):
+        model = _CountingModel()
+        service = _service(model)
+        service.encode(["cat"], "m1")
+        service.encode(["cat"], "m2")
+        service.encode(["cat"], "m1", task="text-matching")
+
+        assert len(model.calls) == 3
+        assert text_cache_key("m1", "cat") != text_cache_key("m1", "cat", task="text-matching")
+
+    def test_concurrent_small_requests_share_a_forward_pass(self):
+        model = _CountingModel(delay=0.05)
+        service = _service(model, max_wait_seconds=0.05)
+        results = {}
+
+        def encode(text):
+            results[text] = service.encode([text], "m")
+
+        threads = [threading.Thread(target=encode, args=(f"word{i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(results) == 8
+        assert len(model.calls) < 8
+        assert sum(len(call) for call in model.calls) == 8
+        np.testing.assert_allclose(results["word3"][0], [5.0, sum(map(ord, "word3")) % 97, 1.0])
+
+    def test_large_requests_are_chunked_in_caller(self):
+        model = _CountingModel()
+        service = _service(model, max_batch_size=4)
+
+        vectors = service.encode([f"t{i}" for i in range(10)], "m")
+
+        assert vectors.shape == (10, 3)
+        assert [len(call) for call in model.calls] == [4, 4, 2]
@@ -461,33 +461,226 @@ class TestGetRevision:
 
 
 class TestGetStats:
-    @patch('app.services.entry_revision_service.EntryRevision')
-    def test_basic_stats(self, MockRevision):
-        r1 = Mock()
-        r1.entry_id = 'e1'
-        r1.user_id = 'u1'
-        r1.created_by = 'u1'
-        r1.change_report = [{'field_path': 'lexeme', 'kind': 'modified'}]
-        r1.timestamp_utc = datetime(2025, 1, 15, tzinfo=timezone.utc)
-
-        r2 = Mock()
-        r2.entry_id = 'e1'
-        r2.user_id = 'u1'
-        r2.created_by = 'u1'
-        r2.change_report = [{'field_path': 'senses[abc].gloss', 'kind': 'modified'}]
-        r2.timestamp_utc = datetime(2025, 1, 16, tzinfo=timezone.utc)
+    def _save(self, entry_id, snapshot, user_id, when):
+        from app.services.entry_revision_service import EntryRevisionService
+        with patch('app.services.entry_revision_service.datetime') as mock_dt:
+            mock_dt.now.return_value = when
+            mock_dt.fromisoformat = datetime.fromisoformat
+            mock_dt.combine = datetime.combine
+            mock_dt.min = datetime.min
+            EntryRevisionService.save_revision(entry_id, snapshot, user_id=user_id)
+
+    def _history(self):
+        day = lambda d: datetime(2025, 1, d, 12, tzinfo=timezone.utc)
+        self._save('e1', {'lexeme': 'a'}, 'u1', day(15))
+        self._save('e1', {'lexeme': 'b'}, 'u1', day(15))
+        self._save('e1', {'lexeme': 'b', 'senses': [{'id': 's1', 'gloss': 'x'}]}, 'u2', day(16))
+        self._save('e2', {'lexeme': 'z'}, None, day(20))
+
+    def test_basic_stats(self, revision_app):
+        from app.services.entry_revision_service import EntryRevisionService
+        self._history()
 
-        mock_q = Mock()
-        MockRevision.query = mock_q
-        mock_q.filter.return_value = mock_q
-        mock_q.order_by.return_value = mock_q
-        mock_q.all.return_value = [r1, r2]
+        stats = EntryRevisionService.get_stats()
 
+        assert stats['total_revisions'] == 4
+        assert stats['unique_entries_touched'] == 2
+        assert stats['unique_users'] == 2
+        assert stats['timeline'] == [{'date': '2025-01-15', 'count': 2},
+                                     {'date': '2025-01-16', 'count': 1},
+                                     {'date': '2025-01-20', 'count': 1}]
+        assert stats['top_edited_entries'][0] == {'entry_id': 'e1', 'revisions': 3}
+        assert stats['top_editors'][:2] == [{'user_id': 'u1', 'revisions': 2},
+                                            {'user_id': 'u2', 'revisions': 1}]
+        assert stats['top_editors'][2]['user_id'] == 'unknown'
+        assert stats['by_field'] == {'lexeme': {'modified': 1}, 'senses': {'added': 1}}
+
+    def test_filters_and_week_granularity(self, revision_app):
         from app.services.entry_revision_service import EntryRevisionService
-        stats = EntryRevisionService.get_stats()
+        self._history()
+
+        ranged = EntryRevisionService.get_stats(from_date='2025-01-16', to_date='2025-01-20')
+        assert ranged['total_revisions'] == 2
+        assert ranged['by_field'] == {'senses': {'added': 1}}
+
+        by_user = EntryRevisionService.get_stats(user_id='u1', granularity='week')
+        assert by_user['total_revisions'] == 2
+        assert by_user['timeline'] == [{'date': '2025-02', 'count': 2}]
+
+    def test_entry_filter_groups_revisions_directly(self, revision_app):
+        from app.services.entry_revision_service import EntryRevisionService
+        self._history()
+
+        stats = EntryRevisionService.get_stats(entry_id='e1', to_date='2025-01-15')
 
         assert stats['total_revisions'] == 2
-        assert stats['unique_entries_touched'] == 1
-        assert stats['unique_users'] == 1
-        assert len(stats['timeline']) == 2
-        assert stats['top_edited_entries'][0]['revisions'] == 2
+        assert stats['timeline'] == [{'date': '2025-01-15', 'count': 2}]
+        assert stats['top_editors'] == [{'user_id': 'u1', 'revisions': 2}]
+        assert stats['by_field'] == {'lexeme': {'modified': 1}}
+
+    def test_rebuild_rollups_matches_incremental(self, revision_app):
+        from app.services.entry_revision_service import EntryRevisionService
+        self._history()
+        before = EntryRevisionService.get_stats()
+
+        assert EntryRevisionService.rebuild_rollups() == 4
+        assert EntryRevisionService.get_stats() == before
+
+    def test_delete_revisions_updates_rollups(self, revision_app):
+        from app.services.entry_revision_service import EntryRevisionService
+        self._history()
+
+        assert EntryRevisionService.delete_revisions('e1') == 3
+        stats = EntryRevisionService.get_stats()
+
+        assert stats['total_revisions'] == 1
+        assert stats['timeline'] == [{'date': '2025-01-20', 'count': 1}]
+        assert stats['by_field'] == {}
+        assert EntryRevisionService.rebuild_rollups() == 1
+        assert EntryRevisionService.get_stats() == stats
+
+
+# ======================================================================
+# Delta storage — patch format and keyframe chain
+# ======================================================================
+
+
+class TestSnapshotPatch:
+    def test_round_trip(self):
+        from app.services.entry_revision_service import apply_patch, make_patch
+        prev = {'lexeme': 'cat', 'flag': 1, 'senses': [{'id': 's1', 'gloss': {'en': 'cat'}}, {'id': 's2'}],
+                'notes': {'a': 'x'}}
+        curr = {'lexeme': 'cats', 'flag': True, 'senses': [{'id': 's1', 'gloss': {'en': 'feline', 'pl': 'kot'}}],
+                'pronunciations': [{'type': 'ipa'}]}
+        ops = make_patch(prev, curr)
+        assert apply_patch(prev, ops) == curr
+        assert type(apply_patch(prev, ops)['flag']) is bool
+        assert apply_patch(curr, make_patch(curr, prev)) == prev
+        assert prev['senses'][1] == {'id': 's2'}  # input untouched
+
+    def test_list_growth_and_root_replace(self):
+        from app.services.entry_revision_service import apply_patch, make_patch
+        assert make_patch([1, 2], [1, 2, 3]) == [['+', [], [3]]]
+        assert apply_patch({'a': 1}, make_patch({'a': 1}, [1])) == [1]
+
+    def test_encode_chain_keyframes(self):
+        from app.services.entry_revision_service import encode_chain
+        snapshots = [{'lexeme': 'word', 'senses': [{'id': f's{j}', 'gloss': {'en': 'long gloss text ' * 5}}
+                                                    for j in range(5)], 'n': i} for i in range(7)]
+        plan = encode_chain(snapshots, interval=3)
+        assert [k for k, _ in plan] == [True, False, False, True, False, False, True]
+        assert all((d is None) == k for k, d in plan)
+
+
+@pytest.fixture
+def revision_app():
+    from flask import Flask
+    from app.models.workset_models import db
+    from app.models.entry_revision import EntryRevision, RevisionDailyRollup, RevisionFieldRollup
+    from app.services.entry_revision_service import EntryRevisionService
+
+    app = Flask(__name__)
+    app.config.update({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        'SQLALCHEMY_TRACK_MODIFICATIONS': False,
+    })
+    db.init_app(app)
+    with app.app_context():
+        db.metadata.create_all(db.engine, tables=[
+            EntryRevision.__table__, RevisionDailyRollup.__table__, RevisionFieldRollup.__table__])
+        EntryRevisionService.snapshot_cache.clear()
+        yield app
+        db.session.remove()
+    EntryRevisionService.snapshot_cache.clear()
+
+
+def _entry_snapshot(i):
+    return {
+        'id': 'e1',
+        'lexical_unit': {'en': 'word'},
+        'senses': [{'id': f's{j}', 'gloss': {'en': f'gloss {j} ' + 'text ' * 20},
+                    'definition': {'en': {'text': 'definition ' * 10}}} for j in range(4)],
+        'notes': {'general': f'edit {i}'},
+    }
+
+
+class TestDeltaRevisionStorage:
+    def test_history_is_reconstructed_exactly(self, revision_app):
+        from app.models.entry_revision import EntryRevision
+        from app.services.entry_revision_service import EntryRevisionService
+
+        EntryRevisionService.keyframe_interval = 4
+        try:
+            snapshots = [_entry_snapshot(i) for i in range(10)]
+            for snap in snapshots:
+                EntryRevisionService.save_revision('e1', snap, user_id='u1')
+        finally:
+            EntryRevisionService.keyframe_interval = 20
+
+        rows = EntryRevision.query.order_by(EntryRevision.revision_number).all()
+        assert [r.is_keyframe for r in rows] == [True, False, False, False, True,
+                                                 False, False, False, True, False]
+        assert all(r.snapshot is None and r.delta for r in rows if not r.is_keyframe)
+
+        EntryRevisionService.snapshot_cache.clear()
+        for number, snap in enumerate(snapshots, start=1):
+            assert EntryRevisionService.get_snapshot('e1', number) == snap
+        rev = EntryRevisionService.get_revision('e1', 7)
+        assert rev.to_dict(include_snapshot=True)['snapshot'] == snapshots[6]
+        assert rev.change_report[0]['field_path'] == 'notes.general'
+
+    def test_save_uses_cached_previous_snapshot(self, revision_app):
+        from app.services.entry_revision_service import EntryRevisionService
+
+        EntryRevisionService.save_revision('e1', _entry_snapshot(0))
+        with patch.object(EntryRevisionService, '_reconstruct') as reconstruct:
+            rev = EntryRevisionService.save_revision('e1', _entry_snapshot(1))
+        reconstruct.assert_not_called()
+        assert EntryRevisionService.snapshot_cache.hits == 1
+        assert not rev.is_keyframe and len(rev.change_report) == 1
+
+        # A cold cache falls back to reconstructing from the database.
+        EntryRevisionService.snapshot_cache.clear()
+        rev = EntryRevisionService.save_revision('e1', _entry_snapshot(2))
+        assert rev.change_report[0]['before'] == 'edit 1'
+
+    def test_history_restarted_by_another_worker_is_not_diffed_against_cache(self, revision_app):
+        from app.models.entry_revision import EntryRevision
+        from app.models.workset_models import db
+        from app.services.entry_revision_service import EntryRevisionService
+
+        EntryRevisionService.save_revision('e1', _entry_snapshot(0))
+        # Another process deletes the history and saves a new first revision
+        EntryRevision.query.filter_by(entry_id='e1').delete()
+        db.session.add(EntryRevision(entry_id='e1', revision_number=1, id=1000,
+                                     snapshot=_entry_snapshot(5), is_keyframe=True))
+        db.session.commit()
+
+        rev = EntryRevisionService.save_revision('e1', _entry_snapshot(6))
+
+        assert rev.change_report[0]['before'] == 'edit 5'
+        assert EntryRevisionService.get_snapshot('e1', 1) == _entry_snapshot(5)
+        assert EntryRevisionService.get_snapshot('e1', 2) == _entry_snapshot(6)
+
+    def test_compact_legacy_rows(self, revision_app):
+        from app.models.entry_revision import EntryRevision
+        from app.models.workset_models import db
+        from app.services.entry_revision_service import EntryRevisionService
+
+        snapshots = [_entry_snapshot(i) for i in range(5)]
+        for number, snap in enumerate(snapshots, start=1):
+            db.session.add(EntryRevision(entry_id='e1', revision_number=number, snapshot=snap))
+        db.session.commit()
+
+        assert EntryRevisionService.compact_revisions('e1') == 4
+        assert EntryRevision.query.filter(EntryRevision.snapshot.isnot(None)).count() == 1
+        assert [EntryRevisionService.get_snapshot('e1', n) for n in range(1, 6)] == snapshots
+
+    def test_missing_delta_columns_are_reported(self, revision_app):
+        from app.models.workset_models import db
+        from app.services.entry_revision_service import missing_revision_columns
+
+        assert missing_revision_columns() == []
+        db.session.execute(db.text('ALTER TABLE entry_revisions DROP COLUMN delta'))
+        db.session.commit()
+        assert missing_revision_columns() == ['delta']
@@ -0,0 +1,164 @@
+"""
+Unit tests for the single-query entry view bundle.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask
+
+from app.models.entry import Entry
+from app.models.sense import Sense
+from app import views
+from app.services.css_mapping_service import CSSMappingService
+from app.services.dictionary_service import DictionaryService
+from app.services.entry_view_bundle import EntryViewBundle
+from app.utils.exceptions import NotFoundError
+from app.utils.xquery_builder import XQueryBuilder
+
+
+ENTRY_XML = (
+    '<entry id="main"><lexical-unit><form lang="en"><text>main</text></form></lexical-unit>'
+    '<relation type="_component-lexeme" ref="var1"><trait name="variant-type" value="Spelling"/></relation>'
+    '<relation type="_component-lexeme" ref="comp1"><trait name="complex-form-type" value="Compound"/></relation>'
+    '<sense id="s1"><gloss lang="en"><text>chief</text></gloss></sense></entry>'
+)
+
+BUNDLE_XML = (
+    '<bundle id="main">'
+    '<entry>' + ENTRY_XML.replace('<', '&lt;').replace('>', '&gt;') + '</entry>'
+    '<labels>'
+    '<item id="var1" order=""><form lang="en">mayne</form></item>'
+    '<item id="comp1" order="2"><form lang="en">head</form></item>'
+    '<item id="sub1" order=""><form lang="pl">główny</form></item>'
+    '</labels>'
+    '<reverse><rel source="sub1" type="_component-lexeme" order="1">'
+    '<trait name="complex-form-type" value="Phrase"/></rel></reverse>'
+    '<senses><sense id="t1" entry="other" gloss="big"><form lang="fr">grand</form></sense></senses>'
+    '<subentries><item id="sub1">&lt;entry id="sub1"/&gt;</item></subentries>'
+    '</bundle>'
+)
+
+
+def _bundle(service=None):
+    return EntryViewBundle.from_xml(service or MagicMock(), BUNDLE_XML)
+
+
+class TestEntryViewBundle:
+
+    def test_from_xml_parses_sections(self):
+        bundle = _bundle()
+
+        assert bundle.entry_id == 'main'
+        assert bundle.entry_xml == ENTRY_XML
+        assert bundle.labels['comp1'] == {'lexical_unit': {'en': 'head'}, 'homograph_number': 2}
+        assert [(r.source_id, r.traits, r.order) for r in bundle.reverse] == [
+            ('sub1', {'complex-form-type': 'Phrase'}, 1)]
+        assert bundle.sense_targets['t1'] == {
+            'entry_id': 'other', 'lexical_unit': {'fr': 'grand'}, 'gloss': 'big'}
+        assert bundle.subentry_xml == {'sub1': '<entry id="sub1"/>'}
+
+    def test_empty_result_is_none(self):
+        assert EntryViewBundle.from_xml(MagicMock(), '  ') is None
+
+    def test_misses_fall_through_to_service(self):
+        service = MagicMock()
+        service.get_entry_labels.return_value = {'far': {'lexical_unit': {'en': 'far'}, 'homograph_number': None}}
+        service.resolve_headwords_batch.return_value = {'far': 'far'}
+        bundle = _bundle(service)
+
+        labels = bundle.get_entry_labels(['var1', 'far'])
+        headwords = bundle.resolve_headwords_batch(['comp1', 'far'])
+        bundle.get_reverse_relations('elsewhere')
+
+        assert set(labels) == {'var1', 'far'}
+        service.get_entry_labels.assert_called_once_with(['far'], project_id=None)
+        assert headwords == {'comp1': 'head', 'far': 'far'}
+        service.get_reverse_relations.assert_called_once_with('elsewhere', None, project_id=None)
+        assert bundle.get_lift_ranges is service.get_lift_ranges
+
+    def test_entry_enrichment_uses_bundle_only(self):
+        service = MagicMock()
+        bundle = _bundle(service)
+        entry = Entry(id_='main', lexical_unit={'en': 'main'}, relations=[
+            {'type': '_component-lexeme', 'ref': 'var1', 'traits': {'variant-type': 'Spelling'}},
+            {'type': '_component-lexeme', 'ref': 'comp1', 'traits': {'complex-form-type': 'Compound'}},
+        ])
+
+        variants = entry.get_variant_relations(bundle)
+        components = entry.get_forward_component_relations(bundle)
+        subentries = entry.get_subentries(bundle)
+
+        assert variants[0]['ref_display_text'] == 'mayne'
+        assert components[0]['ref_display_text'].startswith('head')
+        assert [s['id'] for s in subentries] == ['sub1']
+        service.get_entry.assert_not_called()
+        service.get_entry_labels.assert_not_called()
+        service.get_reverse_relations.assert_not_called()
+
+    def test_sense_relations_resolved_from_bundle(self):
+        service = MagicMock()
+        sense = Sense(id_='s1', relations=[{'type': 'synonym', 'ref': 't1'}])
+
+        enriched = sense.enrich_relations_with_display_text(_bundle(service))
+
+        assert enriched[0]['ref_display_text'] == 'grand'
+        assert enriched[0]['ref_entry_id'] == 'other'
+        assert enriched[0]['ref_gloss'] == 'big'
+        service.db_connector.execute_query.assert_not_called()
+
+
+class TestDictionaryServiceViewBundle:
+
+    def _service(self, query_result):
+        connector = MagicMock()
+        connector.database = 'dictionary'
+        connector.execute_query.return_value = query_result
+        return DictionaryService(db_connector=connector)
+
+    @pytest.mark.skip_et_mock
+    def test_get_entry_view_bundle_parses_entry(self):
+        service = self._service(BUNDLE_XML)
+        with patch.object(DictionaryService, '_detect_namespace_usage', return_value=False):
+            bundle = service.get_entry_view_bundle('main')
+
+        assert bundle.entry.id == 'main'
+        assert bundle.entry._raw_xml == ENTRY_XML
+        assert service.db_connector.execute_query.call_count == 1
+
+    def test_missing_entry_raises_not_found(self):
+        service = self._service('')
+        with patch.object(DictionaryService, '_detect_namespace_usage', return_value=False):
+            with pytest.raises(NotFoundError):
+                service.get_entry_view_bundle('nope')
+
+    def test_bundle_query_escapes_entry_id(self):
+        query = XQueryBuilder.build_entry_view_bundle_query("o'brien", 'dictionary', has_namespace=False,
+                                                             include_subentries=True)
+
+        assert XQueryBuilder.escape_xquery_string("o'brien") in query
+        assert '<subentries>' in query
+
+    @pytest.mark.skip_et_mock
+    def test_view_page_renders_subentries_from_the_bundle(self):
+        service = self._service(BUNDLE_XML)
+        css_service = MagicMock()
+        css_service.render_entry.return_value = '<div>x</div>'
+        app = Flask(__name__)
+        app.secret_key = 'test'
+        app.injector = SimpleNamespace(
+            get=lambda cls: css_service if cls is CSSMappingService else service)
+        profile = SimpleNamespace(show_subentries=True)
+
+        with app.test_request_context('/entries/main'), \
+                patch.object(DictionaryService, '_detect_namespace_usage', return_value=False), \
+                patch.object(DictionaryService, 'get_lift_ranges', return_value={}), \
+                patch.object(views, '_get_default_display_profile', return_value=profile), \
+                patch.object(views, 'render_template', return_value='page') as render_template:
+            views.view_entry('main')
+
+        assert service.db_connector.execute_query.call_count == 1
+        assert '<subentries>' in service.db_connector.execute_query.call_args.args[0]
+        assert css_service.render_entry.call_args.args[0] == '<entry id="sub1"/>'
+        assert '<div class="subentry" data-subentry-id="sub1">' in render_template.call_args.kwargs['css_html']
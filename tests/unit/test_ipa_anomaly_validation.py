@@ -178,5 +178,81 @@ def test_service_detect_decompresses_before_model():
     assert "(ə)" not in result["stored_ipa"]
 
 
+# --------------------------------------------------------------------------- #
+# batched detection
+# --------------------------------------------------------------------------- #
+class _BatchDetector:
+    """Records detect_batch calls; 'ˈkæt' is the only well-predicted IPA."""
+
+    def __init__(self):
+        self.batches: List[List[Dict[str, str]]] = []
+
+    def detect_batch(self, entries, show_progress=True, batch_size=64, num_beams=None,
+                     max_length=None, bucket_by_length=False):
+        self.batches.append(list(entries))
+
+        class _R:
+            def __init__(self, ipa):
+                self.is_anomaly = ipa != "ˈkæt"
+                self.predicted_ipa = "ˈkæt"
+                self.confidence_score = 1.0 if ipa == "ˈkæt" else 0.1
+                self.anomaly_type = "confidence" if self.is_anomaly else None
+                self.details = {"per": 0.0}
+
+        return [_R(e["ipa"]) for e in entries]
+
+
+def _batch_service() -> IPAAnomalyService:
+    service = IPAAnomalyService(ipa_ws="seh-fonipa")
+    service._detector = _BatchDetector()
+    service._available = True
+    service.model_version = "v1"
+    return service
+
+
+def test_detect_many_runs_one_batch_and_caches_variants():
+    service = _batch_service()
+    results = service.detect_many([("cat", "ˈkæt"), ("dog", ""), ("scotsism", "ˈskɒtɪˌsɪz(ə)m"),
+                                   ("cat", "ˈkæt")])
+
+    assert [r and r["is_anomaly"] for r in results] == [False, None, True, False]
+    assert len(service._detector.batches) == 1
+    assert len(service._detector.batches[0]) == 3  # ˈkæt once, plus both scotsism variants
+
+    assert service.detect("cat", "ˈkæt")["confidence_score"] == 1.0
+    assert len(service._detector.batches) == 1
+
+
+def test_detect_runs_single_items_unbatched():
+    service = _batch_service()
+    singles = []
+    service._detector.detect = lambda headword, ipa: (
+        singles.append(ipa) or service._detector.detect_batch([{"ipa": ipa}])[0])
+
+    assert service.detect("scotsism", "ˈskɒtɪˌsɪz(ə)m")["stored_ipa"] == "ˈskɒtɪˌsɪzm"
+    assert sorted(singles) == ["ˈskɒtɪˌsɪzm", "ˈskɒtɪˌsɪzəm"]
+    assert [len(batch) for batch in service._detector.batches] == [1, 1]
+
+
+def test_detect_many_cache_is_keyed_by_model_version():
+    service = _batch_service()
+    service.detect_many([("cat", "ˈkæt")])
+    service.model_version = "v2"
+    service.detect_many([("cat", "ˈkæt")])
+    assert len(service._detector.batches) == 2
+
+
+def test_warm_cache_batches_pronunciations_across_entries():
+    service = _batch_service()
+    with patch.object(IPAAnomalyService, "get_instance", classmethod(lambda cls, **kw: service)):
+        engine = _engine()
+        entries = [_entry(f"word{i}", f"ˈwɜːd{i}") for i in range(10)]
+        assert engine.warm_ipa_anomaly_cache(entries) == 10
+        for entry in entries:
+            engine.validate_json(entry, "save")
+
+    assert [len(batch) for batch in service._detector.batches] == [10]
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__, "-q"]))
@@ -42,6 +42,9 @@ class _StubService:
     def draft_ipa(self, headword, num_return_sequences=1):
         return self._candidates
 
+    def draft_ipa_batch(self, headwords, num_return_sequences=1):
+        return [self._candidates if h else [] for h in headwords]
+
 
 def test_draft_endpoint_returns_candidates(monkeypatch):
     from app import create_app
@@ -126,5 +129,27 @@ def test_draft_endpoint_requires_authentication(monkeypatch):
     assert resp.get_json()["code"] == "authentication_required"
 
 
+def test_draft_batch_endpoint_returns_drafts_in_order(monkeypatch):
+    from app import create_app
+    import app.services.ipa_byt5_service as byt5mod
+
+    _authenticate(monkeypatch)
+    monkeypatch.setattr(
+        byt5mod.IPAByT5Service,
+        "get_instance",
+        staticmethod(lambda *a, **k: _StubService(True, ["ˈkæt"])),
+    )
+
+    client = create_app().test_client()
+    resp = client.post("/api/pronunciation/draft/batch", json={"headwords": ["cat", "", "dog"]})
+    assert resp.status_code == 200
+    drafts = resp.get_json()["drafts"]
+    assert [d["headword"] for d in drafts] == ["cat", "", "dog"]
+    assert [d["candidates"] for d in drafts] == [["ˈkæt"], [], ["ˈkæt"]]
+
+    resp = client.post("/api/pronunciation/draft/batch", json={"headwords": ["x"] * 501})
+    assert resp.status_code == 400
+
+
 if __name__ == "__main__":
     raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,140 @@
+"""
+Golden-file tests for the direct entry writer behind ``_prepare_entry_xml``.
+
+tests/unit/data/entry_xml/<case>.xml holds what the old path stored for each
+case: ``generate_lift_string([entry])``, parsed again, namespaces stripped and
+the ``<entry>`` serialized (``_round_trip`` below).
+"""
+
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from app.models.entry import Entry, Etymology, Relation, Variant
+from app.models.example import Example
+from app.models.sense import Sense
+from app.parsers.lift_entry_writer import write_entry_xml
+from app.parsers.lift_parser import LIFTParser
+
+pytestmark = pytest.mark.skip_et_mock
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), 'data', 'entry_xml')
+
+
+def _round_trip(entry):
+    """The old ``_prepare_entry_xml``."""
+    parser = LIFTParser(validate=False)
+    root = ET.fromstring(parser.generate_lift_string([entry]))
+    elem = root.find('.//lift:entry', parser.NSMAP)
+    for child in elem.iter():
+        child.tag = child.tag.split('}', 1)[-1]
+    return ET.tostring(elem, encoding='unicode')
+
+
+def _minimal():
+    return Entry(id_='cat_1', lexical_unit={'en': 'cat'}, morph_type='stem',
+                 senses=[Sense(id_='cat_1_s0', glosses={'pl': 'kot'})])
+
+
+def _parsed():
+    xml = '''<lift><entry id="house_1" dateCreated="2024-01-01T10:00:00Z" dateModified="2024-02-01T10:00:00Z" order="2">
+      <lexical-unit><form lang="en"><text>house</text></form><form lang="pl"><text>dom</text></form></lexical-unit>
+      <citation><form lang="en"><text>house (n.)</text></form></citation>
+      <pronunciation><form lang="seh-fonipa"><text>haʊs</text></form>
+        <media href="house.mp3"><label><form lang="en"><text>UK</text></form></label></media></pronunciation>
+      <variant type="spelling"><form lang="en"><text>hous</text></form>
+        <grammatical-info value="Noun"><trait name="number" value="sg"/></grammatical-info>
+        <trait name="dialect" value="old"/></variant>
+      <grammatical-info value="Noun"/>
+      <trait name="morph-type" value="stem"/>
+      <trait name="domain-type" value="building"/>
+      <trait name="status" value="draft"/>
+      <relation type="synonym" ref="home_3"><trait name="strength" value="high"/></relation>
+      <etymology type="borrowed" source="Old English">
+        <form lang="ang"><text>hūs</text></form><gloss lang="en"><text>dwelling</text></gloss>
+        <field type="comment"><form lang="en"><text>cf. German Haus</text></form></field>
+        <field type="certainty"><form lang="en"><text>high</text></form></field></etymology>
+      <note type="usage"><form lang="en"><text>Common.</text></form></note>
+      <field type="import-residue"><form lang="en"><text>row 12</text></form></field>
+      <annotation name="reviewed" value="yes" who="ann" when="2024-03-01"><form lang="en"><text>ok</text></form></annotation>
+      <sense id="house_1_s0">
+        <grammatical-info value="Noun"><trait name="gender" value="n"/></grammatical-info>
+        <gloss lang="pl"><text>dom</text></gloss>
+        <definition><form lang="en"><text>a building for living in</text></form></definition>
+        <example id="ex1" source="corpus"><form lang="en"><text>The house is big.</text></form>
+          <translation><form lang="pl"><text>Dom jest duży.</text></form></translation>
+          <field type="note"><form lang="en"><text>literal</text></form></field>
+          <field type="register"><form lang="en"><text>neutral</text></form></field></example>
+        <relation type="hypernym" ref="building_5"/>
+        <trait name="usage-type" value="colloquial"/>
+        <trait name="domain-type" value="architecture"/>
+        <trait name="semantic-domain-ddp4" value="6.5.1"/>
+        <trait name="anthro-code" value="342"/>
+        <note type="encyclopedic"><form lang="en"><text>See also hut.</text></form></note>
+        <field type="exemplar"><form lang="en"><text>a house</text></form></field>
+        <field type="scientific-name"><form lang="la"><text>domus</text></form></field>
+        <field type="sense-residue"><form lang="en"><text>x</text></form></field>
+        <illustration href="house.png"><label><form lang="en"><text>A house</text></form></label></illustration>
+        <annotation name="checked" value="no"/>
+        <subsense id="house_1_s0_0"><gloss lang="pl"><text>domostwo</text></gloss>
+          <field type="literal-meaning"><form lang="en"><text>home place</text></form></field></subsense>
+      </sense>
+    </entry></lift>'''
+    return LIFTParser(validate=False).parse_string(xml)[0]
+
+
+def _edge_cases():
+    """Shapes that only come from the editor or from to_dict() snapshots."""
+    sense = Sense(
+        id_='odd_1_s0',
+        definitions={'en': {'text': 'a <b> & "c"'}},
+        glosses={'pl': 'x\r\ny'},
+        examples=[Example(id_='ex2', form={'en': ''}), {'en': 'legacy example'}],
+        relations=[{'type': 'compare', 'ref': 'cat_1', 'order': 1, 'traits': {'k': 'v'}}],
+        illustrations=[{'href': 'a b.png'}],
+        notes={'general': 'plain note', 'source': {'en': {'text': 'dict note'}, 'pl': ''}},
+        subsenses=[{'id': 'odd_1_s0_0', 'glosses': {'en': 'from dict'}}],
+    )
+    sense.reversals = [{'type': 'en', 'forms': {'en': 'odd'}}, {'en': 'strange'}, 'skipped']
+    return Entry(
+        id_='odd_1', date_created='2024-01-01T00:00:00Z', date_modified='2024-01-02T00:00:00Z',
+        date_deleted='2024-01-03T00:00:00Z', homograph_number=3,
+        lexical_unit={'en': {'text': 'odd'}, 'pl': 'dziwny'}, morph_type='stem',
+        traits={'note': 'tab\there', 'quote': 'say "hi"\nbye'},
+        domain_type='general',
+        pronunciation_media=[{'href': 'odd.mp3'}],
+        citations=[{'lang': 'en', 'text': 'odd!'}, {'en': 'odd?', 'pl': {'text': 'dziwny?'}}],
+        variants=[Variant(form={'en': {'text': 'odde'}})],
+        relations=[Relation(type='compare', ref='cat_1', order=2)],
+        etymologies=[Etymology(type='', source='', form={'la': 'oddus'}, gloss={})],
+        notes={'general': {'en': 'entry note'}},
+        senses=[sense],
+    )
+
+
+CASES = {'minimal': _minimal, 'parsed': _parsed, 'edge_cases': _edge_cases}
+
+
+@pytest.mark.parametrize('case', sorted(CASES))
+def test_writer_matches_golden_file(case):
+    with open(os.path.join(GOLDEN_DIR, f'{case}.xml'), encoding='utf-8', newline='') as f:
+        golden = f.read()
+
+    assert write_entry_xml(CASES[case]()) == golden
+
+
+@pytest.mark.parametrize('case', sorted(CASES))
+def test_writer_matches_round_trip(case):
+    entry = CASES[case]()
+
+    assert write_entry_xml(entry) == _round_trip(entry)
+
+
+def test_written_entry_parses_back():
+    entry = _parsed()
+    reparsed = LIFTParser(validate=False).parse_string(f'<lift>{write_entry_xml(entry)}</lift>')[0]
+
+    assert reparsed.lexical_unit == entry.lexical_unit
+    assert [s.id for s in reparsed.senses] == ['house_1_s0']
+    assert reparsed.senses[0].subsenses[0].literal_meaning == {'en': 'home place'}
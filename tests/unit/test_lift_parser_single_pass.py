@@ -0,0 +1,147 @@
+"""
+The single-pass entry reader: plain and LIFT-namespaced documents read the
+same, and the sample LIFT file keeps the entries the XPath reader produced.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from app.parsers.lift_parser import LIFTParser
+
+pytestmark = pytest.mark.skip_et_mock
+
+ENTRY = '''<entry id="house_1" dateCreated="2024-01-01T10:00:00Z" dateModified="2024-02-01T10:00:00Z" order="2">
+  <lexical-unit><form lang="en"><text> house </text></form><form lang="pl"><text>dom</text></form></lexical-unit>
+  <citation><form lang="en"><text>house (n.)</text></form></citation>
+  <pronunciation>
+    <form lang="seh-fonipa"><text>haʊs</text></form>
+    <media href="house.mp3"><label><form lang="en"><text>UK</text></form></label></media>
+    <media href="house-us.mp3"><label/></media>
+  </pronunciation>
+  <variant type="spelling" ref="hous_2">
+    <form lang="en"><text>hous</text></form>
+    <grammatical-info value="Noun"><trait name="number" value="sg"/></grammatical-info>
+    <trait name="dialect" value="old"/>
+  </variant>
+  <grammatical-info value="Noun"/>
+  <trait name="morph-type" value="stem"/>
+  <trait name="domain-type" value="building"/>
+  <trait name="status" value="draft"/>
+  <relation type="synonym" ref="home_3"><trait name="strength" value="high"/></relation>
+  <relation type="_component-lexeme" ref="hut_4"/>
+  <etymology type="borrowed" source="Old English">
+    <form lang="ang"><text>hūs</text></form>
+    <gloss lang="en"><text>dwelling</text></gloss>
+    <field type="comment"><form lang="en"><text>cf. German Haus</text></form></field>
+    <field type="certainty"><form lang="en"><text>high</text></form></field>
+  </etymology>
+  <note type="usage"><form lang="en"><text>Common.</text></form></note>
+  <note>bare note text</note>
+  <field type="import-residue"><form lang="en"><text>row 12</text></form></field>
+  <annotation name="reviewed" value="yes" who="ann" when="2024-03-01"><form lang="en"><text>ok</text></form></annotation>
+  <sense id="house_1_s0">
+    <grammatical-info value="Noun"><trait name="gender" value="n"/></grammatical-info>
+    <gloss lang="pl"><text>dom</text></gloss>
+    <definition><form lang="en"><text>a building for living in</text></form></definition>
+    <example id="ex1" source="corpus">
+      <form lang="en"><text>The house is big.</text></form>
+      <translation type="free"><form lang="pl"><text>Dom jest duży.</text></form></translation>
+      <field type="note"><form lang="en"><text>literal</text></form></field>
+      <field type="register"><form lang="en"><text>neutral</text></form></field>
+    </example>
+    <relation type="hypernym" ref="building_5"/>
+    <trait name="usage-type" value="colloquial"/>
+    <trait name="usage-type" value="dated"/>
+    <trait name="domain-type" value="architecture"/>
+    <trait name="semantic-domain-ddp4" value="6.5.1"/>
+    <trait name="anthro-code" value="342"/>
+    <note type="encyclopedic"><form lang="en"><text>See also hut.</text></form></note>
+    <field type="exemplar"><form lang="en"><text>a house</text></form></field>
+    <field type="scientific-name"><form lang="la"><text>domus</text></form></field>
+    <field type="sense-residue"><form lang="en"><text>x</text></form></field>
+    <illustration href="house.png"><label><form lang="en"><text>A house</text></form></label></illustration>
+    <annotation name="checked" value="no"/>
+    <subsense id="house_1_s0_0">
+      <gloss lang="pl"><text>domostwo</text></gloss>
+      <field type="literal-meaning"><form lang="en"><text>home place</text></form></field>
+    </subsense>
+  </sense>
+  <sense id="house_1_s1">
+    <definition><form lang="en"><text>a family line</text></form></definition>
+  </sense>
+</entry>'''
+
+PLAIN = f'<lift version="0.13">{ENTRY}</lift>'
+NAMESPACED = f'<lift xmlns="http://fieldworks.sil.org/schemas/lift/0.13" version="0.13">{ENTRY}</lift>'
+
+
+def _without_generated_ids(value, xml):
+    """Drop IDs the models generated (they differ between any two parses)."""
+    if isinstance(value, dict):
+        return {k: _without_generated_ids(v, xml) for k, v in value.items()
+                if not (k == 'id' and isinstance(v, str) and f'"{v}"' not in xml)}
+    if isinstance(value, list):
+        return [_without_generated_ids(v, xml) for v in value]
+    return value
+
+
+def test_plain_and_namespaced_documents_read_the_same():
+    plain = LIFTParser(validate=False).parse_string(PLAIN)
+    namespaced = LIFTParser(validate=False).parse_string(NAMESPACED)
+
+    assert len(plain) == len(namespaced) == 1
+    assert (_without_generated_ids(plain[0].to_dict(), PLAIN)
+            == _without_generated_ids(namespaced[0].to_dict(), NAMESPACED))
+
+    entry = namespaced[0]
+    assert entry.lexical_unit == {'en': 'house', 'pl': 'dom'}
+    assert entry.morph_type == 'stem' and entry.traits['status'] == 'draft'
+    assert entry.domain_type == ['building'] and entry.pronunciation_media[0]['label'] == {'en': 'UK'}
+    assert entry.variants[0].grammatical_traits == {'number': 'sg'}
+    assert entry.relations[0].traits == {'strength': 'high'}
+    assert entry.etymologies[0].comment == {'en': 'cf. German Haus'}
+    assert entry.etymologies[0].custom_fields == {'certainty': {'en': 'high'}}
+    assert entry.notes == {'usage': {'en': {'text': 'Common.'}}, 'general': {'und': {'text': 'bare note text'}}}
+    assert entry.custom_fields == {'import-residue': {'en': 'row 12'}}
+    assert entry.annotations[0]['content'] == {'en': 'ok'}
+
+    sense = entry.senses[0]
+    assert sense.usage_type == ['colloquial', 'dated'] and sense.domain_type == ['architecture']
+    assert sense.semantic_domains == ['6.5.1'] and sense.traits == {'anthro-code': '342'}
+    assert sense.grammatical_traits == {'gender': 'n'}
+    assert sense.exemplar == {'en': 'a house'} and sense.scientific_name == {'la': 'domus'}
+    assert sense.custom_fields == {'sense-residue': {'en': 'x'}}
+    assert sense.illustrations == [{'href': 'house.png', 'label': {'en': 'A house'}}]
+    assert sense.subsenses[0].literal_meaning == {'en': 'home place'}
+    assert sense.examples[0].note == {'en': 'literal'}
+    assert sense.examples[0].custom_fields == {'register': {'en': 'neutral'}}
+
+
+# Digest of the sample file's entries as read by the XPath reader this one replaced
+SAMPLE_LIFT = Path(__file__).resolve().parents[2] / 'sample-lift-file' / 'sample-lift-file.lift'
+SAMPLE_DIGEST = '47b6f58341c96e2a87c7bc3b0cae2b779de6b6a29764e731318e377b0b7fc9f6'
+
+
+def test_sample_lift_file_entries_are_unchanged():
+    xml = SAMPLE_LIFT.read_text(encoding='utf-8')
+    entries = [_without_generated_ids(e.to_dict(), xml) for e in LIFTParser(validate=False).parse_string(xml)]
+    digest = hashlib.sha256(json.dumps(entries, sort_keys=True, default=str).encode()).hexdigest()
+
+    assert len(entries) == 315
+    assert digest == SAMPLE_DIGEST
+
+
+def test_namespaced_children_win_over_plain_ones():
+    xml = ('<lift xmlns:l="http://fieldworks.sil.org/schemas/lift/0.13"><l:entry id="e1">'
+           '<lexical-unit><form lang="en"><text>plain</text></form></lexical-unit>'
+           '<l:lexical-unit><l:form lang="en"><l:text>lift</l:text></l:form></l:lexical-unit>'
+           '<x:note xmlns:x="urn:other"><x:form lang="en"><x:text>ignored</x:text></x:form></x:note>'
+           '</l:entry></lift>')
+
+    entry = LIFTParser(validate=False).parse_string(xml)[0]
+
+    assert entry.lexical_unit == {'en': 'lift'}
+    assert entry.notes == {}
@@ -0,0 +1,211 @@
+"""
+Unit tests for the memory-mapped local vector store.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from app.services.embedding_service import EmbeddingService, sense_point_id
+from app.services import local_vector_store as lvs
+from app.services.local_vector_store import LocalPoint, LocalVectorStore
+
+
+def _unit_vectors(n, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(n, dim)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _points(vectors, pos=None):
+    return [
+        LocalPoint(f"p{i}", {"entry_id": f"e{i // 2}", "pos": pos or ("n" if i % 2 else "v")}, v.tolist())
+        for i, v in enumerate(vectors)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LocalVectorStore(str(tmp_path / "vectors"), dtype="float32")
+    store.create_collection("c", vectors_config=16)
+    return store
+
+
+class TestLocalVectorStore:
+
+    def test_exact_search_matches_brute_force(self, store):
+        vectors = _unit_vectors(3000)
+        store.upsert("c", _points(vectors))
+        queries = _unit_vectors(5, seed=1)
+
+        results = store.search_matrix("c", queries, limit=7)
+
+        expected = np.argsort(-(queries @ vectors.T), axis=1)[:, :7]
+        for hits, rows in zip(results, expected):
+            assert [h.id for h in hits] == [f"p{r}" for r in rows]
+            assert hits[0].score >= hits[-1].score
+
+    def test_query_points_threshold_and_filter(self, store):
+        vectors = _unit_vectors(50)
+        store.upsert("c", _points(vectors))
+
+        hits = store.query_points("c", query=vectors[3].tolist(), limit=5, score_threshold=0.99).points
+        assert [h.id for h in hits] == ["p3"]
+        assert hits[0].payload["entry_id"] == "e1"
+
+        filtered = store.search("c", vectors[3].tolist(), limit=50, query_filter={"pos": "v"})
+        assert filtered and all(h.payload["pos"] == "v" for h in filtered)
+
+    def test_scroll_pages_and_filters(self, store):
+        store.upsert("c", _points(_unit_vectors(25)))
+
+        seen, offset = [], None
+        while True:
+            page, offset = store.scroll("c", limit=10, offset=offset, with_payload=["entry_id"])
+            seen.extend(page)
+            if offset is None:
+                break
+        assert len(seen) == 25 and set(seen[0].payload) == {"entry_id"}
+
+        odd, _ = store.scroll("c", scroll_filter={"entry_id": ["e0", "e1"]}, limit=100, with_vectors=True)
+        assert [p.id for p in odd] == ["p0", "p1", "p2", "p3"]
+        assert len(odd[0].vector) == 16
+
+    def test_upsert_delete_grow_and_reopen(self, store, tmp_path):
+        vectors = _unit_vectors(1500)
+        store.upsert("c", _points(vectors[:1000]))
+        store.upsert("c", _points(vectors)[1000:])  # grows past the initial capacity
+        store.upsert("c", [LocalPoint("p0", {"entry_id": "moved"}, vectors[1].tolist())])
+        store.delete("c", points_selector=["p1", "p2", "missing"])
+
+        reopened = LocalVectorStore(str(tmp_path / "vectors"), dtype="float32")
+        info = reopened.get_collection("c")
+        assert info.points_count == 1498
+        assert info.config.params.vectors.size == 16
+        hits = reopened.search("c", vectors[1].tolist(), limit=1)
+        assert (hits[0].id, hits[0].payload) == ("p0", {"entry_id": "moved"})
+        assert reopened.retrieve("c", ["p2"]) == []
+
+    def test_compaction_preserves_points(self, store):
+        vectors = _unit_vectors(40)
+        store.upsert("c", _points(vectors))
+        store.delete("c", [f"p{i}" for i in range(0, 40, 2)])
+        store._get("c").compact()
+
+        assert store.get_collection("c").points_count == 20
+        hits = store.search("c", vectors[5].tolist(), limit=1)
+        assert hits[0].id == "p5" and hits[0].score == pytest.approx(1.0, abs=1e-5)
+
+    def test_search_blocks_stay_within_memory_budget(self, store):
+        vectors = _unit_vectors(20000)
+        store.upsert("c", _points(vectors))
+        queries = _unit_vectors(2048, seed=1)
+        collection = store._get("c")
+        block_rows = []
+
+        class RecordingVectors:
+            def __init__(self, vectors):
+                self.vectors = vectors
+
+            def __getitem__(self, selector):
+                block = self.vectors[selector]
+                block_rows.append(len(block))
+                return block
+
+        collection.vectors = RecordingVectors(collection.vectors)
+        hits = collection.top_k(queries, 3)
+
+        assert block_rows == [8192, 8192, 3616]
+        assert all(len(queries) * rows <= lvs.SCORE_BLOCK_ELEMENTS for rows in block_rows)
+        expected = np.argmax(queries @ vectors.T, axis=1)
+        assert [h[0][0] for h in hits] == expected.tolist()
+
+    def test_ivf_search_finds_near_duplicates(self, tmp_path):
+        store = LocalVectorStore(str(tmp_path / "ivf"), dtype="float16", ivf_lists=8, ivf_probe=3, ivf_min_points=100)
+        store.create_collection("c", vectors_config=16)
+        vectors = _unit_vectors(2000)
+        store.upsert("c", _points(vectors))
+
+        results = store.search_matrix("c", vectors[:50], limit=1)
+
+        assert store.get_collection("c").ivf_lists == 8
+        assert sum(hits[0].id == f"p{i}" for i, hits in enumerate(results)) >= 48
+
+    def test_other_process_writes_are_picked_up(self, store, tmp_path):
+        other = LocalVectorStore(str(tmp_path / "vectors"), dtype="float32")
+        vectors = _unit_vectors(1500)
+        store.upsert("c", _points(vectors[:10]))
+        assert other.get_collection("c").points_count == 10
+
+        store.upsert("c", _points(vectors)[10:20])
+        store.delete("c", ["p0"])
+        assert other.get_collection("c").points_count == 19
+        assert other.search("c", vectors[15].tolist(), limit=1)[0].id == "p15"
+        assert other.retrieve("c", ["p0"]) == []
+
+        other.upsert("c", _points(vectors)[20:1500])  # grows the matrix
+        store._get("c").compact()
+        assert other.get_collection("c").points_count == 1499
+        assert store.search("c", vectors[1200].tolist(), limit=1)[0].id == "p1200"
+        assert other.search("c", vectors[3].tolist(), limit=1)[0].id == "p3"
+
+        other.delete_collection("c")
+        with pytest.raises(ValueError):
+            store.get_collection("c")
+
+    def test_writes_lock_the_collection_exclusively(self, store):
+        import fcntl
+
+        with patch("app.services.local_vector_store.fcntl.flock") as flock:
+            store.upsert("c", _points(_unit_vectors(1)))
+            store.search("c", _unit_vectors(1)[0].tolist())
+
+        modes = [c.args[1] for c in flock.call_args_list if c.args[1] != fcntl.LOCK_UN]
+        assert modes == [fcntl.LOCK_EX, fcntl.LOCK_SH]
+
+    def test_delete_collection(self, store):
+        assert store.collection_exists("c")
+        assert store.delete_collection("c")
+        assert not store.collection_exists("c")
+
+
+class _FakeModel:
+    """Deterministic 384-dim 'encoder' keyed on the text."""
+
+    def encode(self, texts, **kwargs):
+        vectors = np.stack([_unit_vectors(1, dim=384, seed=sum(map(ord, t)))[0] for t in texts])
+        return vectors
+
+
+class TestEmbeddingServiceLocalBackend:
+
+    def _service(self, tmp_path):
+        service = EmbeddingService(backend="local", store_path=str(tmp_path / "vectors"))
+        service.store_dtype = "float32"
+        return service
+
+    def test_sync_and_search_without_qdrant(self, tmp_path):
+        service = self._service(tmp_path)
+        senses = [
+            {"entry_id": "e1", "headword": "cat", "sense_id": "s1", "pos": "n", "definition": "", "glosses": [], "text": "cat"},
+            {"entry_id": "e2", "headword": "dog", "sense_id": "s2", "pos": "n", "definition": "", "glosses": [], "text": "dog"},
+        ]
+        with patch.object(EmbeddingService, "_get_model", return_value=_FakeModel()), \
+                patch.object(EmbeddingService, "_resolve_dictionary_service", return_value=MagicMock()), \
+                patch.object(EmbeddingService, "_load_index_settings",
+                             return_value=(None, "sentence-transformers/all-MiniLM-L6-v2", "cpu")), \
+                patch.object(EmbeddingService, "extract_senses_from_basex", return_value=senses):
+            first = service.sync_index(project_id=1)
+            second = service.sync_index(project_id=1)
+
+            assert first["indexed"] == 2
+            assert (second["encoded"], second["unchanged"]) == (0, 2)
+            assert service.get_index_status(project_id=1)["vectors_count"] == 2
+
+            results = service.semantic_search("dog", project_id=1, top_k=1, threshold=0.9)
+            assert results[0]["entry_id"] == "e2"
+
+        client = service._get_qdrant_client()
+        hashes = service._load_index_hashes(client, "project_1_senses", ["e1"])
+        assert list(hashes) == [sense_point_id("e1", "s1")]
@@ -132,3 +132,68 @@ def test_analyze_definition_phrases_expected_pos_override() -> None:
     assert len(analysis["contradictions"]) == 0
 
 
+
+
+class _FakeToken:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tag_ = "VB" if text.startswith("to ") else "NN"
+        self.pos_ = "VERB" if self.tag_ == "VB" else "NOUN"
+        self.dep_ = "ROOT"
+        self.head = self
+        self.children = []
+
+
+class _FakeNlp:
+    """One-token docs; records every nlp.pipe call."""
+
+    pipe_names = ["tok2vec", "tagger", "attribute_ruler", "parser", "senter"]
+    meta = {"lang": "en", "name": "fake", "version": "1"}
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def pipe(self, texts, batch_size=1000, n_process=1, disable=()):
+        texts = list(texts)
+        self.calls.append({"texts": texts, "disable": list(disable), "batch_size": batch_size})
+        return [[_FakeToken(text)] for text in texts]
+
+
+@pytest.fixture
+def fake_nlp(monkeypatch):
+    import app.services.pos_tagger_service as module
+
+    nlp = _FakeNlp()
+    monkeypatch.setattr(module, "_get_spacy_nlp_parser", lambda: nlp)
+    monkeypatch.setattr(module, "_get_spacy_nlp", lambda: nlp)
+    return nlp
+
+
+def test_analyze_definition_phrases_batch_parses_once(fake_nlp) -> None:
+    svc = POSTaggerService()
+    definitions = ["a cat, a dog", "", "a dog, to bark", "a cat, a dog"]
+
+    results = svc.analyze_definition_phrases_batch(definitions, batch_size=32)
+
+    assert len(fake_nlp.calls) == 1
+    assert fake_nlp.calls[0]["texts"] == ["a cat", "a dog", "to bark"]
+    assert fake_nlp.calls[0]["disable"] == ["senter"]
+    assert fake_nlp.calls[0]["batch_size"] == 32
+    assert [r["is_consistent"] for r in results] == [True, True, False, True]
+    assert results[2]["contradictions"][0]["found_pos"] == "Verb Phrase"
+    assert svc.last_batch_stats["docs"] == 3
+
+    # Served from the in-process cache (Redis is disabled in unit tests).
+    assert svc.analyze_definition_phrases("a dog, to bark") == results[2]
+    assert len(fake_nlp.calls) == 1
+    assert svc.get_stats()["cache_hits"] == 1
+
+
+def test_tag_texts_uses_one_pipe_call(fake_nlp) -> None:
+    svc = POSTaggerService()
+    tagged = svc.tag_texts(["cat", "", "to run"])
+
+    assert len(fake_nlp.calls) == 1
+    assert fake_nlp.calls[0]["disable"] == ["parser", "senter"]
+    assert tagged[1] == []
+    assert [t[0]["normalized_pos"] for t in (tagged[0], tagged[2])] == ["Noun", "Verb"]
@@ -0,0 +1,129 @@
+"""
+Unit tests for the BaseX query profiler and its connector/response hooks.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+
+from app.database.basex_connector import BaseXConnector
+from app.database.query_profiler import QueryProfiler, fingerprint, get_query_profiler, normalize_query
+
+
+def _connector(execute_return='<entry id="a"/>'):
+    """A BaseXConnector whose pool hands out one mocked connection."""
+    with patch.object(BaseXConnector, '_make_connection'):
+        connector = BaseXConnector('localhost', 1984, 'admin', 'admin', 'testdb')
+    conn = MagicMock()
+    conn.current_db = 'testdb'
+    conn.session.query.return_value.execute.return_value = execute_return
+    connector._make_connection = MagicMock(return_value=conn)
+    return connector
+
+
+class TestFingerprint:
+
+    def test_literals_and_whitespace_are_normalized(self):
+        a = "xquery collection('dictionary')//entry[@id='a_1']\n   [position() = 1 to 20]"
+        b = 'collection("other")//entry[@id="b_2"] [position() = 21 to 40]'
+
+        assert normalize_query(a) == "collection(?)//entry[@id=?] [position() = ? to ?]"
+        assert fingerprint(a) == fingerprint(b)
+        assert fingerprint(a) != fingerprint("collection('dictionary')//sense[@id='a']")
+
+
+class TestQueryProfiler:
+
+    def test_slow_log_is_a_ring_buffer(self):
+        profiler = QueryProfiler(slow_query_ms=10, slow_log_size=2)
+        profiler.record("//entry[@id='fast']", 0.001)
+        for ms in (20, 30, 40):
+            profiler.record(f"//entry[@id='{ms}']", ms / 1000, result_bytes=ms)
+
+        slow = profiler.slow_queries()
+        assert [s['ms'] for s in slow] == [40.0, 30.0]
+        assert slow[0]['query'] == "//entry[@id='40']"
+        assert profiler.get_stats()['slow_queries'] == 3
+
+        shapes = profiler.top_fingerprints()
+        assert len(shapes) == 1 and shapes[0]['count'] == 4 and shapes[0]['bytes'] == 90
+
+    def test_request_summary_accumulates_per_request(self):
+        profiler = QueryProfiler()
+        app = Flask(__name__)
+
+        with app.test_request_context('/entries'):
+            for entry_id in 'abc':
+                profiler.record(f"//entry[@id='{entry_id}']", 0.002, result_bytes=100)
+            profiler.record('insert node <x/> into //entry', 0.001, kind='update')
+            profiler.record_wait(0.005)
+            summary = profiler.request_summary()
+
+        assert summary['queries'] == 3 and summary['updates'] == 1
+        assert summary['db_ms'] == 7.0 and summary['pool_wait_ms'] == 5.0
+        assert summary['bytes'] == 300 and summary['distinct_queries'] == 2
+        assert summary['most_repeated']['count'] == 3
+
+        with app.test_request_context('/other'):
+            assert profiler.request_summary() is None
+        assert profiler.request_summary() is None
+
+
+class TestConnectorProfiling:
+
+    def test_queries_and_updates_are_recorded(self):
+        connector = _connector()
+        profiler = get_query_profiler()
+        profiler.clear()
+        app = Flask(__name__)
+
+        with app.test_request_context('/entries/a'):
+            connector.execute_query("collection('testdb')//entry[@id='a']")
+            connector.execute_query("collection('testdb')//entry[@id='b']")
+            connector.execute_update("insert node <entry id='c'/> into collection('testdb')/lift")
+            summary = profiler.request_summary()
+
+        assert summary['queries'] == 2 and summary['updates'] == 1
+        assert summary['bytes'] == 2 * len('<entry id="a"/>')
+        assert summary['most_repeated']['count'] == 2
+        assert profiler.get_stats()['queries'] == 2
+        profiler.clear()
+
+    def test_result_size_is_utf8_bytes_of_the_queried_db(self):
+        connector = _connector('<entry id="żółw"/>')
+        conn = connector._make_connection.return_value
+        released = connector._release
+
+        def release_and_switch(c):
+            released(c)
+            c.current_db = 'otherdb'
+
+        connector._release = release_and_switch
+        with patch.object(get_query_profiler(), 'record') as record:
+            connector.execute_query("collection('testdb')//entry")
+
+        assert record.call_args.args[2] == len('<entry id="żółw"/>'.encode('utf-8'))
+        assert record.call_args.kwargs['db_name'] == 'testdb' and conn.current_db == 'otherdb'
+
+    def test_server_timing_header(self):
+        from app import create_app
+
+        app = create_app('testing')
+        app.config['REQUIRE_AUTH'] = False
+        connector = _connector()
+
+        @app.route('/api/_profiler_probe')
+        def probe():
+            connector.execute_query("collection('testdb')//entry[@id='a']")
+            return 'ok'
+
+        with app.test_client() as client:
+            timed = client.get('/api/_profiler_probe')
+            untimed = client.get('/health')
+
+        assert timed.headers['Server-Timing'].startswith('basex;dur=')
+        assert 'desc="1 queries, 0 updates' in timed.headers['Server-Timing']
+        assert 'Server-Timing' not in untimed.headers
+        get_query_profiler().clear()
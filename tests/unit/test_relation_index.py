@@ -0,0 +1,164 @@
+"""
+Unit tests for the reverse-relation index and its DictionaryService/Entry wiring.
+"""
+
+from unittest.mock import MagicMock
+
+from app.models.entry import Entry
+from app.services.dictionary_service import DictionaryService
+from app.services.relation_index import RelationRow, ReverseRelationIndex
+
+
+def _rows():
+    return [
+        RelationRow('sub1', '_component-lexeme', 'main', {'complex-form-type': 'Compound', 'is-primary': 'true'}, 2),
+        RelationRow('sub2', '_component-lexeme', 'main', {'complex-form-type': 'Phrase'}, 1),
+        RelationRow('var1', '_component-lexeme', 'main', {'variant-type': 'Spelling'}, None),
+        RelationRow('syn1', 'synonym', 'other', {}, None),
+    ]
+
+
+def _loader(rows):
+    loader = MagicMock(side_effect=lambda ids: [r for r in rows if ids is None or r.source_id in ids])
+    return loader
+
+
+class TestReverseRelationIndex:
+
+    def test_lookup_builds_once(self):
+        loader = _loader(_rows())
+        index = ReverseRelationIndex(loader)
+
+        refs = index.lookup('main')
+        assert [r.source_id for r in refs] == ['sub1', 'sub2', 'var1']
+        assert index.lookup('other', 'synonym')[0].source_id == 'syn1'
+        assert index.lookup('missing') == []
+        assert loader.call_count == 1
+
+    def test_update_and_remove_source(self):
+        index = ReverseRelationIndex(_loader(_rows()))
+        index.rebuild()
+
+        index.update_source('sub1', [RelationRow('sub1', 'synonym', 'other', {}, None)])
+        assert [r.source_id for r in index.lookup('main')] == ['sub2', 'var1']
+        assert {r.source_id for r in index.lookup('other')} == {'syn1', 'sub1'}
+
+        index.remove_source('syn1')
+        assert [r.source_id for r in index.lookup('other')] == ['sub1']
+
+    def test_incremental_updates_ignored_until_built(self):
+        loader = _loader(_rows())
+        index = ReverseRelationIndex(loader)
+
+        index.update_source('new', [RelationRow('new', 'synonym', 'main', {}, None)])
+        index.reindex_sources(['sub1'])
+
+        assert loader.call_count == 0
+        assert 'new' not in {r.source_id for r in index.lookup('main')}
+
+    def test_reindex_sources_reloads_in_one_call(self):
+        rows = _rows()
+        loader = _loader(rows)
+        index = ReverseRelationIndex(loader)
+        index.rebuild()
+
+        rows[:] = [r for r in rows if r.source_id != 'sub2']
+        index.reindex_sources(['sub2', 'var1'])
+
+        loader.assert_called_with(['sub2', 'var1'])
+        assert [r.source_id for r in index.lookup('main')] == ['sub1', 'var1']
+
+    def test_stale_index_is_rebuilt(self):
+        loader = _loader(_rows())
+        index = ReverseRelationIndex(loader, max_age_seconds=0)
+        index.lookup('main')
+        index.lookup('main')
+        assert loader.call_count == 2
+
+    def test_pairs_are_sorted(self):
+        index = ReverseRelationIndex(_loader(_rows()))
+        assert index.pairs('synonym') == {('other', 'syn1')}
+
+
+class TestDictionaryServiceRelationIndex:
+
+    def _service(self, query_result):
+        connector = MagicMock()
+        connector.database = 'dictionary'
+        connector.execute_query.return_value = query_result
+        return DictionaryService(db_connector=connector)
+
+    def test_load_relation_rows_parses_traits_and_order(self):
+        service = self._service(
+            "sub1|||_component-lexeme|||main|||3|||complex-form-type==Compound;;is-primary==true\n"
+            "syn1|||synonym|||other||||||\n"
+        )
+        rows = service._load_relation_rows('dictionary')
+
+        assert rows[0] == RelationRow('sub1', '_component-lexeme', 'main',
+                                      {'complex-form-type': 'Compound', 'is-primary': 'true'}, 3)
+        assert rows[1] == RelationRow('syn1', 'synonym', 'other', {}, None)
+
+    def test_get_entry_labels(self):
+        service = self._service(
+            '<results><item id="e1" order="2"><form lang="pl">kot</form><form lang="en">cat</form></item>'
+            '<item id="e2" order=""><form lang="fr">chien</form></item></results>'
+        )
+        labels = service.get_entry_labels(['e1', 'e2'])
+
+        assert labels['e1'] == {'lexical_unit': {'pl': 'kot', 'en': 'cat'}, 'homograph_number': 2}
+        assert labels['e2'] == {'lexical_unit': {'fr': 'chien'}, 'homograph_number': None}
+
+    def test_save_updates_built_index(self):
+        service = self._service('')
+        index = service.get_relation_index()
+        index.rebuild()
+
+        entry = Entry(id_='sub9', lexical_unit={'en': 'x'},
+                      relations=[{'type': '_component-lexeme', 'ref': 'main',
+                                  'traits': {'complex-form-type': 'Compound'}}])
+        service._sync_relation_index('dictionary', 'sub9', entry)
+        assert [r.source_id for r in service.get_reverse_relations('main')] == ['sub9']
+
+        service._sync_relation_index('dictionary', 'sub9', None, entry)
+        assert service.get_reverse_relations('main') == []
+
+
+class _IndexedService:
+    """Minimal service exposing the indexed lookup API."""
+
+    def __init__(self, rows, labels):
+        self._index = ReverseRelationIndex(lambda ids: rows)
+        self._labels = labels
+
+    def get_reverse_relations(self, target_id, relation_type=None, project_id=None):
+        return self._index.lookup(target_id, relation_type)
+
+    def get_entry_labels(self, entry_ids, project_id=None):
+        return {i: self._labels[i] for i in entry_ids if i in self._labels}
+
+
+class TestEntryIndexedLookups:
+
+    def _service(self):
+        return _IndexedService(_rows(), {
+            'sub1': {'lexical_unit': {'en': 'blackboard'}, 'homograph_number': 2},
+            'sub2': {'lexical_unit': {'pl': 'tablica'}, 'homograph_number': None},
+            'var1': {'lexical_unit': {'en': 'mayne'}, 'homograph_number': None},
+        })
+
+    def test_get_subentries_skips_variants(self):
+        subentries = Entry(id_='main', lexical_unit={'en': 'main'}).get_subentries(self._service())
+
+        assert [s['id'] for s in subentries] == ['sub2', 'sub1']
+        assert subentries[1]['display_text'].startswith('blackboard<sub')
+        assert subentries[1]['is_primary'] is True
+        assert subentries[0]['complex_form_type'] == 'Phrase'
+
+    def test_get_reverse_variant_relations(self):
+        variants = Entry(id_='main', lexical_unit={'en': 'main'}).get_reverse_variant_relations(self._service())
+
+        assert variants == [{
+            'ref': 'var1', 'ref_lexical_unit': 'mayne', 'ref_display_text': 'mayne',
+            'variant_type': 'Spelling', 'type': '_component-lexeme', 'direction': 'incoming',
+        }]
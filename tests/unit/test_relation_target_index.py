@@ -0,0 +1,98 @@
+"""
+Unit tests for the relation-target index and its ValidationEngine/DictionaryService wiring.
+"""
+
+import random
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models.entry import Entry
+from app.services.dictionary_service import DictionaryService
+from app.services.relation_target_index import RelationTargetIndex, expand_targets
+from app.services.validation_engine import ValidationEngine
+
+
+def _linear_scan(target, ids):
+    """The check ValidationEngine ran before the index existed."""
+    return target in ids or any(eid.endswith(target) or target.endswith(eid) for eid in ids)
+
+
+class TestRelationTargetIndex:
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(3)
+        alphabet = 'ab_1'
+        ids = {''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 8))) for _ in range(300)}
+        index = RelationTargetIndex(ids)
+
+        for _ in range(2000):
+            target = ''.join(rng.choice(alphabet + 'c') for _ in range(rng.randint(1, 10)))
+            assert index.resolves(target) == _linear_scan(target, ids), target
+
+    def test_suffix_lookups(self):
+        index = RelationTargetIndex(expand_targets(['cat_3f2a', 'dog_91bc', 'dog_91bc_s1']))
+
+        assert index.resolves('3f2a')          # GUID part of an ID
+        assert index.resolves('g_91bc')        # suffix of an ID
+        assert index.resolves('other_3f2a')    # ends with an indexed GUID
+        assert not index.resolves('cat')
+        assert not index.resolves('s2')
+
+    def test_entries_are_updated_and_removed(self):
+        index = RelationTargetIndex.from_entries({'cat_g1': ['cat_g1', 'senseA'], 'dog_g1': ['dog_g1']})
+        assert index.resolves('senseA')
+
+        index.set_entry('cat_g1', ['cat_g1', 'senseB'])
+        assert not index.resolves('senseA') and index.resolves('senseB')
+        # 'g1' is shared by both entries, so it stays until the last one goes
+        index.remove_entry('cat_g1')
+        assert 'cat_g1' not in index and index.resolves('g1')
+
+        index.remove_entry('dog_g1')
+        assert len(index) == 0 and not index.resolves('dog_g1')
+
+
+class TestValidationEngineRelationTargets:
+
+    RELATIONS = {'id': 'e1', 'lexical_unit': {'en': 'x'}, 'senses': [],
+                 'relations': [{'type': 'synonym', 'ref': 'word_9z'}, {'type': 'synonym', 'ref': 'gone'}]}
+
+    @pytest.mark.parametrize('targets', [{'e1', 'x_word_9z'}, RelationTargetIndex({'e1', 'x_word_9z'})])
+    def test_accepts_set_or_index(self, targets):
+        engine = ValidationEngine(existing_entry_ids=targets)
+        result = engine.validate_json(self.RELATIONS, rule_id_filter='R5.3.1')
+
+        assert [e.value for e in result.errors] == ['gone']
+
+    def test_set_is_indexed_once(self):
+        engine = ValidationEngine(existing_entry_ids={'e1'})
+        engine.validate_json(self.RELATIONS, rule_id_filter='R5.3.1')
+        index = engine._relation_targets
+
+        engine.validate_json(self.RELATIONS, rule_id_filter='R5.3.1')
+        assert index is not None and engine._relation_targets is index
+
+
+class TestDictionaryServiceTargetIndex:
+
+    def _service(self, query_result):
+        connector = MagicMock()
+        connector.database = 'dictionary'
+        connector.execute_query.return_value = query_result
+        return DictionaryService(db_connector=connector)
+
+    def test_built_once_and_synced_on_save(self):
+        service = self._service("cat_1|||g-cat|||cat_1_s1\ndog_2|||dog_2_s1|||g-sense\n")
+        index = service.get_relation_target_index()
+        queries = service.db_connector.execute_query.call_count
+        assert service.get_relation_target_index() is index
+        assert service.db_connector.execute_query.call_count == queries
+        assert index.resolves('g-sense') and index.resolves('cat_1_s1')
+
+        entry = Entry(id_='cow_3', lexical_unit={'en': 'cow'}, senses=[{'id': 'cow_3_s1'}])
+        service._sync_target_index('dictionary', 'cow_3', entry)
+        assert index.resolves('cow_3_s1')
+
+        service._sync_target_index('dictionary', 'dog_2', None)
+        assert not index.resolves('g-sense') and not index.resolves('dog_2')
@@ -0,0 +1,215 @@
+"""
+Unit tests for the rendered-entry HTML cache.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from app.models.entry import Entry
+from app.services.cache_service import CacheService
+from app.services.css_mapping_service import CSSMappingService
+from app.services.dictionary_service import DictionaryService
+from app.services.rendered_entry_cache import (
+    RANGES_NAMESPACE, RenderedEntryCache, entry_identity, relation_refs,
+)
+
+
+def _xml(entry_id='a', modified='2024-01-01T00:00:00Z', refs=(), text='word'):
+    relations = ''.join(f'<relation type="synonym" ref="{r}"/>' for r in refs)
+    return (f'<entry id="{entry_id}" dateModified="{modified}"><lexical-unit><form lang="en">'
+            f'<text>{text}</text></form></lexical-unit>{relations}</entry>')
+
+
+def _profile(profile_id=1, css=''):
+    element = SimpleNamespace(lift_element='lexical-unit', display_order=1, css_class='headword',
+                              prefix='', suffix='', visibility='always', config={}, language_filter='*')
+    return SimpleNamespace(id=profile_id, name='Default', custom_css=css, show_subentries=False,
+                           number_senses=True, updated_at=None, elements=[element])
+
+
+@pytest.fixture
+def local_cache():
+    CacheService.reset_singleton()
+    with patch.dict('os.environ', {'REDIS_ENABLED': 'true'}), patch('redis.Redis') as mock_redis:
+        mock_redis.side_effect = redis.ConnectionError("Redis unavailable")
+        cache = CacheService()
+    yield cache
+    CacheService.reset_singleton()
+
+
+@pytest.fixture
+def render_cache(local_cache):
+    return RenderedEntryCache(local_cache)
+
+
+class _Renderer:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return f'<div>render {self.calls}</div>'
+
+
+class TestRenderedEntryCache:
+
+    def test_entry_identity_and_refs(self):
+        xml = '<root><entry guid="g" id="x1" dateModified="d"><sense><relation ref="s9" type="t"/></sense></entry></root>'
+        assert entry_identity(xml) == ('x1', 'd')
+        assert relation_refs(xml) == ['s9']
+
+    def test_hit_after_first_render(self, render_cache):
+        render = _Renderer()
+        first = render_cache.get_or_render('db', _xml(), _profile(), render)
+        second = render_cache.get_or_render('db', _xml(), _profile(), render)
+
+        assert first == second and render.calls == 1
+        stats = render_cache.get_stats()
+        assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 0.5)
+
+    def test_key_tracks_entry_profile_and_ranges_versions(self, render_cache, local_cache):
+        base = render_cache.key_for('db', _xml(), _profile())
+
+        assert render_cache.key_for('db', _xml(modified='2024-02-01'), _profile()) != base
+        assert render_cache.key_for('db', _xml(), _profile(css='b {}')) != base
+        assert render_cache.key_for('db', _xml(), _profile(profile_id=2)) != base
+        assert render_cache.key_for('db', _xml(), _profile(), {'b': 'bee'}) != base
+        local_cache.bump_namespace(RANGES_NAMESPACE, 'db')
+        assert render_cache.key_for('db', _xml(), _profile()) != base
+
+    def test_unkeyed_renders_and_errors_are_not_cached(self, render_cache):
+        render = _Renderer()
+        render_cache.get_or_render('db', _xml(), SimpleNamespace(id=None, elements=[]), render)
+        render_cache.get_or_render('db', _xml(), SimpleNamespace(id=None, elements=[]), render)
+        error = MagicMock(return_value='<div class="entry-render-error">x</div>')
+        render_cache.get_or_render('db', _xml(), _profile(), error)
+        render_cache.get_or_render('db', _xml(), _profile(), error)
+
+        assert render.calls == 2 and error.call_count == 2
+        assert render_cache.get_stats()['bypassed'] == 2
+
+    def test_headword_change_invalidates_dependents(self, render_cache):
+        render = _Renderer()
+        render_cache.get_or_render('db', _xml('a', refs=['b', 's1']), _profile(), render)
+        render_cache.get_or_render('db', _xml('c'), _profile(), render)
+
+        render_cache.invalidate_entry('db', 'b', label_changed=False)
+        render_cache.get_or_render('db', _xml('a', refs=['b', 's1']), _profile(), render)
+        assert render.calls == 2
+
+        render_cache.invalidate_entry('db', 'z', label_changed=True, sense_ids=['s1'])
+        render_cache.get_or_render('db', _xml('a', refs=['b', 's1']), _profile(), render)
+        render_cache.get_or_render('db', _xml('c'), _profile(), render)
+        assert render.calls == 3
+
+    def test_invalidate_all(self, render_cache):
+        render = _Renderer()
+        render_cache.get_or_render('db', _xml(), _profile(), render)
+        render_cache.invalidate_all('db')
+        render_cache.get_or_render('db', _xml(), _profile(), render)
+        assert render.calls == 2
+
+    def test_warm_renders_most_viewed(self, render_cache):
+        for entry_id, views in (('a', 3), ('b', 1), ('c', 2)):
+            for _ in range(views):
+                render_cache.record_view(entry_id)
+        rendered = []
+
+        def render_one(entry_id):
+            if entry_id == 'c':
+                raise RuntimeError('gone')
+            rendered.append(entry_id)
+
+        result = render_cache.warm(render_one, limit=2)
+
+        assert rendered == ['a']
+        assert result == {'warmed': 1, 'failed': ['c'], 'entries': ['a']}
+
+
+class TestRenderCacheWiring:
+
+    def test_css_service_renders_once(self, render_cache):
+        service = CSSMappingService()
+        service.render_cache = render_cache
+        dict_service = MagicMock()
+        dict_service.db_connector.database = 'db'
+
+        with patch.object(CSSMappingService, '_render_entry_uncached', return_value='<div>x</div>') as render:
+            service.render_entry(_xml(), _profile(), dict_service=dict_service)
+            html = service.render_entry(_xml(), _profile(), dict_service=dict_service)
+
+        assert html == '<div>x</div>' and render.call_count == 1
+
+    def test_entry_save_invalidates_by_label(self):
+        before = Entry(id_='b', lexical_unit={'en': 'bee'}, senses=[{'id': 's1'}])
+        same_label = Entry(id_='b', lexical_unit={'en': 'bee'}, senses=[{'id': 's1'}], grammatical_info='noun')
+        renamed = Entry(id_='b', lexical_unit={'en': 'bea'}, senses=[{'id': 's1'}])
+        resensed = Entry(id_='b', lexical_unit={'en': 'bee'}, senses=[{'id': 's2'}])
+        service = DictionaryService.__new__(DictionaryService)
+        service.logger = MagicMock()
+
+        with patch('app.services.dictionary_service.rendered_entry_cache') as cache:
+            service._sync_render_cache('db', 'b', same_label, before)
+            service._sync_render_cache('db', 'b', renamed, before)
+            service._sync_render_cache('db', 'b', resensed, before)
+
+        assert cache.invalidate_entry.call_args_list[0].args == ('db', 'b', False, ['s1'])
+        assert cache.invalidate_entry.call_args_list[1].args == ('db', 'b', True, ['s1'])
+        # The removed sense s1 may still be shown by other entries
+        assert cache.invalidate_entry.call_args_list[2].args == ('db', 'b', True, ['s1', 's2'])
+
+    @pytest.mark.skip_et_mock
+    def test_xml_api_save_invalidates_dependent_renders(self, render_cache, local_cache):
+        from flask import Flask
+        from app.api import xml_entries
+        from app.parsers.lift_parser import LIFTParser
+
+        dict_service = DictionaryService.__new__(DictionaryService)
+        dict_service.lift_parser = LIFTParser(validate=False)
+        dict_service.logger = MagicMock()
+        dict_service.get_entry = MagicMock(return_value=Entry(id_='b', lexical_unit={'en': 'bee'}))
+        xml_service = MagicMock(database='db')
+        xml_service.update_entry.return_value = {'id': 'b', 'status': 'updated'}
+        app = Flask(__name__)
+        app.register_blueprint(xml_entries.xml_entries_bp)
+        app.injector = SimpleNamespace(get=lambda _cls: dict_service)
+
+        render = _Renderer()
+        render_cache.get_or_render('db', _xml('a', refs=['b']), _profile(), render)
+        render_cache.get_or_render('db', _xml('c'), _profile(), render)
+        with patch.object(xml_entries, 'get_xml_entry_service', return_value=xml_service), \
+                patch('app.services.cache_service.CacheService', return_value=local_cache), \
+                patch('app.services.dictionary_service.rendered_entry_cache', render_cache), \
+                patch.multiple(DictionaryService, _sync_relation_index=MagicMock(),
+                               _sync_target_index=MagicMock(), _sync_stats_store=MagicMock()):
+            response = app.test_client().put('/api/xml/entries/b', data=_xml('b', text='bea'),
+                                             content_type='application/xml')
+        render_cache.get_or_render('db', _xml('a', refs=['b']), _profile(), render)
+        render_cache.get_or_render('db', _xml('c'), _profile(), render)
+
+        assert response.status_code == 200
+        assert render.calls == 3
+
+    def test_cache_endpoints_are_admin_only_and_clamp_limit(self, render_cache):
+        from flask import Flask
+        from app.views import main_bp
+
+        css_service = MagicMock(render_cache=render_cache)
+        app = Flask(__name__)
+        app.secret_key = 'test'
+        app.register_blueprint(main_bp)
+        app.injector = SimpleNamespace(get=lambda _cls: css_service)
+        client = app.test_client()
+        render_cache.warm = MagicMock(return_value={'warmed': 0, 'failed': [], 'entries': []})
+
+        with patch('app.utils.auth_decorators.get_current_user', return_value=SimpleNamespace(is_admin=False)):
+            assert client.get('/api/render-cache/stats').status_code == 403
+            assert client.post('/api/render-cache/warm').status_code == 403
+        with patch('app.utils.auth_decorators.get_current_user', return_value=SimpleNamespace(is_admin=True)), \
+                patch('app.views._get_default_display_profile', return_value=_profile()):
+            assert client.post('/api/render-cache/warm?limit=1000000').status_code == 200
+
+        assert render_cache.warm.call_args.kwargs['limit'] == RenderedEntryCache.MAX_WARM_ENTRIES
@@ -6,6 +6,7 @@ fallback behavior and download helper logic.
 from __future__ import annotations
 
 import os
+import sys
 import tempfile
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,14 @@ import pytest
 from app.services.validation_engine import SchematronValidator
 
 
+@pytest.fixture(autouse=True)
+def _compiled_dir(tmp_path: Path, monkeypatch: Any) -> Path:
+    # Keep compiled stylesheets out of the working tree
+    compiled_dir = tmp_path / 'compiled'
+    monkeypatch.setenv('SCHEMATRON_COMPILED_DIR', str(compiled_dir))
+    return compiled_dir
+
+
 def _write_minimal_xslt2_schema(path: Path) -> None:
     path.write_text(
         '''<?xml version="1.0"?>
@@ -95,5 +104,177 @@ def test_xslt2_schema_with_saxon_and_xmlresolver(monkeypatch: Any, tmp_path: Pat
     # Ensure compiled xsl was created
     compiled_xsl_path = validator._validator[1]
     assert Path(compiled_xsl_path).exists()
+    assert Path(compiled_xsl_path).parent == tmp_path / 'compiled'
     assert getattr(validator, '_saxon_jar') == str(saxon_jar)
     assert getattr(validator, '_xmlresolver_jar') == str(xmlresolver_jar)
+
+
+SVRL_NS = 'http://purl.oclc.org/dsdl/svrl'
+LIFT_NS = 'http://code.google.com/p/lift-standard'
+
+
+def _svrl(*locations: str) -> bytes:
+    asserts = ''.join(
+        f'<svrl:failed-assert location="{loc}"><svrl:text>R1.1.3 Violation: sense required</svrl:text>'
+        f'</svrl:failed-assert>' for loc in locations
+    )
+    return f'<svrl:schematron-output xmlns:svrl="{SVRL_NS}">{asserts}</svrl:schematron-output>'.encode()
+
+
+# Speaks SchematronWorker.java's framing; answers "ERR" for documents containing "boom".
+_FAKE_WORKER = r'''
+import sys
+out = sys.stdout.buffer
+out.write(b"READY\n"); out.flush()
+svrl = b"<svrl:schematron-output xmlns:svrl='http://purl.oclc.org/dsdl/svrl'/>"
+while True:
+    header = sys.stdin.buffer.readline()
+    if not header:
+        break
+    doc = sys.stdin.buffer.read(int(header))
+    status, body = (b"ERR", b"bad document") if b"boom" in doc else (b"OK", svrl)
+    out.write(status + b" %d\n" % len(body) + body); out.flush()
+'''
+
+
+class _FakeSaxonWorker:
+
+    @staticmethod
+    def make(tmp_path: Path):
+        from app.services.saxon_worker import SaxonWorker
+
+        script = tmp_path / 'fake_worker.py'
+        script.write_text(_FAKE_WORKER)
+
+        class Worker(SaxonWorker):
+            def _command(self):
+                return [sys.executable, str(script)]
+
+        return Worker('saxon.jar', 'compiled.xsl', timeout=10)
+
+
+def test_saxon_worker_reuses_one_process(tmp_path: Path) -> None:
+    from app.services.saxon_worker import SaxonWorkerError
+
+    worker = _FakeSaxonWorker.make(tmp_path)
+    try:
+        assert b'schematron-output' in worker.transform('<entry id="a"/>')
+        pid = worker._process.pid
+        assert b'schematron-output' in worker.transform('<entry id="b">' + 'x' * 200000 + '</entry>')
+        assert worker._process.pid == pid and worker.get_stats()['starts'] == 1
+
+        with pytest.raises(SaxonWorkerError, match='bad document'):
+            worker.transform('<boom/>')
+        assert worker._process.pid == pid
+
+        worker._process.kill()
+        worker._process.wait()
+        worker.transform('<entry id="c"/>')
+        assert worker.get_stats()['starts'] == 2
+    finally:
+        worker.close()
+
+
+def test_saxon_worker_start_times_out(tmp_path: Path, monkeypatch: Any) -> None:
+    from app.services.saxon_worker import SaxonWorker, SaxonWorkerError
+
+    script = tmp_path / 'silent_worker.py'
+    script.write_text('import sys\nsys.stdin.read()\n')
+    monkeypatch.setattr(SaxonWorker, '_command', lambda self: [sys.executable, str(script)])
+    monkeypatch.setattr(SaxonWorker, 'START_TIMEOUT_SECONDS', 0.5)
+
+    worker = SaxonWorker('saxon.jar', 'compiled.xsl')
+    with pytest.raises(SaxonWorkerError, match='timed out'):
+        worker.start()
+    assert not worker.is_running
+
+
+def test_recompiled_stylesheet_replaces_worker_after_transform_in_flight(
+        tmp_path: Path, monkeypatch: Any) -> None:
+    import threading
+    from app.services import saxon_worker
+
+    script = tmp_path / 'fake_worker.py'
+    script.write_text(_FAKE_WORKER)
+    monkeypatch.setattr(saxon_worker.SaxonWorker, '_command', lambda self: [sys.executable, str(script)])
+    monkeypatch.setattr(saxon_worker, '_workers', {})
+    compiled = tmp_path / 'compiled.xsl'
+    compiled.write_text('<xsl/>')
+
+    old = saxon_worker.get_saxon_worker('saxon.jar', str(compiled))
+    old.transform('<entry id="a"/>')
+    os.utime(compiled, (1, 1))
+    replaced = []
+    try:
+        with old._lock:  # a transform in flight
+            getter = threading.Thread(
+                target=lambda: replaced.append(saxon_worker.get_saxon_worker('saxon.jar', str(compiled))))
+            getter.start()
+            getter.join(0.2)
+            assert old.is_running and not replaced
+        getter.join(5)
+
+        assert replaced and replaced[0] is not old and not old.is_running
+        assert b'schematron-output' in old.transform('<entry id="b"/>')
+        assert not old.is_running and replaced[0].get_stats()['transforms'] == 1
+    finally:
+        saxon_worker.shutdown_saxon_workers()
+        old.close()
+
+
+def test_split_svrl_by_entry() -> None:
+    from lxml import etree
+    from app.services.saxon_worker import split_svrl_by_entry
+
+    ns_step = f"[namespace-uri()='{LIFT_NS}']"
+    svrl = etree.fromstring(_svrl(
+        '/lift[1]/entry[2]',
+        f'/*:lift{ns_step}[1]/*:entry{ns_step}[2]/*:sense{ns_step}[1]',
+        '/lift[1]/entry[3]/lexical-unit[1]',
+        '/lift[1]',
+    ))
+    by_position, unplaced = split_svrl_by_entry(svrl, 3)
+
+    assert {pos: len(found) for pos, found in by_position.items()} == {2: 2, 3: 1}
+    assert [f.get('location') for f in unplaced] == ['/lift[1]']
+
+
+def test_validate_batch_splits_one_transform_per_entry(monkeypatch: Any) -> None:
+    validator = SchematronValidator()
+    validator._validator = ('saxon', 'compiled.xsl')
+    documents = []
+
+    def fake_svrl(xml):
+        documents.append(xml)
+        return _svrl('/lift[1]/entry[2]')
+
+    monkeypatch.setattr(validator, '_saxon_svrl', fake_svrl)
+    results = validator.validate_batch(['<entry id="a"/>', "<entry guid='g' id='b'/>", '<entry/>'])
+
+    assert len(documents) == 1 and documents[0].startswith('<lift><entry id="a"/>')
+    assert list(results) == ['a', 'b', '#3']
+    assert results['a'].is_valid and results['#3'].is_valid
+    assert [e.rule_id for e in results['b'].errors] == ['R1.1.3']
+
+
+def test_saxon_falls_back_to_one_jvm_per_call(monkeypatch: Any) -> None:
+    from app.services import saxon_worker
+    from app.services.saxon_worker import SaxonWorkerError
+
+    class BrokenWorker:
+        is_running = False
+
+        def start(self):
+            raise SaxonWorkerError('java 8 cannot run source files')
+
+    validator = SchematronValidator()
+    validator._validator = ('saxon', 'compiled.xsl')
+    validator._saxon_jar = 'saxon.jar'
+    monkeypatch.setattr(saxon_worker, 'get_saxon_worker', lambda *args: BrokenWorker())
+    calls = []
+    monkeypatch.setattr(validator, '_saxon_svrl_subprocess',
+                        lambda xml, xsl, resolver: calls.append(xml) or _svrl())
+
+    assert validator._saxon_svrl('<entry/>') == _svrl()
+    assert validator._saxon_svrl('<entry/>') == _svrl()
+    assert len(calls) == 2 and validator._saxon_worker_failed
@@ -0,0 +1,177 @@
+"""
+Unit tests for the spell-check verdict cache and DictionaryLoader negative caching.
+"""
+
+import pytest
+
+from app.services.dictionary_loader import DictionaryLoader
+from app.services.spell_cache import SpellVerdictCache, get_spell_verdict_cache
+from app.services.validation_engine import ValidationEngine
+
+
+class FakeHunspell:
+    """Counts calls; knows a fixed set of words."""
+
+    def __init__(self, known=()):
+        self.known = set(known)
+        self.spell_calls = []
+        self.suggest_calls = []
+
+    def spell(self, word):
+        self.spell_calls.append(word)
+        return word in self.known
+
+    def suggest(self, word):
+        self.suggest_calls.append(word)
+        return [f'{word}-1', f'{word}-2', f'{word}-3', f'{word}-4']
+
+
+class TestSpellVerdictCache:
+
+    def test_spell_many_dedupes_and_caches(self):
+        cache = SpellVerdictCache()
+        hunspell = FakeHunspell(known={'cat'})
+
+        verdicts = cache.spell_many(hunspell, ['cat', 'dgo', 'cat', 'dgo'], 'en')
+        assert verdicts == {'cat': True, 'dgo': False}
+        assert sorted(hunspell.spell_calls) == ['cat', 'dgo']
+
+        assert cache.spell(hunspell, 'cat', 'en') is True
+        assert len(hunspell.spell_calls) == 2
+        assert cache.get_stats()['hits'] == 1
+
+    def test_verdicts_are_per_dictionary_and_language(self):
+        cache = SpellVerdictCache()
+        en, pl = FakeHunspell(known={'kot'}), FakeHunspell()
+
+        assert cache.spell(en, 'kot', 'en') is True
+        assert cache.spell(pl, 'kot', 'pl') is False
+        assert cache.spell(en, 'kot', 'en-GB') is True
+        assert len(en.spell_calls) == 2
+
+    def test_suggestions_cached(self):
+        cache = SpellVerdictCache()
+        hunspell = FakeHunspell()
+
+        assert cache.suggest(hunspell, 'dgo', 'en')[:3] == ['dgo-1', 'dgo-2', 'dgo-3']
+        cache.suggest(hunspell, 'dgo', 'en')
+        assert hunspell.suggest_calls == ['dgo'] and hunspell.spell_calls == ['dgo']
+
+    def test_lru_eviction(self):
+        cache = SpellVerdictCache(max_entries=2)
+        hunspell = FakeHunspell()
+
+        cache.spell_many(hunspell, ['aaa', 'bbb'])
+        cache.spell(hunspell, 'aaa')        # 'bbb' is now least recently used
+        cache.spell(hunspell, 'ccc')
+        cache.spell_many(hunspell, ['aaa', 'bbb'])
+
+        assert hunspell.spell_calls == ['aaa', 'bbb', 'ccc', 'bbb']
+        assert cache.get_stats()['evictions'] == 2
+
+    def test_forget_and_clear(self):
+        cache = SpellVerdictCache()
+        first, second = FakeHunspell(), FakeHunspell()
+        cache.spell_many(first, ['aaa', 'bbb'])
+        cache.spell(second, 'aaa')
+
+        assert cache.forget(first) == 2
+        assert cache.forget(FakeHunspell()) == 0
+        cache.spell(first, 'aaa')
+        assert first.spell_calls == ['aaa', 'bbb', 'aaa']
+
+        assert cache.clear() == 2
+        assert cache.get_stats()['dictionaries'] == 0
+
+
+class TestDictionaryLoaderMisses:
+
+    @pytest.fixture
+    def loader(self, monkeypatch):
+        loader = DictionaryLoader()
+        monkeypatch.setattr(loader, '_hunspell_available', True)
+        monkeypatch.setattr(loader, 'SYSTEM_DICT_PATHS', [])
+        loader.lookups, loader.scans = [], []
+        discover = loader.discover_system_dictionaries
+
+        def counting_discover():
+            loader.lookups.append(1)
+            if loader._system_dicts is None:
+                loader.scans.append(1)
+            return discover()
+
+        monkeypatch.setattr(loader, 'discover_system_dictionaries', counting_discover)
+        return loader
+
+    def test_missing_dictionary_is_remembered(self, loader):
+        assert loader.load_system_dictionary('xx') is None
+        assert loader.load_system_dictionary('xx') is None
+        assert len(loader.lookups) == 1
+
+        loader.load_system_dictionary('yy')
+        assert len(loader.lookups) == 2 and len(loader.scans) == 1
+
+    def test_miss_expires(self, loader, monkeypatch):
+        monkeypatch.setattr(loader, 'MISSING_TTL_SECONDS', 0.0)
+        loader.load_system_dictionary('xx')
+        loader._missing['system:xx'] -= 1
+        assert not loader._is_known_missing('system:xx')
+
+    def test_clear_cache_resets_discovery_and_misses(self, loader):
+        loader.load_system_dictionary('xx')
+        loader.clear_cache()
+
+        assert loader._missing == {}
+        loader.load_system_dictionary('xx')
+        assert len(loader.scans) == 2
+
+
+class TestWarmSpellingCache:
+
+    def test_each_token_checked_once_across_entries(self, monkeypatch):
+        hunspell = FakeHunspell(known={'cat', 'small'})
+        engine = ValidationEngine()
+        monkeypatch.setattr(engine, '_get_hunspell_for_language', lambda lang: hunspell if lang == 'en' else None)
+
+        entries = [
+            {'id': f'e{i}', 'lexical_unit': {'en': 'cat dgo', 'xx': 'ignored'},
+             'senses': [{'id': f'e{i}_s1', 'definition': {'en': 'small cat'}}]}
+            for i in range(20)
+        ]
+        checked = engine.warm_spelling_cache(entries)
+
+        assert checked == {'en': 3}
+        assert sorted(hunspell.spell_calls) == ['cat', 'dgo', 'small']
+
+        for data in entries:
+            engine.validate_json(data)
+        assert sorted(hunspell.spell_calls) == ['cat', 'dgo', 'small']
+        get_spell_verdict_cache().forget(hunspell)
+
+
+class TestHunspellValidatorMisses:
+
+    def test_missing_dictionary_is_retried_after_ttl(self, monkeypatch):
+        import sys
+        import types
+        from app.validators.hunspell_validator import HunspellValidator
+
+        installed = []
+
+        def make(lang, dict_path=None):
+            if not installed:
+                raise OSError('no dictionary')
+            return FakeHunspell()
+
+        monkeypatch.setitem(sys.modules, 'hunspell', types.SimpleNamespace(Hunspell=make))
+        validator = HunspellValidator(dictionaries_path='/nonexistent')
+        validator._hunspell_available = True
+
+        assert validator._get_hunspell('xx') is None
+        installed.append(1)
+        assert validator._get_hunspell('xx') is None
+        assert 'xx' not in validator._hunspell_instances
+
+        validator._missing['xx'] -= DictionaryLoader.MISSING_TTL_SECONDS + 1
+        assert isinstance(validator._get_hunspell('xx'), FakeHunspell)
+        assert validator._missing == {}
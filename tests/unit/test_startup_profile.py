@@ -0,0 +1,53 @@
+"""
+Unit tests for startup profiling and the lazy loading of heavy dependencies.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from app.utils.startup_profile import StartupProfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Optional stacks that create_app must not import; they load on first use
+HEAVY_MODULES = ('sklearn', 'scipy', 'torch', 'spacy', 'sentence_transformers', 'qdrant_client')
+
+
+class TestStartupProfile:
+
+    def test_marks_consecutive_phases(self):
+        profile = StartupProfile()
+        assert profile.mark('imports') >= 0
+        profile.mark('blueprints')
+
+        report = profile.report()
+        assert [p['name'] for p in report['phases']] == ['imports', 'blueprints']
+        assert report['total_ms'] == round(profile.total_ms, 1)
+        assert sum(p['ms'] for p in report['phases']) <= report['total_ms'] + 0.1
+
+    def test_format_lists_slowest_phases(self):
+        profile = StartupProfile()
+        profile.phases = [('a', 1.0), ('b', 30.0), ('c', 5.0)]
+        assert profile.format().split('(')[1].startswith('b 30 ms, c 5 ms, a 1 ms')
+
+
+class TestCreateAppStartup:
+
+    def test_create_app_skips_heavy_imports(self):
+        code = (
+            "import json, sys\n"
+            "from app import create_app\n"
+            "app = create_app('testing')\n"
+            f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+            "print(json.dumps({'heavy': heavy, 'profile': app.startup_profile}))\n"
+        )
+        proc = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True,
+                              text=True, timeout=300)
+        assert proc.returncode == 0, proc.stderr[-2000:]
+
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        assert result['heavy'] == []
+        names = [p['name'] for p in result['profile']['phases']]
+        assert 'blueprints' in names and 'services' in names
@@ -0,0 +1,134 @@
+"""
+Unit tests for the compiled validation plan.
+
+The plan must give exactly the results of applying every rule with
+``ValidationEngine._apply_rule`` (the pre-plan code path).
+"""
+
+from __future__ import annotations
+
+import copy
+
+import jsonpath_ng
+import pytest
+
+from app.services.validation_engine import ValidationEngine, ValidationPriority
+from app.services.validation_plan import CompiledPath, EntryView, ValidationPlan, compile_path
+
+
+def _legacy_validate(engine, data, validation_mode='save'):
+    """The rule-by-rule loop validate_json ran before plans existed."""
+    issues = []
+    for rule_id, rule_config in engine.rules.items():
+        if not rule_config.get('client_side', True):
+            continue
+        rule_mode = rule_config.get('validation_mode', 'all')
+        if rule_mode == 'save_only' and validation_mode in ['delete', 'draft']:
+            continue
+        elif rule_mode == 'delete_only' and validation_mode != 'delete':
+            continue
+        elif rule_mode == 'draft_only' and validation_mode not in ['draft', 'all']:
+            continue
+        issues.extend(engine._apply_rule(rule_id, rule_config, data))
+    return issues
+
+
+def _as_tuples(issues):
+    return [(e.rule_id, e.message, e.path, e.priority, repr(e.value)) for e in issues]
+
+
+ENTRIES = [
+    {
+        'id': 'e1', 'lexical_unit': {'en': 'word', 'pl': 'słowo'},
+        'pronunciations': {'seh-fonipa': 'wɜːd'}, 'notes': {'general': {'en': 'a note'}},
+        'date_created': '2024-01-01T00:00:00Z', 'date_modified': 'not a date',
+        'relations': [{'type': 'synonym', 'ref': 'e2'}, {'type': 'antonym', 'ref': 'e2'}],
+        'senses': [
+            {'id': 's1', 'definition': {'en': {'text': 'one, two'}}, 'gloss': {'pl': {'text': ' '}},
+             'grammatical_info': 'Noun', 'examples': [{'text': {'en': ''}}, {'text': 'x'}]},
+            {'id': '', 'gloss': {}, 'relations': [{'type': 'synonym', 'ref': 's1'}]},
+        ],
+    },
+    {'lexical_unit': {}, 'senses': []},
+    {'id': 'e3', 'lexical_unit': 'flat', 'senses': {'id': 's'}, 'notes': [], 'pronunciations': None},
+    {'id': 'e4', 'lexical_unit': {'en': 'x'}, 'senses': [None, 7, 'str', {'id': 's', 'definition': 1.5}]},
+    {'id': 'e5', 'lexical_unit': {'a.b': 'dotted', 'en': None}, 'senses': 1.5, 'variants': [{'ref': 'e5'}]},
+]
+
+
+@pytest.fixture(scope='module')
+def engine():
+    return ValidationEngine()
+
+
+class TestEntryView:
+
+    @pytest.mark.parametrize('data', ENTRIES + [{'senses': [{'gloss': {'en': {'text': 't'}}}]}])
+    def test_matches_jsonpath_ng(self, engine, data):
+        paths = {rule['path'] for rule in engine.rules.values()} | {'$.*', '$.lexical_unit[*]'}
+        view = EntryView(data)
+        for path in sorted(paths):
+            expr = jsonpath_ng.parse(path)
+            try:
+                expected = [(str(m.full_path), m.value) for m in expr.find(data)]
+            except Exception as e:
+                with pytest.raises(type(e)):
+                    view.find(CompiledPath(path, expr, compile_path(expr)))
+                continue
+            actual = [(str(m.full_path), m.value) for m in view.find(CompiledPath(path, expr, compile_path(expr)))]
+            assert actual == expected, path
+
+    def test_unsupported_expressions_use_jsonpath_ng(self):
+        expr = jsonpath_ng.parse('$..text')
+        assert compile_path(expr) is None
+        matches = EntryView({'a': {'text': 'x'}}).find(CompiledPath('$..text', expr, None))
+        assert [m.value for m in matches] == ['x']
+
+
+class TestValidationPlan:
+
+    @pytest.mark.parametrize('mode', ['save', 'delete', 'draft', 'all'])
+    @pytest.mark.parametrize('index', range(len(ENTRIES)))
+    def test_results_match_rule_by_rule_path(self, engine, index, mode):
+        data = copy.deepcopy(ENTRIES[index])
+        result = engine.validate_json(data, mode)
+
+        expected = _as_tuples(_legacy_validate(engine, copy.deepcopy(ENTRIES[index]), mode))
+        actual = _as_tuples(result.errors + result.warnings + result.info)
+        assert sorted(actual, key=repr) == sorted(expected, key=repr)
+        assert result.is_valid == (not any(e[3] == ValidationPriority.CRITICAL for e in expected))
+
+    def test_plan_is_shared_and_mode_filtered(self, engine):
+        rules = {
+            'A': {'name': 'a', 'path': '$.id', 'condition': 'required', 'priority': 'critical',
+                  'category': 'entry_level', 'error_message': 'no id', 'validation': {'type': 'string', 'minLength': 1},
+                  'validation_mode': 'save_only'},
+            'B': {'name': 'b', 'path': '$.x', 'condition': 'if_type', 'validation': {}},
+            'C': {'name': 'c', 'client_side': False, 'path': '$.x', 'condition': 'required', 'validation': {}},
+        }
+        project_engine = ValidationEngine(project_rules=rules)
+        plan = project_engine.get_plan()
+
+        assert plan is project_engine.get_plan()
+        assert engine.get_plan() is not plan
+        assert [r.rule_id for r in plan.rules_for('save') if r.rule_id in rules] == ['A', 'B']
+        assert [r.rule_id for r in plan.rules_for('draft') if r.rule_id in rules] == ['B']
+
+    def test_malformed_rule_reports_error(self):
+        engine = ValidationEngine(project_rules={'BAD': {'name': 'bad', 'validation': {}}})
+        result = engine.validate_json({'id': 'x'}, rule_id_filter='BAD')
+
+        assert 'BAD' in engine.get_plan().legacy
+        assert [e.rule_id for e in result.errors] == ['BAD']
+        assert result.errors[0].message.startswith('Error applying validation rule')
+
+    def test_every_configured_custom_function_is_dispatched(self, engine):
+        configured = {rule['validation'].get('custom_function') for rule in engine.rules.values()} - {None}
+        assert configured <= set(ValidationEngine._CUSTOM_VALIDATORS)
+        for method_name, _ in ValidationEngine._CUSTOM_VALIDATORS.values():
+            assert callable(getattr(ValidationEngine, method_name))
+
+    def test_plan_stats(self, engine):
+        stats = ValidationPlan(engine.rules, ValidationEngine).stats()
+        assert stats['rules'] == len(engine.rules)
+        assert stats['fast_paths'] == stats['paths']
@@ -6,8 +6,8 @@ Tests verifying workset query accuracy and entry addition persistence.
 Addresses critical data paths 4-5 from the data path integrity audit.
 
 Components Tested:
-1. Query filter to entry matching (_execute_query)
-2. Workset entry addition persistence (add_entry_to_workset)
+1. Workset entry addition persistence (add_entry_to_workset)
+2. Query to membership IDs (_execute_id_query)
 
 Usage:
     pytest tests/unit/test_workset_query_integrity.py -v
@@ -20,130 +20,6 @@ from app.services.workset_service import WorksetService
 from app.models.workset import WorksetQuery, QueryFilter
 
 
-class TestWorksetQueryFilterMatching:
-    """Test _execute_query() returns accurate matching results - component: workset_service"""
-
-    def test_query_uses_dictionary_service_list_entries(self):
-        """Query execution should use dictionary_service.list_entries for efficient filtering."""
-        service = WorksetService()
-        
-        # Create a query with filters
-        query = WorksetQuery(
-            filters=[QueryFilter(field='lexical_unit', operator='contains', value='test')],
-            sort_by='lexical_unit',
-            sort_order='asc'
-        )
-        
-        # Mock dictionary service
-        mock_dict_service = Mock()
-        mock_dict_service.list_entries.return_value = ([], 0)
-        
-        service._execute_query(query, mock_dict_service)
-        
-        # Verify list_entries was called (not search_entries)
-        mock_dict_service.list_entries.assert_called_once()
-        call_kwargs = mock_dict_service.list_entries.call_args[1]
-        assert call_kwargs['filter_text'] == 'test'
-        assert call_kwargs['sort_by'] == 'lexical_unit'
-        assert call_kwargs['sort_order'] == 'asc'
-
-    def test_query_converts_lexical_unit_filter_to_search_term(self):
-        """Query should convert lexical_unit filter to filter_text parameter."""
-        service = WorksetService()
-        
-        query = WorksetQuery(
-            filters=[
-                QueryFilter(field='lexical_unit', operator='contains', value='search_term')
-            ]
-        )
-        
-        mock_dict_service = Mock()
-        mock_dict_service.list_entries.return_value = ([], 0)
-        
-        service._execute_query(query, mock_dict_service)
-        
-        # Verify filter_text is set from lexical_unit filter
-        call_kwargs = mock_dict_service.list_entries.call_args[1]
-        assert call_kwargs['filter_text'] == 'search_term'
-
-    def test_query_returns_entry_dicts(self):
-        """Query should return entry dictionaries by calling to_dict on entries."""
-        service = WorksetService()
-        
-        query = WorksetQuery(filters=[])
-        
-        # Create mock entries with to_dict method
-        mock_entry1 = Mock()
-        mock_entry1.to_dict.return_value = {'id': 'entry_1', 'lexical_unit': {'en': 'test1'}}
-        mock_entry2 = Mock()
-        mock_entry2.to_dict.return_value = {'id': 'entry_2', 'lexical_unit': {'en': 'test2'}}
-        
-        mock_dict_service = Mock()
-        mock_dict_service.list_entries.return_value = ([mock_entry1, mock_entry2], 2)
-        
-        entries, total = service._execute_query(query, mock_dict_service)
-        
-        assert len(entries) == 2
-        assert entries[0] == {'id': 'entry_1', 'lexical_unit': {'en': 'test1'}}
-        assert entries[1] == {'id': 'entry_2', 'lexical_unit': {'en': 'test2'}}
-        assert total == 2
-        
-        # Verify to_dict was called on entries
-        mock_entry1.to_dict.assert_called_once()
-        mock_entry2.to_dict.assert_called_once()
-
-    def test_query_handles_empty_filter_text(self):
-        """Query should handle filters without lexical_unit (empty filter_text)."""
-        service = WorksetService()
-        
-        query = WorksetQuery(filters=[QueryFilter(field='grammatical_info', operator='equals', value='noun')])
-        
-        mock_dict_service = Mock()
-        mock_dict_service.list_entries.return_value = ([], 0)
-        
-        service._execute_query(query, mock_dict_service)
-        
-        # Verify filter_text is empty when no lexical_unit filter
-        call_kwargs = mock_dict_service.list_entries.call_args[1]
-        assert call_kwargs['filter_text'] == ''
-
-    def test_query_handles_errors_gracefully(self):
-        """Query execution should handle errors gracefully and return empty results."""
-        service = WorksetService()
-        
-        query = WorksetQuery(filters=[])
-        mock_dict_service = Mock()
-        mock_dict_service.search_entries.side_effect = Exception("Database error")
-        
-        entries, total = service._execute_query(query, mock_dict_service)
-        
-        assert entries == []
-        assert total == 0
-
-    def test_query_passes_correct_parameters_to_list_entries(self):
-        """Query should pass correct parameters to dictionary service list_entries."""
-        service = WorksetService()
-        
-        query = WorksetQuery(
-            filters=[QueryFilter(field='lexical_unit', operator='contains', value='test')],
-            sort_by='lexical_unit',
-            sort_order='asc'
-        )
-        
-        mock_dict_service = Mock()
-        mock_dict_service.list_entries.return_value = ([], 0)
-        
-        service._execute_query(query, mock_dict_service)
-        
-        # Verify list_entries was called with correct parameters
-        call_kwargs = mock_dict_service.list_entries.call_args[1]
-        assert call_kwargs['filter_text'] == 'test'
-        assert call_kwargs['sort_by'] == 'lexical_unit'
-        assert call_kwargs['sort_order'] == 'asc'
-        assert call_kwargs['limit'] == 10000
-        assert call_kwargs['offset'] == 0
-
-
 class TestWorksetEntryAdditionPersistence:
     """Test add_entry_to_workset() persists entries correctly - component: worksets api"""
 
@@ -215,9 +91,10 @@ class TestWorksetMissingEntryTolerance:
 
         mock_dictionary_service = Mock()
         present_entry = Mock()
+        present_entry.id = 'entry-1'
         present_entry.to_dict.return_value = {'id': 'entry-1', 'lexical_unit': {'en': 'house'}}
 
-        mock_dictionary_service.get_entry.side_effect = [present_entry, None]
+        mock_dictionary_service.get_entries_by_ids.return_value = [present_entry]
 
         mock_conn = Mock()
         mock_cursor = Mock()
@@ -245,3 +122,113 @@ class TestWorksetMissingEntryTolerance:
         assert workset is not None
         assert len(workset.entries) == 1
         assert workset.entries[0]['id'] == 'entry-1'
+        mock_dictionary_service.get_entries_by_ids.assert_called_once_with(['entry-1', 'missing-entry'])
+        mock_dictionary_service.get_entry.assert_not_called()
+
+    def test_get_workset_preserves_membership_order(self):
+        service = WorksetService()
+        import app.services.workset_service as workset_service_module
+
+        entries = []
+        for entry_id in ('b', 'a', 'c'):
+            entry = Mock()
+            entry.id = entry_id
+            entry.to_dict.return_value = {'id': entry_id}
+            entries.append(entry)
+
+        mock_dictionary_service = Mock()
+        # BaseX may return the batch in any order
+        mock_dictionary_service.get_entries_by_ids.return_value = entries
+
+        mock_cursor = Mock()
+        mock_cursor.fetchone.side_effect = [
+            (1, 'ordered', {'filters': []}, 3, datetime.now(), datetime.now(), {}),
+        ]
+        mock_cursor.fetchall.return_value = [('a',), ('b',), ('c',)]
+        cursor_context = MagicMock()
+        cursor_context.__enter__.return_value = mock_cursor
+        mock_conn = Mock()
+        mock_conn.cursor.return_value = cursor_context
+        mock_current_app = Mock()
+        mock_current_app.pg_pool.getconn.return_value = mock_conn
+
+        with patch.object(workset_service_module, 'current_app', mock_current_app):
+            with patch('app.services.workset_service.get_dictionary_service', return_value=mock_dictionary_service):
+                workset = service.get_workset(1)
+
+        assert [e['id'] for e in workset.entries] == ['a', 'b', 'c']
+
+
+class TestWorksetIdQueryAndMembershipSync:
+    """Membership is materialized from entry IDs with bulk writes."""
+
+    def test_id_query_uses_list_entry_ids_without_limit(self):
+        service = WorksetService()
+        query = WorksetQuery(
+            filters=[QueryFilter(field='lexical_unit', operator='contains', value='ho')],
+            sort_by='lexical_unit',
+            sort_order='desc'
+        )
+        mock_dict_service = Mock()
+        mock_dict_service.list_entry_ids.return_value = (['e1', 'e2', 'e1'], 3)
+
+        entry_ids, total = service._execute_id_query(query, mock_dict_service)
+
+        assert entry_ids == ['e1', 'e2']
+        assert total == 2
+        call_kwargs = mock_dict_service.list_entry_ids.call_args[1]
+        assert call_kwargs['filter_text'] == 'ho'
+        assert call_kwargs['sort_order'] == 'desc'
+        assert 'limit' not in call_kwargs
+        mock_dict_service.list_entries.assert_not_called()
+
+    def test_id_query_propagates_errors(self):
+        service = WorksetService()
+        mock_dict_service = Mock()
+        mock_dict_service.list_entry_ids.side_effect = Exception("Database error")
+
+        with pytest.raises(Exception, match="Database error"):
+            service._execute_id_query(WorksetQuery(filters=[]), mock_dict_service)
+
+    def test_failed_query_leaves_membership_alone(self):
+        import app.services.workset_service as workset_service_module
+
+        service = WorksetService()
+        mock_dict_service = Mock()
+        mock_dict_service.list_entry_ids.side_effect = Exception("BaseX unavailable")
+        mock_current_app = Mock()
+
+        with patch.object(workset_service_module, 'current_app', mock_current_app):
+            with patch('app.services.workset_service.get_dictionary_service', return_value=mock_dict_service):
+                assert service.update_workset_query(5, WorksetQuery(filters=[])) is None
+
+        mock_current_app.pg_pool.getconn.assert_not_called()
+
+    def test_insert_uses_single_bulk_statement(self):
+        service = WorksetService()
+        cur = Mock()
+        with patch('app.services.workset_service.execute_values') as mock_execute_values:
+            service._insert_workset_entries(cur, 7, ['x', 'y'])
+
+        cur.execute.assert_not_called()
+        args = mock_execute_values.call_args[0]
+        assert args[0] is cur
+        assert args[2] == [(7, 'x', 0), (7, 'y', 1)]
+
+    def test_sync_only_writes_the_difference(self):
+        service = WorksetService()
+        cur = Mock()
+        cur.fetchall.return_value = [('keep',), ('gone',)]
+
+        with patch('app.services.workset_service.execute_values') as mock_execute_values:
+            service._sync_workset_entries(cur, 3, ['new', 'keep'])
+
+        delete_call = cur.execute.call_args_list[-1]
+        assert delete_call[0][0].startswith('DELETE FROM workset_entries')
+        assert delete_call[0][1] == (3, ['gone'])
+
+        update_call, insert_call = mock_execute_values.call_args_list
+        assert update_call[0][1].startswith('UPDATE workset_entries')
+        assert update_call[0][2] == [('keep', 1)]
+        assert insert_call[0][1].startswith('INSERT INTO workset_entries')
+        assert insert_call[0][2] == [(3, 'new', 0)]
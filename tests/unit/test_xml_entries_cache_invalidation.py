@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
 import pytest
 from flask import Flask
 
 from app.api import xml_entries
+from app.services.dictionary_service import DictionaryService
 
 
 class DummyService:
+    database = 'dict_db'
+
     def __init__(self) -> None:
         self.updated: list[tuple[str, str]] = []
         self.created: list[tuple[str, str]] = []
 
-    def update_entry(self, entry_id: str, xml_string: str):
+    def update_entry(self, entry_id: str, xml_string: str, base_modified=None):
         self.updated.append((entry_id, xml_string))
         return {'id': entry_id, 'status': 'updated'}
 
@@ -20,6 +26,9 @@ class DummyService:
         self.created.append(('unknown', xml_string))
         return {'id': 'unknown', 'status': 'created'}
 
+    def delete_entry(self, entry_id: str):
+        return {'id': entry_id, 'status': 'deleted'}
+
 
 class DummyCache:
     def __init__(self) -> None:
@@ -37,6 +46,9 @@ class DummyCache:
         self.incremented_keys.append((key, amount))
         return 1
 
+    def bump_namespace(self, prefix: str, scope: str = '', ttl: int = 0) -> int:
+        return self.increment(f"{prefix}:version:{scope}", 1, ttl)
+
 
 @pytest.fixture
 def xml_app(monkeypatch: pytest.MonkeyPatch) -> tuple[Flask, DummyService, DummyCache]:
@@ -77,3 +89,40 @@ def test_xml_update_clears_cache(xml_app: tuple[Flask, DummyService, DummyCache]
     assert ('cache_test', xml_payload) in service.updated
     # Version bumping replaces clear_pattern to avoid cache stampede
     assert any('entries:version:' in k for k, _ in cache.incremented_keys)
+
+
+XML_PAYLOAD = (
+    '<entry id="cache_test"><lexical-unit><form lang="en"><text>word</text></form></lexical-unit>'
+    '<sense id="s1"><gloss lang="pl"><text>slowo</text></gloss></sense></entry>'
+)
+
+
+def test_xml_writes_run_the_after_write_hook(xml_app: tuple[Flask, DummyService, DummyCache]) -> None:
+    app, _, _ = xml_app
+    dict_service = MagicMock()
+    dict_service.get_entry.return_value = 'stored entry'
+    app.injector = SimpleNamespace(get=lambda _cls: dict_service)
+    client = app.test_client()
+
+    assert client.put('/api/xml/entries/cache_test', data=XML_PAYLOAD).status_code == 200
+    assert client.delete('/api/xml/entries/cache_test').status_code == 200
+
+    saved, deleted = dict_service.after_external_entry_write.call_args_list
+    assert saved.args == ('cache_test',)
+    assert saved.kwargs == {'previous_entry': 'stored entry', 'entry_xml': XML_PAYLOAD,
+                            'deleted': False, 'db_name': 'dict_db'}
+    assert deleted.kwargs['deleted'] is True and deleted.kwargs['previous_entry'] == 'stored entry'
+
+
+@pytest.mark.skip_et_mock
+def test_external_writes_emit_entry_events() -> None:
+    service = DictionaryService(MagicMock())
+    events = []
+
+    with patch('app.services.event_bus.event_bus.emit',
+               side_effect=lambda name, data: events.append((name, data['entry_id'], data['db_name']))), \
+            patch('app.services.dictionary_service.rendered_entry_cache'):
+        service.after_external_entry_write('cache_test', entry_xml=XML_PAYLOAD, db_name='dict_db')
+        service.after_external_entry_write('cache_test', deleted=True, db_name='dict_db')
+
+    assert events == [('entry_saved', 'cache_test', 'dict_db'), ('entry_deleted', 'cache_test', 'dict_db')]
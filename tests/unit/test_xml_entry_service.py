@@ -8,6 +8,7 @@ Uses mocks to avoid requiring actual BaseX database connection.
 from __future__ import annotations
 
 import pytest
+from contextlib import contextmanager
 from unittest.mock import Mock, MagicMock, patch
 from xml.etree import ElementTree as ET
 
@@ -19,6 +20,7 @@ from app.services.xml_entry_service import (
     DatabaseConnectionError,
     LIFT_NS
 )
+from app.database.basex_connector import BaseXConnector, reset_shared_connectors
 
 
 # Sample valid LIFT XML for testing
@@ -78,26 +80,39 @@ def mock_basex_session():
     return session
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_pool():
+    """Keep the process-wide connector pool from leaking mocks between tests."""
+    reset_shared_connectors()
+    yield
+    reset_shared_connectors()
+
+
+def make_mock_connector(session):
+    """Create a connector stand-in whose pooled checkouts yield *session*."""
+    connector = MagicMock()
+
+    @contextmanager
+    def _session(db_name=None):
+        yield session
+
+    connector.session.side_effect = _session
+    return connector
+
+
 @pytest.fixture
 def xml_service(mock_basex_session):
     """Create XMLEntryService with mocked BaseX connection."""
-    with patch('app.services.xml_entry_service.BaseXClient.Session') as mock_session_class:
-        # Always return the same mock session
-        mock_session_class.return_value = mock_basex_session
-        
-        # Force namespace detection to work correctly in tests
-        # Set up the mock BEFORE creating the service so it can detect namespaces properly
-        detection_query_mock = MagicMock()
-        detection_query_mock.execute.return_value = 'true'
-        detection_query_mock.close.return_value = None
-        mock_basex_session.query.return_value = detection_query_mock
-        
-        service = XMLEntryService()
-        
-        # Patch _get_session to always return our mock
-        service._get_session = Mock(return_value=mock_basex_session)
-        
-        yield service
+    # Force namespace detection to work correctly in tests
+    # Set up the mock BEFORE creating the service so it can detect namespaces properly
+    detection_query_mock = MagicMock()
+    detection_query_mock.execute.return_value = 'true'
+    detection_query_mock.close.return_value = None
+    mock_basex_session.query.return_value = detection_query_mock
+
+    service = XMLEntryService(connector=make_mock_connector(mock_basex_session))
+
+    yield service
 
 
 class TestXMLEntryServiceInit:
@@ -108,7 +123,7 @@ class TestXMLEntryServiceInit:
         # Ensure any TEST_DB_NAME or BASEX_DATABASE from other tests does not leak into this unit test
         monkeypatch.delenv('TEST_DB_NAME', raising=False)
         monkeypatch.delenv('BASEX_DATABASE', raising=False)
-        with patch('app.services.xml_entry_service.BaseXClient.Session') as mock_session_class:
+        with patch('app.database.basex_connector.BaseXSession') as mock_session_class:
             mock_session_class.return_value = mock_basex_session
             service = XMLEntryService()
             
@@ -123,7 +138,7 @@ class TestXMLEntryServiceInit:
     
     def test_init_with_custom_params(self, mock_basex_session):
         """Test initialization with custom parameters."""
-        with patch('app.services.xml_entry_service.BaseXClient.Session') as mock_session_class:
+        with patch('app.database.basex_connector.BaseXSession') as mock_session_class:
             mock_session_class.return_value = mock_basex_session
             service = XMLEntryService(
                 host='testhost',
@@ -142,7 +157,7 @@ class TestXMLEntryServiceInit:
     def test_init_connection_failure(self):
         """Test initialization fails with bad connection."""
         XMLEntryService._namespace_cache.clear()  # Ensure namespace detection runs
-        with patch('app.services.xml_entry_service.BaseXClient.Session') as mock_session_class:
+        with patch('app.database.basex_connector.BaseXSession') as mock_session_class:
             mock_session_class.side_effect = Exception("Connection failed")
             
             with pytest.raises(DatabaseConnectionError):
@@ -521,25 +536,46 @@ class TestFilenameGeneration:
 class TestSessionManagement:
     """Test BaseX session management."""
     
-    def test_get_session_success(self, xml_service, mock_basex_session):
-        """Test getting a valid session."""
-        # Restore real _get_session (fixture patches it to bypass session reuse logic)
-        import types
-        xml_service._get_session = types.MethodType(XMLEntryService._get_session, xml_service)
-
-        with patch('app.services.xml_entry_service.BaseXClient.Session') as mock_session_class:
+    def test_session_scope_uses_shared_pool(self, mock_basex_session, monkeypatch):
+        """Services for the same server borrow sessions from one pool."""
+        monkeypatch.delenv('TEST_DB_NAME', raising=False)
+        XMLEntryService._namespace_cache['testdb'] = True
+        with patch('app.database.basex_connector.BaseXSession') as mock_session_class:
             mock_session_class.return_value = mock_basex_session
-            xml_service._session = None  # Clear cached session so mock is used
-            
-            session = xml_service._get_session()
-            
-            assert session is not None
-            assert mock_basex_session.execute.called
+            first = XMLEntryService(database='testdb')
+            second = XMLEntryService(database='testdb')
+
+            assert first._connector is second._connector
+            with first._session_scope() as session:
+                assert session is mock_basex_session
+            with second._session_scope() as session:
+                assert session is mock_basex_session
+
+            # One TCP session, opened once, and no liveness probe per checkout
+            assert mock_session_class.call_count == 1
+            executed = [c.args[0] for c in mock_basex_session.execute.call_args_list]
+            assert executed == ['OPEN testdb']
+
+    def test_idle_connection_is_health_checked(self, mock_basex_session):
+        """Connections idle past the threshold are pinged before reuse."""
+        with patch('app.database.basex_connector.BaseXSession') as mock_session_class:
+            mock_session_class.return_value = mock_basex_session
+            connector = BaseXConnector('localhost', 1984, 'admin', 'admin', idle_check_seconds=0)
+            with connector.session('testdb'):
+                pass
+            with connector.session('testdb'):
+                pass
+
+            metrics = connector.get_pool_metrics()
+            assert metrics['acquisitions'] == 2
+            assert metrics['health_checks'] == 1
+            assert metrics['in_use'] == 0
+            assert metrics['idle'] == 1
     
     def test_get_session_connection_failure(self):
         """Test session creation failure."""
         XMLEntryService._namespace_cache.clear()  # Ensure namespace detection runs
-        with patch('app.services.xml_entry_service.BaseXClient.Session') as mock_session_class:
+        with patch('app.database.basex_connector.BaseXSession') as mock_session_class:
             mock_session_class.side_effect = Exception("Connection failed")
             
             # Create a fresh service instance that will fail on connection test
@@ -0,0 +1,97 @@
+/*
+ * Long-lived Saxon worker for XSLT2 Schematron validation.
+ *
+ * Compiles the Schematron-generated stylesheet once and then transforms
+ * documents read from stdin, writing the SVRL report to stdout, until stdin
+ * is closed. Started by app/services/saxon_worker.py as a single-file source
+ * program (Java 11+), so no separate compile step is needed:
+ *
+ *   java -cp saxon-he.jar[:xmlresolver.jar] tools/schematron/SchematronWorker.java compiled.xsl
+ *
+ * Framing (all lengths in bytes of UTF-8):
+ *   request:  "<length>\n" followed by the XML document
+ *   response: "OK <length>\n" followed by the SVRL document, or
+ *             "ERR <length>\n" followed by an error message
+ * The worker prints "READY\n" once the stylesheet is compiled.
+ */
+
+import java.io.BufferedInputStream;
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.File;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.OutputStream;
+import java.nio.charset.StandardCharsets;
+
+import javax.xml.transform.stream.StreamSource;
+
+import net.sf.saxon.s9api.Processor;
+import net.sf.saxon.s9api.Serializer;
+import net.sf.saxon.s9api.Xslt30Transformer;
+import net.sf.saxon.s9api.XsltExecutable;
+
+public class SchematronWorker {
+
+    public static void main(String[] args) throws Exception {
+        if (args.length != 1) {
+            System.err.println("usage: SchematronWorker <compiled-schematron.xsl>");
+            System.exit(2);
+        }
+        Processor processor = new Processor(false);
+        XsltExecutable executable = processor.newXsltCompiler().compile(new StreamSource(new File(args[0])));
+
+        InputStream in = new BufferedInputStream(System.in);
+        OutputStream out = System.out;
+        write(out, "READY", new byte[0]);
+
+        while (true) {
+            String header = readLine(in);
+            if (header == null) {
+                return;
+            }
+            byte[] document = readExact(in, Integer.parseInt(header.trim()));
+            try {
+                Xslt30Transformer transformer = executable.load30();
+                ByteArrayOutputStream svrl = new ByteArrayOutputStream();
+                Serializer serializer = processor.newSerializer(svrl);
+                transformer.transform(new StreamSource(new ByteArrayInputStream(document)), serializer);
+                write(out, "OK", svrl.toByteArray());
+            } catch (Exception e) {
+                write(out, "ERR", String.valueOf(e.getMessage()).getBytes(StandardCharsets.UTF_8));
+            }
+        }
+    }
+
+    private static void write(OutputStream out, String status, byte[] body) throws IOException {
+        String header = body.length == 0 && status.equals("READY") ? "READY\n" : status + " " + body.length + "\n";
+        out.write(header.getBytes(StandardCharsets.US_ASCII));
+        out.write(body);
+        out.flush();
+    }
+
+    private static String readLine(InputStream in) throws IOException {
+        StringBuilder line = new StringBuilder();
+        int c;
+        while ((c = in.read()) != -1) {
+            if (c == '\n') {
+                return line.toString();
+            }
+            line.append((char) c);
+        }
+        return line.length() == 0 ? null : line.toString();
+    }
+
+    private static byte[] readExact(InputStream in, int length) throws IOException {
+        byte[] buffer = new byte[length];
+        int read = 0;
+        while (read < length) {
+            int n = in.read(buffer, read, length - read);
+            if (n == -1) {
+                throw new IOException("stdin closed mid-document");
+            }
+            read += n;
+        }
+        return buffer;
+    }
+}